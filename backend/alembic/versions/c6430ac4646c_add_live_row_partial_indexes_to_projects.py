@@ -0,0 +1,81 @@
+"""
+add live-row partial indexes to projects
+
+Revision ID: c6430ac4646c
+Revises: b0504ade70d4
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6430ac4646c'
+down_revision: Union[str, None] = 'b0504ade70d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LIVE_ROWS = sa.text('soft_deleted = false')
+
+LIVE_INDEXES = {
+    'ix_projects_live_owner_id_created_at': ['owner_id', 'created_at', 'id'],
+    'ix_projects_live_status_created_at': ['status', 'created_at', 'id'],
+    'ix_projects_live_created_at': ['created_at', 'id'],
+}
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        for name, columns in LIVE_INDEXES.items():
+            op.create_index(
+                name,
+                'projects',
+                columns,
+                unique=False,
+                postgresql_where=LIVE_ROWS,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        op.drop_index(
+            'ix_projects_soft_deleted',
+            table_name='projects',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            'ix_projects_created_at',
+            table_name='projects',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_projects_created_at',
+            'projects',
+            ['created_at'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_projects_soft_deleted',
+            'projects',
+            ['soft_deleted'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        for name in LIVE_INDEXES:
+            op.drop_index(
+                name,
+                table_name='projects',
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,40 @@
+"""
+create project_members table
+
+Revision ID: e2b7d4a91f36
+Revises: c6430ac4646c
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b7d4a91f36'
+down_revision: Union[str, None] = 'c6430ac4646c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('project_members',
+    sa.Column('project_id', sa.UUID(as_uuid=False), nullable=False),
+    sa.Column('user_id', sa.UUID(as_uuid=False), nullable=False),
+    sa.Column('role', sa.Enum('OWNER', 'ADMIN', 'MEMBER', 'VIEWER', name='projectrole'), server_default='MEMBER', nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('project_id', 'user_id')
+    )
+    # The primary key covers (project_id, user_id); this is the reverse
+    # direction, for access checks and the accessible-projects semi-join.
+    op.create_index('ix_project_members_user_id_project_id', 'project_members', ['user_id', 'project_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_project_members_user_id_project_id', table_name='project_members')
+    op.drop_table('project_members')
+    sa.Enum(name='projectrole').drop(op.get_bind(), checkfirst=True)
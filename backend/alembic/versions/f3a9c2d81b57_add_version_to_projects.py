@@ -0,0 +1,29 @@
+"""
+add version to projects
+
+Revision ID: f3a9c2d81b57
+Revises: e2b7d4a91f36
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a9c2d81b57'
+down_revision: Union[str, None] = 'e2b7d4a91f36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Existing rows start at 1; the ETags they had (from updated_at) are
+    # simply no longer current.
+    op.add_column('projects', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('projects', 'version')
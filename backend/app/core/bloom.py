@@ -0,0 +1,56 @@
+# Bloom Filter
+# ------------
+# Fixed-size, in-process set membership with no false negatives.
+# `item in bloom` is False only if the item was never added; True means
+# "possibly added" and must be confirmed against the source of truth.
+# Sized from an expected capacity and false-positive rate; past capacity
+# the false-positive rate climbs, so owners rebuild it periodically.
+
+from __future__ import annotations
+
+import hashlib
+import math
+from collections.abc import Iterable
+
+
+class BloomFilter:
+    """Bloom filter over strings, using double hashing of one blake2b digest."""
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.001) -> None:
+        if capacity < 1 or not 0 < error_rate < 1:
+            raise ValueError("capacity must be >= 1 and 0 < error_rate < 1")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self._count = 0
+
+    @classmethod
+    def from_items(
+        cls, items: Iterable[str], *, capacity: int = 100_000, error_rate: float = 0.001
+    ) -> BloomFilter:
+        """A filter holding `items`, grown to twice their number if that exceeds `capacity`."""
+        items = list(items)
+        bloom = cls(max(capacity, 2 * len(items)), error_rate)
+        for item in items:
+            bloom.add(item)
+        return bloom
+
+    def __len__(self) -> int:
+        """Number of `add` calls (duplicates included)."""
+        return self._count
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[i >> 3] & (1 << (i & 7)) for i in self._positions(item))
+
+    def add(self, item: str) -> None:
+        for i in self._positions(item):
+            self._bits[i >> 3] |= 1 << (i & 7)
+        self._count += 1
+
+    def _positions(self, item: str) -> list[int]:
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
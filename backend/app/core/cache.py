@@ -0,0 +1,599 @@
+# Cache
+# -----
+# Read-through JSON caching in two tiers:
+#   L1  LRUCache     — bounded, TTL-evicting, per worker process
+#   L2  RedisCache   — shared by all workers
+# TieredCache combines them and broadcasts invalidations over Redis
+# pub/sub so every worker evicts its L1 copy when a key changes.
+# Repository methods opt in with the `cached` decorator.
+#
+# - TTLs are jittered so keys written together do not expire together.
+# - `get_or_set` takes a short per-key lock on a miss: one caller loads,
+#   concurrent callers wait for its result instead of stampeding the DB.
+# - A `guard` lists version keys that writers bump before writing and again
+#   after commit; a loaded value is only stored if none of them moved while
+#   it loaded, so a read racing a write cannot re-cache the old value.
+# - Redis errors are logged and treated as misses; the cache never fails
+#   a request that the database could serve.
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import functools
+import inspect
+import json
+import random
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any, Concatenate, ParamSpec, TypeVar
+
+import structlog
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.core.config import get_settings
+from app.core.redis import get_redis
+
+logger = structlog.get_logger()
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+# Delete the lock only if we still own it.
+_RELEASE_LOCK = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+# SET KEYS[1] only if every guard key (KEYS[2..]) still holds the version
+# read before loading (ARGV[3..]; "" for a missing key).
+_SET_IF_CURRENT = """
+for i = 2, #KEYS do
+    if (redis.call('get', KEYS[i]) or '') ~= ARGV[i + 1] then
+        return 0
+    end
+end
+redis.call('set', KEYS[1], ARGV[1], 'ex', ARGV[2])
+return 1
+"""
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, default=_json_default)
+
+
+# ---- Metrics ----
+
+
+@dataclass(slots=True)
+class CacheStats:
+    """Counters for one cache tier; read with `snapshot()`."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0  # dropped to stay within max_entries
+    expirations: int = 0  # dropped because their TTL passed
+    invalidations: int = 0  # dropped because the key changed
+    errors: int = 0  # backend failures treated as misses
+
+    def snapshot(self) -> dict[str, int]:
+        return asdict(self)
+
+
+# ---- L2: Redis ----
+
+
+class RedisCache:
+    """JSON values under a key namespace, with jittered TTLs and stampede locks."""
+
+    def __init__(
+        self,
+        redis: Redis,
+        *,
+        namespace: str = "pmt",
+        ttl_seconds: int = 300,
+        jitter: float = 0.1,
+        lock_seconds: float = 5.0,
+        lock_poll_seconds: float = 0.05,
+    ) -> None:
+        self.redis = redis
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.jitter = jitter
+        self.lock_seconds = lock_seconds
+        self.lock_poll_seconds = lock_poll_seconds
+        self.stats = CacheStats()
+
+    # ---- Keys ----
+
+    def key(self, *parts: object) -> str:
+        return ":".join([self.namespace, *(str(part) for part in parts)])
+
+    def ttl(self, seconds: int | None = None) -> int:
+        """Jittered TTL: `seconds` ± `jitter`, at least one second."""
+        base = self.ttl_seconds if seconds is None else seconds
+        spread = base * self.jitter
+        return max(1, round(base + random.uniform(-spread, spread)))
+
+    # ---- Read / Write ----
+
+    async def get(self, key: str) -> Any | None:
+        try:
+            raw = await self.redis.get(key)
+        except RedisError as e:
+            self._unavailable("get", e)
+            return None
+        self._count(raw)
+        return None if raw is None else json.loads(raw)
+
+    async def get_many(self, keys: Sequence[str]) -> list[Any | None]:
+        """MGET; one round trip for several keys."""
+        try:
+            raws = await self.redis.mget(keys)
+        except RedisError as e:
+            self._unavailable("mget", e)
+            return [None] * len(keys)
+        for raw in raws:
+            self._count(raw)
+        return [None if raw is None else json.loads(raw) for raw in raws]
+
+    async def set(self, key: str, value: Any, *, ttl: int | None = None) -> None:
+        payload = _dumps(value)
+        try:
+            await self.redis.set(key, payload, ex=self.ttl(ttl))
+        except RedisError as e:
+            self._unavailable("set", e)
+
+    async def delete(self, *keys: str) -> None:
+        if not keys:
+            return
+        try:
+            await self.redis.delete(*keys)
+        except RedisError as e:
+            self._unavailable("delete", e)
+            return
+        self.stats.invalidations += len(keys)
+
+    async def incr(self, *keys: str, ttl: int) -> None:
+        """Bump version counters and (re)arm their expiry, in one round trip."""
+        if not keys:
+            return
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                for key in keys:
+                    pipe.incr(key).expire(key, ttl)
+                await pipe.execute()
+        except RedisError as e:
+            self._unavailable("incr", e)
+
+    async def get_or_set(
+        self,
+        key: str,
+        load: Callable[[], Awaitable[Any | None]],
+        *,
+        ttl: int | None = None,
+        guard: Sequence[str] = (),
+    ) -> Any | None:
+        """Return the cached value, or load, cache and return it.
+
+        None results are not cached. If another caller holds the key's lock,
+        wait up to `lock_seconds` for its value before loading ourselves.
+        The value is not stored if a `guard` version moved during the load.
+        """
+        value, _ = await self._get_or_load(key, load, ttl=ttl, guard=guard)
+        return value
+
+    async def _get_or_load(
+        self,
+        key: str,
+        load: Callable[[], Awaitable[Any | None]],
+        *,
+        ttl: int | None,
+        guard: Sequence[str],
+    ) -> tuple[Any | None, bool]:
+        """get_or_set, plus False when the value must not be cached anywhere."""
+        cached = await self.get(key)
+        if cached is not None:
+            return cached, True
+
+        lock_key = f"{key}:lock"
+        token = uuid.uuid4().hex
+        if await self._acquire(lock_key, token):
+            try:
+                versions = await self._versions(guard)
+                value = await load()
+                if value is None:
+                    return None, True
+                return value, await self._set_if_current(key, value, ttl, guard, versions)
+            finally:
+                await self._release(lock_key, token)
+
+        deadline = time.monotonic() + self.lock_seconds
+        while time.monotonic() < deadline:
+            await asyncio.sleep(self.lock_poll_seconds)
+            cached = await self.get(key)
+            if cached is not None:
+                return cached, True
+            if not await self._locked(lock_key):
+                break
+        # Loaded without reading the guard first: nothing vouches for it.
+        return await load(), not guard
+
+    # ---- Guarded writes (Private) ----
+
+    async def _versions(self, guard: Sequence[str]) -> list[Any]:
+        if not guard:
+            return []
+        try:
+            raws = await self.redis.mget(guard)
+        except RedisError as e:
+            self._unavailable("mget", e)
+            return []
+        return ["" if raw is None else raw for raw in raws]
+
+    async def _set_if_current(
+        self, key: str, value: Any, ttl: int | None, guard: Sequence[str], versions: list[Any]
+    ) -> bool:
+        """Store `value` unless a guard version moved; False if one did."""
+        if not guard:
+            await self.set(key, value, ttl=ttl)
+            return True
+        if len(versions) != len(guard):
+            return False  # versions unknown (Redis failed): do not store
+        try:
+            stored = await self.redis.eval(
+                _SET_IF_CURRENT,
+                1 + len(guard),
+                key,
+                *guard,
+                _dumps(value),
+                self.ttl(ttl),
+                *versions,
+            )
+        except RedisError as e:
+            self._unavailable("set", e)
+            return False
+        return bool(stored)
+
+    # ---- Locking (Private) ----
+
+    async def _acquire(self, lock_key: str, token: str) -> bool:
+        try:
+            return bool(
+                await self.redis.set(lock_key, token, nx=True, px=int(self.lock_seconds * 1000))
+            )
+        except RedisError as e:
+            self._unavailable("lock", e)
+            # No Redis, no coordination: load directly.
+            return True
+
+    async def _release(self, lock_key: str, token: str) -> None:
+        try:
+            await self.redis.eval(_RELEASE_LOCK, 1, lock_key, token)
+        except RedisError as e:
+            self._unavailable("unlock", e)
+
+    async def _locked(self, lock_key: str) -> bool:
+        try:
+            return bool(await self.redis.exists(lock_key))
+        except RedisError as e:
+            self._unavailable("exists", e)
+            return False
+
+    def _count(self, raw: Any) -> None:
+        if raw is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+
+    def _unavailable(self, operation: str, error: Exception) -> None:
+        self.stats.errors += 1
+        logger.warning("cache_unavailable", operation=operation, error=str(error))
+
+
+# ---- L1: in-process LRU ----
+
+
+class LRUCache:
+    """Bounded per-process cache; least recently used entries go first.
+
+    Entries also expire after `ttl_seconds`, which bounds staleness if an
+    invalidation message is lost. Values are shared, not copied: callers
+    must treat them as immutable.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 10_000,
+        ttl_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self.stats = CacheStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        self._entries[key] = (self._clock() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def delete(self, *keys: str) -> None:
+        for key in keys:
+            if self._entries.pop(key, None) is not None:
+                self.stats.invalidations += 1
+
+    def clear(self) -> None:
+        self.stats.invalidations += len(self._entries)
+        self._entries.clear()
+
+
+# ---- Two tiers ----
+
+
+class TieredCache:
+    """L1 in front of L2, with cross-worker L1 invalidation over pub/sub.
+
+    Same interface as RedisCache. L1 holds the JSON text, so a hit returns
+    a fresh copy exactly as Redis would. Every write (`set`, `delete`, `incr`)
+    publishes the changed keys on `channel`; `start()` runs a listener that
+    evicts them from this worker's L1. If the subscription drops, the
+    listener clears L1 on reconnect, since messages may have been missed.
+    """
+
+    def __init__(
+        self,
+        l2: RedisCache,
+        l1: LRUCache,
+        *,
+        channel: str = "pmt:cache:invalidate",
+        reconnect_seconds: float = 1.0,
+    ) -> None:
+        self.l1 = l1
+        self.l2 = l2
+        self.channel = channel
+        self.reconnect_seconds = reconnect_seconds
+        self.origin = uuid.uuid4().hex
+        self._listener: asyncio.Task[None] | None = None
+        self._subscribed = asyncio.Event()
+
+    def key(self, *parts: object) -> str:
+        return self.l2.key(*parts)
+
+    def metrics(self) -> dict[str, dict[str, int]]:
+        return {"l1": self.l1.stats.snapshot(), "l2": self.l2.stats.snapshot()}
+
+    # ---- Read / Write ----
+
+    async def get(self, key: str) -> Any | None:
+        payload = self.l1.get(key)
+        if payload is not None:
+            return json.loads(payload)
+        value = await self.l2.get(key)
+        self._fill(key, value)
+        return value
+
+    async def get_many(self, keys: Sequence[str]) -> list[Any | None]:
+        payloads = [self.l1.get(key) for key in keys]
+        values = [None if payload is None else json.loads(payload) for payload in payloads]
+        missing = [i for i, payload in enumerate(payloads) if payload is None]
+        if missing:
+            fetched = await self.l2.get_many([keys[i] for i in missing])
+            for i, value in zip(missing, fetched, strict=True):
+                values[i] = value
+                self._fill(keys[i], value)
+        return values
+
+    async def get_or_set(
+        self,
+        key: str,
+        load: Callable[[], Awaitable[Any | None]],
+        *,
+        ttl: int | None = None,
+        guard: Sequence[str] = (),
+    ) -> Any | None:
+        payload = self.l1.get(key)
+        if payload is not None:
+            return json.loads(payload)
+        value, current = await self.l2._get_or_load(key, load, ttl=ttl, guard=guard)
+        if current:
+            self._fill(key, value)
+        return value
+
+    async def set(self, key: str, value: Any, *, ttl: int | None = None) -> None:
+        await self.l2.set(key, value, ttl=ttl)
+        self.l1.delete(key)
+        await self._broadcast([key])
+
+    async def delete(self, *keys: str) -> None:
+        await self.l2.delete(*keys)
+        self.l1.delete(*keys)
+        await self._broadcast(keys)
+
+    async def incr(self, *keys: str, ttl: int) -> None:
+        await self.l2.incr(*keys, ttl=ttl)
+        self.l1.delete(*keys)
+        await self._broadcast(keys)
+
+    def _fill(self, key: str, value: Any | None) -> None:
+        if value is not None:
+            self.l1.set(key, _dumps(value))
+
+    # ---- Invalidation listener ----
+
+    def start(self) -> None:
+        """Start the pub/sub listener on the running loop (idempotent)."""
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.get_running_loop().create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
+        self._subscribed.clear()
+
+    async def wait_subscribed(self) -> None:
+        await self._subscribed.wait()
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                async with self.l2.redis.pubsub() as pubsub:
+                    await pubsub.subscribe(self.channel)
+                    self._subscribed.set()
+                    while True:
+                        message = await pubsub.get_message(
+                            ignore_subscribe_messages=True, timeout=1.0
+                        )
+                        if message is not None:
+                            self._evict(message["data"])
+            except RedisError as e:
+                self._subscribed.clear()
+                self.l2._unavailable("subscribe", e)
+                self.l1.clear()
+                await asyncio.sleep(self.reconnect_seconds)
+
+    def _evict(self, data: bytes | str) -> None:
+        try:
+            message = json.loads(data)
+        except ValueError:
+            return
+        if message.get("origin") != self.origin:
+            self.l1.delete(*message.get("keys", []))
+
+    async def _broadcast(self, keys: Sequence[str]) -> None:
+        if not keys:
+            return
+        payload = json.dumps({"origin": self.origin, "keys": list(keys)})
+        try:
+            await self.l2.redis.publish(self.channel, payload)
+        except RedisError as e:
+            self.l2._unavailable("publish", e)
+
+
+Cache = RedisCache | TieredCache
+
+
+# ---- Repository opt-in ----
+
+
+def cached(
+    key: Callable[..., str | Awaitable[str]],
+    *,
+    encode: Callable[[Any], Any] = lambda value: value,
+    decode: Callable[[Any], Any] = lambda data: data,
+    ttl: int | None = None,
+    guard: Callable[..., Sequence[str]] | None = None,
+    cache_attr: str = "cache",
+) -> Callable[
+    [Callable[Concatenate[Any, P], Awaitable[R]]], Callable[Concatenate[Any, P], Awaitable[R]]
+]:
+    """Read-through caching for an async method.
+
+    `key(self, *args, **kwargs)` builds the cache key (it may be async).
+    The instance's `cache_attr` attribute supplies the Cache; when it is
+    None the method runs uncached. `encode` turns a result into JSON data
+    and `decode` rebuilds it on a hit; on a miss the caller gets the
+    method's own return value. None results are not cached.
+    `guard(self, *args, **kwargs)` names the version keys writers bump
+    for this entry (see RedisCache.get_or_set).
+    """
+
+    def decorator(
+        fn: Callable[Concatenate[Any, P], Awaitable[R]],
+    ) -> Callable[Concatenate[Any, P], Awaitable[R]]:
+        @functools.wraps(fn)
+        async def wrapper(self: Any, *args: P.args, **kwargs: P.kwargs) -> R:
+            cache: Cache | None = getattr(self, cache_attr)
+            if cache is None:
+                return await fn(self, *args, **kwargs)
+
+            cache_key = key(self, *args, **kwargs)
+            if inspect.isawaitable(cache_key):
+                cache_key = await cache_key
+
+            loaded: list[R] = []
+
+            async def load() -> Any | None:
+                result = await fn(self, *args, **kwargs)
+                loaded.append(result)
+                return None if result is None else encode(result)
+
+            guard_keys = () if guard is None else guard(self, *args, **kwargs)
+            data = await cache.get_or_set(cache_key, load, ttl=ttl, guard=guard_keys)
+            if loaded:
+                return loaded[0]
+            return None if data is None else decode(data)  # type: ignore[return-value]
+
+        return wrapper
+
+    return decorator
+
+
+# ---- Process-wide instance ----
+
+_shared: TieredCache | None = None
+
+
+def get_shared_cache() -> TieredCache:
+    """Return this worker's TieredCache, built from settings on first call."""
+    global _shared
+    if _shared is None:
+        settings = get_settings()
+        _shared = TieredCache(
+            RedisCache(
+                get_redis(),
+                ttl_seconds=settings.CACHE_TTL_SECONDS,
+                jitter=settings.CACHE_TTL_JITTER,
+            ),
+            LRUCache(
+                max_entries=settings.CACHE_L1_MAX_ENTRIES,
+                ttl_seconds=settings.CACHE_L1_TTL_SECONDS,
+            ),
+            channel=settings.CACHE_INVALIDATION_CHANNEL,
+        )
+    return _shared
+
+
+async def close_shared_cache() -> None:
+    global _shared
+    if _shared is not None:
+        await _shared.stop()
+        _shared = None
@@ -0,0 +1,149 @@
+# Conditional Requests
+# --------------------
+# ETag / Last-Modified validators and RFC 9110 precondition evaluation.
+# Read routes compute validators from a cheap version query and answer
+# `If-None-Match` / `If-Modified-Since` with 304 before loading rows;
+# write routes check `If-Match` for optimistic concurrency.
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any
+
+from fastapi import Request, Response, status
+
+from app.core.exceptions import PreconditionFailedError
+
+
+def make_etag(*parts: object, variant: object = None) -> str:
+    """Strong entity tag over `parts` (datetimes are normalized to UTC).
+
+    A `variant` (e.g. a field selection) tags one representation of that
+    state as `"<state>.<variant>"`; `require_match` compares the state only.
+    """
+    tag = _digest(parts, digest_size=12)
+    if variant:
+        tag += "." + _digest([variant], digest_size=6)
+    return f'"{tag}"'
+
+
+def is_conditional(request: Request) -> bool:
+    """True when the request carries a validator worth a pre-check query."""
+    headers = request.headers
+    return "if-none-match" in headers or "if-modified-since" in headers
+
+
+def request_variant(request: Request) -> str:
+    """Path and query: what distinguishes representations of one listing scope."""
+    return f"{request.url.path}?{request.url.query}"
+
+
+def require_match(if_match: str | None, etag: str) -> None:
+    """Raise PreconditionFailedError unless `If-Match` is absent or matches `etag`."""
+    if if_match is None:
+        return
+    tags = _parse_tags(if_match)
+    if "*" in tags:
+        return
+    # If-Match uses strong comparison: weak tags never match. Variants of the
+    # current state do, so the ETag of a sparse read can guard a write.
+    if etag.startswith("W/") or _state(etag) not in {_state(tag) for tag in tags}:
+        raise PreconditionFailedError(details=[{"header": "If-Match", "current": etag}])
+
+
+@dataclass(frozen=True, slots=True)
+class Validators:
+    """Entity tag and modification time of one representation."""
+
+    etag: str
+    last_modified: datetime | None = None
+
+    @property
+    def headers(self) -> dict[str, str]:
+        # Per-user data: no shared caches, and clients revalidate every time
+        # instead of applying heuristic freshness from Last-Modified.
+        headers = {"ETag": self.etag, "Cache-Control": "private, no-cache"}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = http_date(self.last_modified)
+        return headers
+
+    def is_fresh(self, request: Request) -> bool:
+        """Whether the client's cached copy is current (answer with 304).
+
+        `If-None-Match` takes precedence; `If-Modified-Since` is only
+        consulted when it is absent (RFC 9110 §13.2.2).
+        """
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            tags = _parse_tags(if_none_match)
+            return "*" in tags or _weak(self.etag) in {_weak(tag) for tag in tags}
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since is None or self.last_modified is None:
+            return False
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        # HTTP dates have one-second resolution.
+        return _utc(self.last_modified).replace(microsecond=0) <= _utc(since)
+
+    def apply(self, response: Response) -> Response:
+        """Set the validator headers on `response` and return it."""
+        response.headers.update(self.headers)
+        return response
+
+    def attach(self, payload: Any, response: Response) -> Any:
+        """Set the headers on `payload` if it is a Response, else on `response`.
+
+        `response` is the route's injected Response, whose headers FastAPI
+        copies onto responses it renders from a returned model.
+        """
+        self.apply(payload if isinstance(payload, Response) else response)
+        return payload
+
+    def not_modified(self) -> Response:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=self.headers)
+
+
+def http_date(value: datetime) -> str:
+    """IMF-fixdate, e.g. `Sun, 18 Oct 2026 09:00:00 GMT`."""
+    return format_datetime(_utc(value).replace(microsecond=0), usegmt=True)
+
+
+# ---- Helpers (Private) ----
+
+
+def _utc(value: datetime) -> datetime:
+    # Naive values come from SQLite, which stores UTC without an offset.
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _digest(parts: Iterable[object], *, digest_size: int) -> str:
+    text = "|".join(_normalize(part) for part in parts)
+    return hashlib.blake2b(text.encode(), digest_size=digest_size).hexdigest()
+
+
+def _normalize(part: object) -> str:
+    if isinstance(part, datetime):
+        return _utc(part).isoformat()
+    return "" if part is None else str(part)
+
+
+def _parse_tags(header: str) -> set[str]:
+    return {tag.strip() for tag in header.split(",") if tag.strip()}
+
+
+def _state(tag: str) -> str:
+    """`"<state>.<variant>"` -> `"<state>"`; other tags are returned as is."""
+    head, separator, _ = tag.partition(".")
+    return f'{head}"' if separator else tag
+
+
+def _weak(tag: str) -> str:
+    return tag.removeprefix("W/")
@@ -66,3 +66,17 @@ class TaskType(str, enum.Enum):
     STORY = "STORY"
     EPIC = "EPIC"
 
+
+class CountStrategy(str, enum.Enum):
+    """How list endpoints compute their `total`."""
+
+    EXACT = "EXACT"  # count(*) over the full filtered set
+    CAPPED = "CAPPED"  # stop counting at a cap and report "N+"
+    ESTIMATED = "ESTIMATED"  # planner row estimate (Postgres only)
+
+
+class ExportFormat(str, enum.Enum):
+    """Streaming export formats (values are the `?format=` query values)."""
+
+    NDJSON = "ndjson"
+    CSV = "csv"
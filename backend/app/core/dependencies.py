@@ -4,20 +4,33 @@
 
 from __future__ import annotations
 
-from typing import Annotated
+from collections.abc import AsyncGenerator
+from typing import Annotated, Any
 
-from fastapi import Depends
+import structlog
+from fastapi import Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import Settings, get_settings
 from app.core.constants import Role
-from app.core.exceptions import AuthenticationError, InsufficientPermissionError
-from app.core.schemas import PaginationParams
+from app.core.exceptions import (
+    AuthenticationError,
+    BadRequestError,
+    InsufficientPermissionError,
+    QueryBudgetExceededError,
+)
+from app.core.schemas import CursorParams, PaginationParams
 from app.core.security import decode_access_token, oauth2_scheme
-from app.db.session import get_db
+from app.db.query_stats import current_query_stats
+from app.db.session import get_db, get_streaming_db
+
+logger = structlog.get_logger()
 
 # ---- Database Session Dependency ----
 
-DBSession = Annotated[AsyncSession, Depends(get_db)]
+# "function" scope: get_db commits before the response is sent, not after.
+DBSession = Annotated[AsyncSession, Depends(get_db, scope="function")]
+StreamingDBSession = Annotated[AsyncSession, Depends(get_streaming_db)]
 
 
 # ---- Auth Dependencies ----
@@ -38,17 +51,19 @@ class CurrentUser:
         return self.role in [r.value for r in roles]
 
 
-async def get_current_user(token: str = Depends(oauth2_scheme)) -> CurrentUser:
+async def get_current_user(request: Request, token: str = Depends(oauth2_scheme)) -> CurrentUser:
     """Extract and validate current user from JWT access token.
 
     Returns a lightweight CurrentUser with id and role.
     Raises AuthenticationError if token is invalid.
+    The user id is kept on `request.state` for read-your-writes routing.
     """
     payload = decode_access_token(token)
     user_id = payload.get("sub")
     user_role = payload.get("role")
     if not user_id or not user_role:
         raise AuthenticationError("Invalid token payload")
+    request.state.user_id = user_id
     return CurrentUser(id=user_id, role=user_role)
 
 
@@ -81,4 +96,49 @@ def require_role(*allowed_roles: Role):
 # ---- Pagination Dependency ----
 
 Pagination = Annotated[PaginationParams, Depends()]
+CursorPagination = Annotated[CursorParams, Depends()]
+
+
+async def reject_mixed_pagination(request: Request) -> None:
+    """Reject requests that combine offset (`page`) and keyset (`cursor`) parameters."""
+    params = request.query_params
+    if "page" in params and "cursor" in params:
+        raise BadRequestError("Use either `page` or `cursor` pagination, not both")
+
+
+# ---- Query Budget ----
+
 
+def query_budget(max_queries: int) -> Any:
+    """Returns a dependency that caps the SQL statements a route may run.
+
+    Checked when the path operation returns. Over budget, production logs a
+    warning; the test environment raises QueryBudgetExceededError.
+
+    Usage:
+        @router.get("/{id}", dependencies=[query_budget(1)])
+    """
+
+    async def _check(
+        request: Request, settings: Settings = Depends(get_settings)
+    ) -> AsyncGenerator[None, None]:
+        stats = current_query_stats()
+        if stats is not None:
+            stats.budget = max_queries
+        yield
+        if stats is None or not stats.over_budget:
+            return
+        if settings.is_test:
+            raise QueryBudgetExceededError(
+                f"{request.method} {request.url.path} ran {stats.count} queries "
+                f"(budget {max_queries})"
+            )
+        logger.warning(
+            "query_budget_exceeded",
+            method=request.method,
+            path=request.url.path,
+            db_queries=stats.count,
+            budget=max_queries,
+        )
+
+    return Depends(_check, scope="function")
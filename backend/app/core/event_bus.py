@@ -8,8 +8,65 @@
 #   publish(event: DomainEvent) -> None
 #   subscribe(event_type, handler: Callable) -> None
 #
-# Current: synchronous in-process dispatch.
+# Current: in-process dispatch; handlers run inline, in subscription order.
 # Future: swap to Redis Streams, RabbitMQ, or Kafka
 #         when extracting to microservices.
-#
-# Placeholder — implementation pending.
+
+from __future__ import annotations
+
+import inspect
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any
+
+import structlog
+
+from app.core.events import DomainEvent
+
+logger = structlog.get_logger()
+
+Handler = Callable[[Any], Awaitable[None] | None]
+
+
+class EventBus:
+    """Dispatches events to handlers subscribed to their type (or a base type).
+
+    A failing handler is logged and does not stop the others: events are
+    published after the database commit, so there is nothing to roll back.
+    """
+
+    def __init__(self) -> None:
+        self._handlers: dict[type[DomainEvent], list[Handler]] = {}
+
+    def subscribe(self, event_type: type[DomainEvent], handler: Handler) -> None:
+        """Register `handler` for `event_type`. Subscribing twice is a no-op."""
+        handlers = self._handlers.setdefault(event_type, [])
+        if handler not in handlers:
+            handlers.append(handler)
+
+    def unsubscribe(self, event_type: type[DomainEvent], handler: Handler) -> None:
+        handlers = self._handlers.get(event_type, [])
+        if handler in handlers:
+            handlers.remove(handler)
+
+    async def publish(self, event: DomainEvent) -> None:
+        for event_type, handlers in list(self._handlers.items()):
+            if not isinstance(event, event_type):
+                continue
+            for handler in list(handlers):
+                try:
+                    result = handler(event)
+                    if inspect.isawaitable(result):
+                        await result
+                except Exception:
+                    logger.exception(
+                        "event_handler_failed",
+                        event_type=type(event).__name__,
+                        handler=getattr(handler, "__qualname__", repr(handler)),
+                    )
+
+    async def publish_all(self, events: Iterable[DomainEvent]) -> None:
+        for event in events:
+            await self.publish(event)
+
+
+event_bus = EventBus()
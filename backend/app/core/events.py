@@ -4,12 +4,56 @@
 # Supports future event-driven architecture and
 # decoupling between modules.
 #
-# Events: TaskCreated, TaskStatusChanged, SprintStarted,
-#         SprintCompleted, UserAssigned, ScorecardEvaluated,
-#         ProjectArchived
+# Events: ProjectCreated, ProjectUpdated, ProjectDeleted,
+#         ProjectMembershipChanged
+# Future: TaskCreated, TaskStatusChanged, SprintStarted,
+#         SprintCompleted, UserAssigned, ScorecardEvaluated
 #
-# Pattern: Each event is a frozen dataclass / Pydantic model
-# that can be published to an in-process event bus (sync)
-# or message broker (async) when extracting to microservices.
-#
-# Placeholder — implementation pending.
+# Pattern: Each event is a frozen dataclass that can be published
+# to the in-process event bus (see app/core/event_bus.py) or a
+# message broker when extracting to microservices.
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class DomainEvent:
+    """Base class for all domain events."""
+
+    occurred_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+# ---- Projects ----
+
+
+@dataclass(frozen=True, slots=True)
+class ProjectCreated(DomainEvent):
+    project_id: str
+    owner_id: str
+
+
+@dataclass(frozen=True, slots=True)
+class ProjectUpdated(DomainEvent):
+    """`owner_id` is None when a set-based write did not select by owner."""
+
+    project_id: str
+    owner_id: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class ProjectDeleted(DomainEvent):
+    """`owner_id` is None when a set-based write did not select by owner."""
+
+    project_id: str
+    owner_id: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class ProjectMembershipChanged(DomainEvent):
+    """A user was added to, removed from, or given a new role on a project."""
+
+    project_id: str
+    user_id: str
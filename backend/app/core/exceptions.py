@@ -28,14 +28,35 @@ class AppException(Exception):
         code: str | None = None,
         status_code: int | None = None,
         details: list[dict[str, Any]] | None = None,
+        headers: dict[str, str] | None = None,
     ) -> None:
         self.message = message or self.__class__.message
         self.code = code or self.__class__.code
         self.status_code = status_code or self.__class__.status_code
         self.details = details
+        self.headers = headers
         super().__init__(self.message)
 
 
+# ---- Request Exceptions (400) ----
+
+
+class BadRequestError(AppException):
+    status_code = 400
+    code = "BAD_REQUEST"
+    message = "The request could not be processed"
+
+
+class InvalidCursorError(BadRequestError):
+    code = "INVALID_CURSOR"
+    message = "Pagination cursor is invalid or has been tampered with"
+
+
+class InvalidFieldsError(BadRequestError):
+    code = "INVALID_FIELDS"
+    message = "Unknown field in `fields` selection"
+
+
 # ---- Auth Exceptions (401) ----
 
 
@@ -104,6 +125,15 @@ class AlreadyExistsError(AppException):
         )
 
 
+# ---- Precondition Exceptions (412) ----
+
+
+class PreconditionFailedError(AppException):
+    status_code = 412
+    code = "PRECONDITION_FAILED"
+    message = "The resource has changed since it was last read"
+
+
 # ---- Validation Exceptions (422) ----
 
 
@@ -122,6 +152,29 @@ class RateLimitExceededError(AppException):
     message = "Too many requests. Please try again later."
 
 
+# ---- Capacity Exceptions (503) ----
+
+
+class ServiceUnavailableError(AppException):
+    status_code = 503
+    code = "SERVICE_UNAVAILABLE"
+    message = "Service temporarily unavailable. Please try again later."
+
+
+class PasswordHasherBusyError(ServiceUnavailableError):
+    code = "PASSWORD_HASHER_BUSY"
+    message = "Too many sign-in attempts in progress. Please try again shortly."
+
+
+# ---- Internal Exceptions (500) ----
+
+
+class QueryBudgetExceededError(AppException):
+    status_code = 500
+    code = "QUERY_BUDGET_EXCEEDED"
+    message = "Request exceeded its SQL query budget"
+
+
 # ---- Exception Handler Registration ----
 
 
@@ -140,6 +193,7 @@ def register_exception_handlers(app: FastAPI) -> None:
                     "request_id": getattr(request.state, "request_id", None),
                 }
             },
+            headers=exc.headers,
         )
 
     @app.exception_handler(Exception)
@@ -156,4 +210,3 @@ def register_exception_handlers(app: FastAPI) -> None:
                 }
             },
         )
-
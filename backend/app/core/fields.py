@@ -0,0 +1,85 @@
+# Sparse Fieldsets
+# ----------------
+# `?fields=id,name,status` support for read endpoints.
+# The dependency validates the selection against a response schema,
+# repositories load only the selected columns, and the response is
+# serialized with a matching partial model (cached per selection).
+
+from __future__ import annotations
+
+import functools
+from collections.abc import Callable, Collection
+from typing import Any
+
+from fastapi import Query, Response
+from pydantic import BaseModel, ConfigDict, create_model
+
+from app.core.exceptions import InvalidFieldsError
+
+FieldSelection = frozenset[str] | None
+
+
+def parse_fields(
+    raw: str | None, allowed: Collection[str], *, always: Collection[str] = ("id",)
+) -> FieldSelection:
+    """Parse a comma-separated selection; None means "all fields"."""
+    if raw is None:
+        return None
+    names = {name.strip() for name in raw.split(",") if name.strip()}
+    unknown = sorted(names - set(allowed))
+    if unknown:
+        raise InvalidFieldsError(
+            f"Unknown field(s): {', '.join(unknown)}",
+            details=[{"field": name, "allowed": sorted(allowed)} for name in unknown],
+        )
+    if not names:
+        raise InvalidFieldsError("`fields` must name at least one field")
+    return frozenset(names | set(always))
+
+
+def sparse_fields(
+    schema: type[BaseModel], *, always: Collection[str] = ("id",)
+) -> Callable[..., FieldSelection]:
+    """Returns a dependency that parses `?fields=` against `schema`'s fields.
+
+    Usage:
+        ProjectFields = Annotated[FieldSelection, Depends(sparse_fields(ProjectResponse))]
+    """
+    allowed = tuple(schema.model_fields)
+
+    def _parse(
+        fields: str | None = Query(
+            default=None,
+            description=f"Comma-separated subset of: {', '.join(allowed)}",
+            examples=["id,name,status"],
+        ),
+    ) -> FieldSelection:
+        return parse_fields(fields, allowed, always=always)
+
+    return _parse
+
+
+@functools.lru_cache(maxsize=256)
+def partial_model(schema: type[BaseModel], fields: frozenset[str]) -> type[BaseModel]:
+    """A model with only `fields` of `schema`, keeping their types and metadata."""
+    definitions: dict[str, Any] = {
+        name: (info.annotation, info)
+        for name, info in schema.model_fields.items()
+        if name in fields
+    }
+    return create_model(
+        f"{schema.__name__}Partial",
+        __config__=ConfigDict(from_attributes=True),
+        **definitions,
+    )
+
+
+def sparse_response(payload: BaseModel, fields: FieldSelection) -> Any:
+    """Return `payload` as-is, or pre-serialized when it carries partial models.
+
+    Partial payloads do not match the route's declared response_model, so
+    they bypass response validation as a ready-made JSON Response.
+    """
+    if fields is None:
+        return payload
+    return Response(content=payload.model_dump_json(), media_type="application/json")
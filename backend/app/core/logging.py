@@ -0,0 +1,267 @@
+# Logging
+# -------
+# structlog configuration and the asynchronous log sink.
+#
+# Processors that need the caller's context (contextvars merge, level,
+# timestamp, exception formatting) run where the log call is made. The
+# event dict is then handed to QueueLogSink: a bounded in-memory queue
+# drained by one writer thread, which renders it (JSON in production,
+# console otherwise) and writes batches to stdout. Log calls never wait on
+# stdout; when the queue is full the record is dropped, counted, and the
+# writer reports the count as `log_records_dropped`.
+#
+# At high RPS, success logs are sampled (see SuccessSampler); warnings,
+# errors and slow requests are always kept.
+
+from __future__ import annotations
+
+import atexit
+import logging
+import queue
+import sys
+import threading
+import time
+from collections.abc import Callable
+from typing import IO, Any
+
+import structlog
+
+from app.core.config import Settings
+
+Renderer = Callable[[Any, str, dict[str, Any]], str]
+
+
+class SuccessSampler:
+    """Keeps every success log up to `threshold` per second, then one in `rate`.
+
+    A success log is an `info` record with a `status_code` below 400 that is
+    not flagged `slow`. Kept records past the threshold carry
+    `sample_rate`, so aggregators can re-weight counts. Counting is
+    per-second and approximate when several threads log at once.
+    """
+
+    def __init__(
+        self,
+        *,
+        threshold: int = 100,
+        rate: int = 10,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.threshold = threshold
+        self.rate = max(1, rate)
+        self._clock = clock
+        self._second = -1
+        self._seen = 0
+
+    def keep(self, level: str, event_dict: dict[str, Any]) -> bool:
+        status_code = event_dict.get("status_code")
+        if level != "info" or status_code is None or status_code >= 400 or event_dict.get("slow"):
+            return True
+        second = int(self._clock())
+        if second != self._second:
+            self._second, self._seen = second, 0
+        self._seen += 1
+        over = self._seen - self.threshold
+        if over <= 0:
+            return True
+        if over % self.rate:
+            return False
+        event_dict["sample_rate"] = self.rate
+        return True
+
+
+class QueueLogSink:
+    """Bounded queue of event dicts, rendered and written by a writer thread."""
+
+    def __init__(
+        self,
+        renderer: Renderer,
+        *,
+        max_size: int = 10_000,
+        sampler: SuccessSampler | None = None,
+        stream: IO[str] | None = None,
+        batch_size: int = 256,
+    ) -> None:
+        self.renderer = renderer
+        self.sampler = sampler
+        self.batch_size = batch_size
+        self._stream = stream
+        self._queue: queue.Queue[tuple[str, dict[str, Any]] | threading.Event | None] = queue.Queue(
+            max_size
+        )
+        self._writer: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._unreported_drops = 0
+        self.stats = {"written": 0, "dropped": 0, "sampled_out": 0}
+
+    def submit(self, level: str, event_dict: dict[str, Any]) -> None:
+        """Enqueue one record without blocking (dropped if the queue is full)."""
+        if self.sampler is not None and not self.sampler.keep(level, event_dict):
+            self.stats["sampled_out"] += 1
+            return
+        try:
+            self._queue.put_nowait((level, event_dict))
+        except queue.Full:
+            self.stats["dropped"] += 1
+            self._unreported_drops += 1
+            return
+        if self._writer is None:
+            self._start()
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until everything queued so far is written; False on timeout."""
+        if self._writer is None:
+            return True
+        done = threading.Event()
+        try:
+            self._queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Flush and stop the writer; it restarts on the next record."""
+        with self._lock:
+            writer, self._writer = self._writer, None
+        if writer is None:
+            return
+        self._queue.put(None)
+        writer.join(timeout)
+
+    # ---- Writer thread ----
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._run, name="log-writer", daemon=True)
+                self._writer.start()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            lines: list[str] = []
+            markers: list[threading.Event] = []
+            stop = False
+            for item in batch:
+                if item is None:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    markers.append(item)
+                else:
+                    lines.append(self._render(*item))
+            if self._unreported_drops:
+                dropped, self._unreported_drops = self._unreported_drops, 0
+                lines.append(
+                    self._render("warning", {"event": "log_records_dropped", "count": dropped})
+                )
+            self._write(lines)
+            for marker in markers:
+                marker.set()
+            if stop:
+                return
+
+    def _render(self, level: str, event_dict: dict[str, Any]) -> str:
+        event_dict.setdefault("level", level)
+        try:
+            return self.renderer(None, level, event_dict)
+        except Exception as e:  # a bad value must not kill the writer
+            return f"log_render_failed error={e!r} event={event_dict.get('event')!r}"
+
+    def _write(self, lines: list[str]) -> None:
+        if not lines:
+            return
+        # Resolved per batch: test runners and daemons swap sys.stdout.
+        stream = self._stream or sys.stdout
+        try:
+            stream.write("\n".join(lines) + "\n")
+            stream.flush()
+        except (OSError, ValueError):
+            self.stats["dropped"] += len(lines)
+            return
+        self.stats["written"] += len(lines)
+
+
+class QueueLogger:
+    """structlog logger that hands event dicts to a QueueLogSink."""
+
+    def __init__(self, sink: QueueLogSink) -> None:
+        self._sink = sink
+
+    def debug(self, **event_dict: Any) -> None:
+        self._sink.submit("debug", event_dict)
+
+    def info(self, **event_dict: Any) -> None:
+        self._sink.submit("info", event_dict)
+
+    def warning(self, **event_dict: Any) -> None:
+        self._sink.submit("warning", event_dict)
+
+    def error(self, **event_dict: Any) -> None:
+        self._sink.submit("error", event_dict)
+
+    def critical(self, **event_dict: Any) -> None:
+        self._sink.submit("critical", event_dict)
+
+    msg = info
+    warn = warning
+    exception = error
+    fatal = critical
+
+
+def _to_sink(_logger: Any, _method: str, event_dict: dict[str, Any]) -> dict[str, Any]:
+    # Returning the dict makes structlog call `logger.<level>(**event_dict)`:
+    # rendering happens on the writer thread.
+    return event_dict
+
+
+# ---- Process-wide configuration ----
+
+_sink: QueueLogSink | None = None
+
+
+def configure_logging(settings: Settings) -> QueueLogSink:
+    """Route structlog through this process's QueueLogSink (idempotent)."""
+    global _sink
+    use_json = settings.LOG_JSON if settings.LOG_JSON is not None else settings.is_production
+    renderer: Renderer = (
+        structlog.processors.JSONRenderer() if use_json else structlog.dev.ConsoleRenderer()
+    )
+    sampler = (
+        SuccessSampler(threshold=settings.LOG_SAMPLE_THRESHOLD, rate=settings.LOG_SAMPLE_RATE)
+        if settings.LOG_SAMPLE_RATE > 1
+        else None
+    )
+    if _sink is None:
+        _sink = QueueLogSink(renderer, max_size=settings.LOG_QUEUE_SIZE, sampler=sampler)
+        atexit.register(_sink.close)
+    else:
+        _sink.renderer, _sink.sampler = renderer, sampler
+
+    sink = _sink
+    structlog.configure(
+        processors=[
+            structlog.contextvars.merge_contextvars,
+            structlog.processors.add_log_level,
+            structlog.processors.TimeStamper(fmt="iso", utc=True),
+            structlog.processors.StackInfoRenderer(),
+            structlog.processors.format_exc_info,
+            _to_sink,
+        ],
+        wrapper_class=structlog.make_filtering_bound_logger(
+            logging.getLevelName(settings.LOG_LEVEL.upper())
+        ),
+        logger_factory=lambda *_: QueueLogger(sink),
+        cache_logger_on_first_use=True,
+    )
+    return sink
+
+
+def shutdown_logging(timeout: float = 5.0) -> None:
+    """Write out queued records (application shutdown)."""
+    if _sink is not None:
+        _sink.flush(timeout)
@@ -0,0 +1,167 @@
+# Metrics
+# -------
+# Prometheus metric families and the /metrics exposition.
+#
+# Label children are bound once and kept (per method, per route template,
+# per status, per engine); the request path only does dict lookups on
+# plain strings and ints, never builds label dicts.
+#
+# Multiprocess mode: when PROMETHEUS_MULTIPROC_DIR is set before
+# prometheus_client is imported (gunicorn.conf.py sets it), every worker
+# writes its values to mmap'd files in that directory and a scrape of any
+# worker aggregates all of them. Gauges use `livesum`, so a dead worker's
+# in-flight requests and pool connections drop out once gunicorn's
+# child_exit hook marks it dead.
+
+from __future__ import annotations
+
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from prometheus_client.process_collector import ProcessCollector
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0)
+
+# Any other method is counted as OTHER, keeping label cardinality bounded.
+METHODS = ("GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS")
+OTHER_METHOD = "OTHER"
+
+# Path label for requests that matched no route (404s, slash redirects).
+UNMATCHED_PATH = "<unmatched>"
+
+
+def multiprocess_dir() -> str | None:
+    return os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+
+
+class RouteMetrics:
+    """Pre-bound children for one (method, route template)."""
+
+    __slots__ = ("_duration", "_requests", "_statuses", "method", "path")
+
+    def __init__(self, metrics: HttpMetrics, method: str, path: str) -> None:
+        self.method = method
+        self.path = path
+        self._requests = metrics.requests
+        self._duration = metrics.duration.labels(method, path)
+        self._statuses: dict[int, Counter] = {}
+
+    def observe(self, seconds: float, status_code: int) -> None:
+        self._duration.observe(seconds)
+        counter = self._statuses.get(status_code)
+        if counter is None:
+            counter = self._requests.labels(self.method, self.path, str(status_code))
+            self._statuses[status_code] = counter
+        counter.inc()
+
+
+class HttpMetrics:
+    """Request counters, latency histograms and in-flight gauges."""
+
+    def __init__(
+        self,
+        registry: CollectorRegistry,
+        *,
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> None:
+        self.requests = Counter(
+            "http_requests_total",
+            "HTTP requests by method, route template and status.",
+            ("method", "path", "status"),
+            registry=registry,
+        )
+        self.duration = Histogram(
+            "http_request_duration_seconds",
+            "HTTP request latency by method and route template.",
+            ("method", "path"),
+            buckets=buckets,
+            registry=registry,
+        )
+        self.in_progress = Gauge(
+            "http_requests_in_progress",
+            "HTTP requests being handled, by method.",
+            ("method",),
+            multiprocess_mode="livesum",
+            registry=registry,
+        )
+        self._in_progress = {
+            method: self.in_progress.labels(method) for method in (*METHODS, OTHER_METHOD)
+        }
+        self._routes: dict[str, dict[str, RouteMetrics]] = {
+            method: {} for method in self._in_progress
+        }
+
+    def method_label(self, method: str) -> str:
+        return method if method in self._in_progress else OTHER_METHOD
+
+    def in_progress_for(self, method: str) -> Gauge:
+        """The in-flight gauge child for a (normalized) method."""
+        return self._in_progress[method]
+
+    def route(self, method: str, path: str) -> RouteMetrics:
+        """The children for a (normalized) method and route template, bound on first use."""
+        routes = self._routes[method]
+        route = routes.get(path)
+        if route is None:
+            route = routes[path] = RouteMetrics(self, method, path)
+        return route
+
+
+class PoolMetrics:
+    """Connection pool gauges and checkout wait times, per engine."""
+
+    def __init__(self, registry: CollectorRegistry) -> None:
+        self.checked_out = Gauge(
+            "db_pool_checked_out",
+            "Connections currently checked out of the pool.",
+            ("engine",),
+            multiprocess_mode="livesum",
+            registry=registry,
+        )
+        self.overflow = Gauge(
+            "db_pool_overflow",
+            "Connections open beyond pool_size (up to max_overflow).",
+            ("engine",),
+            multiprocess_mode="livesum",
+            registry=registry,
+        )
+        self.checkout_wait = Histogram(
+            "db_pool_checkout_wait_seconds",
+            "Time spent getting a connection from the pool, including connecting.",
+            ("engine",),
+            buckets=WAIT_BUCKETS,
+            registry=registry,
+        )
+
+
+# ---- Process-wide metrics ----
+
+registry = CollectorRegistry()
+if multiprocess_dir() is None:
+    # Per-process CPU/memory is meaningless once several workers are summed.
+    ProcessCollector(registry=registry)
+
+http_metrics = HttpMetrics(registry)
+pool_metrics = PoolMetrics(registry)
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Exposition body and content type for a scrape.
+
+    In multiprocess mode the values of every worker (live and dead) are read
+    from PROMETHEUS_MULTIPROC_DIR; otherwise this process's registry is used.
+    """
+    if multiprocess_dir() is not None:
+        scrape = CollectorRegistry()
+        multiprocess.MultiProcessCollector(scrape)
+        return generate_latest(scrape), CONTENT_TYPE_LATEST
+    return generate_latest(registry), CONTENT_TYPE_LATEST
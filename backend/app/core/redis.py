@@ -0,0 +1,33 @@
+# Redis Client
+# ------------
+# Process-wide asyncio Redis client built from REDIS_URL.
+# Created lazily on first use and closed on application shutdown.
+
+from __future__ import annotations
+
+from redis.asyncio import Redis
+
+from app.core.config import get_settings
+
+_client: Redis | None = None
+
+
+def get_redis() -> Redis:
+    """Return the shared Redis client, creating it on first call."""
+    global _client
+    if _client is None:
+        settings = get_settings()
+        _client = Redis.from_url(
+            settings.REDIS_URL,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        )
+    return _client
+
+
+async def close_redis() -> None:
+    """Close the shared client's connection pool."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
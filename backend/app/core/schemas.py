@@ -23,6 +23,24 @@ class PaginationMeta(BaseModel):
     per_page: int
     total: int
     total_pages: int
+    total_is_exact: bool = Field(
+        default=True,
+        description=(
+            "False when `total` is not an exact count: a capped total is a lower "
+            "bound, a planner estimate may be too high or too low"
+        ),
+    )
+
+    @classmethod
+    def create(cls, *, total: int, page: int, per_page: int) -> PaginationMeta:
+        return cls(
+            page=page,
+            per_page=per_page,
+            total=total,
+            total_pages=ceil(total / per_page) if per_page > 0 else 0,
+            # Repositories return a TotalCount that knows whether it is exact.
+            total_is_exact=getattr(total, "is_exact", True),
+        )
 
 
 class PaginatedResponse(BaseModel, Generic[T]):
@@ -31,17 +49,38 @@ class PaginatedResponse(BaseModel, Generic[T]):
     data: list[T]
     meta: PaginationMeta
 
+    @classmethod
+    def create(cls, *, data: list[T], total: int, page: int, per_page: int) -> PaginatedResponse[T]:
+        return cls(
+            data=data,
+            meta=PaginationMeta.create(total=total, page=page, per_page=per_page),
+        )
+
+
+class CursorPaginationMeta(BaseModel):
+    """Metadata for keyset (cursor-based) pagination."""
+
+    per_page: int
+    next_cursor: str | None
+    has_more: bool
+
+
+class CursorPaginatedResponse(BaseModel, Generic[T]):
+    """Paginated response envelope for keyset pagination."""
+
+    data: list[T]
+    meta: CursorPaginationMeta
+
     @classmethod
     def create(
-        cls, *, data: list[T], total: int, page: int, per_page: int
-    ) -> PaginatedResponse[T]:
+        cls, *, data: list[T], next_cursor: str | None, per_page: int
+    ) -> CursorPaginatedResponse[T]:
         return cls(
             data=data,
-            meta=PaginationMeta(
-                page=page,
+            meta=CursorPaginationMeta(
                 per_page=per_page,
-                total=total,
-                total_pages=ceil(total / per_page) if per_page > 0 else 0,
+                next_cursor=next_cursor,
+                has_more=next_cursor is not None,
             ),
         )
 
@@ -57,6 +96,19 @@ class PaginationParams(BaseModel):
         return (self.page - 1) * self.per_page
 
 
+class CursorParams(BaseModel):
+    """Keyset pagination switch for listings. Used alongside PaginationParams.
+
+    Present (even empty) selects keyset pagination; `per_page` still comes
+    from PaginationParams.
+    """
+
+    cursor: str | None = Field(
+        default=None,
+        description="Keyset pagination: empty for the first page, then the previous page's meta.next_cursor",
+    )
+
+
 # ---- Response Envelope ----
 
 
@@ -85,4 +137,3 @@ class TimestampSchema(BaseModel):
 
     created_at: datetime
     updated_at: datetime
-
@@ -1,21 +1,42 @@
 # Security Utilities
 # ------------------
-# JWT token creation/validation, password hashing, OAuth2 scheme.
+# JWT token creation/validation (with a per-worker cache of verified
+# tokens), password hashing (sync, or async on a bounded thread pool),
+# OAuth2 scheme, signed pagination cursors.
 
 from __future__ import annotations
 
+import asyncio
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import secrets
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, TypeVar
 
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
+from app.core.cache import LRUCache
 from app.core.config import get_settings
-from app.core.exceptions import TokenExpiredError, TokenInvalidError
+from app.core.exceptions import (
+    InvalidCursorError,
+    PasswordHasherBusyError,
+    TokenExpiredError,
+    TokenInvalidError,
+)
 
 settings = get_settings()
 
+T = TypeVar("T")
+
 # ---- Password Hashing ----
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -31,6 +52,158 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+class PasswordHashPool:
+    """Dedicated thread pool for bcrypt with a bounded backlog.
+
+    bcrypt releases the GIL while hashing, so `workers` threads hash in
+    parallel and the event loop keeps serving other requests. At most
+    `workers + queue_limit` calls are admitted at once; beyond that a call
+    fails fast with PasswordHasherBusyError (503 + Retry-After) instead of
+    queuing behind a login flood. A slot is released when its future is
+    done: a running hash keeps its slot until it finishes, even if the
+    caller gave up, while a queued call is dropped (freeing its slot at
+    once) when its caller is cancelled or `shutdown()` cancels the queue.
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: int = 4,
+        queue_limit: int = 32,
+        retry_after_seconds: int = 1,
+    ) -> None:
+        self.workers = workers
+        self.capacity = workers + queue_limit
+        self.retry_after_seconds = retry_after_seconds
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._rejected = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {"in_flight": self._in_flight, "rejected": self._rejected}
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run `fn(*args)` on the pool, or raise PasswordHasherBusyError when full."""
+        with self._lock:
+            if self._in_flight >= self.capacity:
+                self._rejected += 1
+                raise PasswordHasherBusyError(
+                    headers={"Retry-After": str(self.retry_after_seconds)}
+                )
+            self._in_flight += 1
+        try:
+            future = self._pool().submit(fn, *args)
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def shutdown(self) -> None:
+        """Stop the threads; queued calls are cancelled, running hashes finish.
+
+        The pool restarts on next use.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="password-hash"
+                )
+            return self._executor
+
+    def _release(self, _future: object = None) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+
+password_hash_pool = PasswordHashPool(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    queue_limit=settings.PASSWORD_HASH_QUEUE_LIMIT,
+    retry_after_seconds=settings.PASSWORD_HASH_RETRY_AFTER_SECONDS,
+)
+
+
+async def hash_password_async(password: str) -> str:
+    """hash_password on `password_hash_pool`; use this from request handlers."""
+    return await password_hash_pool.run(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password on `password_hash_pool`; use this from request handlers."""
+    return await password_hash_pool.run(verify_password, plain_password, hashed_password)
+
+
+# ---- Verified Token Cache ----
+
+
+class VerifiedTokenCache:
+    """Bounded per-process memo of access tokens whose signature checked out.
+
+    Keyed by a digest of the token, so raw tokens are not kept in memory and
+    a forged token can only miss. An entry is dropped at the token's `exp`
+    or after `ttl_seconds`, whichever comes first; only successful
+    verifications are stored.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 10_000,
+        ttl_seconds: float = 300.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._clock = clock
+        self._entries = LRUCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return self._entries.stats.snapshot()
+
+    def get(self, token: str) -> dict[str, Any] | None:
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, claims = entry
+        if expires_at <= self._clock():
+            self._entries.delete(key)
+            return None
+        return claims
+
+    def put(self, token: str, claims: dict[str, Any]) -> None:
+        expires_at = claims.get("exp")
+        if isinstance(expires_at, int | float):
+            self._entries.set(self._key(token), (float(expires_at), claims))
+
+    def discard(self, token: str) -> None:
+        self._entries.delete(self._key(token))
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return hashlib.blake2b(token.encode(), digest_size=20).hexdigest()
+
+
+verified_tokens: VerifiedTokenCache | None = (
+    VerifiedTokenCache(
+        max_entries=settings.AUTH_TOKEN_CACHE_MAX_ENTRIES,
+        ttl_seconds=settings.AUTH_TOKEN_CACHE_TTL_SECONDS,
+    )
+    if settings.AUTH_TOKEN_CACHE_ENABLED
+    else None
+)
+
+
 # ---- JWT ----
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
@@ -57,11 +230,19 @@ def create_access_token(
     return jwt.encode(payload, settings.SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
 
 
-def decode_access_token(token: str) -> dict[str, Any]:
+def decode_access_token(token: str, *, use_cache: bool = True) -> dict[str, Any]:
     """Decode and validate a JWT access token.
 
+    Tokens verified before are answered from `verified_tokens` until their
+    `exp` (or the cache TTL); pass `use_cache=False` to always verify.
     Raises TokenExpiredError or TokenInvalidError.
     """
+    cache = verified_tokens if use_cache else None
+    if cache is not None:
+        claims = cache.get(token)
+        if claims is not None:
+            return dict(claims)
+
     try:
         payload = jwt.decode(
             token,
@@ -70,9 +251,68 @@ def decode_access_token(token: str) -> dict[str, Any]:
         )
         if payload.get("type") != "access":
             raise TokenInvalidError("Invalid token type")
-        return payload
     except JWTError as e:
         if "expired" in str(e).lower():
             raise TokenExpiredError() from e
         raise TokenInvalidError() from e
 
+    if cache is not None:
+        cache.put(token, dict(payload))
+    return payload
+
+
+def create_refresh_token() -> str:
+    """Create an opaque refresh token (64 random bytes, base64url).
+
+    Only its digest is stored server-side; see auth.repository.RefreshTokenStore.
+    """
+    return secrets.token_urlsafe(64)
+
+
+# ---- Pagination Cursors ----
+
+# Derived key: cursors and JWTs never share signing material.
+_CURSOR_KEY = hmac.new(settings.SECRET_KEY.encode(), b"pagination-cursor", hashlib.sha256).digest()
+
+
+def _b64encode(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(value: str) -> bytes:
+    return base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+
+
+def _cursor_signature(body: bytes) -> bytes:
+    return hmac.new(_CURSOR_KEY, body, hashlib.sha256).digest()
+
+
+def encode_cursor(payload: dict[str, Any]) -> str:
+    """Serialize a JSON-compatible payload into an opaque, signed cursor token."""
+    body = json.dumps(payload, separators=(",", ":"), sort_keys=True).encode()
+    return f"{_b64encode(body)}.{_b64encode(_cursor_signature(body))}"
+
+
+def decode_cursor(token: str) -> dict[str, Any]:
+    """Verify and decode a cursor produced by encode_cursor.
+
+    Raises InvalidCursorError if the token is malformed or its signature
+    does not match.
+    """
+    try:
+        body_part, signature_part = token.split(".", 1)
+        body = _b64decode(body_part)
+        signature = _b64decode(signature_part)
+    except (ValueError, binascii.Error) as e:
+        raise InvalidCursorError() from e
+
+    if not hmac.compare_digest(signature, _cursor_signature(body)):
+        raise InvalidCursorError()
+
+    try:
+        payload = json.loads(body)
+    except ValueError as e:
+        raise InvalidCursorError() from e
+    if not isinstance(payload, dict):
+        raise InvalidCursorError()
+    return payload
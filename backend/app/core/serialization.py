@@ -0,0 +1,46 @@
+# Row Serialization
+# -----------------
+# Fast path for hot list endpoints: Core rows (or plain mappings) are
+# validated in one call by a cached TypeAdapter and dumped straight to
+# JSON bytes, skipping per-item model_validate and FastAPI's response
+# validation/serialization pass.
+
+from __future__ import annotations
+
+import functools
+from collections.abc import Sequence
+from typing import Any
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import Row
+
+
+@functools.lru_cache(maxsize=256)
+def list_adapter(schema: type[BaseModel]) -> TypeAdapter[list[Any]]:
+    """A TypeAdapter for `list[schema]`, built once per schema."""
+    return TypeAdapter(list[schema])  # type: ignore[valid-type]
+
+
+def rows_to_json(schema: type[BaseModel], rows: Sequence[Any]) -> bytes:
+    """Validate rows against `schema` in bulk and return the JSON array.
+
+    Rows may be Core `Row`s, ORM instances or mappings; values are read by
+    field name, so extra columns (e.g. a window total) are ignored. Core rows
+    are zipped into dicts first: per-attribute `Row` access is far slower.
+    """
+    if rows and isinstance(rows[0], Row):
+        keys = rows[0]._fields
+        rows = [dict(zip(keys, row, strict=True)) for row in rows]
+    adapter = list_adapter(schema)
+    return adapter.dump_json(adapter.validate_python(rows, from_attributes=True))
+
+
+def envelope_json(data: bytes, meta: BaseModel) -> bytes:
+    """Assemble `{"data": ..., "meta": ...}` from a pre-rendered data array."""
+    return b'{"data":' + data + b',"meta":' + meta.model_dump_json().encode() + b"}"
+
+
+def json_response(body: bytes, *, status_code: int = 200) -> Response:
+    """A JSON Response around pre-rendered bytes (no re-encoding)."""
+    return Response(content=body, status_code=status_code, media_type="application/json")
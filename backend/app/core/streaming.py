@@ -0,0 +1,81 @@
+# Streaming Exports
+# -----------------
+# Encode an async stream of Pydantic models as NDJSON or CSV bytes
+# and wrap it in a StreamingResponse. Rows are flushed in small
+# batches so memory stays flat regardless of result size.
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+from collections.abc import AsyncIterable, AsyncIterator
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from app.core.constants import ExportFormat
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+}
+
+ROWS_PER_CHUNK = 500
+
+
+async def ndjson_chunks(
+    items: AsyncIterable[BaseModel], *, rows_per_chunk: int = ROWS_PER_CHUNK
+) -> AsyncIterator[bytes]:
+    """One JSON object per line."""
+    lines: list[str] = []
+    async for item in items:
+        lines.append(json.dumps(item.model_dump(mode="json"), separators=(",", ":")))
+        if len(lines) >= rows_per_chunk:
+            yield ("\n".join(lines) + "\n").encode()
+            lines.clear()
+    if lines:
+        yield ("\n".join(lines) + "\n").encode()
+
+
+async def csv_chunks(
+    items: AsyncIterable[BaseModel],
+    fields: list[str],
+    *,
+    rows_per_chunk: int = ROWS_PER_CHUNK,
+) -> AsyncIterator[bytes]:
+    """Header row followed by one row per item, in `fields` order."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+    rows = 0
+    async for item in items:
+        data = item.model_dump(mode="json")
+        writer.writerow(["" if data[field] is None else data[field] for field in fields])
+        rows += 1
+        if rows >= rows_per_chunk:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+            rows = 0
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def export_response(
+    items: AsyncIterable[BaseModel],
+    schema: type[BaseModel],
+    export_format: ExportFormat,
+    *,
+    filename: str,
+) -> StreamingResponse:
+    """Stream `items` as an attachment in the requested format."""
+    if export_format is ExportFormat.CSV:
+        body = csv_chunks(items, list(schema.model_fields))
+    else:
+        body = ndjson_chunks(items)
+    return StreamingResponse(
+        body,
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{export_format.value}"'},
+    )
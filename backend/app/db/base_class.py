@@ -8,11 +8,11 @@
 #
 # Import each model as its domain is implemented.
 
-from app.domains.projects.models import Project  # noqa: F401
+from app.domains.projects.models import Project, ProjectMember  # noqa: F401
 
 # ---- Future domain models (uncomment as implemented) ----
 # from app.domains.users.models import User  # noqa: F401
-# from app.domains.auth.models import RefreshToken, PasswordResetToken  # noqa: F401
+# from app.domains.auth.models import PasswordResetToken  # noqa: F401
 # from app.domains.sprints.models import Sprint  # noqa: F401
 # from app.domains.tasks.models import Task, Comment, Attachment  # noqa: F401
 # from app.domains.scorecards.models import Scorecard  # noqa: F401
@@ -4,26 +4,125 @@
 
 from __future__ import annotations
 
+import json
+from collections.abc import AsyncIterator, Collection, Iterator, Sequence
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Generic, TypeVar
 from uuid import UUID
 
-from sqlalchemy import Select, func, select
+from sqlalchemy import (
+    ARRAY,
+    ColumnElement,
+    Select,
+    and_,
+    any_,
+    bindparam,
+    delete,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    tuple_,
+    type_coerce,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.elements import UnaryExpression
+from sqlalchemy.types import UserDefinedType
 
-from app.core.exceptions import NotFoundError
+from app.core.constants import CountStrategy
+from app.core.exceptions import InvalidCursorError, NotFoundError
+from app.core.security import decode_cursor, encode_cursor
 from app.db.base import Base
+from app.db.loader import get_loader
+from app.db.routing import read_only
 
 ModelType = TypeVar("ModelType", bound=Base)
 
 
+class TotalCount(int):
+    """A row total that also records whether it is exact.
+
+    Behaves as a plain int; `is_exact` is False for capped or estimated totals.
+    """
+
+    is_exact: bool
+
+    def __new__(cls, value: int, *, is_exact: bool = True) -> TotalCount:
+        instance = super().__new__(cls, value)
+        instance.is_exact = is_exact
+        return instance
+
+
+@dataclass(frozen=True, slots=True)
+class BulkResult(Generic[ModelType]):
+    """Outcome of a chunked bulk write.
+
+    `ids` lists every affected row; `chunk_counts` holds the rows written by
+    each statement. `items` is only populated by `create_many`.
+    """
+
+    ids: list[str] = field(default_factory=list)
+    chunk_counts: list[int] = field(default_factory=list)
+    items: list[ModelType] = field(default_factory=list)
+
+    @property
+    def count(self) -> int:
+        return len(self.ids)
+
+
+class _RawValue(UserDefinedType):
+    """Pass-through type: values travel to and from the driver unprocessed."""
+
+    cache_ok = True
+
+    def get_col_spec(self, **kw: Any) -> str:
+        return "RAW"
+
+
+def id_in(session: AsyncSession, model: type[Base], ids: Sequence[str]) -> ColumnElement[bool]:
+    """Membership test on a model's `id` primary key.
+
+    Postgres gets `id = ANY(:ids)` with a single array bind, so every list
+    length shares one statement (and one prepared plan); other dialects
+    use `IN`.
+    """
+    column = model.id  # type: ignore[attr-defined]
+    if session.get_bind().dialect.name != "postgresql":
+        return column.in_(ids)
+    return column == any_(bindparam("ids", list(ids), type_=ARRAY(column.type)))
+
+
 class BaseRepository(Generic[ModelType]):
     """Generic repository providing standard CRUD operations.
 
     All domain repositories extend this base class.
     Soft-delete-aware by default when the model has a `soft_deleted` attribute.
+
+    `count_strategy` controls how paginated totals are computed; subclasses
+    backed by large tables can override it (and `count_cap`) per repository.
+    Bulk writes are split so no statement exceeds `max_bind_params`.
+
+    Listing and counting methods are `@read_only`: they may be served by a
+    replica until the session writes (see app/db/routing.py).
+
+    When the session carries a BatchLoader (installed by `get_db`), `get()`
+    is batched and memoized per request. Subclasses that narrow
+    `_base_query` beyond the soft-delete filter must also override `get`.
+
+    Listing methods take `fields` to SELECT only those columns (plus the
+    primary key); touching any other attribute on the result raises.
     """
 
+    count_strategy: CountStrategy = CountStrategy.EXACT
+    count_cap: int = 1000
+    # Stay under the driver bind-parameter limit (32767 for asyncpg and SQLite).
+    max_bind_params: int = 32_000
+
     def __init__(self, session: AsyncSession, model: type[ModelType]) -> None:
         self.session = session
         self.model = model
@@ -37,10 +136,38 @@ class BaseRepository(Generic[ModelType]):
             query = query.where(self.model.soft_deleted == False)  # noqa: E712
         return query
 
+    def _project(self, query: Select, fields: Collection[str] | None) -> Select:
+        """Load only the named columns (the primary key is always loaded)."""
+        if not fields:
+            return query
+        columns = self.model.__mapper__.column_attrs
+        attrs = [getattr(self.model, name) for name in sorted(fields) if name in columns]
+        return query.options(load_only(*attrs, raiseload=True))
+
+    def _row_query(self, fields: Collection[str] | None = None) -> Select:
+        """Column-level variant of `_base_query` for Core `Row` results.
+
+        Selects the named columns (all when None) straight from the table,
+        skipping ORM identity-map and instance construction.
+        """
+        table = self.model.__table__
+        names = [column.key for column in table.columns if fields is None or column.key in fields]
+        query = select(*(table.c[name] for name in names))
+        if hasattr(self.model, "soft_deleted"):
+            query = query.where(table.c.soft_deleted == False)  # noqa: E712
+        return query
+
+    def _id_in(self, ids: Sequence[str]) -> ColumnElement[bool]:
+        """Membership test on the primary key (see `id_in`)."""
+        return id_in(self.session, self.model, ids)
+
     # ---- Read ----
 
     async def get(self, id: str) -> ModelType | None:
         """Get a single record by ID. Returns None if not found or soft-deleted."""
+        loader = get_loader(self.session)
+        if loader is not None:
+            return await loader.load(self.model, id)
         query = self._base_query().where(self.model.id == id)
         result = await self.session.execute(query)
         return result.scalar_one_or_none()
@@ -49,83 +176,524 @@ class BaseRepository(Generic[ModelType]):
         """Get a single record by ID. Raises NotFoundError if not found."""
         record = await self.get(id)
         if record is None:
-            name = resource_name or self.model.__tablename__.rstrip("s").capitalize()
-            raise NotFoundError(resource=name, identifier=id)
+            raise self._not_found(id, resource_name)
         return record
 
+    async def get_for_update(self, id: str, resource_name: str | None = None) -> ModelType:
+        """Load a live row fresh from the primary and lock it until commit.
+
+        Bypasses the batch loader and any cache, so callers can compare
+        against the current version (e.g. `If-Match`) before writing.
+        """
+        query = (
+            self._base_query()
+            .where(self.model.id == id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        result = await self.session.execute(query)
+        record = result.scalar_one_or_none()
+        if record is None:
+            raise self._not_found(id, resource_name)
+        return record
+
+    @read_only
+    async def get_many(self, ids: Sequence[str]) -> list[ModelType]:
+        """Live records for `ids` in one query, in no particular order.
+
+        Unknown and soft-deleted IDs are simply absent from the result.
+        """
+        unique = list(dict.fromkeys(ids))
+        if not unique:
+            return []
+        result = await self.session.execute(self._base_query().where(self._id_in(unique)))
+        records = list(result.scalars().all())
+        for record in records:
+            self._prime(record)
+        return records
+
+    @read_only
     async def get_multi(
         self,
         *,
         offset: int = 0,
         limit: int = 20,
         order_by: Any | None = None,
-    ) -> tuple[list[ModelType], int]:
+        count_strategy: CountStrategy | None = None,
+        fields: Collection[str] | None = None,
+    ) -> tuple[list[ModelType], TotalCount]:
         """Get multiple records with pagination. Returns (items, total_count)."""
-        query = self._base_query()
+        return await self._paginate(
+            self._project(self._base_query(), fields),
+            offset=offset,
+            limit=limit,
+            order_by=order_by,
+            count_strategy=count_strategy,
+        )
+
+    @read_only
+    async def get_multi_rows(
+        self,
+        *,
+        offset: int = 0,
+        limit: int = 20,
+        order_by: Any | None = None,
+        count_strategy: CountStrategy | None = None,
+        fields: Collection[str] | None = None,
+    ) -> tuple[list[Any], TotalCount]:
+        """get_multi returning Core rows (attribute access by column name)."""
+        return await self._paginate(
+            self._row_query(fields),
+            offset=offset,
+            limit=limit,
+            order_by=order_by,
+            count_strategy=count_strategy,
+            rows=True,
+        )
+
+    async def exists(self, id: str) -> bool:
+        """Check if a record exists (not soft-deleted)."""
+        query = self._base_query().where(self.model.id == id)
+        return await self._count(query) > 0
 
-        # Count total
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await self.session.execute(count_query)
-        total = total_result.scalar_one()
+    @read_only
+    async def count(self, *, count_strategy: CountStrategy | None = None) -> TotalCount:
+        """Count all active (non-soft-deleted) records."""
+        return await self._total(self._base_query(), count_strategy)
+
+    @read_only
+    async def get_multi_keyset(
+        self,
+        *,
+        cursor: str | None = None,
+        limit: int = 20,
+        order_by: Sequence[Any] | None = None,
+        fields: Collection[str] | None = None,
+    ) -> tuple[list[ModelType], str | None]:
+        """Get one page of records using keyset pagination.
+
+        Returns (items, next_cursor). next_cursor is None on the last page.
+        """
+        return await self._paginate_keyset(
+            self._project(self._base_query(), fields),
+            cursor=cursor,
+            limit=limit,
+            order_by=order_by,
+        )
+
+    # ---- Streaming ----
+
+    async def stream(
+        self,
+        query: Select | None = None,
+        *,
+        order_by: Any | None = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[ModelType]:
+        """Yield every row of `query` (default: all live rows) from a server-side cursor.
 
-        # Apply ordering
+        Rows are fetched `batch_size` at a time, so memory stays flat. The
+        session must stay open while iterating; inside a request, use a
+        session from `get_streaming_db`.
+        """
+        query = self._base_query() if query is None else query
         if order_by is not None:
             query = query.order_by(order_by)
+        elif hasattr(self.model, "created_at"):
+            query = query.order_by(self.model.created_at.desc(), self.model.id.desc())
+        result = await self.session.stream_scalars(query.execution_options(yield_per=batch_size))
+        async for instance in result:
+            yield instance
+
+    # ---- Pagination Helpers ----
+
+    async def _count(self, query: Select) -> int:
+        """Count the rows matched by a query."""
+        count_query = select(func.count()).select_from(query.order_by(None).subquery())
+        result = await self.session.execute(count_query)
+        return result.scalar_one()
+
+    async def _capped_count(self, query: Select, cap: int) -> TotalCount:
+        """Count at most `cap + 1` rows; anything beyond the cap is reported as "cap+"."""
+        limited = (
+            query.order_by(None)
+            .with_only_columns(literal(1), maintain_column_froms=True)
+            .limit(cap + 1)
+        )
+        count = await self._count(limited)
+        if count > cap:
+            return TotalCount(cap, is_exact=False)
+        return TotalCount(count)
+
+    async def _estimated_count(self, query: Select) -> TotalCount:
+        """Use the Postgres planner's row estimate for a query.
+
+        The estimate is derived from `pg_class.reltuples` and column
+        statistics, so it costs a plan rather than a scan. Small estimates
+        are unreliable and cheap to verify, so anything under `count_cap`
+        is counted exactly. Other dialects always count exactly.
+        """
+        bind = self.session.get_bind()
+        if bind.dialect.name != "postgresql":
+            return TotalCount(await self._count(query))
+
+        compiled = query.order_by(None).compile(
+            dialect=bind.dialect,
+            compile_kwargs={"literal_binds": True},
+        )
+        connection = await self.session.connection()
+        result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}")
+        plan = result.scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        estimate = int(plan[0]["Plan"]["Plan Rows"])
+
+        if estimate < self.count_cap:
+            return TotalCount(await self._count(query))
+        return TotalCount(estimate, is_exact=False)
+
+    async def _total(self, query: Select, count_strategy: CountStrategy | None) -> TotalCount:
+        """Compute a total for `query` using the given (or repository) strategy."""
+        strategy = count_strategy or self.count_strategy
+        if strategy is CountStrategy.CAPPED:
+            return await self._capped_count(query, self.count_cap)
+        if strategy is CountStrategy.ESTIMATED:
+            return await self._estimated_count(query)
+        return TotalCount(await self._count(query))
+
+    async def _paginate(
+        self,
+        query: Select,
+        *,
+        offset: int = 0,
+        limit: int = 20,
+        order_by: Any | None = None,
+        count_strategy: CountStrategy | None = None,
+        rows: bool = False,
+    ) -> tuple[list[Any], TotalCount]:
+        """Fetch one page of a query together with its total.
+
+        With the EXACT strategy the total is computed by a `count(*) OVER ()`
+        window column, which Postgres evaluates over the filtered set before
+        LIMIT/OFFSET apply, so page and total come back in one round trip.
+        An empty page carries no window value, so the total falls back to a
+        separate count only when the offset points past the last row.
+
+        CAPPED and ESTIMATED avoid scanning the whole filtered set: the page
+        is fetched on its own and the total comes from a bounded count or
+        the planner estimate.
+
+        With `rows=True` the items are the Core `Row`s of a column query
+        (see `_row_query`) rather than ORM instances.
+        """
+        strategy = count_strategy or self.count_strategy
+
+        if isinstance(order_by, (list, tuple)):
+            query = query.order_by(*order_by)
+        elif order_by is not None:
+            query = query.order_by(order_by)
         elif hasattr(self.model, "created_at"):
             query = query.order_by(self.model.created_at.desc())
 
-        # Apply pagination
-        query = query.offset(offset).limit(limit)
-        result = await self.session.execute(query)
-        items = list(result.scalars().all())
+        if strategy is not CountStrategy.EXACT:
+            result = await self.session.execute(query.offset(offset).limit(limit))
+            items = list(result.all() if rows else result.scalars().all())
+            return items, await self._total(query, strategy)
 
-        return items, total
+        windowed = (
+            query.add_columns(func.count().over().label("_total")).offset(offset).limit(limit)
+        )
+        result = await self.session.execute(windowed)
+        page = result.all()
 
-    async def exists(self, id: str) -> bool:
-        """Check if a record exists (not soft-deleted)."""
-        query = self._base_query().where(self.model.id == id)
-        count_query = select(func.count()).select_from(query.subquery())
-        result = await self.session.execute(count_query)
-        return result.scalar_one() > 0
+        if page:
+            # Core rows keep the trailing _total column; readers go by name.
+            items = list(page) if rows else [row[0] for row in page]
+            return items, TotalCount(page[0][-1])
+        if offset > 0:
+            return [], TotalCount(await self._count(query))
+        return [], TotalCount(0)
 
-    async def count(self) -> int:
-        """Count all active (non-soft-deleted) records."""
-        query = select(func.count()).select_from(self._base_query().subquery())
+    async def _paginate_keyset(
+        self,
+        query: Select,
+        *,
+        cursor: str | None = None,
+        limit: int = 20,
+        order_by: Sequence[Any] | None = None,
+    ) -> tuple[list[ModelType], str | None]:
+        """Fetch the page that follows `cursor` under a stable ordering.
+
+        Instead of skipping rows with OFFSET, the query seeks directly past
+        the last row of the previous page, so every page costs the same
+        index range scan. The ordering defaults to (created_at DESC, id DESC);
+        `id` is appended to any other ordering so positions are unique.
+
+        Key values are read and compared in the database's stored form,
+        bypassing column type processing, so the seek predicate never
+        disagrees with how the driver renders the same value (e.g. SQLite
+        timestamps with and without fractional seconds). Cursors are signed,
+        so a client cannot forge positions or replay a cursor under another
+        ordering.
+        """
+        keys = self._keyset_columns(order_by)
+        signature = [f"{column.key}:{'d' if descending else 'a'}" for column, descending in keys]
+        raw_keys = [(type_coerce(column, _RawValue()), descending) for column, descending in keys]
+        raw_labels = [column.label(f"_k{i}") for i, (column, _) in enumerate(raw_keys)]
+
+        if cursor:
+            payload = decode_cursor(cursor)
+            if payload.get("o") != signature or len(payload.get("k", [])) != len(keys):
+                raise InvalidCursorError()
+            values = [self._load_cursor_value(raw) for raw in payload["k"]]
+            query = query.where(self._keyset_predicate(raw_keys, values))
+
+        query = (
+            query.add_columns(*raw_labels)
+            .order_by(
+                *(column.desc() if descending else column.asc() for column, descending in keys)
+            )
+            .limit(limit + 1)
+        )
         result = await self.session.execute(query)
-        return result.scalar_one()
+        rows = result.all()
+
+        if len(rows) <= limit:
+            return [row[0] for row in rows], None
+
+        rows = rows[:limit]
+        next_cursor = encode_cursor(
+            {
+                "o": signature,
+                "k": [self._dump_cursor_value(value) for value in rows[-1][1:]],
+            }
+        )
+        return [row[0] for row in rows], next_cursor
+
+    def _keyset_columns(self, order_by: Sequence[Any] | None) -> list[tuple[Any, bool]]:
+        """Normalize an ordering into unique (column, descending) pairs."""
+        if order_by is None:
+            if hasattr(self.model, "created_at"):
+                order_by = (self.model.created_at.desc(),)
+            else:
+                order_by = ()
+
+        keys: list[tuple[Any, bool]] = []
+        for clause in order_by:
+            if isinstance(clause, UnaryExpression) and clause.modifier in (
+                operators.desc_op,
+                operators.asc_op,
+            ):
+                keys.append((clause.element, clause.modifier is operators.desc_op))
+            else:
+                keys.append((clause, False))
+
+        # The primary key breaks ties so no row can straddle a page boundary.
+        pk = self.model.id.expression
+        if not any(column.compare(pk) for column, _ in keys):
+            keys.append((pk, keys[-1][1] if keys else False))
+        return keys
+
+    @staticmethod
+    def _keyset_predicate(keys: list[tuple[Any, bool]], values: list[Any]) -> ColumnElement[bool]:
+        """Build the "rows after this position" condition for a keyset."""
+        columns = [column for column, _ in keys]
+        params = [literal(value, _RawValue()) for value in values]
+        directions = {descending for _, descending in keys}
+
+        if len(directions) == 1:
+            descending = directions.pop()
+            if len(columns) == 1:
+                return columns[0] < params[0] if descending else columns[0] > params[0]
+            left, right = tuple_(*columns), tuple_(*params)
+            return left < right if descending else left > right
+
+        # Mixed directions cannot use a row comparison; expand it instead.
+        clauses = []
+        for i, (column, descending) in enumerate(keys):
+            ties = [columns[j] == params[j] for j in range(i)]
+            step = column < params[i] if descending else column > params[i]
+            clauses.append(and_(*ties, step))
+        return or_(*clauses)
+
+    @staticmethod
+    def _dump_cursor_value(value: Any) -> Any:
+        """Tag driver-native values that JSON cannot carry as-is."""
+        if isinstance(value, datetime):
+            return {"dt": value.isoformat()}
+        if isinstance(value, UUID):
+            return {"uuid": str(value)}
+        return value
+
+    @staticmethod
+    def _load_cursor_value(raw: Any) -> Any:
+        """Reverse _dump_cursor_value."""
+        if not isinstance(raw, dict):
+            return raw
+        try:
+            if set(raw) == {"dt"}:
+                return datetime.fromisoformat(raw["dt"])
+            if set(raw) == {"uuid"}:
+                return UUID(raw["uuid"])
+        except (TypeError, ValueError) as e:
+            raise InvalidCursorError() from e
+        raise InvalidCursorError()
 
     # ---- Write ----
+    # Each mutation is a single INSERT/UPDATE/DELETE ... RETURNING statement;
+    # the returned row populates the ORM instance, so no flush+refresh SELECT.
 
     async def create(self, data: dict[str, Any]) -> ModelType:
         """Create a new record."""
-        instance = self.model(**data)
-        self.session.add(instance)
-        await self.session.flush()
-        await self.session.refresh(instance)
+        stmt = insert(self.model).values(**self._column_values(data)).returning(self.model)
+        result = await self.session.execute(stmt)
+        instance = result.scalar_one()
+        self._prime(instance)
         return instance
 
     async def update(self, id: str, data: dict[str, Any]) -> ModelType:
         """Update an existing record. Raises NotFoundError if not found."""
-        instance = await self.get_or_raise(id)
-        for key, value in data.items():
-            if hasattr(instance, key):
-                setattr(instance, key, value)
-        await self.session.flush()
-        await self.session.refresh(instance)
-        return instance
+        values = self._column_values(data)
+        if not values:
+            return await self.get_or_raise(id)
+        return await self._update_returning(id, values)
 
     async def soft_delete(self, id: str) -> ModelType:
         """Soft-delete a record. Raises NotFoundError if not found."""
-        instance = await self.get_or_raise(id)
-        instance.soft_deleted = True  # type: ignore[attr-defined]
-        instance.deleted_at = datetime.now(timezone.utc)  # type: ignore[attr-defined]
-        await self.session.flush()
-        await self.session.refresh(instance)
-        return instance
+        return await self._update_returning(
+            id, {"soft_deleted": True, "deleted_at": datetime.now(timezone.utc)}
+        )
 
     async def hard_delete(self, id: str) -> None:
         """Hard-delete a record. Use only for non-audited entities."""
-        instance = await self.get_or_raise(id)
-        await self.session.delete(instance)
-        await self.session.flush()
+        stmt = delete(self.model).where(self.model.id == id).returning(self.model.id)
+        result = await self.session.execute(stmt)
+        self._forget([id])
+        if result.scalar_one_or_none() is None:
+            raise self._not_found(id)
+
+    # ---- Bulk Write ----
+
+    async def create_many(self, rows: Sequence[dict[str, Any]]) -> BulkResult[ModelType]:
+        """Insert many records with multi-row INSERT ... RETURNING, chunked."""
+        values = [self._column_values(row) for row in rows]
+        if not values:
+            return BulkResult()
+        width = max(len(self.model.__table__.columns), 1)
+        items: list[ModelType] = []
+        chunk_counts: list[int] = []
+        for chunk in self._chunks(values, self.max_bind_params // width):
+            stmt = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+            created = list((await self.session.scalars(stmt, chunk)).all())
+            for instance in created:
+                self._prime(instance)
+            items.extend(created)
+            chunk_counts.append(len(created))
+        return BulkResult(ids=[item.id for item in items], chunk_counts=chunk_counts, items=items)
+
+    async def update_many(
+        self,
+        data: dict[str, Any],
+        *,
+        ids: Sequence[str] | None = None,
+        filters: dict[str, Any] | None = None,
+    ) -> BulkResult[ModelType]:
+        """Set-based UPDATE of live records matching `ids` and/or column `filters`.
+
+        At least one selector is required; when both are given a row must match
+        both. Id lists are chunked to respect `max_bind_params`.
+        """
+        if ids is None and not filters:
+            raise ValueError("update_many requires ids or filters")
+        values = self._column_values(data)
+        if not values:
+            return BulkResult()
+
+        criteria = [getattr(self.model, key) == value for key, value in (filters or {}).items()]
+        if hasattr(self.model, "soft_deleted"):
+            criteria.append(self.model.soft_deleted == False)  # noqa: E712
+
+        if ids is None:
+            updated = await self._update_where(values, criteria)
+            return BulkResult(ids=updated, chunk_counts=[len(updated)])
+
+        affected: list[str] = []
+        chunk_counts: list[int] = []
+        size = self.max_bind_params - len(values) - len(criteria)
+        for chunk in self._chunks(list(dict.fromkeys(ids)), size):
+            updated = await self._update_where(values, [*criteria, self.model.id.in_(chunk)])
+            affected.extend(updated)
+            chunk_counts.append(len(updated))
+        return BulkResult(ids=affected, chunk_counts=chunk_counts)
+
+    async def soft_delete_many(
+        self,
+        *,
+        ids: Sequence[str] | None = None,
+        filters: dict[str, Any] | None = None,
+    ) -> BulkResult[ModelType]:
+        """Soft-delete live records matching `ids` and/or column `filters`."""
+        return await self.update_many(
+            {"soft_deleted": True, "deleted_at": datetime.now(timezone.utc)},
+            ids=ids,
+            filters=filters,
+        )
+
+    # ---- Write Helpers ----
+
+    def _column_values(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Keep only keys that map to a column attribute on the model."""
+        columns = self.model.__mapper__.column_attrs.keys()
+        return {key: value for key, value in data.items() if key in columns}
+
+    async def _update_returning(self, id: str, values: dict[str, Any]) -> ModelType:
+        """UPDATE a live row by id and return it, refreshing any loaded instance."""
+        stmt = update(self.model).where(self.model.id == id)
+        if hasattr(self.model, "soft_deleted"):
+            stmt = stmt.where(self.model.soft_deleted == False)  # noqa: E712
+        stmt = (
+            stmt.values(**values)
+            .returning(self.model)
+            .execution_options(populate_existing=True, synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        instance = result.scalar_one_or_none()
+        if instance is None:
+            self._forget([id])
+            raise self._not_found(id)
+        if getattr(instance, "soft_deleted", False):
+            self._forget([id])
+        else:
+            self._prime(instance)
+        return instance
+
+    async def _update_where(
+        self, values: dict[str, Any], criteria: list[ColumnElement[bool]]
+    ) -> list[str]:
+        """Run one UPDATE ... RETURNING id; loaded instances are synchronized."""
+        stmt = update(self.model).where(*criteria).values(**values).returning(self.model.id)
+        result = await self.session.execute(stmt)
+        ids = list(result.scalars().all())
+        self._forget(ids)
+        return ids
+
+    def _prime(self, instance: ModelType) -> None:
+        loader = get_loader(self.session)
+        if loader is not None:
+            loader.prime(instance)
+
+    def _forget(self, ids: Sequence[str]) -> None:
+        """Drop memoized rows whose state a write just changed."""
+        loader = get_loader(self.session)
+        if loader is not None:
+            loader.clear(self.model, ids)
+
+    @staticmethod
+    def _chunks(items: list[Any], size: int) -> Iterator[list[Any]]:
+        size = max(size, 1)
+        for start in range(0, len(items), size):
+            yield items[start : start + size]
 
+    def _not_found(self, id: str, resource_name: str | None = None) -> NotFoundError:
+        name = resource_name or self.model.__tablename__.rstrip("s").capitalize()
+        return NotFoundError(resource=name, identifier=id)
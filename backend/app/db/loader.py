@@ -0,0 +1,121 @@
+# Batch Loader
+# ------------
+# Request-scoped DataLoader for primary-key lookups.
+# Coalesces get-by-id calls made in the same event-loop tick into a
+# single primary-key lookup per model and memoizes the results.
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+from typing import Any, TypeVar
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.base import Base
+
+ModelType = TypeVar("ModelType", bound=Base)
+
+LOADER_KEY = "batch_loader"
+
+
+class BatchLoader:
+    """Batches and memoizes live-row lookups by ID for one session.
+
+    `load()` registers the ID and schedules a dispatch with `call_soon`, so
+    every lookup issued before the loop regains control (e.g. from
+    `asyncio.gather`) lands in the same query. Results, including misses,
+    are kept in a per-request identity map until `clear()` is called.
+
+    Rows are filtered like `BaseRepository._base_query`: soft-deleted records
+    resolve to None.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+        self._memo: dict[tuple[type[Base], str], Any] = {}
+        self._pending: dict[type[Base], dict[str, asyncio.Future[Any]]] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+        # AsyncSession does not allow concurrent statements; batches take turns.
+        self._lock = asyncio.Lock()
+
+    # ---- Public API ----
+
+    async def load(self, model: type[ModelType], pk: str) -> ModelType | None:
+        """Return the live row with this ID, or None."""
+        key = (model, pk)
+        if key in self._memo:
+            return self._memo[key]
+
+        loop = asyncio.get_running_loop()
+        pending = self._pending.get(model)
+        if pending is None:
+            pending = self._pending[model] = {}
+            loop.call_soon(self._dispatch, model)
+        future = pending.get(pk)
+        if future is None:
+            future = pending[pk] = loop.create_future()
+        # Shield so one cancelled caller does not cancel a lookup others share.
+        return await asyncio.shield(future)
+
+    async def load_many(self, model: type[ModelType], ids: Sequence[str]) -> list[ModelType | None]:
+        """Load several IDs in one batch, preserving input order."""
+        return list(await asyncio.gather(*(self.load(model, pk) for pk in ids)))
+
+    def prime(self, instance: Base) -> None:
+        """Seed the identity map with a freshly written instance."""
+        self._memo[(type(instance), instance.id)] = instance  # type: ignore[attr-defined]
+
+    def clear(self, model: type[Base], ids: Sequence[str] | None = None) -> None:
+        """Forget memoized rows for `ids`, or every row of `model`."""
+        if ids is None:
+            self._memo = {key: value for key, value in self._memo.items() if key[0] is not model}
+            return
+        for pk in ids:
+            self._memo.pop((model, pk), None)
+
+    # ---- Dispatch (Private) ----
+
+    def _dispatch(self, model: type[Base]) -> None:
+        batch = self._pending.pop(model, {})
+        if not batch:
+            return
+        task = asyncio.get_running_loop().create_task(self._fetch(model, batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _fetch(self, model: type[Base], batch: dict[str, asyncio.Future[Any]]) -> None:
+        # Deferred: base_repository imports this module.
+        from app.db.base_repository import id_in
+
+        query = select(model).where(id_in(self.session, model, list(batch)))
+        if hasattr(model, "soft_deleted"):
+            query = query.where(model.soft_deleted == False)  # noqa: E712
+        try:
+            async with self._lock:
+                result = await self.session.execute(query)
+                rows = {row.id: row for row in result.scalars().all()}
+        except Exception as exc:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for pk, future in batch.items():
+            instance = rows.get(pk)
+            self._memo[(model, pk)] = instance
+            if not future.done():
+                future.set_result(instance)
+
+
+def get_loader(session: AsyncSession) -> BatchLoader | None:
+    """Return the loader installed on this session by `get_db`, if any."""
+    return session.info.get(LOADER_KEY)
+
+
+def install_loader(session: AsyncSession) -> BatchLoader:
+    """Attach a fresh BatchLoader to the session."""
+    loader = BatchLoader(session)
+    session.info[LOADER_KEY] = loader
+    return loader
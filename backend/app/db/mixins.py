@@ -3,9 +3,10 @@
 # Reusable SQLAlchemy column mixins for domain models.
 
 from datetime import datetime
+from typing import Any
 from uuid import uuid4
 
-from sqlalchemy import Boolean, DateTime, func
+from sqlalchemy import Boolean, DateTime, Index, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -18,6 +19,9 @@ class UUIDPrimaryKeyMixin:
         primary_key=True,
         default=lambda: str(uuid4()),
         server_default=func.gen_random_uuid(),
+        # The server default would otherwise stop multi-row INSERT ... RETURNING
+        # from batching rows; the client-side default keeps their order known.
+        insert_sentinel=True,
     )
 
 
@@ -38,14 +42,17 @@ class TimestampMixin:
 
 
 class SoftDeleteMixin:
-    """Provides soft delete support via a boolean flag and timestamp."""
+    """Provides soft delete support via a boolean flag and timestamp.
+
+    The flag is not indexed on its own (it is almost always false); declare
+    partial indexes over live rows with `live_index()` in `__table_args__`.
+    """
 
     soft_deleted: Mapped[bool] = mapped_column(
         Boolean,
         nullable=False,
         default=False,
         server_default="false",
-        index=True,
     )
     deleted_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True),
@@ -57,3 +64,17 @@ class SoftDeleteMixin:
     def is_deleted(self) -> bool:
         return self.soft_deleted
 
+    @staticmethod
+    def live_index(name: str, *columns: str, **kwargs: Any) -> Index:
+        """Partial index restricted to rows where `soft_deleted = false`.
+
+        The predicate matches what `BaseRepository._base_query` renders per
+        dialect, so the planner can use the index for every live-row query.
+        """
+        return Index(
+            name,
+            *columns,
+            postgresql_where=text("soft_deleted = false"),
+            sqlite_where=text("soft_deleted = 0"),
+            **kwargs,
+        )
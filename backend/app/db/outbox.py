@@ -0,0 +1,29 @@
+# Session Outbox
+# --------------
+# Domain events recorded during a unit of work.
+# Repositories record events as they write; `get_db` publishes them
+# to the event bus only after the transaction commits, so handlers
+# (e.g. cache invalidation) never observe uncommitted state.
+
+from __future__ import annotations
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.events import DomainEvent
+
+EVENTS_KEY = "pending_events"
+
+
+def record_event(session: AsyncSession, event: DomainEvent) -> None:
+    """Queue an event to publish once the session commits."""
+    session.info.setdefault(EVENTS_KEY, []).append(event)
+
+
+def take_events(session: AsyncSession) -> list[DomainEvent]:
+    """Remove and return the events queued on this session."""
+    return session.info.pop(EVENTS_KEY, [])
+
+
+def has_pending_events(session: AsyncSession) -> bool:
+    """True once the session has recorded an uncommitted event."""
+    return bool(session.info.get(EVENTS_KEY))
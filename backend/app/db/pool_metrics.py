@@ -0,0 +1,83 @@
+# Pool Metrics
+# ------------
+# Connection pool gauges (checked out, overflow) and checkout wait times,
+# exported through app/core/metrics.py.
+#
+# InstrumentedAsyncQueuePool updates the gauges right after each checkout
+# and return, instead of a collector reading the pool at scrape time: in
+# multiprocess mode the scraped worker can only see its own pool, while
+# gauge values written by every worker are aggregated. (The pool's
+# `checkin` event is no substitute: it fires before the connection is
+# back in the queue.)
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from prometheus_client import Gauge, Histogram
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core.metrics import PoolMetrics, pool_metrics
+
+
+@dataclass(slots=True)
+class PoolGauges:
+    """Metric children bound to one engine's label."""
+
+    checked_out: Gauge
+    overflow: Gauge
+    checkout_wait: Histogram
+
+    def report(self, pool: AsyncAdaptedQueuePool) -> None:
+        self.checked_out.set(pool.checkedout())
+        self.overflow.set(max(0, pool.overflow()))
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that reports to PoolGauges once instrumented."""
+
+    gauges: PoolGauges | None = None
+
+    def _do_get(self) -> Any:
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            # Waiting for a free connection, or opening a new one.
+            if self.gauges is not None:
+                self.gauges.checkout_wait.observe(time.perf_counter() - start)
+                self.gauges.report(self)
+
+    def _do_return_conn(self, record: Any) -> None:
+        super()._do_return_conn(record)
+        if self.gauges is not None:
+            self.gauges.report(self)
+
+    def recreate(self) -> InstrumentedAsyncQueuePool:
+        # engine.dispose() swaps in a fresh pool; keep reporting from it.
+        pool = super().recreate()
+        pool.gauges = self.gauges
+        return pool  # type: ignore[return-value]
+
+
+def instrument_pool(
+    engine: AsyncEngine,
+    name: str,
+    metrics: PoolMetrics = pool_metrics,
+) -> None:
+    """Export an engine's pool metrics under `engine=name`.
+
+    The engine must be created with `poolclass=InstrumentedAsyncQueuePool`.
+    """
+    pool = engine.sync_engine.pool
+    if not isinstance(pool, InstrumentedAsyncQueuePool):
+        raise TypeError(f"engine {name!r} does not use InstrumentedAsyncQueuePool")
+    pool.gauges = PoolGauges(
+        checked_out=metrics.checked_out.labels(name),
+        overflow=metrics.overflow.labels(name),
+        checkout_wait=metrics.checkout_wait.labels(name),
+    )
+    pool.gauges.report(pool)
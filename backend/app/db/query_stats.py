@@ -0,0 +1,88 @@
+# Query Statistics
+# ----------------
+# Per-request SQL statement counting and timing.
+# Engine cursor events add to the QueryStats bound to the current context;
+# QueryStatsMiddleware opens one per request.
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+_TIMER_KEY = "query_stats_started"
+
+
+@dataclass(slots=True)
+class QueryStats:
+    """Statement count and cumulative DB time for one request."""
+
+    count: int = 0
+    duration_ms: float = 0.0
+    budget: int | None = None
+
+    @property
+    def over_budget(self) -> bool:
+        return self.budget is not None and self.count > self.budget
+
+
+_current: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def current_query_stats() -> QueryStats | None:
+    """Stats for the request in progress, or None outside a tracked scope."""
+    return _current.get()
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Count statements executed inside the block.
+
+    Usable directly in tests: `with track_queries() as stats: ...`.
+    """
+    stats = QueryStats()
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+# ---- Engine instrumentation ----
+
+
+def _before_cursor_execute(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+    if _current.get() is not None:
+        conn.info.setdefault(_TIMER_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+    stats = _current.get()
+    timers = conn.info.get(_TIMER_KEY)
+    if stats is None or not timers:
+        return
+    stats.count += 1
+    stats.duration_ms += (time.perf_counter() - timers.pop()) * 1000
+
+
+def _handle_error(context: Any) -> None:
+    # A failed statement never reaches after_cursor_execute; count it here so
+    # its start time does not stay on the (pooled) connection.
+    if context.connection is not None:
+        _after_cursor_execute(context.connection, None, context.statement)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Attach statement counting to an engine (idempotent)."""
+    sync_engine = engine.sync_engine
+    if event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
@@ -0,0 +1,167 @@
+# Read Replica Routing
+# --------------------
+# Session subclass that sends read-only work to replica engines,
+# with read-your-writes stickiness to the primary after a write.
+
+from __future__ import annotations
+
+import functools
+import random
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Sequence
+from contextvars import ContextVar
+from typing import Any, ParamSpec, TypeVar
+
+from sqlalchemy import Engine, event
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import ORMExecuteState, Session
+from sqlalchemy.sql.dml import UpdateBase
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+# session.info keys
+READ_ONLY_KEY = "read_only"
+WROTE_KEY = "wrote"
+STICKY_KEY = "sticky_key"
+
+_read_only_scope: ContextVar[bool] = ContextVar("read_only_scope", default=False)
+
+
+# ---- Read-your-writes ----
+
+
+class ReadYourWritesTracker:
+    """Remembers which callers wrote recently so their reads stay on the primary.
+
+    State is per process; with several workers a caller may briefly hit a
+    replica from a worker that did not see the write, bounded by replica lag.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float,
+        *,
+        max_entries: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.window_seconds = window_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._until: OrderedDict[str, float] = OrderedDict()
+
+    def mark(self, key: str | None) -> None:
+        """Pin `key` to the primary for the next `window_seconds`."""
+        if key is None or self.window_seconds <= 0:
+            return
+        self._until[key] = self._clock() + self.window_seconds
+        self._until.move_to_end(key)
+        while len(self._until) > self.max_entries:
+            self._until.popitem(last=False)
+
+    def is_sticky(self, key: str | None) -> bool:
+        if key is None:
+            return False
+        until = self._until.get(key)
+        if until is None:
+            return False
+        if until <= self._clock():
+            del self._until[key]
+            return False
+        return True
+
+
+# ---- Read-only scope ----
+
+
+def read_only(fn: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+    """Mark an async repository method as safe to serve from a replica.
+
+    Applies only until the session has written; after that every statement
+    in the session goes to the primary.
+    """
+
+    @functools.wraps(fn)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        token = _read_only_scope.set(True)
+        try:
+            return await fn(*args, **kwargs)
+        finally:
+            _read_only_scope.reset(token)
+
+    return wrapper
+
+
+# ---- Routing session ----
+
+
+class RoutingSession(Session):
+    """Session that picks the primary or a replica per statement.
+
+    A statement goes to a replica only when all of these hold:
+      - replicas are configured,
+      - the session is marked read-only (`info["read_only"]`, set by
+        `get_db` for GET/HEAD) or the call is inside a `@read_only` method,
+      - it is not a flush or an INSERT/UPDATE/DELETE,
+      - the session has not written yet,
+      - the caller (`info["sticky_key"]`) has not written within the
+        read-your-writes window.
+
+    Read-only sessions run on autocommit connections (see `get_db`), so they
+    refuse to write rather than commit each statement on its own.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        replicas: Sequence[AsyncEngine | Engine] = (),
+        tracker: ReadYourWritesTracker | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.replicas = [
+            engine.sync_engine if isinstance(engine, AsyncEngine) else engine for engine in replicas
+        ]
+        self.tracker = tracker
+
+    def get_bind(self, mapper: Any = None, clause: Any = None, **kw: Any) -> Any:
+        if self._use_replica(clause):
+            return random.choice(self.replicas)
+        return super().get_bind(mapper, clause=clause, **kw)
+
+    def _use_replica(self, clause: Any) -> bool:
+        if not self.replicas or self._flushing or self.info.get(WROTE_KEY):
+            return False
+        if isinstance(clause, UpdateBase):
+            return False
+        if not (self.info.get(READ_ONLY_KEY) or _read_only_scope.get()):
+            return False
+        sticky_key = self.info.get(STICKY_KEY)
+        if callable(sticky_key):
+            sticky_key = sticky_key()
+        return not (self.tracker is not None and self.tracker.is_sticky(sticky_key))
+
+
+def _reject_write(session: Session) -> None:
+    if session.info.get(READ_ONLY_KEY):
+        raise InvalidRequestError("Read-only session cannot write; use a non-GET route")
+
+
+@event.listens_for(RoutingSession, "do_orm_execute")
+def _record_dml(state: ORMExecuteState) -> None:
+    if state.is_insert or state.is_update or state.is_delete:
+        _reject_write(state.session)
+        state.session.info[WROTE_KEY] = True
+
+
+@event.listens_for(RoutingSession, "before_flush")
+def _check_flush(session: Session, flush_context: Any, instances: Any) -> None:
+    if session.new or session.dirty or session.deleted:
+        _reject_write(session)
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _record_flush(session: Session, flush_context: Any) -> None:
+    session.info[WROTE_KEY] = True
@@ -1,43 +1,140 @@
 # Database Session
 # ----------------
 # AsyncSession factory and get_db dependency.
+# Reads may be routed to replica engines (see app/db/routing.py).
 
 from collections.abc import AsyncGenerator
+from typing import Any
 
+from fastapi import Request
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.core.config import get_settings
+from app.core.event_bus import event_bus
+from app.db.loader import install_loader
+from app.db.outbox import take_events
+from app.db.pool_metrics import InstrumentedAsyncQueuePool, instrument_pool
+from app.db.query_stats import instrument_engine
+from app.db.routing import (
+    READ_ONLY_KEY,
+    STICKY_KEY,
+    WROTE_KEY,
+    ReadYourWritesTracker,
+    RoutingSession,
+)
 
 settings = get_settings()
 
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=settings.DEBUG,
-    pool_size=5 if not settings.is_production else 20,
-    max_overflow=5 if not settings.is_production else 10,
-    pool_timeout=30 if not settings.is_production else 10,
-    pool_recycle=3600 if not settings.is_production else 1800,
-    pool_pre_ping=True,
-)
+
+def _engine_options() -> dict[str, Any]:
+    return {
+        "echo": settings.DEBUG,
+        "pool_size": 5 if not settings.is_production else 20,
+        "max_overflow": 5 if not settings.is_production else 10,
+        "pool_timeout": 30 if not settings.is_production else 10,
+        "pool_recycle": 3600 if not settings.is_production else 1800,
+        "pool_pre_ping": True,
+        "poolclass": InstrumentedAsyncQueuePool,
+    }
+
+
+engine = create_async_engine(settings.DATABASE_URL, **_engine_options())
+
+replica_engines = [
+    create_async_engine(url, **_engine_options()) for url in settings.DATABASE_REPLICA_URLS
+]
+
+for _engine in (engine, *replica_engines):
+    instrument_engine(_engine)
+
+instrument_pool(engine, "primary")
+for _index, _replica in enumerate(replica_engines):
+    instrument_pool(_replica, f"replica-{_index}")
+
+read_your_writes = ReadYourWritesTracker(settings.READ_YOUR_WRITES_SECONDS)
 
 async_session_factory = async_sessionmaker(
     engine,
     class_=AsyncSession,
+    sync_session_class=RoutingSession,
     expire_on_commit=False,
+    replicas=replica_engines,
+    tracker=read_your_writes,
 )
 
+# Read-only requests share the same pools but run in autocommit mode:
+# no BEGIN, and no COMMIT/ROLLBACK round trip when the connection is released.
+_AUTOCOMMIT = {"isolation_level": "AUTOCOMMIT"}
+
+read_only_session_factory = async_sessionmaker(
+    engine.execution_options(**_AUTOCOMMIT),
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    expire_on_commit=False,
+    replicas=[replica.execution_options(**_AUTOCOMMIT) for replica in replica_engines],
+    tracker=read_your_writes,
+)
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
+# Long-running reads (exports) need a real transaction for server-side
+# cursors; on PostgreSQL it is opened as BEGIN READ ONLY.
+_READ_ONLY_TRANSACTION = {"postgresql_readonly": True}
+
+streaming_session_factory = async_sessionmaker(
+    engine.execution_options(**_READ_ONLY_TRANSACTION),
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    expire_on_commit=False,
+    replicas=[replica.execution_options(**_READ_ONLY_TRANSACTION) for replica in replica_engines],
+    tracker=read_your_writes,
+)
+
+READ_METHODS = frozenset({"GET", "HEAD"})
+
+
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
     """Yield an async database session.
 
     Auto-commits on success, rolls back on exception.
-    Used as a FastAPI dependency.
+    Used as a FastAPI dependency with `scope="function"` (see `DBSession`),
+    so the commit, read-your-writes mark and event publishing finish before
+    the response is sent. Each session carries a request-scoped BatchLoader
+    that `BaseRepository.get` routes through. Domain events recorded by
+    repositories are published only after a successful commit.
+
+    GET/HEAD requests get a read-only autocommit session: their queries may
+    use a replica (unless the caller wrote within READ_YOUR_WRITES_SECONDS),
+    writes are rejected, and there is no commit. Connections are checked out
+    lazily on the first query, so requests that fail auth never acquire one.
     """
-    async with async_session_factory() as session:
+    read_only = request.method in READ_METHODS
+    factory = read_only_session_factory if read_only else async_session_factory
+    async with factory() as session:
+        install_loader(session)
+        session.info[READ_ONLY_KEY] = read_only
+        session.info[STICKY_KEY] = lambda: getattr(request.state, "user_id", None)
+        if read_only:
+            yield session
+            return
         try:
             yield session
             await session.commit()
         except Exception:
             await session.rollback()
+            take_events(session)
             raise
+        if session.info.get(WROTE_KEY):
+            read_your_writes.mark(getattr(request.state, "user_id", None))
+        await event_bus.publish_all(take_events(session))
 
+
+async def get_streaming_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Yield a read-only transactional session for streaming responses.
+
+    The dependency's exit runs after the response body has been sent, so
+    the session (and its server-side cursor) outlives the handler. Closing
+    the session rolls the read-only transaction back; there is no commit.
+    """
+    async with streaming_session_factory() as session:
+        session.info[READ_ONLY_KEY] = True
+        session.info[STICKY_KEY] = lambda: getattr(request.state, "user_id", None)
+        yield session
@@ -2,11 +2,11 @@
 # -----------
 # SQLAlchemy models owned by the auth domain:
 #
-#   RefreshToken — id, user_id (FK), token_hash, expires_at,
-#                  revoked_at, created_at
 #   PasswordResetToken — id, user_id (FK), token_hash,
 #                        expires_at, consumed_at, created_at
 #
+# Refresh tokens are not a table: see repository.RefreshTokenStore (Redis).
+#
 # These models are auth-specific and distinct from the User model
 # which is owned by the users domain.
 #
@@ -2,15 +2,340 @@
 # ---------------
 # Data access for auth-specific entities (refresh tokens, reset tokens).
 #
+# Refresh tokens live in Redis (RefreshTokenStore) rather than a DB table:
+# /auth/refresh and /auth/logout never touch Postgres, and expiry is native
+# key TTL instead of a periodic sweep. Keys, under the `pmt` namespace:
+#
+#   auth:refresh:{jti}        JSON record, EXPIREAT the token's expiry
+#   auth:refresh:user:{id}    ZSET jti -> expiry (a user's active tokens)
+#   auth:refresh:revoked      ZSET jti -> expiry (revocation list)
+#
+# `jti` is the SHA-256 of the opaque token, so Redis never holds a usable
+# token. Each worker mirrors the revocation list in a BloomFilter, rebuilt
+# from Redis whenever it (re)subscribes to the revocation channel, so
+# `is_revoked` answers "definitely not revoked" without a round trip.
+#
 # Methods:
-#   store_refresh_token(user_id, token, expires_at) -> None
-#   revoke_refresh_token(token: str) -> None
-#   get_refresh_token(token: str) -> RefreshToken | None
-#   store_reset_token(user_id, token, expires_at) -> None
-#   consume_reset_token(token: str) -> ResetToken | None
+#   store_refresh_token(user_id, token, expires_at) -> RefreshTokenRecord
+#   get_refresh_token(token: str) -> RefreshTokenRecord | None
+#   revoke_refresh_token(token: str) -> RefreshTokenRecord | None
+#   revoke_user_tokens(user_id) -> int
+#   is_revoked(jti: str) -> bool
 #   cleanup_expired_tokens() -> int
+#   store_reset_token(user_id, token, expires_at) -> None      (pending)
+#   consume_reset_token(token: str) -> ResetToken | None       (pending)
+#
+# Redis errors propagate: auth fails closed instead of reading an
+# unreachable store as "no token" or "not revoked".
 #
 # Note: This repository does NOT handle user persistence.
 # User lookup goes through users.repository.
-#
-# Placeholder — implementation pending.
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import math
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+from uuid import UUID
+
+import structlog
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.core.bloom import BloomFilter
+from app.core.config import get_settings
+from app.core.redis import get_redis
+
+logger = structlog.get_logger()
+
+
+@dataclass(frozen=True, slots=True)
+class RefreshTokenRecord:
+    """Server-side state of one refresh token (never the token itself)."""
+
+    jti: str
+    user_id: str
+    expires_at: datetime
+    created_at: datetime
+
+
+class RefreshTokenStore:
+    """Hashed refresh tokens in Redis, with a per-worker revocation filter.
+
+    At most `max_active` tokens are kept per user; storing another revokes
+    the oldest. `start()` runs the listener that keeps the filter in sync;
+    until it has subscribed and rebuilt the filter, and whenever the
+    subscription drops, `is_revoked` asks Redis every time.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        *,
+        namespace: str = "pmt",
+        max_active: int = 5,
+        channel: str = "pmt:auth:revoked",
+        filter_capacity: int = 100_000,
+        filter_error_rate: float = 0.001,
+        reconnect_seconds: float = 1.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.redis = redis
+        self.namespace = namespace
+        self.max_active = max_active
+        self.channel = channel
+        self.filter_capacity = filter_capacity
+        self.filter_error_rate = filter_error_rate
+        self.reconnect_seconds = reconnect_seconds
+        self._clock = clock
+        self._revoked = BloomFilter(filter_capacity, filter_error_rate)
+        self._rebuilding: list[str] | None = None
+        self._synced = False
+        self._listener: asyncio.Task[None] | None = None
+        self._subscribed = asyncio.Event()
+        self.stats = {"filter_skips": 0, "redis_checks": 0}
+
+    # ---- Keys ----
+
+    @staticmethod
+    def token_id(token: str) -> str:
+        """The `jti` of an opaque refresh token."""
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def _token_key(self, jti: str) -> str:
+        return f"{self.namespace}:auth:refresh:{jti}"
+
+    def _user_key(self, user_id: str | UUID) -> str:
+        return f"{self.namespace}:auth:refresh:user:{user_id}"
+
+    @property
+    def _revoked_key(self) -> str:
+        return f"{self.namespace}:auth:refresh:revoked"
+
+    # ---- Tokens ----
+
+    async def store_refresh_token(
+        self, user_id: str | UUID, token: str, expires_at: datetime
+    ) -> RefreshTokenRecord:
+        """Store `token` until `expires_at`; revokes the user's oldest beyond `max_active`."""
+        now = self._clock()
+        expires = expires_at.timestamp()
+        if expires <= now:
+            raise ValueError("expires_at must be in the future")
+        record = RefreshTokenRecord(
+            jti=self.token_id(token),
+            user_id=str(user_id),
+            expires_at=expires_at,
+            created_at=datetime.fromtimestamp(now, timezone.utc),
+        )
+        index = self._user_key(user_id)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.set(self._token_key(record.jti), _dump(record), exat=math.ceil(expires))
+            pipe.zremrangebyscore(index, "-inf", now)
+            pipe.zadd(index, {record.jti: expires})
+            pipe.zrange(index, 0, -1, withscores=True)
+            *_, active = await pipe.execute()
+
+        # Ordered by expiry: with a fixed TTL, oldest first.
+        overflow = active[: max(0, len(active) - self.max_active)]
+        await self.redis.expireat(index, math.ceil(active[-1][1]))
+        if overflow:
+            await self._revoke({_text(jti): score for jti, score in overflow}, record.user_id)
+        return record
+
+    async def get_refresh_token(self, token: str) -> RefreshTokenRecord | None:
+        raw = await self.redis.get(self._token_key(self.token_id(token)))
+        return None if raw is None else _load(raw)
+
+    async def revoke_refresh_token(self, token: str) -> RefreshTokenRecord | None:
+        """Revoke `token` and return its record, or None if it was not active.
+
+        The record is taken with GETDEL, so of two concurrent refreshes with
+        the same token exactly one gets the record (and may rotate it).
+        """
+        raw = await self.redis.getdel(self._token_key(self.token_id(token)))
+        if raw is None:
+            return None
+        record = _load(raw)
+        await self._revoke({record.jti: record.expires_at.timestamp()}, record.user_id)
+        return record
+
+    async def revoke_user_tokens(self, user_id: str | UUID) -> int:
+        """Revoke every active token of a user (logout everywhere, password change)."""
+        active = await self.redis.zrange(self._user_key(user_id), 0, -1, withscores=True)
+        if active:
+            await self._revoke({_text(jti): score for jti, score in active}, str(user_id))
+        return len(active)
+
+    async def _revoke(self, expiries: dict[str, float], user_id: str) -> None:
+        # A revoked jti only matters until the token would have expired.
+        now = self._clock()
+        live = {jti: expires for jti, expires in expiries.items() if expires > now}
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.delete(*(self._token_key(jti) for jti in expiries))
+            pipe.zrem(self._user_key(user_id), *expiries)
+            if live:
+                pipe.zadd(self._revoked_key, live)
+                pipe.publish(self.channel, json.dumps(list(live)))
+            await pipe.execute()
+        self._remember(live)
+
+    # ---- Revocation filter ----
+
+    async def is_revoked(self, jti: str) -> bool:
+        if self._synced and jti not in self._revoked:
+            self.stats["filter_skips"] += 1
+            return False
+        self.stats["redis_checks"] += 1
+        expires = await self.redis.zscore(self._revoked_key, jti)
+        return expires is not None and expires > self._clock()
+
+    async def rebuild_filter(self) -> int:
+        """Drop expired revocations from Redis and rebuild this worker's filter.
+
+        Returns the number of revocations dropped.
+        """
+        self._rebuilding = []
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.zremrangebyscore(self._revoked_key, "-inf", self._clock())
+                pipe.zrange(self._revoked_key, 0, -1)
+                pruned, revoked = await pipe.execute()
+            # Revocations seen while the snapshot was in flight go in too.
+            self._revoked = BloomFilter.from_items(
+                [*map(_text, revoked), *self._rebuilding],
+                capacity=self.filter_capacity,
+                error_rate=self.filter_error_rate,
+            )
+        finally:
+            self._rebuilding = None
+        return pruned
+
+    async def cleanup_expired_tokens(self) -> int:
+        """Token records expire on their own; this prunes the revocation list."""
+        return await self.rebuild_filter()
+
+    def _remember(self, jtis: Iterable[str]) -> None:
+        for jti in jtis:
+            self._revoked.add(jti)
+            if self._rebuilding is not None:
+                self._rebuilding.append(jti)
+
+    # ---- Revocation listener ----
+
+    def start(self) -> None:
+        """Start the revocation listener on the running loop (idempotent)."""
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.get_running_loop().create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
+        self._synced = False
+        self._subscribed.clear()
+
+    async def wait_subscribed(self) -> None:
+        await self._subscribed.wait()
+
+    async def _listen(self) -> None:
+        outage = False
+        while True:
+            try:
+                async with self.redis.pubsub() as pubsub:
+                    await pubsub.subscribe(self.channel)
+                    # Subscribe before the snapshot, so no revocation falls between them.
+                    await self.rebuild_filter()
+                    self._synced = True
+                    self._subscribed.set()
+                    if outage:
+                        logger.info("revocation_feed_restored")
+                        outage = False
+                    while True:
+                        message = await pubsub.get_message(
+                            ignore_subscribe_messages=True, timeout=1.0
+                        )
+                        if message is not None:
+                            self._remember(_parse_jtis(message["data"]))
+            except RedisError as e:
+                # Messages may be missed while disconnected: stop trusting the filter.
+                self._synced = False
+                self._subscribed.clear()
+                if not outage:  # once per outage, not once per retry
+                    logger.warning(
+                        "revocation_feed_unavailable", error=str(e), fallback="redis_lookup"
+                    )
+                    outage = True
+                await asyncio.sleep(self.reconnect_seconds)
+
+
+# ---- Process-wide instance ----
+
+_store: RefreshTokenStore | None = None
+
+
+def get_refresh_token_store() -> RefreshTokenStore:
+    """Return this worker's RefreshTokenStore, built from settings on first call."""
+    global _store
+    if _store is None:
+        settings = get_settings()
+        _store = RefreshTokenStore(
+            get_redis(),
+            max_active=settings.REFRESH_TOKEN_MAX_ACTIVE,
+            channel=settings.AUTH_REVOCATION_CHANNEL,
+            filter_capacity=settings.AUTH_REVOCATION_FILTER_CAPACITY,
+            filter_error_rate=settings.AUTH_REVOCATION_FILTER_ERROR_RATE,
+        )
+    return _store
+
+
+async def close_refresh_token_store() -> None:
+    global _store
+    if _store is not None:
+        await _store.stop()
+        _store = None
+
+
+# ---- Helpers (Private) ----
+
+
+def _text(value: bytes | str) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def _dump(record: RefreshTokenRecord) -> str:
+    return json.dumps(
+        {
+            "jti": record.jti,
+            "user_id": record.user_id,
+            "expires_at": record.expires_at.isoformat(),
+            "created_at": record.created_at.isoformat(),
+        }
+    )
+
+
+def _load(raw: bytes | str) -> RefreshTokenRecord:
+    data: dict[str, Any] = json.loads(raw)
+    return RefreshTokenRecord(
+        jti=data["jti"],
+        user_id=data["user_id"],
+        expires_at=datetime.fromisoformat(data["expires_at"]),
+        created_at=datetime.fromisoformat(data["created_at"]),
+    )
+
+
+def _parse_jtis(data: bytes | str) -> list[str]:
+    try:
+        jtis = json.loads(data)
+    except ValueError:
+        return []
+    return [jti for jti in jtis if isinstance(jti, str)] if isinstance(jtis, list) else []
@@ -0,0 +1,254 @@
+# Projects Cache
+# --------------
+# Key scheme, serialization and invalidation for cached projects.
+# ProjectRepository opts in with `@cached` (app/core/cache.py); the
+# backend is the worker's TieredCache (in-process L1 + Redis L2).
+# Invalidated by project domain events, which `get_db` publishes after commit
+# (and before the response is sent).
+#
+# Keys (under the cache namespace):
+#   projects:id:{id}                                   one live project row
+#   projects:id:{id}:ver                               project version
+#   projects:gen                                       global generation
+#   projects:owner:{owner_id}:ver                      owner listing version
+#   projects:owner:{owner_id}:{gen}.{ver}:{offset}:{limit}:{fields}   one listing page
+#   projects:members:{user_id}                         {project_id: role} of a user
+#   projects:members:{user_id}:ver                     memberships version
+#
+# Writes delete the project's key and bump its owner's version, so stale
+# pages are never read again and simply age out. Set-based writes that do
+# not know the owner bump the global generation instead. Membership changes
+# delete the member's entry.
+#
+# Versions are also each entry's `guard` (see app/core/cache.py): the
+# repository bumps them before it writes, invalidation bumps them again after
+# commit, and a read that loaded across either bump does not store its value.
+
+from __future__ import annotations
+
+import functools
+from collections.abc import Callable, Collection
+from datetime import datetime
+from typing import Any
+
+from fastapi import Depends
+from sqlalchemy import DateTime, Enum, inspect
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.core.cache import Cache, get_shared_cache
+from app.core.config import Settings, get_settings
+from app.core.constants import ProjectRole
+from app.core.event_bus import EventBus
+from app.core.events import (
+    ProjectCreated,
+    ProjectDeleted,
+    ProjectMembershipChanged,
+    ProjectUpdated,
+)
+from app.db.base_repository import TotalCount
+from app.domains.projects.models import Project
+
+ProjectEvent = ProjectCreated | ProjectUpdated | ProjectDeleted | ProjectMembershipChanged
+
+# Must outlive every page written under a version (TTL plus jitter).
+VERSION_TTL_SECONDS = 86_400
+
+
+class ProjectCache:
+    """Project keys on a Cache backend, plus event-driven invalidation."""
+
+    def __init__(self, backend: Cache) -> None:
+        self.backend = backend
+
+    # ---- Keys ----
+
+    def project_key(self, project_id: str) -> str:
+        return self.backend.key("projects", "id", project_id)
+
+    def memberships_key(self, user_id: str) -> str:
+        return self.backend.key("projects", "members", user_id)
+
+    async def owner_page_key(
+        self, owner_id: str, offset: int, limit: int, fields: Collection[str] | None = None
+    ) -> str:
+        """Key for one listing page under the current generation and owner version."""
+        gen, ver = await self.backend.get_many([self._gen_key(), self._owner_version_key(owner_id)])
+        selection = ",".join(sorted(fields)) if fields else "*"
+        return self.backend.key(
+            "projects", "owner", owner_id, f"{gen or 0}.{ver or 0}", offset, limit, selection
+        )
+
+    # ---- Guards ----
+
+    def project_guard(self, project_id: str) -> list[str]:
+        return [self._gen_key(), self._project_version_key(project_id)]
+
+    def owner_guard(self, owner_id: str) -> list[str]:
+        return [self._gen_key(), self._owner_version_key(owner_id)]
+
+    def memberships_guard(self, user_id: str) -> list[str]:
+        return [self._memberships_version_key(user_id)]
+
+    async def before_write(
+        self,
+        *,
+        project_ids: Collection[str] = (),
+        owner_ids: Collection[str | None] = (),
+        member_id: str | None = None,
+        all_projects: bool = False,
+    ) -> None:
+        """Bump the guards of what a write is about to change.
+
+        Reads already loading will not store the old value; reads starting
+        before commit are caught by the bump in `invalidate`.
+        """
+        keys = [self._project_version_key(project_id) for project_id in project_ids]
+        keys.extend(self._owner_version_key(owner) for owner in owner_ids if owner is not None)
+        if member_id is not None:
+            keys.append(self._memberships_version_key(member_id))
+        if all_projects:
+            keys.append(self._gen_key())
+        await self.backend.incr(*keys, ttl=VERSION_TTL_SECONDS)
+
+    # ---- Invalidation ----
+
+    async def invalidate(self, event: ProjectEvent) -> None:
+        """Drop everything a committed project write may have made stale."""
+        # Bump before deleting: a racing read either stores before the
+        # delete removes it, or sees the bump and does not store.
+        if isinstance(event, ProjectMembershipChanged):
+            await self.backend.incr(
+                self._memberships_version_key(event.user_id), ttl=VERSION_TTL_SECONDS
+            )
+            await self.backend.delete(self.memberships_key(event.user_id))
+            return
+        if event.owner_id is None:
+            listing_key = self._gen_key()
+        else:
+            listing_key = self._owner_version_key(event.owner_id)
+        if isinstance(event, ProjectCreated):
+            await self.backend.incr(listing_key, ttl=VERSION_TTL_SECONDS)
+            return
+        await self.backend.incr(
+            listing_key, self._project_version_key(event.project_id), ttl=VERSION_TTL_SECONDS
+        )
+        await self.backend.delete(self.project_key(event.project_id))
+
+    # ---- Keys (Private) ----
+
+    def _gen_key(self) -> str:
+        return self.backend.key("projects", "gen")
+
+    def _owner_version_key(self, owner_id: str) -> str:
+        return self.backend.key("projects", "owner", owner_id, "ver")
+
+    def _project_version_key(self, project_id: str) -> str:
+        return self.backend.key("projects", "id", project_id, "ver")
+
+    def _memberships_version_key(self, user_id: str) -> str:
+        return self.backend.key("projects", "members", user_id, "ver")
+
+
+# ---- Serialization ----
+
+
+def dump_project(project: Project) -> dict[str, Any]:
+    """Loaded column values; columns left out by a projection are skipped."""
+    unloaded = inspect(project).unloaded
+    return {
+        attr.key: getattr(project, attr.key)
+        for attr in Project.__mapper__.column_attrs
+        if attr.key not in unloaded
+    }
+
+
+@functools.cache
+def _decoders() -> dict[str, Callable[[Any], Any]]:
+    decoders: dict[str, Callable[[Any], Any]] = {}
+    for attr in Project.__mapper__.column_attrs:
+        column_type = attr.columns[0].type
+        if isinstance(column_type, DateTime):
+            decoders[attr.key] = datetime.fromisoformat
+        elif isinstance(column_type, Enum) and column_type.enum_class is not None:
+            decoders[attr.key] = column_type.enum_class
+    return decoders
+
+
+def load_project(data: dict[str, Any]) -> Project:
+    """Rebuild a detached Project; it is not attached to any session."""
+    decoders = _decoders()
+    values = {
+        key: decoders[key](value) if value is not None and key in decoders else value
+        for key, value in data.items()
+    }
+    project = Project(**values)
+    make_transient_to_detached(project)
+    return project
+
+
+def dump_page(page: tuple[list[Project], TotalCount]) -> dict[str, Any]:
+    items, total = page
+    return {
+        "items": [dump_project(item) for item in items],
+        "total": int(total),
+        "is_exact": total.is_exact,
+    }
+
+
+def load_page(data: dict[str, Any]) -> tuple[list[Project], TotalCount]:
+    return (
+        [load_project(item) for item in data["items"]],
+        TotalCount(data["total"], is_exact=data["is_exact"]),
+    )
+
+
+def dump_row_page(page: tuple[list[Any], TotalCount]) -> dict[str, Any]:
+    """dump_page for Core rows; the entry is shared with the ORM listing."""
+    rows, total = page
+    return {
+        "items": [
+            {key: value for key, value in row._mapping.items() if key != "_total"} for row in rows
+        ],
+        "total": int(total),
+        "is_exact": total.is_exact,
+    }
+
+
+def load_row_page(data: dict[str, Any]) -> tuple[list[dict[str, Any]], TotalCount]:
+    """Cached rows stay plain mappings; the response adapter parses their values."""
+    return data["items"], TotalCount(data["total"], is_exact=data["is_exact"])
+
+
+def load_memberships(data: dict[str, str]) -> dict[str, ProjectRole]:
+    return {project_id: ProjectRole(role) for project_id, role in data.items()}
+
+
+# ---- Wiring ----
+
+
+def build_project_cache(settings: Settings) -> ProjectCache | None:
+    """ProjectCache on the worker's shared TieredCache, or None when caching is off."""
+    if not settings.CACHE_ENABLED:
+        return None
+    return ProjectCache(get_shared_cache())
+
+
+def get_project_cache(settings: Settings = Depends(get_settings)) -> ProjectCache | None:
+    """FastAPI dependency for the project cache."""
+    return build_project_cache(settings)
+
+
+def register_event_handlers(bus: EventBus, cache: ProjectCache | None) -> None:
+    """Subscribe `cache`'s invalidation to project events; nothing when None."""
+    if cache is None:
+        return
+    for event_type in (ProjectCreated, ProjectUpdated, ProjectDeleted, ProjectMembershipChanged):
+        bus.subscribe(event_type, cache.invalidate)
+
+
+def unregister_event_handlers(bus: EventBus, cache: ProjectCache | None) -> None:
+    """Undo register_event_handlers, on shutdown."""
+    if cache is None:
+        return
+    for event_type in (ProjectCreated, ProjectUpdated, ProjectDeleted, ProjectMembershipChanged):
+        bus.unsubscribe(event_type, cache.invalidate)
@@ -4,11 +4,11 @@
 
 from __future__ import annotations
 
-from sqlalchemy import Enum, Index, String, Text
+from sqlalchemy import Enum, ForeignKey, Index, Integer, String, Text, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.core.constants import ProjectStatus
+from app.core.constants import ProjectRole, ProjectStatus
 from app.db.base import Base
 from app.db.mixins import SoftDeleteMixin, TimestampMixin, UUIDPrimaryKeyMixin
 
@@ -43,14 +43,63 @@ class Project(UUIDPrimaryKeyMixin, TimestampMixin, SoftDeleteMixin, Base):
         nullable=False,
         index=True,
     )
+    # Bumped by every UPDATE (set-based ones too); the ETag is built from it,
+    # since two writes can share an `updated_at` (SQLite stores whole seconds).
+    version: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=1,
+        server_default="1",
+        onupdate=text("version + 1"),
+    )
 
     # ---- Table-level indexes ----
+    # Listing indexes are partial over live rows and end in (created_at, id),
+    # matching the (created_at DESC, id DESC) order read by a backward scan.
 
     __table_args__ = (
         Index("ix_projects_owner_id_status", "owner_id", "status"),
-        Index("ix_projects_created_at", "created_at"),
+        SoftDeleteMixin.live_index(
+            "ix_projects_live_owner_id_created_at", "owner_id", "created_at", "id"
+        ),
+        SoftDeleteMixin.live_index(
+            "ix_projects_live_status_created_at", "status", "created_at", "id"
+        ),
+        SoftDeleteMixin.live_index("ix_projects_live_created_at", "created_at", "id"),
     )
 
     def __repr__(self) -> str:
         return f"<Project id={self.id} name={self.name!r} status={self.status}>"
 
+
+class ProjectMember(TimestampMixin, Base):
+    """A user's role on a project they do not own.
+
+    Ownership stays on `projects.owner_id`; a user can read a project they
+    own or are a member of. The primary key serves project -> members
+    lookups; the `(user_id, project_id)` index serves user -> projects
+    (access checks and the accessible-projects semi-join) from the index alone.
+    """
+
+    __tablename__ = "project_members"
+
+    project_id: Mapped[str] = mapped_column(
+        UUID(as_uuid=False),
+        ForeignKey("projects.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    user_id: Mapped[str] = mapped_column(
+        UUID(as_uuid=False),
+        primary_key=True,
+    )
+    role: Mapped[str] = mapped_column(
+        Enum(ProjectRole, name="projectrole", create_type=True),
+        nullable=False,
+        default=ProjectRole.MEMBER.value,
+        server_default=ProjectRole.MEMBER.value,
+    )
+
+    __table_args__ = (Index("ix_project_members_user_id_project_id", "user_id", "project_id"),)
+
+    def __repr__(self) -> str:
+        return f"<ProjectMember project_id={self.project_id} user_id={self.user_id}>"
@@ -5,14 +5,44 @@
 
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import AsyncIterator, Collection, Sequence
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import Select, func, select
+from sqlalchemy import ColumnElement, Row, delete, func, select, union_all
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
-from app.core.constants import ProjectStatus
-from app.db.base_repository import BaseRepository
-from app.domains.projects.models import Project
+from app.core.cache import Cache, cached
+from app.core.constants import ProjectRole, ProjectStatus
+from app.core.events import (
+    DomainEvent,
+    ProjectCreated,
+    ProjectDeleted,
+    ProjectMembershipChanged,
+    ProjectUpdated,
+)
+from app.db.base_repository import BaseRepository, BulkResult, TotalCount
+from app.db.outbox import has_pending_events, record_event
+from app.db.routing import read_only
+from app.domains.projects.cache import (
+    dump_page,
+    dump_project,
+    dump_row_page,
+    load_memberships,
+    load_page,
+    load_project,
+    load_row_page,
+)
+from app.domains.projects.models import Project, ProjectMember
+
+if TYPE_CHECKING:
+    from app.domains.projects.cache import ProjectCache
+
+# Listing order; `id` breaks created_at ties so pages are stable across query
+# shapes (the live listing indexes end in (created_at, id)).
+NEWEST_FIRST = (Project.created_at.desc(), Project.id.desc())
 
 
 class ProjectRepository(BaseRepository[Project]):
@@ -20,75 +50,372 @@ class ProjectRepository(BaseRepository[Project]):
 
     Extends BaseRepository with project-specific queries.
     All queries automatically filter out soft-deleted records.
+
+    With a ProjectCache, `get`, the owner listings and a user's memberships
+    read through the two-tier cache (in-process L1, Redis L2).
+    Every write bumps the affected cache guards first and records a project
+    event on the session; `get_db` publishes them after commit and the cache
+    invalidates the affected keys. Once a session has written, its reads
+    bypass the cache to see its own writes.
     """
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(self, session: AsyncSession, cache: ProjectCache | None = None) -> None:
         super().__init__(session=session, model=Project)
+        self.cache = cache
+
+    @property
+    def read_cache(self) -> Cache | None:
+        """Backend for `@cached` reads; None once this session has pending writes."""
+        if self.cache is None or has_pending_events(self.session):
+            return None
+        return self.cache.backend
+
+    # ---- Cached Reads ----
+
+    @cached(
+        lambda self, id: self.cache.project_key(id),
+        encode=dump_project,
+        decode=load_project,
+        guard=lambda self, id: self.cache.project_guard(id),
+        cache_attr="read_cache",
+    )
+    async def get(self, id: str) -> Project | None:
+        """Get a live project by ID, through the cache when configured."""
+        return await super().get(id)
 
     # ---- Custom Queries ----
 
+    @read_only
+    @cached(
+        lambda self, owner_id, *, offset=0, limit=20, fields=None: self.cache.owner_page_key(
+            owner_id, offset, limit, fields
+        ),
+        encode=dump_page,
+        decode=load_page,
+        guard=lambda self, owner_id, **_: self.cache.owner_guard(owner_id),
+        cache_attr="read_cache",
+    )
     async def get_by_owner(
         self,
         owner_id: str,
         *,
         offset: int = 0,
         limit: int = 20,
-    ) -> tuple[list[Project], int]:
+        fields: Collection[str] | None = None,
+    ) -> tuple[list[Project], TotalCount]:
         """List projects owned by a specific user."""
         query = self._base_query().where(Project.owner_id == owner_id)
+        query = self._project(query, fields)
+        return await self._paginate(
+            query,
+            offset=offset,
+            limit=limit,
+            order_by=NEWEST_FIRST,
+        )
 
-        # Count
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await self.session.execute(count_query)
-        total = total_result.scalar_one()
-
-        # Paginate
-        query = query.order_by(Project.created_at.desc()).offset(offset).limit(limit)
-        result = await self.session.execute(query)
-        items = list(result.scalars().all())
-
-        return items, total
+    @read_only
+    @cached(
+        lambda self, owner_id, *, offset=0, limit=20, fields=None: self.cache.owner_page_key(
+            owner_id, offset, limit, fields
+        ),
+        encode=dump_row_page,
+        decode=load_row_page,
+        guard=lambda self, owner_id, **_: self.cache.owner_guard(owner_id),
+        cache_attr="read_cache",
+    )
+    async def get_rows_by_owner(
+        self,
+        owner_id: str,
+        *,
+        offset: int = 0,
+        limit: int = 20,
+        fields: Collection[str] | None = None,
+    ) -> tuple[list[Any], TotalCount]:
+        """get_by_owner as Core rows; shares its cache entries (same encoded shape)."""
+        query = self._row_query(fields).where(Project.owner_id == owner_id)
+        return await self._paginate(
+            query,
+            offset=offset,
+            limit=limit,
+            order_by=NEWEST_FIRST,
+            rows=True,
+        )
 
+    @read_only
     async def list_by_status(
         self,
         status: ProjectStatus,
         *,
         offset: int = 0,
         limit: int = 20,
-    ) -> tuple[list[Project], int]:
+    ) -> tuple[list[Project], TotalCount]:
         """List projects filtered by status."""
         query = self._base_query().where(Project.status == status.value)
+        return await self._paginate(
+            query,
+            offset=offset,
+            limit=limit,
+            order_by=NEWEST_FIRST,
+        )
 
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await self.session.execute(count_query)
-        total = total_result.scalar_one()
-
-        query = query.order_by(Project.created_at.desc()).offset(offset).limit(limit)
-        result = await self.session.execute(query)
-        items = list(result.scalars().all())
+    @read_only
+    async def list_accessible_by_user(
+        self,
+        user_id: str,
+        *,
+        offset: int = 0,
+        limit: int = 20,
+        fields: Collection[str] | None = None,
+    ) -> tuple[list[Project], TotalCount]:
+        """List projects a user owns or is a member of.
 
-        return items, total
+        A user without memberships is served from the cached owner listing.
+        """
+        if await self._owns_only(user_id):
+            return await self.get_by_owner(user_id, offset=offset, limit=limit, fields=fields)
+        query = self._base_query().where(self._accessible_by(user_id))
+        query = self._project(query, fields)
+        return await self._paginate(
+            query,
+            offset=offset,
+            limit=limit,
+            order_by=NEWEST_FIRST,
+        )
 
-    async def list_accessible_by_user(
+    @read_only
+    async def list_accessible_by_user_rows(
         self,
         user_id: str,
         *,
         offset: int = 0,
         limit: int = 20,
-    ) -> tuple[list[Project], int]:
-        """List projects accessible to a user (owner or future member).
+        fields: Collection[str] | None = None,
+    ) -> tuple[list[Any], TotalCount]:
+        """list_accessible_by_user returning Core rows (or cached mappings)."""
+        if await self._owns_only(user_id):
+            return await self.get_rows_by_owner(user_id, offset=offset, limit=limit, fields=fields)
+        query = self._row_query(fields).where(self._accessible_by(user_id))
+        return await self._paginate(
+            query,
+            offset=offset,
+            limit=limit,
+            order_by=NEWEST_FIRST,
+            rows=True,
+        )
+
+    @read_only
+    async def list_accessible_by_user_keyset(
+        self,
+        user_id: str,
+        *,
+        cursor: str | None = None,
+        limit: int = 20,
+        fields: Collection[str] | None = None,
+    ) -> tuple[list[Project], str | None]:
+        """Keyset-paginated variant of list_accessible_by_user."""
+        query = self._base_query().where(self._accessible_by(user_id))
+        query = self._project(query, fields)
+        return await self._paginate_keyset(query, cursor=cursor, limit=limit)
+
+    def stream_accessible_by_user(
+        self, user_id: str, *, batch_size: int = 500
+    ) -> AsyncIterator[Project]:
+        """Stream every project accessible to a user (see list_accessible_by_user)."""
+        query = self._base_query().where(self._accessible_by(user_id))
+        return self.stream(query, batch_size=batch_size)
 
-        Currently returns projects owned by user.
-        Will be extended when project_members table is implemented.
+    # ---- Membership ----
+
+    @cached(
+        lambda self, user_id: self.cache.memberships_key(user_id),
+        decode=load_memberships,
+        guard=lambda self, user_id: self.cache.memberships_guard(user_id),
+        cache_attr="read_cache",
+    )
+    async def get_memberships(self, user_id: str) -> dict[str, ProjectRole]:
+        """{project_id: role} for every project the user is a member of.
+
+        Read through the cache for permission checks; owned projects are not
+        memberships (see `projects.owner_id`).
         """
-        return await self.get_by_owner(user_id, offset=offset, limit=limit)
+        query = select(ProjectMember.project_id, ProjectMember.role).where(
+            ProjectMember.user_id == user_id
+        )
+        result = await self.session.execute(query)
+        return {project_id: ProjectRole(role) for project_id, role in result.all()}
+
+    @read_only
+    async def list_members(self, project_id: str) -> list[ProjectMember]:
+        """Members of a project, oldest first."""
+        query = (
+            select(ProjectMember)
+            .where(ProjectMember.project_id == project_id)
+            .order_by(ProjectMember.created_at, ProjectMember.user_id)
+        )
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
+    async def set_member(self, project_id: str, user_id: str, role: ProjectRole) -> ProjectMember:
+        """Add a member, or change the role of an existing one (one upsert)."""
+        await self._before_write(member_id=user_id)
+        dialect = self.session.get_bind().dialect.name
+        insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        stmt = insert(ProjectMember).values(project_id=project_id, user_id=user_id, role=role)
+        stmt = (
+            stmt.on_conflict_do_update(
+                index_elements=[ProjectMember.project_id, ProjectMember.user_id],
+                set_={"role": stmt.excluded.role, "updated_at": func.now()},
+            )
+            .returning(ProjectMember)
+            .execution_options(populate_existing=True)
+        )
+        member = (await self.session.execute(stmt)).scalar_one()
+        self._record(ProjectMembershipChanged(project_id=project_id, user_id=user_id))
+        return member
+
+    async def remove_member(self, project_id: str, user_id: str) -> bool:
+        """Remove a membership; False if there was none."""
+        await self._before_write(member_id=user_id)
+        stmt = (
+            delete(ProjectMember)
+            .where(ProjectMember.project_id == project_id, ProjectMember.user_id == user_id)
+            .returning(ProjectMember.user_id)
+            .execution_options(synchronize_session=False)
+        )
+        removed = (await self.session.execute(stmt)).scalar_one_or_none() is not None
+        if removed:
+            self._record(ProjectMembershipChanged(project_id=project_id, user_id=user_id))
+        return removed
+
+    # ---- Versions (conditional requests) ----
+
+    @read_only
+    async def get_version(self, id: str) -> Row[tuple[str, str, datetime, int]] | None:
+        """(id, owner_id, updated_at, version) of a live project, without loading the row."""
+        query = select(Project.id, Project.owner_id, Project.updated_at, Project.version).where(
+            Project.id == id,
+            Project.soft_deleted == False,  # noqa: E712
+        )
+        result = await self.session.execute(query)
+        return result.one_or_none()
+
+    @read_only
+    async def listing_fingerprint(self, user_id: str | None = None) -> tuple[Any, ...]:
+        """Values that change whenever a listing scope does; all projects when None.
+
+        (live count, latest updated_at, sum of versions) of the scope. The
+        max and sum span soft-deleted rows too: soft deletes are updates, so
+        they move the fingerprint even though the row leaves the listing. The
+        sum moves on every update, even within one `updated_at` tick. A user's
+        scope adds (membership count, latest membership change): removals
+        lower the count and additions or role changes are the newest rows.
+        """
+        columns: list[Any] = [
+            func.count(Project.id).filter(Project.soft_deleted == False),  # noqa: E712
+            func.max(Project.updated_at),
+            func.sum(Project.version),
+        ]
+        query = select(*columns)
+        if user_id is not None:
+            is_member = ProjectMember.user_id == user_id
+            query = select(
+                *columns,
+                select(func.count()).where(is_member).scalar_subquery(),
+                select(func.max(ProjectMember.updated_at)).where(is_member).scalar_subquery(),
+            ).where(self._accessible_by(user_id))
+        return tuple((await self.session.execute(query)).one())
 
     async def name_exists(self, name: str, *, exclude_id: str | None = None) -> bool:
         """Check if a project with the given name already exists."""
         query = self._base_query().where(Project.name == name)
         if exclude_id:
             query = query.where(Project.id != exclude_id)
-        count_query = select(func.count()).select_from(query.subquery())
-        result = await self.session.execute(count_query)
-        return result.scalar_one() > 0
+        return await self._count(query) > 0
+
+    # ---- Write (records events) ----
+
+    async def create(self, data: dict[str, Any]) -> Project:
+        await self._before_write(owner_ids=[data.get("owner_id")])
+        project = await super().create(data)
+        self._record(ProjectCreated(project_id=project.id, owner_id=project.owner_id))
+        return project
+
+    async def update(self, id: str, data: dict[str, Any]) -> Project:
+        await self._before_write(project_ids=[id])
+        project = await super().update(id, data)
+        self._record(ProjectUpdated(project_id=project.id, owner_id=project.owner_id))
+        return project
+
+    async def soft_delete(self, id: str) -> Project:
+        await self._before_write(project_ids=[id])
+        project = await super().soft_delete(id)
+        self._record(ProjectDeleted(project_id=project.id, owner_id=project.owner_id))
+        return project
+
+    async def hard_delete(self, id: str) -> None:
+        await self._before_write(project_ids=[id])
+        await super().hard_delete(id)
+        self._record(ProjectDeleted(project_id=id, owner_id=None))
+
+    async def create_many(self, rows: Sequence[dict[str, Any]]) -> BulkResult[Project]:
+        await self._before_write(owner_ids={row.get("owner_id") for row in rows})
+        result = await super().create_many(rows)
+        for project in result.items:
+            self._record(ProjectCreated(project_id=project.id, owner_id=project.owner_id))
+        return result
+
+    async def update_many(
+        self,
+        data: dict[str, Any],
+        *,
+        ids: Sequence[str] | None = None,
+        filters: dict[str, Any] | None = None,
+    ) -> BulkResult[Project]:
+        """See BaseRepository.update_many; also used by soft_delete_many."""
+        owner_id = (filters or {}).get("owner_id")
+        await self._before_write(
+            project_ids=ids or (),
+            owner_ids=[owner_id],
+            all_projects=ids is None,
+        )
+        result = await super().update_many(data, ids=ids, filters=filters)
+        event_type = ProjectDeleted if data.get("soft_deleted") else ProjectUpdated
+        for project_id in result.ids:
+            self._record(event_type(project_id=project_id, owner_id=owner_id))
+        return result
+
+    # ---- Helpers (Private) ----
+
+    @staticmethod
+    def _accessible_by(user_id: str) -> ColumnElement[bool]:
+        """Projects `user_id` owns or is a member of, as a semi-join.
+
+        `id IN (owned UNION ALL member-of)` sits at the top level of the WHERE
+        clause, so Postgres plans a semi-join fed by two index scans (owner
+        index, `(user_id, project_id)` index) instead of an OR that filters
+        every live row. Soft-deleted rows are left to the caller's query.
+        """
+        owned = aliased(Project)
+        return Project.id.in_(
+            union_all(
+                select(owned.id).where(owned.owner_id == user_id),
+                select(ProjectMember.project_id).where(ProjectMember.user_id == user_id),
+            )
+        )
+
+    async def _owns_only(self, user_id: str) -> bool:
+        """True if a cached lookup shows the user has no memberships.
+
+        Without a cache this is not worth a query: the semi-join is used.
+        """
+        if self.read_cache is None:
+            return False
+        return not await self.get_memberships(user_id)
+
+    async def _before_write(self, **changes: Any) -> None:
+        """Bump the cache guards of what is about to be written (see ProjectCache)."""
+        if self.cache is not None:
+            await self.cache.before_write(**changes)
 
+    def _record(self, event: DomainEvent) -> None:
+        record_event(self.session, event)
@@ -1,17 +1,44 @@
 # Projects Router — /api/v1/projects
 # ------------------------------------
 # Thin router. All business logic delegated to ProjectService.
+# Each route declares a query_budget: the SQL statements it is expected to run.
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, status
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Header, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.dependencies import AuthenticatedUser, DBSession, Pagination
-from app.core.schemas import PaginatedResponse
+from app.core.conditional import is_conditional, request_variant
+from app.core.constants import ExportFormat
+from app.core.dependencies import (
+    AuthenticatedUser,
+    CursorPagination,
+    DBSession,
+    Pagination,
+    StreamingDBSession,
+    query_budget,
+    reject_mixed_pagination,
+)
+from app.core.fields import FieldSelection, sparse_fields, sparse_response
+from app.core.schemas import CursorPaginatedResponse, PaginatedResponse
+from app.core.serialization import json_response
+from app.core.streaming import export_response
+from app.domains.projects.cache import ProjectCache, get_project_cache
 from app.domains.projects.repository import ProjectRepository
 from app.domains.projects.schemas import (
+    ProjectBatchGet,
+    ProjectBatchGetResponse,
+    ProjectBulkCreate,
+    ProjectBulkCreateResponse,
+    ProjectBulkDelete,
+    ProjectBulkDeleteResponse,
     ProjectCreate,
+    ProjectMemberResponse,
+    ProjectMemberSet,
     ProjectResponse,
     ProjectUpdate,
 )
@@ -19,16 +46,27 @@ from app.domains.projects.service import ProjectService
 
 router = APIRouter()
 
+# `?fields=id,name,status` on read endpoints; `id` is always included.
+ProjectFields = Annotated[FieldSelection, Depends(sparse_fields(ProjectResponse))]
+
 
 # ---- Dependency: ProjectService ----
 
 
-def _get_service(session: DBSession) -> ProjectService:
+def _get_service(
+    session: DBSession,
+    cache: ProjectCache | None = Depends(get_project_cache),
+) -> ProjectService:
     """Wire the service with its repository."""
-    repository = ProjectRepository(session)
+    repository = ProjectRepository(session, cache=cache)
     return ProjectService(repository)
 
 
+def _get_streaming_service(session: StreamingDBSession) -> ProjectService:
+    """Service on a session that stays open while the response streams."""
+    return ProjectService(ProjectRepository(session))
+
+
 # ---- Endpoints ----
 
 
@@ -37,6 +75,7 @@ def _get_service(session: DBSession) -> ProjectService:
     response_model=ProjectResponse,
     status_code=status.HTTP_201_CREATED,
     summary="Create a new project",
+    dependencies=[query_budget(1)],
 )
 async def create_project(
     data: ProjectCreate,
@@ -47,56 +86,180 @@ async def create_project(
     return await service.create_project(data, current_user)
 
 
+@router.post(
+    "/bulk",
+    response_model=ProjectBulkCreateResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create many projects",
+    dependencies=[query_budget(1)],
+)
+async def create_projects_bulk(
+    data: ProjectBulkCreate,
+    current_user: AuthenticatedUser,
+    service: ProjectService = Depends(_get_service),
+) -> ProjectBulkCreateResponse:
+    """Create up to 1000 projects in one request. Requires Admin or PM role."""
+    return await service.create_projects(data.items, current_user)
+
+
+@router.delete(
+    "/bulk",
+    response_model=ProjectBulkDeleteResponse,
+    summary="Soft-delete many projects",
+    dependencies=[query_budget(1)],
+)
+async def delete_projects_bulk(
+    data: ProjectBulkDelete,
+    current_user: AuthenticatedUser,
+    service: ProjectService = Depends(_get_service),
+) -> ProjectBulkDeleteResponse:
+    """Soft-delete up to 1000 projects. PMs only affect projects they own.
+
+    Declared before `/{project_id}` so "bulk" is not captured as an ID.
+    """
+    return await service.soft_delete_projects([str(pid) for pid in data.ids], current_user)
+
+
+@router.post(
+    "/batch-get",
+    response_model=ProjectBatchGetResponse,
+    summary="Fetch many projects by ID",
+    dependencies=[query_budget(2)],
+)
+async def batch_get_projects(
+    data: ProjectBatchGet,
+    current_user: AuthenticatedUser,
+    service: ProjectService = Depends(_get_service),
+) -> ProjectBatchGetResponse:
+    """Fetch up to 100 projects in one query (plus a membership lookup if needed).
+
+    IDs that are unknown, deleted, or not readable by the caller are listed
+    in `missing`. POST so long ID lists do not hit URL length limits.
+    """
+    return await service.get_projects([str(pid) for pid in data.ids], current_user)
+
+
 @router.get(
     "/",
-    response_model=PaginatedResponse[ProjectResponse],
+    response_model=PaginatedResponse[ProjectResponse] | CursorPaginatedResponse[ProjectResponse],
     summary="List projects",
+    dependencies=[Depends(reject_mixed_pagination), query_budget(4)],
 )
 async def list_projects(
+    request: Request,
+    response: Response,
     current_user: AuthenticatedUser,
     pagination: Pagination,
+    keyset: CursorPagination,
+    fields: ProjectFields,
     service: ProjectService = Depends(_get_service),
-) -> PaginatedResponse[ProjectResponse]:
+) -> PaginatedResponse[ProjectResponse] | CursorPaginatedResponse[ProjectResponse]:
     """List projects accessible to the current user.
 
-    Admin sees all projects. Others see their own.
+    Admin sees all projects. Others see projects they own or are members of.
+    Offset pages are rendered on the row fast path; the response_model
+    documents the shape. With `cursor` (empty for the first page), pages by
+    keyset instead and returns `meta.next_cursor`.
+    Answers 304 from the listing fingerprint when the client's copy is current.
     """
-    return await service.list_projects(current_user, pagination)
+    validators = await service.listing_validators(current_user, variant=request_variant(request))
+    if validators.is_fresh(request):
+        return validators.not_modified()
+    if keyset.cursor is not None:
+        result = await service.list_projects_keyset(
+            current_user,
+            cursor=keyset.cursor or None,
+            per_page=pagination.per_page,
+            fields=fields,
+        )
+        return validators.attach(sparse_response(result, fields), response)
+    body = await service.list_projects_json(current_user, pagination, fields=fields)
+    return validators.apply(json_response(body))
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    summary="Export projects (NDJSON or CSV stream)",
+)
+async def export_projects(
+    current_user: AuthenticatedUser,
+    export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+    service: ProjectService = Depends(_get_streaming_service),
+) -> StreamingResponse:
+    """Stream every project accessible to the current user.
+
+    Rows come from a server-side cursor, so there is no page size limit.
+    Same access scoping as the listing.
+    """
+    return export_response(
+        service.export_projects(current_user),
+        ProjectResponse,
+        export_format,
+        filename="projects",
+    )
 
 
 @router.get(
     "/{project_id}",
     response_model=ProjectResponse,
     summary="Get project details",
+    dependencies=[query_budget(3)],
 )
 async def get_project(
     project_id: str,
+    request: Request,
+    response: Response,
     current_user: AuthenticatedUser,
+    fields: ProjectFields,
     service: ProjectService = Depends(_get_service),
 ) -> ProjectResponse:
-    """Get a single project by ID."""
-    return await service.get_project(project_id, current_user)
+    """Get a single project by ID.
+
+    With `If-None-Match` / `If-Modified-Since`, a version-only query decides
+    first, so an unchanged project is answered with 304 without loading it.
+    Readers who are neither admin nor owner add one membership lookup.
+    """
+    if is_conditional(request):
+        validators = await service.project_validators(project_id, current_user, fields=fields)
+        if validators.is_fresh(request):
+            return validators.not_modified()
+    result, validators = await service.get_project_versioned(
+        project_id, current_user, fields=fields
+    )
+    return validators.attach(sparse_response(result, fields), response)
 
 
 @router.put(
     "/{project_id}",
     response_model=ProjectResponse,
     summary="Update a project",
+    dependencies=[query_budget(2)],
 )
 async def update_project(
     project_id: str,
     data: ProjectUpdate,
+    response: Response,
     current_user: AuthenticatedUser,
+    if_match: str | None = Header(
+        default=None,
+        description="ETag from a previous read; 412 if the project has changed since.",
+    ),
     service: ProjectService = Depends(_get_service),
 ) -> ProjectResponse:
     """Update a project. Admin can update any. PM can update owned projects."""
-    return await service.update_project(project_id, data, current_user)
+    result, validators = await service.update_project_versioned(
+        project_id, data, current_user, if_match=if_match
+    )
+    response.headers["ETag"] = validators.etag
+    return result
 
 
 @router.delete(
     "/{project_id}",
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Soft-delete a project",
+    dependencies=[query_budget(2)],
 )
 async def delete_project(
     project_id: str,
@@ -106,3 +269,53 @@ async def delete_project(
     """Soft-delete (archive) a project. Never hard-deletes."""
     await service.soft_delete_project(project_id, current_user)
 
+
+# ---- Members ----
+
+
+@router.get(
+    "/{project_id}/members",
+    response_model=list[ProjectMemberResponse],
+    summary="List project members",
+    dependencies=[query_budget(3)],
+)
+async def list_project_members(
+    project_id: str,
+    current_user: AuthenticatedUser,
+    service: ProjectService = Depends(_get_service),
+) -> list[ProjectMemberResponse]:
+    """List the members of a project. Anyone who can read the project may list them."""
+    return await service.list_members(project_id, current_user)
+
+
+@router.put(
+    "/{project_id}/members/{user_id}",
+    response_model=ProjectMemberResponse,
+    summary="Add a project member or change their role",
+    dependencies=[query_budget(2)],
+)
+async def set_project_member(
+    project_id: str,
+    user_id: UUID,
+    data: ProjectMemberSet,
+    current_user: AuthenticatedUser,
+    service: ProjectService = Depends(_get_service),
+) -> ProjectMemberResponse:
+    """Add or update a membership. Admin, or the PM who owns the project."""
+    return await service.set_member(project_id, str(user_id), data, current_user)
+
+
+@router.delete(
+    "/{project_id}/members/{user_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Remove a project member",
+    dependencies=[query_budget(2)],
+)
+async def remove_project_member(
+    project_id: str,
+    user_id: UUID,
+    current_user: AuthenticatedUser,
+    service: ProjectService = Depends(_get_service),
+) -> None:
+    """Remove a membership. Admin, or the PM who owns the project."""
+    await service.remove_member(project_id, str(user_id), current_user)
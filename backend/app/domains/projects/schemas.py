@@ -5,10 +5,11 @@
 from __future__ import annotations
 
 from datetime import datetime
+from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
 
-from app.core.constants import ProjectStatus
+from app.core.constants import ProjectRole, ProjectStatus
 
 
 # ---- Request Schemas ----
@@ -55,6 +56,48 @@ class ProjectUpdate(BaseModel):
     )
 
 
+class ProjectBulkCreate(BaseModel):
+    """Schema for creating many projects in one request."""
+
+    items: list[ProjectCreate] = Field(
+        ...,
+        min_length=1,
+        max_length=1000,
+        description="Projects to create. All are owned by the caller.",
+    )
+
+
+class ProjectBulkDelete(BaseModel):
+    """Schema for soft-deleting many projects in one request."""
+
+    ids: list[UUID] = Field(
+        ...,
+        min_length=1,
+        max_length=1000,
+        description="IDs of the projects to soft-delete. Duplicates are ignored.",
+    )
+
+
+class ProjectBatchGet(BaseModel):
+    """Schema for fetching many projects by ID in one request."""
+
+    ids: list[UUID] = Field(
+        ...,
+        min_length=1,
+        max_length=100,
+        description="IDs of the projects to fetch. Duplicates are ignored.",
+    )
+
+
+class ProjectMemberSet(BaseModel):
+    """Schema for adding a project member or changing their role."""
+
+    role: ProjectRole = Field(
+        default=ProjectRole.MEMBER,
+        description="Role on the project. OWNER is reserved for the project owner.",
+    )
+
+
 # ---- Response Schemas ----
 
 
@@ -84,3 +127,45 @@ class ProjectResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
+
+class ProjectMemberResponse(BaseModel):
+    """Schema for project membership responses."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    project_id: str
+    user_id: str
+    role: ProjectRole
+    created_at: datetime
+    updated_at: datetime
+
+
+class ProjectBulkCreateResponse(BaseModel):
+    """Schema for bulk create responses."""
+
+    data: list[ProjectResponse]
+    chunk_counts: list[int] = Field(description="Rows inserted by each statement.")
+
+
+class ProjectBulkDeleteResponse(BaseModel):
+    """Schema for bulk soft-delete responses.
+
+    IDs that do not exist, are already deleted, or are not modifiable by the
+    caller are reported in `not_deleted`.
+    """
+
+    deleted: list[str]
+    not_deleted: list[str]
+    chunk_counts: list[int] = Field(description="Rows soft-deleted by each statement.")
+
+
+class ProjectBatchGetResponse(BaseModel):
+    """Schema for batch-get responses.
+
+    `data` follows the order of the requested IDs. IDs that do not exist, are
+    deleted, or are not readable by the caller are all reported in `missing`,
+    so the response does not reveal which projects exist.
+    """
+
+    data: list[ProjectResponse]
+    missing: list[str]
@@ -5,20 +5,36 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from datetime import datetime
+
 import structlog
 
-from app.core.constants import ProjectStatus, Role
+from app.core.conditional import Validators, make_etag, require_match
+from app.core.constants import CountStrategy, ProjectRole, ProjectStatus, Role
 from app.core.dependencies import CurrentUser
 from app.core.exceptions import (
     BusinessRuleError,
     InsufficientPermissionError,
     NotFoundError,
 )
-from app.core.schemas import PaginatedResponse, PaginationParams
+from app.core.fields import FieldSelection, partial_model
+from app.core.schemas import (
+    CursorPaginatedResponse,
+    PaginatedResponse,
+    PaginationMeta,
+    PaginationParams,
+)
+from app.core.serialization import envelope_json, rows_to_json
 from app.domains.projects.models import Project
 from app.domains.projects.repository import ProjectRepository
 from app.domains.projects.schemas import (
+    ProjectBatchGetResponse,
+    ProjectBulkCreateResponse,
+    ProjectBulkDeleteResponse,
     ProjectCreate,
+    ProjectMemberResponse,
+    ProjectMemberSet,
     ProjectResponse,
     ProjectUpdate,
 )
@@ -35,6 +51,8 @@ class ProjectService:
 
     def __init__(self, repository: ProjectRepository) -> None:
         self.repo = repository
+        # Memberships already looked up in this request, by user ID.
+        self._memberships: dict[str, dict[str, ProjectRole]] = {}
 
     # ---- Commands ----
 
@@ -72,6 +90,8 @@ class ProjectService:
         project_id: str,
         data: ProjectUpdate,
         current_user: CurrentUser,
+        *,
+        if_match: str | None = None,
     ) -> ProjectResponse:
         """Update an existing project.
 
@@ -79,9 +99,31 @@ class ProjectService:
           - Admin: can update any project.
           - PM: can update projects they own.
           - Developer/Viewer: no access.
+
+        With `if_match` (the client's ETag), the row is read fresh and locked,
+        and the update is refused with 412 if it has changed since.
         """
-        project = await self.repo.get_or_raise(project_id, resource_name="Project")
-        self._require_modify_permission(current_user, project)
+        result, _ = await self.update_project_versioned(
+            project_id, data, current_user, if_match=if_match
+        )
+        return result
+
+    async def update_project_versioned(
+        self,
+        project_id: str,
+        data: ProjectUpdate,
+        current_user: CurrentUser,
+        *,
+        if_match: str | None = None,
+    ) -> tuple[ProjectResponse, Validators]:
+        """update_project plus the validators of the updated project."""
+        if if_match is None:
+            project = await self.repo.get_or_raise(project_id, resource_name="Project")
+            self._require_modify_permission(current_user, project)
+        else:
+            project = await self.repo.get_for_update(project_id, resource_name="Project")
+            self._require_modify_permission(current_user, project)
+            require_match(if_match, self.project_etag(project.id, project.version))
 
         # Build update dict from provided fields only
         update_data = data.model_dump(exclude_unset=True)
@@ -106,7 +148,11 @@ class ProjectService:
             domain="projects",
         )
 
-        return ProjectResponse.model_validate(updated)
+        validators = Validators(
+            etag=self.project_etag(updated.id, updated.version),
+            last_modified=updated.updated_at,
+        )
+        return ProjectResponse.model_validate(updated), validators
 
     async def soft_delete_project(
         self,
@@ -135,46 +181,175 @@ class ProjectService:
             domain="projects",
         )
 
+    async def create_projects(
+        self,
+        items: list[ProjectCreate],
+        current_user: CurrentUser,
+    ) -> ProjectBulkCreateResponse:
+        """Create many projects owned by the current user.
+
+        RBAC: Admin and PM can create projects.
+        """
+        self._require_create_permission(current_user)
+
+        result = await self.repo.create_many(
+            [
+                {
+                    "name": item.name,
+                    "description": item.description,
+                    "status": ProjectStatus.ACTIVE.value,
+                    "owner_id": current_user.id,
+                }
+                for item in items
+            ]
+        )
+
+        logger.info(
+            "projects_bulk_created",
+            count=result.count,
+            chunk_counts=result.chunk_counts,
+            owner_id=current_user.id,
+            domain="projects",
+        )
+
+        return ProjectBulkCreateResponse(
+            data=[ProjectResponse.model_validate(p) for p in result.items],
+            chunk_counts=result.chunk_counts,
+        )
+
+    async def soft_delete_projects(
+        self,
+        project_ids: list[str],
+        current_user: CurrentUser,
+    ) -> ProjectBulkDeleteResponse:
+        """Soft-delete many projects in set-based statements.
+
+        RBAC:
+          - Admin: can delete any project.
+          - PM: only owned projects are deleted; the ownership check runs in SQL.
+          - Developer/Viewer: no access.
+        """
+        if current_user.has_role(Role.ADMIN):
+            result = await self.repo.soft_delete_many(ids=project_ids)
+        elif current_user.has_role(Role.PM):
+            result = await self.repo.soft_delete_many(
+                ids=project_ids, filters={"owner_id": current_user.id}
+            )
+        else:
+            raise InsufficientPermissionError("You do not have permission to modify projects")
+
+        deleted = set(result.ids)
+        not_deleted = [pid for pid in dict.fromkeys(project_ids) if pid not in deleted]
+
+        logger.info(
+            "projects_bulk_soft_deleted",
+            count=result.count,
+            skipped=len(not_deleted),
+            chunk_counts=result.chunk_counts,
+            user_id=current_user.id,
+            domain="projects",
+        )
+
+        return ProjectBulkDeleteResponse(
+            deleted=result.ids,
+            not_deleted=not_deleted,
+            chunk_counts=result.chunk_counts,
+        )
+
     # ---- Queries ----
 
     async def get_project(
         self,
         project_id: str,
         current_user: CurrentUser,
+        *,
+        fields: FieldSelection = None,
     ) -> ProjectResponse:
         """Get a single project by ID.
 
         RBAC: All authenticated users can read projects they have access to.
         Currently: Admin sees all, others see their own.
+
+        The row is loaded whole (it is cached and the RBAC check needs
+        owner_id); `fields` only narrows the response.
         """
+        result, _ = await self.get_project_versioned(project_id, current_user, fields=fields)
+        return result
+
+    async def get_project_versioned(
+        self,
+        project_id: str,
+        current_user: CurrentUser,
+        *,
+        fields: FieldSelection = None,
+    ) -> tuple[ProjectResponse, Validators]:
+        """get_project plus the ETag / Last-Modified of the returned representation."""
         project = await self.repo.get_or_raise(project_id, resource_name="Project")
-        self._require_read_permission(current_user, project)
-        return ProjectResponse.model_validate(project)
+        await self._require_read_permission(current_user, project)
+        validators = Validators(
+            etag=self.project_etag(project.id, project.version, fields),
+            last_modified=project.updated_at,
+        )
+        return self._schema(fields).model_validate(project), validators
+
+    async def get_projects(
+        self,
+        project_ids: list[str],
+        current_user: CurrentUser,
+    ) -> ProjectBatchGetResponse:
+        """Fetch many projects in one query, keeping the requested order.
+
+        RBAC: the same rules as get_project, applied per project. Projects the
+        caller may not read are reported as missing rather than forbidden.
+        """
+        requested = list(dict.fromkeys(project_ids))
+        found = {project.id: project for project in await self.repo.get_many(requested)}
+
+        data: list[ProjectResponse] = []
+        missing: list[str] = []
+        for project_id in requested:
+            project = found.get(project_id)
+            if project is None or not await self._can_read(current_user, project):
+                missing.append(project_id)
+            else:
+                data.append(ProjectResponse.model_validate(project))
+
+        return ProjectBatchGetResponse(data=data, missing=missing)
 
     async def list_projects(
         self,
         current_user: CurrentUser,
         pagination: PaginationParams,
+        *,
+        fields: FieldSelection = None,
     ) -> PaginatedResponse[ProjectResponse]:
         """List projects with pagination.
 
         RBAC:
           - Admin: sees all projects.
           - Others: see only projects they own/are members of.
+
+        The admin listing spans the whole table, so its total is a planner
+        estimate once it grows past the repository's count cap. With
+        `fields`, only those columns are selected and serialized.
         """
         if current_user.has_role(Role.ADMIN):
             items, total = await self.repo.get_multi(
                 offset=pagination.offset,
                 limit=pagination.per_page,
+                count_strategy=CountStrategy.ESTIMATED,
+                fields=fields,
             )
         else:
             items, total = await self.repo.list_accessible_by_user(
                 user_id=current_user.id,
                 offset=pagination.offset,
                 limit=pagination.per_page,
+                fields=fields,
             )
 
-        project_responses = [ProjectResponse.model_validate(p) for p in items]
+        schema = self._schema(fields)
+        project_responses = [schema.model_validate(p) for p in items]
 
         return PaginatedResponse.create(
             data=project_responses,
@@ -183,14 +358,211 @@ class ProjectService:
             per_page=pagination.per_page,
         )
 
+    async def list_projects_json(
+        self,
+        current_user: CurrentUser,
+        pagination: PaginationParams,
+        *,
+        fields: FieldSelection = None,
+    ) -> bytes:
+        """list_projects rendered straight to JSON bytes.
+
+        Same scoping, totals and output as list_projects, but reads Core rows
+        instead of ORM objects and validates the page in one TypeAdapter call.
+        """
+        if current_user.has_role(Role.ADMIN):
+            rows, total = await self.repo.get_multi_rows(
+                offset=pagination.offset,
+                limit=pagination.per_page,
+                count_strategy=CountStrategy.ESTIMATED,
+                fields=fields,
+            )
+        else:
+            rows, total = await self.repo.list_accessible_by_user_rows(
+                user_id=current_user.id,
+                offset=pagination.offset,
+                limit=pagination.per_page,
+                fields=fields,
+            )
+
+        meta = PaginationMeta.create(
+            total=total, page=pagination.page, per_page=pagination.per_page
+        )
+        return envelope_json(rows_to_json(self._schema(fields), rows), meta)
+
+    async def list_projects_keyset(
+        self,
+        current_user: CurrentUser,
+        *,
+        cursor: str | None,
+        per_page: int,
+        fields: FieldSelection = None,
+    ) -> CursorPaginatedResponse[ProjectResponse]:
+        """List projects with keyset (cursor) pagination.
+
+        RBAC: same scoping as list_projects.
+        """
+        if current_user.has_role(Role.ADMIN):
+            items, next_cursor = await self.repo.get_multi_keyset(
+                cursor=cursor,
+                limit=per_page,
+                fields=fields,
+            )
+        else:
+            items, next_cursor = await self.repo.list_accessible_by_user_keyset(
+                user_id=current_user.id,
+                cursor=cursor,
+                limit=per_page,
+                fields=fields,
+            )
+
+        schema = self._schema(fields)
+        return CursorPaginatedResponse.create(
+            data=[schema.model_validate(p) for p in items],
+            next_cursor=next_cursor,
+            per_page=per_page,
+        )
+
+    # ---- Conditional Requests ----
+
+    async def project_validators(
+        self,
+        project_id: str,
+        current_user: CurrentUser,
+        *,
+        fields: FieldSelection = None,
+    ) -> Validators:
+        """Validators of one project from its version alone (no row load).
+
+        Same RBAC and 404 behaviour as get_project, so a 304 never reveals
+        more than the full response would.
+        """
+        current = await self.repo.get_version(project_id)
+        if current is None:
+            raise NotFoundError("Project", project_id)
+        await self._require_read_permission(current_user, current)  # type: ignore[arg-type]
+        return Validators(
+            etag=self.project_etag(current.id, current.version, fields),
+            last_modified=current.updated_at,
+        )
+
+    async def listing_validators(self, current_user: CurrentUser, *, variant: str) -> Validators:
+        """Validators of a listing from its scope's fingerprint.
+
+        `variant` distinguishes representations of the same scope (route,
+        page, page size, cursor, fields); see `request_variant`.
+        """
+        user_id = None if current_user.has_role(Role.ADMIN) else current_user.id
+        fingerprint = await self.repo.listing_fingerprint(user_id)
+        return Validators(
+            etag=make_etag("projects", user_id or "*", *fingerprint, variant),
+            last_modified=max(
+                (value for value in fingerprint if isinstance(value, datetime)), default=None
+            ),
+        )
+
+    @staticmethod
+    def project_etag(project_id: str, version: int, fields: FieldSelection = None) -> str:
+        """ETag of one project version; each field selection is a variant of it.
+
+        If-Match accepts any variant of the current version (see
+        `require_match`), so a sparse read can guard an update.
+        """
+        return make_etag("project", project_id, version, variant=",".join(sorted(fields or ())))
+
+    async def export_projects(self, current_user: CurrentUser) -> AsyncIterator[ProjectResponse]:
+        """Stream every project visible to the user.
+
+        RBAC: same scoping as list_projects.
+        """
+        if current_user.has_role(Role.ADMIN):
+            rows = self.repo.stream()
+        else:
+            rows = self.repo.stream_accessible_by_user(current_user.id)
+
+        logger.info("projects_export_started", user_id=current_user.id, domain="projects")
+
+        async for project in rows:
+            yield ProjectResponse.model_validate(project)
+
+    # ---- Members ----
+
+    async def list_members(
+        self, project_id: str, current_user: CurrentUser
+    ) -> list[ProjectMemberResponse]:
+        """Members of a project (the owner is on the project itself).
+
+        RBAC: anyone who can read the project.
+        """
+        project = await self.repo.get_or_raise(project_id, resource_name="Project")
+        await self._require_read_permission(current_user, project)
+        members = await self.repo.list_members(project_id)
+        return [ProjectMemberResponse.model_validate(m) for m in members]
+
+    async def set_member(
+        self,
+        project_id: str,
+        user_id: str,
+        data: ProjectMemberSet,
+        current_user: CurrentUser,
+    ) -> ProjectMemberResponse:
+        """Add a member to a project, or change their role.
+
+        RBAC: same as update_project.
+        """
+        project = await self.repo.get_or_raise(project_id, resource_name="Project")
+        self._require_modify_permission(current_user, project)
+        if data.role is ProjectRole.OWNER or user_id == project.owner_id:
+            raise BusinessRuleError("Project ownership cannot be granted as a membership")
+
+        member = await self.repo.set_member(project_id, user_id, data.role)
+        self._memberships.pop(user_id, None)
+
+        logger.info(
+            "project_member_set",
+            project_id=project_id,
+            member_id=user_id,
+            role=data.role.value,
+            user_id=current_user.id,
+            domain="projects",
+        )
+
+        return ProjectMemberResponse.model_validate(member)
+
+    async def remove_member(self, project_id: str, user_id: str, current_user: CurrentUser) -> None:
+        """Remove a member from a project.
+
+        RBAC: same as update_project.
+        """
+        project = await self.repo.get_or_raise(project_id, resource_name="Project")
+        self._require_modify_permission(current_user, project)
+        if not await self.repo.remove_member(project_id, user_id):
+            raise NotFoundError("Project member", user_id)
+        self._memberships.pop(user_id, None)
+
+        logger.info(
+            "project_member_removed",
+            project_id=project_id,
+            member_id=user_id,
+            user_id=current_user.id,
+            domain="projects",
+        )
+
+    # ---- Serialization (Private) ----
+
+    @staticmethod
+    def _schema(fields: FieldSelection) -> type[ProjectResponse]:
+        """ProjectResponse, or its cached partial model for a field selection."""
+        if fields is None:
+            return ProjectResponse
+        return partial_model(ProjectResponse, fields)  # type: ignore[return-value]
+
     # ---- RBAC Enforcement (Private) ----
 
     def _require_create_permission(self, user: CurrentUser) -> None:
         """Only Admin and PM can create projects."""
         if not user.has_role(Role.ADMIN, Role.PM):
-            raise InsufficientPermissionError(
-                "Only Admin and PM roles can create projects"
-            )
+            raise InsufficientPermissionError("Only Admin and PM roles can create projects")
 
     def _require_modify_permission(self, user: CurrentUser, project: Project) -> None:
         """Admin can modify any. PM can modify own. Others cannot."""
@@ -198,23 +570,24 @@ class ProjectService:
             return
         if user.has_role(Role.PM) and project.owner_id == user.id:
             return
-        raise InsufficientPermissionError(
-            "You do not have permission to modify this project"
-        )
+        raise InsufficientPermissionError("You do not have permission to modify this project")
+
+    async def _require_read_permission(self, user: CurrentUser, project: Project) -> None:
+        """Raise unless `user` may read `project` (see `_can_read`)."""
+        if not await self._can_read(user, project):
+            raise InsufficientPermissionError("You do not have access to this project")
 
-    def _require_read_permission(self, user: CurrentUser, project: Project) -> None:
-        """Admin can read any. Others can read own projects.
+    async def _can_read(self, user: CurrentUser, project: Project) -> bool:
+        """Admin can read any. Others can read projects they own or are members of.
 
-        This will be extended with project membership checks later.
+        Memberships come from the repository's cached per-user map, looked
+        up at most once per request and only when ownership does not decide.
         """
-        if user.has_role(Role.ADMIN):
-            return
-        if project.owner_id == user.id:
-            return
-        # Future: check project_members table
-        raise InsufficientPermissionError(
-            "You do not have access to this project"
-        )
+        if user.has_role(Role.ADMIN) or project.owner_id == user.id:
+            return True
+        if user.id not in self._memberships:
+            self._memberships[user.id] = await self.repo.get_memberships(user.id)
+        return project.id in self._memberships[user.id]
 
     # ---- Business Rule Validation (Private) ----
 
@@ -236,7 +609,4 @@ class ProjectService:
 
         allowed = allowed_transitions.get(current, set())
         if target not in allowed:
-            raise BusinessRuleError(
-                f"Cannot transition project from {current} to {target.value}"
-            )
-
+            raise BusinessRuleError(f"Cannot transition project from {current} to {target.value}")
@@ -8,12 +8,33 @@ from __future__ import annotations
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.v1 import api_router
+from app.core.cache import close_shared_cache, get_shared_cache
 from app.core.config import get_settings
+from app.core.event_bus import event_bus
 from app.core.exceptions import register_exception_handlers
+from app.core.logging import configure_logging, shutdown_logging
+from app.core.metrics import render_metrics
+from app.core.redis import close_redis, get_redis
+from app.core.security import password_hash_pool
+from app.domains.auth.repository import close_refresh_token_store, get_refresh_token_store
+from app.domains.projects.cache import build_project_cache
+from app.domains.projects.cache import register_event_handlers as register_project_handlers
+from app.domains.projects.cache import unregister_event_handlers as unregister_project_handlers
+from app.middleware.compression import CompressionMiddleware
+from app.middleware.logging import LoggingMiddleware
+from app.middleware.metrics import MetricsMiddleware
+from app.middleware.query_stats import QueryStatsMiddleware
+from app.middleware.rate_limiter import (
+    RateLimitMiddleware,
+    RedisSlidingWindow,
+    TokenBucketBackend,
+    default_policies,
+)
+from app.middleware.request_id import RequestIDMiddleware
 
 
 @asynccontextmanager
@@ -21,9 +42,26 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan: startup and shutdown events."""
     # Startup
     settings = get_settings()
-    # Future: initialize DB engine pool, warm caches, etc.
+    if settings.CACHE_ENABLED:
+        # Evict this worker's L1 entries when another worker changes a key.
+        get_shared_cache().start()
+    # Invalidate cached projects as project events are published.
+    project_cache = build_project_cache(settings)
+    register_project_handlers(event_bus, project_cache)
+    if settings.AUTH_REVOCATION_FILTER_ENABLED:
+        # Mirror the refresh-token revocation list into this worker's filter.
+        # Does not wait for Redis: while it is unreachable (at startup too),
+        # the listener retries and revocation checks go to Redis directly.
+        get_refresh_token_store().start()
+    # Future: initialize DB engine pool, etc.
     yield
     # Shutdown
+    unregister_project_handlers(event_bus, project_cache)
+    await close_shared_cache()
+    await close_refresh_token_store()
+    await close_redis()
+    password_hash_pool.shutdown()
+    shutdown_logging()
     # Future: dispose DB engine, flush logs, etc.
 
 
@@ -33,6 +71,7 @@ def create_app() -> FastAPI:
     Returns a fully-configured FastAPI instance.
     """
     settings = get_settings()
+    configure_logging(settings)
 
     app = FastAPI(
         title=settings.APP_NAME,
@@ -47,6 +86,23 @@ def create_app() -> FastAPI:
     register_exception_handlers(app)
 
     # ---- Middleware ----
+    if settings.RATE_LIMIT_ENABLED:
+        # Added before CORS so CORS wraps it: preflights are answered without
+        # spending budget, and 429s still carry the CORS headers.
+        app.add_middleware(
+            RateLimitMiddleware,
+            backend=(
+                RedisSlidingWindow(get_redis())
+                if settings.RATE_LIMIT_BACKEND == "redis"
+                else TokenBucketBackend(max_keys=settings.RATE_LIMIT_MAX_KEYS)
+            ),
+            policies=default_policies(
+                login_per_minute=settings.RATE_LIMIT_LOGIN_PER_MINUTE,
+                user_per_minute=settings.RATE_LIMIT_USER_PER_MINUTE,
+                anonymous_per_minute=settings.RATE_LIMIT_ANONYMOUS_PER_MINUTE,
+            ),
+            trust_forwarded=settings.RATE_LIMIT_TRUST_FORWARDED,
+        )
     app.add_middleware(
         CORSMiddleware,
         allow_origins=settings.CORS_ORIGINS,
@@ -54,7 +110,25 @@ def create_app() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
-    # Future: RequestIDMiddleware, LoggingMiddleware, RateLimiterMiddleware
+    app.add_middleware(QueryStatsMiddleware)
+    # Logging wraps QueryStats (to see its db fields) and sits inside
+    # RequestID (so every record carries the request id).
+    app.add_middleware(LoggingMiddleware, slow_request_ms=settings.LOG_SLOW_REQUEST_MS)
+    app.add_middleware(RequestIDMiddleware)
+    if settings.METRICS_ENABLED:
+        # Inside compression, which copies the scope: the router's
+        # scope["route"] must be visible here.
+        app.add_middleware(MetricsMiddleware)
+    if settings.COMPRESSION_ENABLED:
+        # Added last, so it wraps everything else and sees final headers.
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+            gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+            brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+            compress_streams=settings.COMPRESSION_STREAMS,
+            cache_entries=settings.COMPRESSION_CACHE_ENTRIES,
+        )
 
     # ---- Routers ----
     app.include_router(api_router)
@@ -64,6 +138,15 @@ def create_app() -> FastAPI:
     async def health_check() -> dict[str, str]:
         return {"status": "healthy", "version": settings.APP_VERSION}
 
+    # ---- Metrics endpoint ----
+    if settings.METRICS_ENABLED:
+
+        @app.get("/metrics", include_in_schema=False)
+        def metrics() -> Response:
+            # Sync: in multiprocess mode the scrape reads every worker's files.
+            body, content_type = render_metrics()
+            return Response(body, media_type=content_type)
+
     return app
 
 
@@ -0,0 +1,264 @@
+# Compression Middleware
+# ----------------------
+# Pure ASGI response compression with Accept-Encoding negotiation.
+#
+# On every HTTP response with a compressible content type:
+#   1. Pick `br` (when the optional `brotli` package is installed) or `gzip`
+#      from the client's Accept-Encoding, honouring q-values
+#   2. Leave bodies under `minimum_size` untouched
+#   3. Compress complete bodies in one go; responses that carry an ETag are
+#      kept compressed in a small LRU keyed by (path, status, ETag, encoding),
+#      so hot unchanged payloads are not recompressed on every request
+#   4. Pass streaming responses through, or compress them chunk by chunk
+#      (with a sync flush per chunk) when `compress_streams` is enabled
+#
+# Compressed responses get `Content-Encoding`, `Vary: Accept-Encoding` and an
+# encoding-specific ETag (`"tag"` -> `"tag-gzip"`). The suffix is stripped
+# from If-None-Match / If-Match on the way in, so routes only ever compare
+# their own tags.
+
+from __future__ import annotations
+
+import gzip
+import re
+import zlib
+from typing import Any
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.cache import LRUCache
+
+try:  # optional: enables `br`
+    import brotli
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None  # type: ignore[assignment]
+
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/xml",
+    "application/problem+json",
+)
+
+_ETAG_SUFFIX = re.compile(r'-(?:gzip|br)"')
+_PRECONDITION_HEADERS = (b"if-none-match", b"if-match")
+
+
+def available_encodings() -> tuple[str, ...]:
+    """Encodings this process can produce, in order of preference."""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate(accept_encoding: str, available: tuple[str, ...]) -> str | None:
+    """Best of `available` for an Accept-Encoding header, or None for identity."""
+    weights: dict[str, float] = {}
+    for item in accept_encoding.lower().split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            weights[name.strip()] = quality
+    wildcard = weights.get("*", 0.0)
+    best = max(available, key=lambda name: weights.get(name, wildcard), default=None)
+    if best is None or weights.get(best, wildcard) <= 0:
+        return None
+    return best
+
+
+class CompressionMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        compress_streams: bool = False,
+        cache_entries: int = 256,
+        cache_max_body: int = 1 << 20,
+        cache_ttl_seconds: float = 300.0,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.compress_streams = compress_streams
+        self.cache_max_body = cache_max_body
+        self.cache = LRUCache(max_entries=cache_entries, ttl_seconds=cache_ttl_seconds)
+        self.encodings = available_encodings()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        scope = _canonical_preconditions(scope)
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding", ""), self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _Responder(self, encoding, scope["path"], send)
+        await self.app(scope, receive, responder)
+
+    # ---- Compression ----
+
+    def compress(self, body: bytes, encoding: str) -> bytes:
+        if encoding == "br":
+            return brotli.compress(body, quality=self.brotli_quality)
+        # mtime=0 keeps the output deterministic for identical bodies.
+        return gzip.compress(body, compresslevel=self.gzip_level, mtime=0)
+
+    def compressor(self, encoding: str) -> _StreamCompressor:
+        if encoding == "br":
+            return _BrotliStream(self.brotli_quality)
+        return _GzipStream(self.gzip_level)
+
+
+class _Responder:
+    """The `send` callable for one response.
+
+    Holds back the start message until the first body chunk shows whether
+    (and how) to compress.
+    """
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, path: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self.path = path
+        self.send = send
+        self.start: Message | None = None
+        self.passthrough = False
+        self.stream: _StreamCompressor | None = None
+
+    async def __call__(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start = message
+            self.passthrough = not _compressible(message)
+            if self.passthrough:
+                await self.send(message)
+            return
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.stream is not None:
+            chunk = self.stream.compress(body, final=not more_body)
+            await self.send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+            return
+
+        assert self.start is not None
+        if more_body:
+            await self._start_stream(body)
+        elif len(body) < self.middleware.minimum_size:
+            await self._send_unchanged(message)
+        else:
+            await self._send_compressed(body)
+
+    async def _send_unchanged(self, message: Message) -> None:
+        self.passthrough = True
+        await self.send(self.start)  # type: ignore[arg-type]
+        await self.send(message)
+
+    async def _send_compressed(self, body: bytes) -> None:
+        assert self.start is not None
+        headers = MutableHeaders(scope=self.start)
+        etag = headers.get("etag")
+        key = f"{self.path}|{self.start['status']}|{etag}|{self.encoding}" if etag else None
+        compressed = self.middleware.cache.get(key) if key else None
+        if compressed is None:
+            compressed = self.middleware.compress(body, self.encoding)
+            if key and len(compressed) <= self.middleware.cache_max_body:
+                self.middleware.cache.set(key, compressed)
+
+        self._mark_encoded(headers)
+        headers["Content-Length"] = str(len(compressed))
+        self.passthrough = True
+        await self.send(self.start)
+        await self.send({"type": "http.response.body", "body": compressed})
+
+    async def _start_stream(self, body: bytes) -> None:
+        assert self.start is not None
+        if not self.middleware.compress_streams:
+            await self._send_unchanged(
+                {"type": "http.response.body", "body": body, "more_body": True}
+            )
+            return
+        self.stream = self.middleware.compressor(self.encoding)
+        headers = MutableHeaders(scope=self.start)
+        self._mark_encoded(headers)
+        del headers["Content-Length"]
+        await self.send(self.start)
+        chunk = self.stream.compress(body, final=False)
+        await self.send({"type": "http.response.body", "body": chunk, "more_body": True})
+
+    def _mark_encoded(self, headers: MutableHeaders) -> None:
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        etag = headers.get("etag")
+        if etag and etag.endswith('"'):
+            headers["ETag"] = f'{etag[:-1]}-{self.encoding}"'
+
+
+# ---- Streaming compressors ----
+
+
+class _StreamCompressor:
+    def compress(self, data: bytes, *, final: bool) -> bytes:
+        raise NotImplementedError
+
+
+class _GzipStream(_StreamCompressor):
+    def __init__(self, level: int) -> None:
+        # wbits=31: gzip container.
+        self._zlib: Any = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes, *, final: bool) -> bytes:
+        # Sync-flush each chunk so the client can decode it immediately.
+        flush_mode = zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH
+        return self._zlib.compress(data) + self._zlib.flush(flush_mode)
+
+
+class _BrotliStream(_StreamCompressor):
+    def __init__(self, quality: int) -> None:
+        self._brotli: Any = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes, *, final: bool) -> bytes:
+        out = self._brotli.process(data)
+        return out + (self._brotli.finish() if final else self._brotli.flush())
+
+
+# ---- Helpers (Private) ----
+
+
+def _compressible(start: Message) -> bool:
+    if start["status"] < 200 or start["status"] in (204, 206, 304):
+        return False
+    headers = Headers(raw=start.get("headers", []))
+    if "content-encoding" in headers or "no-transform" in headers.get("cache-control", ""):
+        return False
+    content_type = headers.get("content-type", "").lower()
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+def _canonical_preconditions(scope: Scope) -> Scope:
+    """Strip our encoding suffixes from entity tags in precondition headers."""
+    headers = scope["headers"]
+    if not any(name in _PRECONDITION_HEADERS for name, _ in headers):
+        return scope
+    rewritten = [
+        (name, _ETAG_SUFFIX.sub('"', value.decode("latin-1")).encode("latin-1"))
+        if name in _PRECONDITION_HEADERS
+        else (name, value)
+        for name, value in headers
+    ]
+    return {**scope, "headers": rewritten}
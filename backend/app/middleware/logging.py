@@ -1,21 +1,80 @@
 # Logging Middleware
 # ------------------
-# Structured request/response logging via structlog.
+# Pure ASGI structured request logging via structlog: one
+# `request_completed` record per request, written when the response
+# finishes (streamed bodies pass through untouched).
 #
 # Logs on every request:
-#   - request_id (from RequestIDMiddleware)
+#   - request_id (contextvars, from RequestIDMiddleware)
+#   - db_queries / db_time_ms (contextvars, from QueryStatsMiddleware)
 #   - method, path, query_string
 #   - status_code
-#   - latency_ms (computed)
-#   - user_id (if authenticated, from JWT)
+#   - latency_ms (computed); `slow` when over the threshold
+#   - user_id (if authenticated: request.state.user_id, set by get_current_user)
 #   - client_ip
 #
-# Configuration:
-#   - JSON format in production (for log aggregation)
-#   - Human-readable format in development
-#   - Request/response body logging DISABLED by default (PII risk)
-#   - Sensitive headers redacted (Authorization, Cookie)
+# Level follows docs/logging_error_handling.md: info for 2xx/3xx, warning
+# for 4xx, error for 5xx; an exception escaping the app is logged as
+# `request_failed` at critical with its traceback, then re-raised.
+# Request/response bodies and headers are never logged (PII risk).
 #
-# See docs/logging_error_handling.md for full standard.
-#
-# Placeholder — implementation pending.
+# Output format, the async sink and sampling: see app/core/logging.py.
+
+from __future__ import annotations
+
+import time
+
+import structlog
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = structlog.get_logger()
+
+
+class LoggingMiddleware:
+    def __init__(self, app: ASGIApp, *, slow_request_ms: float = 1000.0) -> None:
+        self.app = app
+        self.slow_request_ms = slow_request_ms
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        except Exception:
+            logger.critical("request_failed", **self._fields(scope, 500, start), exc_info=True)
+            raise
+
+        fields = self._fields(scope, status_code, start)
+        if status_code >= 500:
+            logger.error("request_completed", **fields)
+        elif status_code >= 400:
+            logger.warning("request_completed", **fields)
+        else:
+            logger.info("request_completed", **fields)
+
+    def _fields(self, scope: Scope, status_code: int, start: float) -> dict[str, object]:
+        latency_ms = round((time.perf_counter() - start) * 1000, 2)
+        client = scope.get("client")
+        fields: dict[str, object] = {
+            "method": scope["method"],
+            "path": scope["path"],
+            "query_string": scope.get("query_string", b"").decode("latin-1"),
+            "status_code": status_code,
+            "latency_ms": latency_ms,
+            "user_id": (scope.get("state") or {}).get("user_id"),
+            "client_ip": client[0] if client else None,
+        }
+        if latency_ms >= self.slow_request_ms:
+            fields["slow"] = True
+        return fields
@@ -0,0 +1,96 @@
+# Metrics Middleware
+# ------------------
+# Pure ASGI Prometheus instrumentation (see app/core/metrics.py):
+#   - http_requests_in_progress{method}
+#   - http_request_duration_seconds{method, path}
+#   - http_requests_total{method, path, status}
+#
+# `path` is the route template ("/api/v1/projects/{project_id}"), never the
+# raw URL, so IDs do not create new series. The template is only known once
+# the router has matched, so it is read from scope["route"] after the app
+# returns; the in-flight gauge is labelled by method alone for the same
+# reason. Templates are resolved once per route and cached.
+#
+# Must sit inside any middleware that copies the scope (CompressionMiddleware
+# does), or the router's scope["route"] is not visible here.
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from starlette.routing import NoMatchFound, compile_path
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import UNMATCHED_PATH, HttpMetrics, http_metrics
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp, *, metrics: HttpMetrics = http_metrics) -> None:
+        self.app = app
+        self.metrics = metrics
+        # id(route) -> (route, template); the route is kept to detect id reuse.
+        self._templates: dict[int, tuple[Any, str]] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = self.metrics.method_label(scope["method"])
+        in_progress = self.metrics.in_progress_for(method)
+        in_progress.inc()
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - start
+            in_progress.dec()
+            route = self.metrics.route(method, self._template(scope))
+            route.observe(elapsed, status_code)
+
+    def _template(self, scope: Scope) -> str:
+        route = scope.get("route")
+        if route is None:
+            return UNMATCHED_PATH
+        cached = self._templates.get(id(route))
+        if cached is not None and cached[0] is route:
+            return cached[1]
+        template = _resolve_template(scope, route)
+        self._templates[id(route)] = (route, template)
+        return template
+
+
+def _resolve_template(scope: Scope, route: Any) -> str:
+    """Full path template of the matched route, including router prefixes.
+
+    A route's own `path_format` lacks the prefixes of routers it was
+    included through, so the template is rebuilt with the top-level
+    router's `url_path_for`, substituting `{name}` for every path parameter.
+    It is only trusted if it matches the request path (route names are not
+    unique).
+    """
+    fallback = getattr(route, "path_format", None) or getattr(route, "path", UNMATCHED_PATH)
+    router = scope.get("router")
+    name = getattr(route, "name", None)
+    if router is None or not name:
+        return fallback
+    placeholders = {param: f"{{{param}}}" for param in scope.get("path_params", {})}
+    try:
+        template = str(router.url_path_for(name, **placeholders))
+    except NoMatchFound:
+        return fallback
+    path = scope["path"]
+    root_path = scope.get("root_path", "")
+    if root_path and path.startswith(root_path):
+        path = path[len(root_path) :]
+    regex, _, _ = compile_path(template)
+    return template if regex.match(path) else fallback
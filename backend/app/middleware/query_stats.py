@@ -0,0 +1,46 @@
+# Query Stats Middleware
+# ----------------------
+# Pure ASGI middleware that tracks SQL statements per request.
+#
+# On every HTTP request:
+#   1. Open a QueryStats scope (see app/db/query_stats.py)
+#   2. Add `Server-Timing: db;dur=<ms>, db-queries;desc="<count>"` to the response
+#   3. Bind db_queries / db_time_ms to structlog contextvars
+#
+# Statements run after the response starts (e.g. a streaming export's reads)
+# are not included in the header.
+
+from __future__ import annotations
+
+import structlog
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.db.query_stats import track_queries
+
+
+class QueryStatsMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+
+            async def send_with_timing(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers.append(
+                        "Server-Timing",
+                        f'db;dur={stats.duration_ms:.2f}, db-queries;desc="{stats.count}"',
+                    )
+                    structlog.contextvars.bind_contextvars(
+                        db_queries=stats.count,
+                        db_time_ms=round(stats.duration_ms, 2),
+                    )
+                await send(message)
+
+            await self.app(scope, receive, send_with_timing)
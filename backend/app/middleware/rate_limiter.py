@@ -1,6 +1,345 @@
 # Rate Limiting Middleware
 # -----------------------
-# Token-bucket or sliding window rate limiter.
-# Configurable per-route limits.
+# Pure ASGI rate limiter with per-route policies and two backends:
+#   TokenBucketBackend     in-process token buckets, one per key, bounded by
+#                          LRU eviction (per worker: limits scale with workers)
+#   RedisSlidingWindow     shared sliding-window counter; check-and-increment
+#                          is one Lua round trip, so workers share one budget
 #
-# Placeholder — implementation pending.
+# On every HTTP request, the first policy whose method/path match and whose
+# key resolves (client IP, or the `sub` of a valid bearer token) is charged.
+# Allowed responses get `X-RateLimit-Limit`, `X-RateLimit-Remaining` and
+# `X-RateLimit-Reset` (seconds); rejected requests get a 429 in the standard
+# error envelope plus `Retry-After`. Requests matching no policy pass as-is.
+#
+# Redis errors are logged and the request is allowed: a Redis outage must
+# not take the API down with it.
+
+from __future__ import annotations
+
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Literal, Protocol
+
+import structlog
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.exceptions import AppException, RateLimitExceededError
+from app.core.security import decode_access_token
+
+logger = structlog.get_logger()
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimit:
+    """`requests` per `window_seconds`."""
+
+    requests: int
+    window_seconds: float = 60.0
+
+    @property
+    def per_second(self) -> float:
+        return self.requests / self.window_seconds
+
+
+@dataclass(frozen=True, slots=True)
+class Decision:
+    allowed: bool
+    limit: int
+    remaining: int
+    reset_seconds: float  # until the full budget is available again
+    retry_after: float = 0.0  # when rejected: until one more request is allowed
+
+    @property
+    def headers(self) -> dict[str, str]:
+        headers = {
+            "X-RateLimit-Limit": str(self.limit),
+            "X-RateLimit-Remaining": str(max(0, self.remaining)),
+            "X-RateLimit-Reset": str(math.ceil(self.reset_seconds)),
+        }
+        if not self.allowed:
+            headers["Retry-After"] = str(max(1, math.ceil(self.retry_after)))
+        return headers
+
+    @property
+    def raw_headers(self) -> list[tuple[bytes, bytes]]:
+        return [(name.lower().encode(), value.encode()) for name, value in self.headers.items()]
+
+
+@dataclass(frozen=True, slots=True)
+class RoutePolicy:
+    """A limit for requests matching `methods` and `path`, counted per IP or user.
+
+    `path` is a prefix unless `exact` is set. A `per="user"` policy only
+    applies to requests with a valid bearer token, so an anonymous policy
+    listed after it catches the rest.
+    """
+
+    name: str
+    limit: RateLimit
+    path: str = "/"
+    methods: frozenset[str] | None = None
+    per: Literal["ip", "user"] = "ip"
+    exact: bool = False
+
+    def matches(self, method: str, path: str) -> bool:
+        if self.methods is not None and method not in self.methods:
+            return False
+        return path == self.path if self.exact else path.startswith(self.path)
+
+
+class RateLimitBackend(Protocol):
+    async def hit(self, key: str, limit: RateLimit) -> Decision: ...
+
+
+# ---- In-process: token buckets ----
+
+
+class TokenBucketBackend:
+    """One token bucket per key, in this process.
+
+    A bucket holds up to `limit.requests` tokens and refills continuously at
+    `limit.per_second`. `hit` has no awaits, so on one event loop it is
+    atomic without locks. At most `max_keys` buckets are kept; the least
+    recently used go first (an idle bucket has refilled, so dropping it
+    loses nothing unless it was still draining).
+    """
+
+    def __init__(self, *, max_keys: int = 100_000, clock: Callable[[], float] = time.monotonic):
+        self.max_keys = max_keys
+        self._clock = clock
+        self._buckets: OrderedDict[str, list[float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    async def hit(self, key: str, limit: RateLimit) -> Decision:
+        now = self._clock()
+        capacity = float(limit.requests)
+        rate = limit.per_second
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            tokens = capacity
+            if len(self._buckets) >= self.max_keys:
+                self._buckets.popitem(last=False)
+            bucket = self._buckets[key] = [tokens, now]
+        else:
+            tokens = min(capacity, bucket[0] + (now - bucket[1]) * rate)
+            self._buckets.move_to_end(key)
+
+        allowed = tokens >= 1.0
+        if allowed:
+            tokens -= 1.0
+        bucket[0], bucket[1] = tokens, now
+        return Decision(
+            allowed=allowed,
+            limit=limit.requests,
+            remaining=int(tokens),
+            reset_seconds=(capacity - tokens) / rate,
+            retry_after=0.0 if allowed else (1.0 - tokens) / rate,
+        )
+
+
+# ---- Shared: Redis sliding window ----
+
+# Sliding-window counter: the previous fixed window's count, weighted by how
+# much of it still overlaps the sliding window, plus the current count.
+# KEYS: current window, previous window. ARGV: limit, window ms, ms elapsed
+# in the current window. Returns {allowed, current, previous}.
+_SLIDING_WINDOW = """
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local elapsed = tonumber(ARGV[3])
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+local previous = tonumber(redis.call('GET', KEYS[2]) or '0')
+if previous * (window - elapsed) / window + current + 1 > limit then
+    return {0, current, previous}
+end
+current = redis.call('INCR', KEYS[1])
+if current == 1 then
+    redis.call('PEXPIRE', KEYS[1], window * 2)
+end
+return {1, current, previous}
+"""
+
+
+class RedisSlidingWindow:
+    """Sliding-window counters in Redis, checked and incremented atomically.
+
+    Two integer keys per client key (current and previous fixed window),
+    hash-tagged so they share a cluster slot. Approximates a true sliding
+    log to within the previous window's distribution, at O(1) memory.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        *,
+        namespace: str = "pmt:ratelimit",
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.redis = redis
+        self.namespace = namespace
+        self._clock = clock
+        self._script = redis.register_script(_SLIDING_WINDOW)
+
+    async def hit(self, key: str, limit: RateLimit) -> Decision:
+        window_ms = int(limit.window_seconds * 1000)
+        now_ms = int(self._clock() * 1000)
+        index, elapsed = divmod(now_ms, window_ms)
+        keys = [f"{self.namespace}:{{{key}}}:{index}", f"{self.namespace}:{{{key}}}:{index - 1}"]
+        try:
+            allowed, current, previous = await self._script(
+                keys=keys, args=[limit.requests, window_ms, elapsed]
+            )
+        except RedisError as e:
+            logger.warning("rate_limit_unavailable", error=str(e))
+            return Decision(True, limit.requests, limit.requests, limit.window_seconds)
+
+        weight = (window_ms - elapsed) / window_ms
+        used = previous * weight + current
+        left_in_window = (window_ms - elapsed) / 1000
+        return Decision(
+            allowed=bool(allowed),
+            limit=limit.requests,
+            remaining=math.floor(limit.requests - used),
+            # The previous window stops counting when this one ends, and
+            # this one's count stops counting one window later.
+            reset_seconds=left_in_window + (limit.window_seconds if current else 0.0),
+            retry_after=0.0 if allowed else _retry_after(limit, current, previous, elapsed),
+        )
+
+
+def _retry_after(limit: RateLimit, current: int, previous: int, elapsed_ms: int) -> float:
+    """Seconds until the weighted count drops below the limit again."""
+    window = limit.window_seconds
+    left_in_window = window - elapsed_ms / 1000
+    if current < limit.requests and previous:
+        # Wait for the previous window's weight to decay enough.
+        target_weight = (limit.requests - 1 - current) / previous
+        return max(0.0, left_in_window - target_weight * window)
+    # This window alone is over budget: wait for it to become the previous one.
+    return left_in_window + max(0.0, 1 - (limit.requests - 1) / max(current, 1)) * window
+
+
+# ---- Middleware ----
+
+
+class RateLimitMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        backend: RateLimitBackend,
+        policies: Iterable[RoutePolicy],
+        trust_forwarded: bool = False,
+    ) -> None:
+        self.app = app
+        self.backend = backend
+        self.policies = tuple(policies)
+        self.trust_forwarded = trust_forwarded
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        match = self._match(scope)
+        if match is None:
+            await self.app(scope, receive, send)
+            return
+
+        policy, identity = match
+        decision = await self.backend.hit(f"{policy.name}:{identity}", policy.limit)
+        if not decision.allowed:
+            await self._reject(scope, receive, send, decision)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Appended raw: these names are ours, so there is nothing to replace.
+                message["headers"] = [*message.get("headers", ()), *decision.raw_headers]
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+    def _match(self, scope: Scope) -> tuple[RoutePolicy, str] | None:
+        method, path = scope["method"], scope["path"]
+        user: str | None | Literal[False] = False  # False: not looked up yet
+        for policy in self.policies:
+            if not policy.matches(method, path):
+                continue
+            if policy.per == "ip":
+                return policy, self._client_ip(scope)
+            if user is False:
+                user = _bearer_subject(scope)
+            if user is not None:
+                return policy, user
+        return None
+
+    def _client_ip(self, scope: Scope) -> str:
+        if self.trust_forwarded:
+            forwarded = Headers(scope=scope).get("x-forwarded-for")
+            if forwarded:
+                return forwarded.split(",", 1)[0].strip()
+        client = scope.get("client")
+        return client[0] if client else "unknown"
+
+    @staticmethod
+    async def _reject(scope: Scope, receive: Receive, send: Send, decision: Decision) -> None:
+        error = RateLimitExceededError()
+        state = scope.get("state") or {}
+        response = JSONResponse(
+            status_code=error.status_code,
+            content={
+                "error": {
+                    "code": error.code,
+                    "message": error.message,
+                    "details": None,
+                    "request_id": state.get("request_id"),
+                }
+            },
+            headers=decision.headers,
+        )
+        await response(scope, receive, send)
+
+
+def default_policies(
+    *, login_per_minute: int, user_per_minute: int, anonymous_per_minute: int
+) -> tuple[RoutePolicy, ...]:
+    """The limits in docs/api-conventions.md and docs/auth_rbac.md."""
+    return (
+        RoutePolicy(
+            "login",
+            RateLimit(login_per_minute),
+            path="/api/v1/auth/login",
+            methods=frozenset({"POST"}),
+            exact=True,
+        ),
+        RoutePolicy("user", RateLimit(user_per_minute), path="/api/", per="user"),
+        RoutePolicy("anonymous", RateLimit(anonymous_per_minute), path="/api/"),
+    )
+
+
+# ---- Helpers (Private) ----
+
+
+def _bearer_subject(scope: Scope) -> str | None:
+    authorization = next(
+        (value for name, value in scope["headers"] if name == b"authorization"), b""
+    )
+    scheme, _, token = authorization.decode("latin-1").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    try:
+        subject = decode_access_token(token).get("sub")
+    except AppException:
+        return None
+    return str(subject) if subject else None
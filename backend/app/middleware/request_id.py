@@ -1,15 +1,63 @@
 # Request ID Middleware
 # --------------------
-# Assigns a unique X-Request-ID to every incoming request.
+# Pure ASGI middleware that assigns a unique X-Request-ID to every request.
 #
 # Behavior:
-#   1. Check for existing X-Request-ID header (from load balancer/gateway)
-#   2. If missing, generate a new UUID4
-#   3. Inject into request.state.request_id
+#   1. Reuse an incoming X-Request-ID header (from load balancer/gateway)
+#      if it is short and printable; otherwise generate a new UUID4
+#   2. Inject into request.state.request_id (scope["state"], in place, so
+#      the exception handlers see it too)
+#   3. Bind to structlog contextvars for the rest of the request
 #   4. Add X-Request-ID to response headers
-#   5. Make available to structlog context via contextvars
 #
 # This enables end-to-end request tracing across logs,
 # error reports, and downstream service calls.
 #
-# Placeholder — implementation pending.
+# The middleware runs in the request's own task (no BaseHTTPMiddleware
+# call_next task), so the binding reaches every log line of the request
+# without copying the context.
+
+from __future__ import annotations
+
+import re
+import uuid
+
+import structlog
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Loose enough for UUIDs and common tracing ids; strict enough to keep
+# arbitrary client input out of logs and headers.
+_VALID_REQUEST_ID = re.compile(r"[A-Za-z0-9._:\-]{1,128}")
+
+
+class RequestIDMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = _incoming(scope) or str(uuid.uuid4())
+        scope.setdefault("state", {})["request_id"] = request_id
+        header = (b"x-request-id", request_id.encode("latin-1"))
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), header]
+            await send(message)
+
+        tokens = structlog.contextvars.bind_contextvars(request_id=request_id)
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            structlog.contextvars.reset_contextvars(**tokens)
+
+
+def _incoming(scope: Scope) -> str | None:
+    for name, value in scope["headers"]:
+        if name == b"x-request-id":
+            candidate = value.decode("latin-1")
+            return candidate if _VALID_REQUEST_ID.fullmatch(candidate) else None
+    return None
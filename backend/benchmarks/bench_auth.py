@@ -0,0 +1,56 @@
+# Auth Dependency Benchmark
+# -------------------------
+# Per-request cost of `get_current_user` for a reused access token:
+#   verify  full jose decode + HMAC check on every call (use_cache=False)
+#   cached  VerifiedTokenCache hit after the first verification
+# Measures the dependency alone (no HTTP stack), so the difference is the
+# overhead the cache removes from every authenticated request.
+#
+# Usage (from backend/):
+#   python -m benchmarks.bench_auth [--iterations 20000]
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from app.core import security
+from app.core.dependencies import get_current_user
+from app.core.security import VerifiedTokenCache, create_access_token
+
+
+async def _time(token: str, iterations: int) -> float:
+    """Best-of-3 mean seconds per get_current_user call."""
+    request = SimpleNamespace(state=SimpleNamespace())
+    await get_current_user(request, token)  # type: ignore[arg-type]
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            await get_current_user(request, token)  # type: ignore[arg-type]
+        best = min(best, (time.perf_counter() - start) / iterations)
+    return best
+
+
+async def main(iterations: int) -> None:
+    token = create_access_token("00000000-0000-0000-0000-000000000001", role="PM")
+
+    with patch.object(security, "verified_tokens", None):
+        verify = await _time(token, iterations)
+    with patch.object(security, "verified_tokens", VerifiedTokenCache()):
+        cached = await _time(token, iterations)
+
+    print(f"get_current_user, {iterations} iterations (best of 3)")
+    for name, seconds in (("verify", verify), ("cached", cached)):
+        print(f"  {name:<7} {seconds * 1e6:8.2f} us/request")
+    print(f"  speedup {verify / cached:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=20_000)
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations))
@@ -0,0 +1,129 @@
+# Metrics Benchmark
+# -----------------
+# Per-request overhead of Prometheus instrumentation around a bare Starlette
+# router with one templated route (/projects/{project_id}), so the
+# instrumentation is not lost in FastAPI's own per-request cost:
+#   none      no instrumentation (baseline)
+#   labels    the same metrics, resolving children per request with
+#             `.labels(method=..., path=..., status=...)`
+#   prebound  MetricsMiddleware (children bound once, templates cached)
+# Calls the ASGI stack directly (no HTTP client). `--multiprocess` runs
+# with PROMETHEUS_MULTIPROC_DIR set (values written to mmap'd files), as
+# under gunicorn.
+#
+# Usage (from backend/):
+#   python -m benchmarks.bench_metrics [--iterations 20000] [--multiprocess]
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from typing import Any
+
+
+async def _receive() -> dict[str, Any]:
+    return {"type": "http.request", "body": b""}
+
+
+async def _send(message: dict[str, Any]) -> None:
+    return None
+
+
+def _build_app() -> Any:
+    from starlette.responses import Response
+    from starlette.routing import Route, Router
+
+    async def get_project(request: Any) -> Response:
+        return Response(b"{}", media_type="application/json")
+
+    return Router([Route("/projects/{project_id}", get_project, name="get_project")])
+
+
+def _per_request_labels(app: Any, metrics: Any) -> Any:
+    """The naive shape: label kwargs resolved on every request."""
+
+    async def instrumented(scope: dict[str, Any], receive: Any, send: Any) -> None:
+        status_code = 500
+
+        async def send_with_status(message: dict[str, Any]) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        metrics.in_progress.labels(method=scope["method"]).inc()
+        start = time.perf_counter()
+        try:
+            await app(scope, receive, send_with_status)
+        finally:
+            route = scope.get("route")
+            path = route.path_format if route is not None else "<unmatched>"
+            metrics.in_progress.labels(method=scope["method"]).dec()
+            metrics.duration.labels(method=scope["method"], path=path).observe(
+                time.perf_counter() - start
+            )
+            metrics.requests.labels(
+                method=scope["method"], path=path, status=str(status_code)
+            ).inc()
+
+    return instrumented
+
+
+async def _time(app: Any, iterations: int) -> float:
+    """Best-of-3 mean seconds per request."""
+    scope = {
+        "type": "http",
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/projects/1",
+        "raw_path": b"/projects/1",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+        "client": ("10.0.0.1", 40000),
+        "server": ("testserver", 80),
+    }
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for i in range(iterations):
+            await app({**scope, "path": f"/projects/{i}"}, _receive, _send)
+        best = min(best, (time.perf_counter() - start) / iterations)
+    return best
+
+
+async def main(iterations: int) -> None:
+    # Imported here: prometheus_client picks its value storage at import time.
+    from prometheus_client import CollectorRegistry
+
+    from app.core.metrics import HttpMetrics
+    from app.middleware.metrics import MetricsMiddleware
+
+    app = _build_app()
+    apps = {
+        "none": app,
+        "labels": _per_request_labels(app, HttpMetrics(CollectorRegistry())),
+        "prebound": MetricsMiddleware(app, metrics=HttpMetrics(CollectorRegistry())),
+    }
+    results = {name: await _time(instrumented, iterations) for name, instrumented in apps.items()}
+
+    mode = "multiprocess" if os.environ.get("PROMETHEUS_MULTIPROC_DIR") else "single process"
+    print(f"Prometheus instrumentation, {iterations} requests ({mode})")
+    for name, seconds in results.items():
+        overhead = seconds - results["none"]
+        print(f"  {name:<9} {seconds * 1e6:8.2f} us/request   +{overhead * 1e6:8.2f} us")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=20_000)
+    parser.add_argument("--multiprocess", action="store_true")
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as directory:
+        if args.multiprocess:
+            os.environ["PROMETHEUS_MULTIPROC_DIR"] = directory
+        asyncio.run(main(args.iterations))
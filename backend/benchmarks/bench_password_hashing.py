@@ -0,0 +1,105 @@
+# Password Hashing Load Benchmark
+# -------------------------------
+# Latency of an unrelated endpoint (`GET /ping`) while a burst of logins
+# hashes passwords on the same worker, with login hashing done:
+#   idle      no logins (baseline)
+#   inline    hash_password called directly in the async route
+#   pool      hash_password_async on PasswordHashPool
+# Requests go through the ASGI stack in-process (httpx ASGITransport), so
+# the numbers isolate event-loop blocking from network effects.
+#
+# Usage (from backend/):
+#   python -m benchmarks.bench_password_hashing [--logins 32] [--rounds 12]
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+from fastapi import FastAPI
+from passlib.context import CryptContext
+
+from app.core import security
+from app.core.exceptions import register_exception_handlers
+from app.core.security import PasswordHashPool, hash_password, hash_password_async
+
+PING_INTERVAL = 0.005
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+    register_exception_handlers(app)
+
+    @app.get("/ping")
+    async def ping() -> dict[str, bool]:
+        return {"ok": True}
+
+    @app.post("/login/inline")
+    async def login_inline() -> dict[str, str]:
+        return {"hash": hash_password("correct horse battery staple")}
+
+    @app.post("/login/pool")
+    async def login_pool() -> dict[str, str]:
+        return {"hash": await hash_password_async("correct horse battery staple")}
+
+    return app
+
+
+async def _ping_latencies(client: httpx.AsyncClient, stop: asyncio.Event) -> list[float]:
+    # Latency counts from when each ping was due, so time the loop spends
+    # blocked (and the ping therefore waits to be sent) is included.
+    latencies: list[float] = []
+    while not stop.is_set():
+        due = time.perf_counter() + PING_INTERVAL
+        await asyncio.sleep(PING_INTERVAL)
+        await client.get("/ping")
+        latencies.append(time.perf_counter() - due)
+    return latencies
+
+
+async def _scenario(client: httpx.AsyncClient, path: str | None, logins: int) -> list[float]:
+    stop = asyncio.Event()
+    pinger = asyncio.create_task(_ping_latencies(client, stop))
+    if path is None:
+        await asyncio.sleep(1.0)
+    else:
+        statuses = await asyncio.gather(*(client.post(path) for _ in range(logins)))
+        rejected = sum(response.status_code == 503 for response in statuses)
+        if rejected:
+            print(f"  ({path}: {rejected}/{logins} logins rejected with 503)")
+    stop.set()
+    return await pinger
+
+
+def _report(name: str, latencies: list[float]) -> None:
+    ordered = sorted(latencies)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    print(
+        f"  {name:<7} n={len(ordered):<5} p50 {statistics.median(ordered) * 1e3:8.2f} ms"
+        f"   p99 {p99 * 1e3:8.2f} ms   max {ordered[-1] * 1e3:8.2f} ms"
+    )
+
+
+async def main(logins: int, rounds: int, workers: int) -> None:
+    security.pwd_context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=rounds)
+    security.password_hash_pool = PasswordHashPool(workers=workers, queue_limit=logins)
+    transport = httpx.ASGITransport(app=_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        hash_password("warm-up")
+        print(f"GET /ping during {logins} concurrent logins (bcrypt rounds={rounds})")
+        _report("idle", await _scenario(client, None, logins))
+        _report("inline", await _scenario(client, "/login/inline", logins))
+        _report("pool", await _scenario(client, "/login/pool", logins))
+    security.password_hash_pool.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--logins", type=int, default=32)
+    parser.add_argument("--rounds", type=int, default=12)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+    asyncio.run(main(args.logins, args.rounds, args.workers))
@@ -0,0 +1,131 @@
+# Project List Benchmark
+# ----------------------
+# Per-row cost of GET /api/v1/projects at 100-row pages, comparing:
+#   orm   ORM objects -> per-item model_validate -> PaginatedResponse, then
+#         FastAPI's response handling (re-validate against response_model,
+#         serialize_json), as `serialize_response` does for the default class.
+#   rows  Core rows -> one TypeAdapter validate -> JSON bytes (list_projects_json).
+# Runs against in-memory SQLite, so database time is a lower bound; the
+# serialization gap is what the fast path removes.
+#
+# Usage (from backend/):
+#   python -m benchmarks.bench_project_list [--rows 100] [--iterations 200]
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.constants import Role
+from app.core.dependencies import CurrentUser
+from app.core.schemas import PaginatedResponse, PaginationMeta, PaginationParams
+from app.core.serialization import envelope_json, rows_to_json
+from app.db.base import Base
+from app.domains.projects.repository import ProjectRepository
+from app.domains.projects.schemas import ProjectResponse
+from app.domains.projects.service import ProjectService
+
+RESPONSE_FIELD = create_model_field(
+    "Response_list_projects", PaginatedResponse[ProjectResponse], mode="serialization"
+)
+
+
+async def _seed(session: AsyncSession, owner_id: str, count: int) -> None:
+    await ProjectRepository(session).create_many(
+        [
+            {"name": f"Project {i}", "description": "x" * 200, "owner_id": owner_id}
+            for i in range(count)
+        ]
+    )
+    await session.commit()
+
+
+async def _time(fn: Callable[[], Awaitable[bytes]], iterations: int) -> float:
+    """Best-of-3 mean seconds per call."""
+    await fn()  # warm caches (adapters, compiled SQL)
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            await fn()
+        best = min(best, (time.perf_counter() - start) / iterations)
+    return best
+
+
+async def main(rows: int, iterations: int) -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    user = CurrentUser(id=str(uuid.uuid4()), role=Role.PM.value)
+    pagination = PaginationParams(page=1, per_page=rows)
+    async with factory() as session:
+        await _seed(session, user.id, rows)
+
+    async def orm_path() -> bytes:
+        async with factory() as session:
+            result = await ProjectService(ProjectRepository(session)).list_projects(
+                user, pagination
+            )
+        return await serialize_response(
+            field=RESPONSE_FIELD, response_content=result, dump_json=True
+        )
+
+    async def row_path() -> bytes:
+        async with factory() as session:
+            return await ProjectService(ProjectRepository(session)).list_projects_json(
+                user, pagination
+            )
+
+    assert await orm_path() == await row_path(), "paths must render identical bodies"
+
+    # The same pages, fetched once, to isolate the work done after the query.
+    async with factory() as session:
+        repository = ProjectRepository(session)
+        projects, total = await repository.list_accessible_by_user(user.id, limit=rows)
+        core_rows, _ = await repository.list_accessible_by_user_rows(user.id, limit=rows)
+
+    async def orm_serialize() -> bytes:
+        result = PaginatedResponse.create(
+            data=[ProjectResponse.model_validate(p) for p in projects],
+            total=total,
+            page=1,
+            per_page=rows,
+        )
+        return await serialize_response(
+            field=RESPONSE_FIELD, response_content=result, dump_json=True
+        )
+
+    async def row_serialize() -> bytes:
+        meta = PaginationMeta.create(total=total, page=1, per_page=rows)
+        return envelope_json(rows_to_json(ProjectResponse, core_rows), meta)
+
+    sections = {
+        "end to end (query + serialize)": (orm_path, row_path),
+        "serialize only (pre-fetched page)": (orm_serialize, row_serialize),
+    }
+    print(f"{rows}-row page, {iterations} iterations (best of 3)")
+    for title, (orm, fast) in sections.items():
+        orm_seconds = await _time(orm, iterations)
+        row_seconds = await _time(fast, iterations)
+        print(title)
+        for name, seconds in (("orm", orm_seconds), ("rows", row_seconds)):
+            print(f"  {name:<5} {seconds * 1e3:8.3f} ms/page  {seconds / rows * 1e6:7.2f} us/row")
+        print(f"  speedup {orm_seconds / row_seconds:.2f}x")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.iterations))
@@ -0,0 +1,100 @@
+# Rate Limiter Benchmark
+# ----------------------
+# Per-request overhead of RateLimitMiddleware around a no-op ASGI app:
+#   none    the bare app (baseline)
+#   memory  TokenBucketBackend (in-process)
+#   redis   RedisSlidingWindow (one EVALSHA per request)
+# Calls the ASGI stack directly (no HTTP client), rotating over `--clients`
+# IPs so buckets never run dry. The Redis backend runs against fakeredis
+# unless `--redis-url` points at a real server, where the round trip is the
+# cost that matters.
+#
+# Usage (from backend/):
+#   python -m benchmarks.bench_rate_limiter [--iterations 20000] [--redis-url redis://...]
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from fakeredis import FakeAsyncRedis
+from redis.asyncio import Redis
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.middleware.rate_limiter import (
+    RateLimitMiddleware,
+    RedisSlidingWindow,
+    TokenBucketBackend,
+    default_policies,
+)
+
+POLICIES = default_policies(login_per_minute=5, user_per_minute=10**9, anonymous_per_minute=10**9)
+
+
+async def _noop_app(scope: Scope, receive: Receive, send: Send) -> None:
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+async def _receive() -> Message:
+    return {"type": "http.request", "body": b""}
+
+
+async def _send(message: Message) -> None:
+    return None
+
+
+def _scopes(clients: int) -> list[Scope]:
+    return [
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/api/v1/projects",
+            "headers": [],
+            "client": (f"10.0.{i // 256}.{i % 256}", 40000),
+        }
+        for i in range(clients)
+    ]
+
+
+async def _time(app: ASGIApp, scopes: list[Scope], iterations: int) -> float:
+    """Best-of-3 mean seconds per request."""
+    for scope in scopes:
+        await app(scope, _receive, _send)
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for i in range(iterations):
+            await app(scopes[i % len(scopes)], _receive, _send)
+        best = min(best, (time.perf_counter() - start) / iterations)
+    return best
+
+
+async def main(iterations: int, clients: int, redis_url: str | None) -> None:
+    redis = Redis.from_url(redis_url) if redis_url else FakeAsyncRedis()
+    scopes = _scopes(clients)
+    apps: dict[str, ASGIApp] = {
+        "none": _noop_app,
+        "memory": RateLimitMiddleware(_noop_app, backend=TokenBucketBackend(), policies=POLICIES),
+        "redis": RateLimitMiddleware(
+            _noop_app, backend=RedisSlidingWindow(redis), policies=POLICIES
+        ),
+    }
+    results = {name: await _time(app, scopes, iterations) for name, app in apps.items()}
+    await redis.aclose()
+
+    target = redis_url or "fakeredis"
+    print(f"RateLimitMiddleware, {iterations} requests over {clients} clients ({target})")
+    for name, seconds in results.items():
+        overhead = seconds - results["none"]
+        print(f"  {name:<7} {seconds * 1e6:8.2f} us/request   +{overhead * 1e6:8.2f} us")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=20_000)
+    parser.add_argument("--clients", type=int, default=1_000)
+    parser.add_argument("--redis-url", default=None)
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations, args.clients, args.redis_url))
@@ -0,0 +1,141 @@
+# Request Logging Benchmark
+# -------------------------
+# Per-request overhead of request ID + request logging around a no-op ASGI app:
+#   none      the bare app (baseline)
+#   basehttp  the same two middlewares written with BaseHTTPMiddleware,
+#             logging synchronously to the stream
+#   asgi      RequestIDMiddleware + LoggingMiddleware, logging through
+#             QueueLogSink
+# Calls the ASGI stack directly (no HTTP client). Logs go to a stream whose
+# write costs `--write-us` microseconds, standing in for a slow stdout
+# (pipe to a log shipper, container log driver under load).
+#
+# Usage (from backend/):
+#   python -m benchmarks.bench_request_logging [--iterations 20000] [--write-us 20]
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import io
+import json
+import time
+import uuid
+
+import structlog
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.logging import QueueLogger, QueueLogSink, _to_sink
+from app.middleware import logging as logging_middleware
+from app.middleware.logging import LoggingMiddleware
+from app.middleware.request_id import RequestIDMiddleware
+
+PROCESSORS = [
+    structlog.contextvars.merge_contextvars,
+    structlog.processors.add_log_level,
+    structlog.processors.TimeStamper(fmt="iso", utc=True),
+]
+
+
+class SlowStream(io.TextIOBase):
+    """Discards writes after busy-waiting `write_us` microseconds."""
+
+    def __init__(self, write_us: float) -> None:
+        self.write_s = write_us / 1e6
+
+    def write(self, text: str) -> int:
+        deadline = time.perf_counter() + self.write_s
+        while time.perf_counter() < deadline:
+            pass
+        return len(text)
+
+
+async def _noop_app(scope: Scope, receive: Receive, send: Send) -> None:
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+async def _receive() -> Message:
+    return {"type": "http.request", "body": b""}
+
+
+async def _send(message: Message) -> None:
+    return None
+
+
+def _base_http_stack(stream: SlowStream) -> ASGIApp:
+    """The pre-ASGI shape: call_next middlewares and a blocking write."""
+
+    async def request_id(request: Request, call_next):
+        request_id = request.headers.get("x-request-id") or str(uuid.uuid4())
+        request.state.request_id = request_id
+        response = await call_next(request)
+        response.headers["X-Request-ID"] = request_id
+        return response
+
+    async def log_request(request: Request, call_next):
+        start = time.perf_counter()
+        response = await call_next(request)
+        record = {
+            "event": "request_completed",
+            "request_id": request.state.request_id,
+            "method": request.method,
+            "path": request.url.path,
+            "status_code": response.status_code,
+            "latency_ms": round((time.perf_counter() - start) * 1000, 2),
+        }
+        stream.write(json.dumps(record) + "\n")
+        return response
+
+    app = BaseHTTPMiddleware(_noop_app, dispatch=log_request)
+    return BaseHTTPMiddleware(app, dispatch=request_id)
+
+
+async def _time(app: ASGIApp, iterations: int) -> float:
+    """Best-of-3 mean seconds per request."""
+    scope: Scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/api/v1/projects",
+        "query_string": b"",
+        "headers": [],
+        "client": ("10.0.0.1", 40000),
+    }
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            await app(dict(scope), _receive, _send)
+        best = min(best, (time.perf_counter() - start) / iterations)
+    return best
+
+
+async def main(iterations: int, write_us: float) -> None:
+    stream = SlowStream(write_us)
+    sink = QueueLogSink(structlog.processors.JSONRenderer(), stream=stream)
+    logging_middleware.logger = structlog.wrap_logger(
+        QueueLogger(sink), processors=[*PROCESSORS, _to_sink]
+    )
+    apps: dict[str, ASGIApp] = {
+        "none": _noop_app,
+        "basehttp": _base_http_stack(stream),
+        "asgi": RequestIDMiddleware(LoggingMiddleware(_noop_app)),
+    }
+    results = {name: await _time(app, iterations) for name, app in apps.items()}
+    sink.close()
+
+    print(f"Request ID + logging, {iterations} requests, {write_us:g} us per stdout write")
+    for name, seconds in results.items():
+        overhead = seconds - results["none"]
+        print(f"  {name:<9} {seconds * 1e6:8.2f} us/request   +{overhead * 1e6:8.2f} us")
+    print(f"  sink: {sink.stats}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=20_000)
+    parser.add_argument("--write-us", type=float, default=20.0)
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations, args.write_us))
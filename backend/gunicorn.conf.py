@@ -0,0 +1,32 @@
+# Gunicorn Configuration
+# ----------------------
+# Loaded automatically from the working directory (see Dockerfile CMD).
+#
+# Prometheus multiprocess mode: each worker writes its metric values to
+# PROMETHEUS_MULTIPROC_DIR and GET /metrics on any worker aggregates them
+# (app/core/metrics.py). The variable must be set before a worker imports
+# prometheus_client, so it is set here, in the master, before forking.
+
+# ruff: noqa: N999  (the file name is gunicorn's default config path)
+
+from __future__ import annotations
+
+import os
+import shutil
+from typing import Any
+
+os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", "/tmp/prometheus")
+
+
+def on_starting(server: Any) -> None:
+    """Start from an empty metrics directory; stale files would skew counters."""
+    path = os.environ["PROMETHEUS_MULTIPROC_DIR"]
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path, exist_ok=True)
+
+
+def child_exit(server: Any, worker: Any) -> None:
+    """Drop a dead worker's live gauges (in-flight requests, pool connections)."""
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
@@ -6,6 +6,7 @@
 from __future__ import annotations
 
 import asyncio
+import os
 import uuid
 from collections.abc import AsyncGenerator, Generator
 from typing import Any
@@ -21,6 +22,10 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 
+# Router tests authenticate through dependency overrides, so every request
+# would count against one anonymous per-IP budget; the limiter has its own tests.
+os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+
 from app.core.config import Settings, get_settings
 from app.core.constants import Role
 from app.core.dependencies import CurrentUser, get_current_user
@@ -38,6 +43,7 @@ def get_test_settings() -> Settings:
         DATABASE_URL="sqlite+aiosqlite:///:memory:",
         SECRET_KEY="test-secret-key",
         DEBUG=True,
+        CACHE_ENABLED=False,
     )
 
 
@@ -152,10 +158,11 @@ async def pm_client(app: FastAPI, pm_user: CurrentUser) -> AsyncGenerator[AsyncC
 
 
 @pytest_asyncio.fixture
-async def viewer_client(app: FastAPI, viewer_user: CurrentUser) -> AsyncGenerator[AsyncClient, None]:
+async def viewer_client(
+    app: FastAPI, viewer_user: CurrentUser
+) -> AsyncGenerator[AsyncClient, None]:
     """Async HTTP client with Viewer authentication."""
     app.dependency_overrides[get_current_user] = lambda: viewer_user
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
-
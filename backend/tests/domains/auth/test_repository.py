@@ -1,3 +1,267 @@
 # Unit tests for auth repository
 # Tests data access operations for auth-related entities including
 # token storage, session persistence, and credential lookups.
+# RefreshTokenStore runs against fakeredis; two stores on one FakeServer
+# stand in for two workers sharing Redis. The lifespan test points the
+# shared client at a closed port, for Redis being down at startup.
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+from fakeredis import FakeAsyncRedis, FakeServer
+from fastapi import FastAPI
+from redis.asyncio import Redis
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app import main
+from app.core import redis as redis_module
+from app.core.config import Settings
+from app.core.security import create_refresh_token
+from app.domains.auth import repository
+from app.domains.auth.repository import RefreshTokenStore
+
+
+def _in(seconds: float) -> datetime:
+    return datetime.now(timezone.utc) + timedelta(seconds=seconds)
+
+
+def _store(redis: FakeAsyncRedis, **kwargs) -> RefreshTokenStore:
+    return RefreshTokenStore(redis, reconnect_seconds=0.01, **kwargs)
+
+
+async def _until(predicate, timeout: float = 1.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline, "condition not met in time"
+        await asyncio.sleep(0.01)
+
+
+@pytest_asyncio.fixture
+async def redis():
+    client = FakeAsyncRedis()
+    yield client
+    await client.aclose()
+
+
+@pytest.fixture
+def store(redis) -> RefreshTokenStore:
+    return _store(redis, max_active=3)
+
+
+class TestRefreshTokenStorage:
+    async def test_store_and_get(self, store: RefreshTokenStore):
+        token = create_refresh_token()
+        stored = await store.store_refresh_token("user-1", token, _in(3600))
+
+        record = await store.get_refresh_token(token)
+
+        assert record == stored
+        assert record.user_id == "user-1"
+        assert await store.get_refresh_token(create_refresh_token()) is None
+
+    async def test_only_the_digest_is_stored(self, store: RefreshTokenStore, redis):
+        token = create_refresh_token()
+        await store.store_refresh_token("user-1", token, _in(3600))
+
+        for key in await redis.keys("*"):
+            assert token.encode() not in key
+            if await redis.type(key) == b"string":
+                assert token.encode() not in await redis.get(key)
+
+    async def test_record_expires_with_the_token(self, store: RefreshTokenStore, redis):
+        token = create_refresh_token()
+        record = await store.store_refresh_token("user-1", token, _in(600))
+
+        ttl = await redis.ttl(f"pmt:auth:refresh:{record.jti}")
+
+        assert 598 <= ttl <= 601
+
+    async def test_rejects_past_expiry(self, store: RefreshTokenStore):
+        with pytest.raises(ValueError):
+            await store.store_refresh_token("user-1", create_refresh_token(), _in(-1))
+
+    async def test_oldest_token_is_revoked_beyond_max_active(self, store: RefreshTokenStore):
+        tokens = [create_refresh_token() for _ in range(4)]
+        for offset, token in enumerate(tokens):
+            await store.store_refresh_token("user-1", token, _in(3600 + offset))
+
+        assert await store.get_refresh_token(tokens[0]) is None
+        assert await store.is_revoked(store.token_id(tokens[0])) is True
+        for token in tokens[1:]:
+            assert await store.get_refresh_token(token) is not None
+
+
+class TestRevocation:
+    async def test_revoke_returns_record_once(self, store: RefreshTokenStore):
+        token = create_refresh_token()
+        await store.store_refresh_token("user-1", token, _in(3600))
+
+        first, second = await asyncio.gather(
+            store.revoke_refresh_token(token), store.revoke_refresh_token(token)
+        )
+
+        assert [first is None, second is None].count(True) == 1
+        assert await store.get_refresh_token(token) is None
+        assert await store.is_revoked(store.token_id(token)) is True
+
+    async def test_revoke_user_tokens(self, store: RefreshTokenStore):
+        mine = [create_refresh_token() for _ in range(2)]
+        theirs = create_refresh_token()
+        for token in mine:
+            await store.store_refresh_token("user-1", token, _in(3600))
+        await store.store_refresh_token("user-2", theirs, _in(3600))
+
+        assert await store.revoke_user_tokens("user-1") == 2
+        assert [await store.get_refresh_token(token) for token in mine] == [None, None]
+        assert await store.get_refresh_token(theirs) is not None
+        assert await store.revoke_user_tokens("user-1") == 0
+
+    async def test_cleanup_prunes_expired_revocations(self, redis):
+        now = [datetime.now(timezone.utc).timestamp()]
+        store = _store(redis, clock=lambda: now[0])
+        token = create_refresh_token()
+        record = await store.store_refresh_token("user-1", token, _in(60))
+        await store.revoke_refresh_token(token)
+
+        assert await store.cleanup_expired_tokens() == 0
+        now[0] += 120
+        assert await store.cleanup_expired_tokens() == 1
+        assert await store.is_revoked(record.jti) is False
+
+
+class TestRevocationFilter:
+    async def test_unsynced_store_always_asks_redis(self, store: RefreshTokenStore):
+        assert await store.is_revoked("unknown") is False
+
+        assert store.stats == {"filter_skips": 0, "redis_checks": 1}
+
+    async def test_synced_store_skips_redis_for_unrevoked(self, store: RefreshTokenStore):
+        revoked = create_refresh_token()
+        await store.store_refresh_token("user-1", revoked, _in(3600))
+        await store.revoke_refresh_token(revoked)
+        store.start()
+        await asyncio.wait_for(store.wait_subscribed(), timeout=1)
+        try:
+            assert await store.is_revoked("never-revoked") is False
+            assert await store.is_revoked(store.token_id(revoked)) is True
+        finally:
+            await store.stop()
+
+        assert store.stats == {"filter_skips": 1, "redis_checks": 1}
+
+    async def test_filter_is_rebuilt_from_redis_on_start(self, redis):
+        first = _store(redis)
+        token = create_refresh_token()
+        await first.store_refresh_token("user-1", token, _in(3600))
+        await first.revoke_refresh_token(token)
+
+        restarted = _store(redis)
+        restarted.start()
+        await asyncio.wait_for(restarted.wait_subscribed(), timeout=1)
+        try:
+            assert token_in_filter(restarted, restarted.token_id(token))
+        finally:
+            await restarted.stop()
+
+    async def test_revocations_reach_other_workers(self):
+        server = FakeServer()
+        workers = [_store(FakeAsyncRedis(server=server)) for _ in range(2)]
+        for worker in workers:
+            worker.start()
+            await asyncio.wait_for(worker.wait_subscribed(), timeout=1)
+        token = create_refresh_token()
+        jti = workers[0].token_id(token)
+        try:
+            await workers[0].store_refresh_token("user-1", token, _in(3600))
+            await workers[0].revoke_refresh_token(token)
+
+            await _until(lambda: token_in_filter(workers[1], jti))
+            assert await workers[1].is_revoked(jti) is True
+        finally:
+            for worker in workers:
+                await worker.stop()
+                await worker.redis.aclose()
+
+    async def test_unavailable_feed_falls_back_to_redis(self, store: RefreshTokenStore):
+        rebuild = store.rebuild_filter
+        attempts = 0
+
+        async def flaky_rebuild() -> int:
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                raise RedisConnectionError("connection refused")
+            return await rebuild()
+
+        store.rebuild_filter = flaky_rebuild  # type: ignore[method-assign]
+        store.start()
+        try:
+            await _until(lambda: attempts >= 1)
+            assert await store.is_revoked("never-revoked") is False
+            assert store.stats["redis_checks"] == 1
+
+            await asyncio.wait_for(store.wait_subscribed(), timeout=1)
+            assert await store.is_revoked("never-revoked") is False
+            assert store.stats["filter_skips"] == 1
+        finally:
+            await store.stop()
+
+    async def test_outage_is_logged_once_and_recovery_once(
+        self, store: RefreshTokenStore, monkeypatch
+    ):
+        """Redis down at startup: one warning, not one per retry, then one recovery."""
+        events = []
+        monkeypatch.setattr(repository.logger, "warning", lambda event, **kw: events.append(event))
+        monkeypatch.setattr(repository.logger, "info", lambda event, **kw: events.append(event))
+        rebuild = store.rebuild_filter
+        attempts = 0
+
+        async def down_then_up() -> int:
+            nonlocal attempts
+            attempts += 1
+            if attempts <= 3:
+                raise RedisConnectionError("connection refused")
+            return await rebuild()
+
+        store.rebuild_filter = down_then_up  # type: ignore[method-assign]
+        store.start()
+        try:
+            await asyncio.wait_for(store.wait_subscribed(), timeout=1)
+        finally:
+            await store.stop()
+
+        assert attempts == 4
+        assert events == ["revocation_feed_unavailable", "revocation_feed_restored"]
+
+
+class TestLifespan:
+    """The revocation feed at application startup."""
+
+    @pytest.mark.parametrize("enabled", [True, False])
+    async def test_feed_is_gated_and_redis_down_does_not_block_startup(
+        self, monkeypatch, enabled: bool
+    ):
+        settings = Settings(CACHE_ENABLED=False, AUTH_REVOCATION_FILTER_ENABLED=enabled)
+        monkeypatch.setattr(main, "get_settings", lambda: settings)
+        # Nothing listens on port 1: Redis is down for the whole test.
+        monkeypatch.setattr(
+            redis_module, "_client", Redis.from_url("redis://127.0.0.1:1", socket_timeout=0.1)
+        )
+        monkeypatch.setattr(repository, "_store", None)
+
+        async with main.lifespan(FastAPI()):
+            store = repository._store
+            if enabled:
+                assert store is not None
+                await _until(lambda: store._listener is not None and not store._listener.done())
+                assert store._synced is False
+            else:
+                assert store is None
+
+
+def token_in_filter(store: RefreshTokenStore, jti: str) -> bool:
+    return jti in store._revoked
@@ -13,6 +13,7 @@ import pytest_asyncio
 
 from app.core.constants import ProjectStatus, Role
 from app.core.dependencies import CurrentUser
+from app.db.base_repository import BulkResult
 from app.domains.projects.models import Project
 from app.domains.projects.repository import ProjectRepository
 from app.domains.projects.schemas import ProjectCreate, ProjectUpdate
@@ -33,6 +34,7 @@ def make_project(
     deleted_at: datetime | None = None,
     created_at: datetime | None = None,
     updated_at: datetime | None = None,
+    version: int = 1,
 ) -> Project:
     """Create a Project model instance for testing."""
     project = Project()
@@ -45,6 +47,7 @@ def make_project(
     project.deleted_at = deleted_at
     project.created_at = created_at or datetime.now(timezone.utc)
     project.updated_at = updated_at or datetime.now(timezone.utc)
+    project.version = version
     return project
 
 
@@ -66,7 +69,12 @@ def mock_repository() -> AsyncMock:
     repo.get_by_owner.return_value = ([], 0)
     repo.list_by_status.return_value = ([], 0)
     repo.list_accessible_by_user.return_value = ([], 0)
+    repo.get_multi_keyset.return_value = ([], None)
+    repo.list_accessible_by_user_keyset.return_value = ([], None)
     repo.name_exists.return_value = False
+    repo.get_memberships.return_value = {}
+    repo.create_many.return_value = BulkResult()
+    repo.soft_delete_many.return_value = BulkResult()
     return repo
 
 
@@ -119,4 +127,3 @@ def sample_project(admin_user: CurrentUser) -> Project:
 def sample_project_owned_by_pm(pm_user: CurrentUser) -> Project:
     """A pre-built Project model owned by the PM user."""
     return make_project(owner_id=pm_user.id, name="PM's Project")
-
@@ -0,0 +1,318 @@
+# Projects cache tests
+# ProjectRepository reading through ProjectCache on fakeredis, with Redis
+# alone and with the two-tier cache: hits skip SQL, writes record events,
+# and events invalidate precisely.
+
+from __future__ import annotations
+
+import uuid
+
+import pytest
+import pytest_asyncio
+from fakeredis import FakeAsyncRedis
+from sqlalchemy import event
+
+from app.core.cache import LRUCache, RedisCache, TieredCache
+from app.core.constants import ProjectRole, ProjectStatus
+from app.core.event_bus import EventBus
+from app.core.events import (
+    ProjectCreated,
+    ProjectDeleted,
+    ProjectMembershipChanged,
+    ProjectUpdated,
+)
+from app.db.outbox import take_events
+from app.domains.projects.cache import (
+    ProjectCache,
+    dump_project,
+    register_event_handlers,
+    unregister_event_handlers,
+)
+from app.domains.projects.repository import ProjectRepository
+
+
+@pytest_asyncio.fixture(params=["redis", "tiered"])
+async def project_cache(request):
+    redis = FakeAsyncRedis()
+    backend = RedisCache(redis, lock_poll_seconds=0.01)
+    if request.param == "tiered":
+        backend = TieredCache(backend, LRUCache(max_entries=100))
+    yield ProjectCache(backend)
+    await redis.aclose()
+
+
+@pytest_asyncio.fixture
+async def cached_repository(db_session, project_cache) -> ProjectRepository:
+    return ProjectRepository(db_session, cache=project_cache)
+
+
+@pytest.fixture
+def statements(async_engine):
+    recorded: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        recorded.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", _record)
+    yield recorded
+    event.remove(async_engine.sync_engine, "before_cursor_execute", _record)
+
+
+async def _commit(repository: ProjectRepository, cache: ProjectCache) -> None:
+    """What get_db does: commit, then publish the recorded events."""
+    await repository.session.commit()
+    for recorded in take_events(repository.session):
+        await cache.invalidate(recorded)
+
+
+async def _seed(repository: ProjectRepository, cache: ProjectCache, owner_id: str, name: str):
+    project = await repository.create({"name": name, "owner_id": owner_id})
+    await _commit(repository, cache)
+    return project
+
+
+class TestProjectCacheReads:
+    """Read-through for get() and owner listings."""
+
+    @pytest.mark.asyncio
+    async def test_get_hit_skips_database(
+        self, cached_repository, project_cache, statements: list[str]
+    ):
+        owner_id = str(uuid.uuid4())
+        project = await _seed(cached_repository, project_cache, owner_id, "Cached")
+        assert (await cached_repository.get(project.id)).id == project.id
+        statements.clear()
+
+        hit = await cached_repository.get(project.id)
+
+        assert statements == []
+        assert hit.id == project.id
+        assert hit.name == "Cached"
+        assert hit.owner_id == owner_id
+        assert hit.status == ProjectStatus.ACTIVE
+        assert hit.created_at == project.created_at
+
+    @pytest.mark.asyncio
+    async def test_owner_listing_hit_skips_database(
+        self, cached_repository, project_cache, statements: list[str]
+    ):
+        owner_id = str(uuid.uuid4())
+        await _seed(cached_repository, project_cache, owner_id, "A")
+        await _seed(cached_repository, project_cache, owner_id, "B")
+        first, total = await cached_repository.get_by_owner(owner_id)
+        await cached_repository.get_memberships(owner_id)  # none: owner listing applies
+        statements.clear()
+
+        items, cached_total = await cached_repository.list_accessible_by_user(owner_id)
+
+        assert statements == []
+        assert [p.id for p in items] == [p.id for p in first]
+        assert cached_total == total == 2
+        assert cached_total.is_exact
+
+    @pytest.mark.asyncio
+    async def test_row_listing_shares_owner_page_entry(
+        self, cached_repository, project_cache, statements: list[str]
+    ):
+        owner_id = str(uuid.uuid4())
+        project = await _seed(cached_repository, project_cache, owner_id, "Shared")
+        await cached_repository.get_by_owner(owner_id)
+        await cached_repository.get_memberships(owner_id)
+        statements.clear()
+
+        rows, total = await cached_repository.list_accessible_by_user_rows(owner_id)
+
+        assert statements == []
+        assert [row["id"] for row in rows] == [project.id]
+        assert total == 1
+
+    @pytest.mark.asyncio
+    async def test_session_with_pending_writes_bypasses_cache(
+        self, cached_repository, project_cache
+    ):
+        """Reads after an uncommitted write must see that write, not the cache."""
+        project = await _seed(cached_repository, project_cache, str(uuid.uuid4()), "Old")
+        await cached_repository.get(project.id)
+
+        await cached_repository.update(project.id, {"name": "New"})
+
+        assert (await cached_repository.get(project.id)).name == "New"
+
+
+class TestProjectCacheInvalidation:
+    """Writes record events; committed events invalidate the affected keys only."""
+
+    @pytest.mark.asyncio
+    async def test_writes_record_events(self, cached_repository):
+        owner_id = str(uuid.uuid4())
+        project = await cached_repository.create({"name": "E", "owner_id": owner_id})
+        await cached_repository.update(project.id, {"name": "E2"})
+        await cached_repository.soft_delete(project.id)
+        others = await cached_repository.create_many(
+            [{"name": "F", "owner_id": owner_id}, {"name": "G", "owner_id": owner_id}]
+        )
+        await cached_repository.soft_delete_many(ids=others.ids)
+
+        recorded = take_events(cached_repository.session)
+
+        assert [type(e) for e in recorded] == [
+            ProjectCreated,
+            ProjectUpdated,
+            ProjectDeleted,
+            ProjectCreated,
+            ProjectCreated,
+            ProjectDeleted,
+            ProjectDeleted,
+        ]
+        assert recorded[2].owner_id == owner_id
+        # An unscoped set-based delete does not know the owners.
+        assert recorded[-1].owner_id is None
+
+    @pytest.mark.asyncio
+    async def test_update_refreshes_get_and_listing(self, cached_repository, project_cache):
+        owner_id = str(uuid.uuid4())
+        project = await _seed(cached_repository, project_cache, owner_id, "Before")
+        await cached_repository.get(project.id)
+        await cached_repository.get_by_owner(owner_id)
+
+        await cached_repository.update(project.id, {"name": "After"})
+        await _commit(cached_repository, project_cache)
+
+        assert (await cached_repository.get(project.id)).name == "After"
+        items, _ = await cached_repository.get_by_owner(owner_id)
+        assert [p.name for p in items] == ["After"]
+
+    @pytest.mark.asyncio
+    async def test_soft_delete_evicts_project(self, cached_repository, project_cache):
+        owner_id = str(uuid.uuid4())
+        project = await _seed(cached_repository, project_cache, owner_id, "Doomed")
+        await cached_repository.get(project.id)
+        await cached_repository.get_by_owner(owner_id)
+
+        await cached_repository.soft_delete(project.id)
+        await _commit(cached_repository, project_cache)
+
+        assert await cached_repository.get(project.id) is None
+        assert await cached_repository.get_by_owner(owner_id) == ([], 0)
+
+    @pytest.mark.asyncio
+    async def test_create_only_invalidates_that_owners_listing(
+        self, cached_repository, project_cache, statements: list[str]
+    ):
+        owner_a, owner_b = str(uuid.uuid4()), str(uuid.uuid4())
+        await _seed(cached_repository, project_cache, owner_a, "A1")
+        await _seed(cached_repository, project_cache, owner_b, "B1")
+        await cached_repository.get_by_owner(owner_a)
+        await cached_repository.get_by_owner(owner_b)
+
+        await _seed(cached_repository, project_cache, owner_a, "A2")
+        statements.clear()
+
+        _, total_b = await cached_repository.get_by_owner(owner_b)
+        assert statements == []
+        _, total_a = await cached_repository.get_by_owner(owner_a)
+        assert statements != []
+        assert (total_a, total_b) == (2, 1)
+
+    @pytest.mark.asyncio
+    async def test_ownerless_bulk_delete_invalidates_all_listings(
+        self, cached_repository, project_cache
+    ):
+        owner_id = str(uuid.uuid4())
+        project = await _seed(cached_repository, project_cache, owner_id, "Bulk")
+        await cached_repository.get_by_owner(owner_id)
+
+        await cached_repository.soft_delete_many(ids=[project.id])
+        await _commit(cached_repository, project_cache)
+
+        assert await cached_repository.get_by_owner(owner_id) == ([], 0)
+
+    @pytest.mark.asyncio
+    async def test_membership_change_evicts_memberships(
+        self, cached_repository, project_cache, statements: list[str]
+    ):
+        user_id = str(uuid.uuid4())
+        project = await _seed(cached_repository, project_cache, str(uuid.uuid4()), "Team")
+        assert await cached_repository.get_memberships(user_id) == {}
+        statements.clear()
+        assert await cached_repository.get_memberships(user_id) == {}
+        assert statements == []
+
+        await cached_repository.set_member(project.id, user_id, ProjectRole.MEMBER)
+        await _commit(cached_repository, project_cache)
+
+        assert await cached_repository.get_memberships(user_id) == {project.id: ProjectRole.MEMBER}
+
+    @pytest.mark.asyncio
+    async def test_member_listing_uses_semi_join(self, cached_repository, project_cache):
+        """Users with memberships skip the owner-page cache and see shared projects."""
+        user_id = str(uuid.uuid4())
+        owned = await _seed(cached_repository, project_cache, user_id, "Owned")
+        shared = await _seed(cached_repository, project_cache, str(uuid.uuid4()), "Shared")
+        assert [p.id for p in (await cached_repository.list_accessible_by_user(user_id))[0]] == [
+            owned.id
+        ]
+
+        await cached_repository.set_member(shared.id, user_id, ProjectRole.VIEWER)
+        await _commit(cached_repository, project_cache)
+
+        items, total = await cached_repository.list_accessible_by_user(user_id)
+        assert {p.id for p in items} == {owned.id, shared.id}
+        assert total == 2
+
+    @pytest.mark.asyncio
+    async def test_writes_bump_guards_before_and_after_commit(
+        self, cached_repository, project_cache
+    ):
+        owner_id = str(uuid.uuid4())
+        project = await _seed(cached_repository, project_cache, owner_id, "Guarded")
+        guard = project_cache.project_guard(project.id)
+        before = await project_cache.backend.get_many(guard)
+
+        await cached_repository.update(project.id, {"name": "Racing"})
+        during = await project_cache.backend.get_many(guard)
+        await _commit(cached_repository, project_cache)
+        after = await project_cache.backend.get_many(guard)
+
+        assert before != during != after
+
+    @pytest.mark.asyncio
+    async def test_read_racing_a_write_does_not_cache_the_old_row(
+        self, cached_repository, project_cache
+    ):
+        """The cache-aside race: a read that loaded the old row stores nothing."""
+        project = await _seed(cached_repository, project_cache, str(uuid.uuid4()), "Old")
+        old_row = dump_project(project)
+        key = project_cache.project_key(project.id)
+
+        async def load_racing_a_write():
+            await project_cache.before_write(project_ids=[project.id])
+            return old_row
+
+        await project_cache.backend.get_or_set(
+            key, load_racing_a_write, guard=project_cache.project_guard(project.id)
+        )
+
+        assert await project_cache.backend.get(key) is None
+
+    def test_handlers_are_registered_once(self, project_cache):
+        bus = EventBus()
+        register_event_handlers(bus, project_cache)
+        register_event_handlers(bus, project_cache)
+
+        for event_type in (
+            ProjectCreated,
+            ProjectUpdated,
+            ProjectDeleted,
+            ProjectMembershipChanged,
+        ):
+            assert bus._handlers[event_type] == [project_cache.invalidate]
+
+        unregister_event_handlers(bus, project_cache)
+        assert not any(bus._handlers.values())
+
+    def test_no_handlers_without_a_cache(self):
+        bus = EventBus()
+        register_event_handlers(bus, None)
+
+        assert not any(bus._handlers.values())
@@ -0,0 +1,61 @@
+# Unit tests for project model metadata
+# Tests the live-row partial indexes declared via SoftDeleteMixin.live_index
+# and that the hot listings can use them.
+
+from __future__ import annotations
+
+import uuid
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
+
+from app.domains.projects.models import Project
+from app.domains.projects.repository import ProjectRepository
+
+LIVE_INDEXES = {
+    "ix_projects_live_owner_id_created_at": ["owner_id", "created_at", "id"],
+    "ix_projects_live_status_created_at": ["status", "created_at", "id"],
+    "ix_projects_live_created_at": ["created_at", "id"],
+}
+
+
+class TestProjectIndexes:
+    """Partial index declarations on the projects table."""
+
+    def test_live_indexes_are_partial(self):
+        """Listing indexes should cover live rows only on PostgreSQL."""
+        indexes = {index.name: index for index in Project.__table__.indexes}
+
+        for name, columns in LIVE_INDEXES.items():
+            index = indexes[name]
+            assert [c.name for c in index.columns] == columns
+            ddl = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+            assert ddl.endswith("WHERE soft_deleted = false")
+
+    def test_soft_deleted_flag_not_indexed_alone(self):
+        """The low-selectivity boolean index should be gone."""
+        assert Project.__table__.c.soft_deleted.index is not True
+        assert all(
+            [c.name for c in index.columns] != ["soft_deleted"]
+            for index in Project.__table__.indexes
+        )
+
+    @pytest.mark.asyncio
+    async def test_owner_listing_uses_live_index(self, db_session):
+        """The owner listing query should be planned on the partial index."""
+        repository = ProjectRepository(db_session)
+        await repository.create({"name": "Planned", "owner_id": str(uuid.uuid4())})
+        query = (
+            repository._base_query()
+            .where(Project.owner_id == "x")
+            .order_by(Project.created_at.desc())
+        )
+        compiled = query.compile(
+            dialect=db_session.bind.dialect, compile_kwargs={"literal_binds": True}
+        )
+
+        plan = (await db_session.execute(text(f"EXPLAIN QUERY PLAN {compiled}"))).all()
+
+        assert any("ix_projects_live_owner_id_created_at" in row[-1] for row in plan)
@@ -8,9 +8,11 @@ import uuid
 
 import pytest
 import pytest_asyncio
+from sqlalchemy import Row, event
+from sqlalchemy.exc import InvalidRequestError
 
-from app.core.constants import ProjectStatus
-from app.core.exceptions import NotFoundError
+from app.core.constants import CountStrategy, ProjectRole, ProjectStatus
+from app.core.exceptions import InvalidCursorError, NotFoundError
 from app.domains.projects.models import Project
 from app.domains.projects.repository import ProjectRepository
 
@@ -131,6 +133,301 @@ class TestProjectRepositoryRead:
         assert total == 5
 
 
+# ============================================================
+# PAGINATION
+# ============================================================
+
+
+class TestProjectRepositoryPagination:
+    """Tests for single-round-trip windowed pagination."""
+
+    @pytest.mark.asyncio
+    async def test_paginated_listings_single_statement(
+        self, project_repository: ProjectRepository, async_engine
+    ):
+        """get_multi and owner listings should fetch page and total in one SELECT."""
+        owner_id = str(uuid.uuid4())
+        for i in range(4):
+            await project_repository.create(
+                {"name": f"Window {i}", "status": ProjectStatus.ACTIVE.value, "owner_id": owner_id}
+            )
+
+        statements: list[str] = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(async_engine.sync_engine, "before_cursor_execute", _record)
+        try:
+            projects, total = await project_repository.get_multi(offset=0, limit=2)
+            assert len(projects) == 2
+            assert total == 4
+            assert len(statements) == 1
+
+            statements.clear()
+            projects, total = await project_repository.get_by_owner(owner_id, offset=0, limit=2)
+            assert len(projects) == 2
+            assert total == 4
+            assert len(statements) == 1
+        finally:
+            event.remove(async_engine.sync_engine, "before_cursor_execute", _record)
+
+    @pytest.mark.asyncio
+    async def test_get_multi_page_past_end_keeps_total(self, project_repository: ProjectRepository):
+        """An empty page beyond the last row should still report the real total."""
+        owner_id = str(uuid.uuid4())
+        for i in range(3):
+            await project_repository.create(
+                {
+                    "name": f"Past End {i}",
+                    "status": ProjectStatus.ACTIVE.value,
+                    "owner_id": owner_id,
+                }
+            )
+
+        projects, total = await project_repository.get_multi(offset=10, limit=5)
+
+        assert projects == []
+        assert total == 3
+
+    @pytest.mark.asyncio
+    async def test_get_multi_empty_table(self, project_repository: ProjectRepository):
+        """An empty table should return no items and a zero total."""
+        projects, total = await project_repository.get_multi(offset=0, limit=5)
+
+        assert projects == []
+        assert total == 0
+
+    @pytest.mark.asyncio
+    async def test_list_by_status_windowed_total(self, project_repository: ProjectRepository):
+        """Filtered listings should report the filtered total, not the table total."""
+        owner_id = str(uuid.uuid4())
+        for i in range(3):
+            await project_repository.create(
+                {
+                    "name": f"Archived {i}",
+                    "status": ProjectStatus.ARCHIVED.value,
+                    "owner_id": owner_id,
+                }
+            )
+        await project_repository.create(
+            {"name": "Active", "status": ProjectStatus.ACTIVE.value, "owner_id": owner_id}
+        )
+
+        projects, total = await project_repository.list_by_status(
+            ProjectStatus.ARCHIVED, offset=0, limit=2
+        )
+
+        assert len(projects) == 2
+        assert total == 3
+
+
+class TestProjectRepositoryCountStrategies:
+    """Tests for capped and estimated totals."""
+
+    @pytest.mark.asyncio
+    async def test_capped_count_reports_lower_bound(self, project_repository: ProjectRepository):
+        """Totals beyond the cap should be reported as the cap and marked inexact."""
+        project_repository.count_cap = 3
+        owner_id = str(uuid.uuid4())
+        for i in range(5):
+            await project_repository.create(
+                {"name": f"Cap {i}", "status": ProjectStatus.ACTIVE.value, "owner_id": owner_id}
+            )
+
+        projects, total = await project_repository.get_multi(
+            offset=0, limit=2, count_strategy=CountStrategy.CAPPED
+        )
+
+        assert len(projects) == 2
+        assert total == 3
+        assert total.is_exact is False
+
+    @pytest.mark.asyncio
+    async def test_capped_count_under_cap_is_exact(self, project_repository: ProjectRepository):
+        """Totals under the cap should be exact."""
+        project_repository.count_strategy = CountStrategy.CAPPED
+        owner_id = str(uuid.uuid4())
+        for i in range(2):
+            await project_repository.create(
+                {"name": f"Small {i}", "status": ProjectStatus.ACTIVE.value, "owner_id": owner_id}
+            )
+
+        _, total = await project_repository.get_by_owner(owner_id, offset=0, limit=10)
+        count = await project_repository.count()
+
+        assert total == 2
+        assert total.is_exact is True
+        assert count == 2
+
+    @pytest.mark.asyncio
+    async def test_estimated_count_falls_back_to_exact(self, project_repository: ProjectRepository):
+        """Dialects without planner estimates should count exactly."""
+        owner_id = str(uuid.uuid4())
+        for i in range(3):
+            await project_repository.create(
+                {"name": f"Est {i}", "status": ProjectStatus.ACTIVE.value, "owner_id": owner_id}
+            )
+
+        _, total = await project_repository.get_multi(
+            offset=0, limit=1, count_strategy=CountStrategy.ESTIMATED
+        )
+
+        assert total == 3
+        assert total.is_exact is True
+
+    @pytest.mark.asyncio
+    async def test_exact_total_is_marked_exact(self, project_repository: ProjectRepository):
+        """The windowed exact total should carry is_exact=True."""
+        _, total = await project_repository.get_multi(offset=0, limit=5)
+
+        assert total == 0
+        assert total.is_exact is True
+
+
+class TestProjectRepositoryKeysetPagination:
+    """Tests for cursor-based (keyset) pagination."""
+
+    @pytest.mark.asyncio
+    async def test_keyset_walks_all_rows_once(self, project_repository: ProjectRepository):
+        """Following next_cursor should visit every row exactly once."""
+        owner_id = str(uuid.uuid4())
+        created_ids = set()
+        for i in range(5):
+            p = await project_repository.create(
+                {"name": f"Keyset {i}", "status": ProjectStatus.ACTIVE.value, "owner_id": owner_id}
+            )
+            created_ids.add(p.id)
+
+        seen: list[str] = []
+        cursor = None
+        pages = 0
+        for _ in range(10):
+            items, cursor = await project_repository.get_multi_keyset(cursor=cursor, limit=2)
+            seen.extend(p.id for p in items)
+            pages += 1
+            if cursor is None:
+                break
+
+        assert cursor is None
+        assert pages == 3
+        assert len(seen) == 5
+        assert set(seen) == created_ids
+
+    @pytest.mark.asyncio
+    async def test_keyset_last_page_has_no_cursor(self, project_repository: ProjectRepository):
+        """A page that holds the remaining rows should not return a cursor."""
+        await project_repository.create(
+            {"name": "Only", "status": ProjectStatus.ACTIVE.value, "owner_id": str(uuid.uuid4())}
+        )
+
+        items, cursor = await project_repository.get_multi_keyset(limit=1)
+
+        assert len(items) == 1
+        assert cursor is None
+
+    @pytest.mark.asyncio
+    async def test_keyset_scoped_to_owner(self, project_repository: ProjectRepository):
+        """Owner-scoped keyset listing should only return that owner's rows."""
+        owner_a = str(uuid.uuid4())
+        for i in range(3):
+            await project_repository.create(
+                {"name": f"A {i}", "status": ProjectStatus.ACTIVE.value, "owner_id": owner_a}
+            )
+        await project_repository.create(
+            {"name": "B", "status": ProjectStatus.ACTIVE.value, "owner_id": str(uuid.uuid4())}
+        )
+
+        first, cursor = await project_repository.list_accessible_by_user_keyset(owner_a, limit=2)
+        second, cursor = await project_repository.list_accessible_by_user_keyset(
+            owner_a, cursor=cursor, limit=2
+        )
+
+        assert {p.owner_id for p in first + second} == {owner_a}
+        assert len(first) + len(second) == 3
+        assert cursor is None
+
+    @pytest.mark.asyncio
+    async def test_keyset_rejects_tampered_cursor(self, project_repository: ProjectRepository):
+        """A modified cursor should fail signature verification."""
+        owner_id = str(uuid.uuid4())
+        for i in range(3):
+            await project_repository.create(
+                {"name": f"Tamper {i}", "status": ProjectStatus.ACTIVE.value, "owner_id": owner_id}
+            )
+        _, cursor = await project_repository.get_multi_keyset(limit=1)
+        body, signature = cursor.split(".")
+
+        with pytest.raises(InvalidCursorError):
+            await project_repository.get_multi_keyset(cursor=f"{body}x.{signature}", limit=1)
+
+    @pytest.mark.asyncio
+    async def test_keyset_rejects_cursor_from_other_ordering(
+        self, project_repository: ProjectRepository
+    ):
+        """A cursor is only valid for the ordering that produced it."""
+        owner_id = str(uuid.uuid4())
+        for i in range(3):
+            await project_repository.create(
+                {"name": f"Order {i}", "status": ProjectStatus.ACTIVE.value, "owner_id": owner_id}
+            )
+        _, cursor = await project_repository.get_multi_keyset(limit=1)
+
+        with pytest.raises(InvalidCursorError):
+            await project_repository.get_multi_keyset(
+                cursor=cursor, limit=1, order_by=[Project.name.asc(), Project.id.asc()]
+            )
+
+    @pytest.mark.asyncio
+    async def test_keyset_mixed_directions(self, project_repository: ProjectRepository):
+        """Mixed ASC/DESC orderings should still page without gaps or repeats."""
+        owner_id = str(uuid.uuid4())
+        for name in ["b", "a", "c", "a", "b"]:
+            await project_repository.create(
+                {"name": name, "status": ProjectStatus.ACTIVE.value, "owner_id": owner_id}
+            )
+        order_by = [Project.name.asc(), Project.id.desc()]
+
+        names: list[str] = []
+        cursor = None
+        for _ in range(10):
+            items, cursor = await project_repository.get_multi_keyset(
+                cursor=cursor, limit=2, order_by=order_by
+            )
+            names.extend(p.name for p in items)
+            if cursor is None:
+                break
+
+        assert cursor is None
+        assert names == ["a", "a", "b", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_keyset_non_unique_ordering_gets_id_tiebreaker(
+        self, project_repository: ProjectRepository
+    ):
+        """Rows tying on a non-unique ordering should not be skipped at page boundaries."""
+        owner_id = str(uuid.uuid4())
+        created_ids = set()
+        for _ in range(5):
+            p = await project_repository.create(
+                {"name": "same", "status": ProjectStatus.ACTIVE.value, "owner_id": owner_id}
+            )
+            created_ids.add(p.id)
+
+        seen: list[str] = []
+        cursor = None
+        for _ in range(10):
+            items, cursor = await project_repository.get_multi_keyset(
+                cursor=cursor, limit=2, order_by=[Project.name.asc()]
+            )
+            seen.extend(p.id for p in items)
+            if cursor is None:
+                break
+
+        assert cursor is None
+        assert sorted(seen) == sorted(created_ids)
+
+
 # ============================================================
 # UPDATE
 # ============================================================
@@ -224,7 +521,9 @@ class TestProjectRepositorySoftDelete:
         assert projects[0].id == p1.id
 
     @pytest.mark.asyncio
-    async def test_exists_returns_false_for_soft_deleted(self, project_repository: ProjectRepository):
+    async def test_exists_returns_false_for_soft_deleted(
+        self, project_repository: ProjectRepository
+    ):
         """exists() should return False for soft-deleted projects."""
         project = await project_repository.create(
             {
@@ -254,6 +553,384 @@ class TestProjectRepositorySoftDelete:
         assert total == 2
 
 
+class TestProjectRepositoryReturningWrites:
+    """Tests for single-statement INSERT/UPDATE ... RETURNING writes."""
+
+    @pytest.mark.asyncio
+    async def test_each_write_is_one_statement(
+        self, project_repository: ProjectRepository, async_engine
+    ):
+        """create, update and soft_delete should each issue exactly one statement."""
+        statements: list[str] = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(async_engine.sync_engine, "before_cursor_execute", _record)
+        try:
+            project = await project_repository.create(
+                {"name": "One Shot", "owner_id": str(uuid.uuid4())}
+            )
+            assert len(statements) == 1
+            assert project.id is not None
+            assert project.status == ProjectStatus.ACTIVE.value
+            assert project.created_at is not None
+            assert project.soft_deleted is False
+
+            statements.clear()
+            updated = await project_repository.update(project.id, {"name": "Renamed"})
+            assert len(statements) == 1
+            assert updated.name == "Renamed"
+
+            statements.clear()
+            deleted = await project_repository.soft_delete(project.id)
+            assert len(statements) == 1
+            assert deleted.soft_deleted is True
+            assert deleted.deleted_at is not None
+        finally:
+            event.remove(async_engine.sync_engine, "before_cursor_execute", _record)
+
+    @pytest.mark.asyncio
+    async def test_update_refreshes_loaded_instance(self, project_repository: ProjectRepository):
+        """An instance already in the session should reflect the returned row."""
+        project = await project_repository.create({"name": "Before", "owner_id": str(uuid.uuid4())})
+
+        updated = await project_repository.update(project.id, {"description": "after"})
+
+        assert updated is project
+        assert project.description == "after"
+
+    @pytest.mark.asyncio
+    async def test_update_ignores_unknown_keys(self, project_repository: ProjectRepository):
+        """Keys that are not model columns should be dropped, not sent to the UPDATE."""
+        project = await project_repository.create({"name": "Keys", "owner_id": str(uuid.uuid4())})
+
+        updated = await project_repository.update(project.id, {"name": "Kept", "bogus": 1})
+
+        assert updated.name == "Kept"
+
+    @pytest.mark.asyncio
+    async def test_soft_delete_nonexistent_raises(self, project_repository: ProjectRepository):
+        """Soft-deleting a missing record should raise NotFoundError."""
+        with pytest.raises(NotFoundError):
+            await project_repository.soft_delete(str(uuid.uuid4()))
+
+    @pytest.mark.asyncio
+    async def test_soft_delete_twice_raises(self, project_repository: ProjectRepository):
+        """An already soft-deleted row should not match the UPDATE."""
+        project = await project_repository.create({"name": "Twice", "owner_id": str(uuid.uuid4())})
+        await project_repository.soft_delete(project.id)
+
+        with pytest.raises(NotFoundError):
+            await project_repository.soft_delete(project.id)
+
+    @pytest.mark.asyncio
+    async def test_update_soft_deleted_raises(self, project_repository: ProjectRepository):
+        """Updating a soft-deleted row should raise NotFoundError."""
+        project = await project_repository.create({"name": "Gone", "owner_id": str(uuid.uuid4())})
+        await project_repository.soft_delete(project.id)
+
+        with pytest.raises(NotFoundError):
+            await project_repository.update(project.id, {"name": "Back"})
+
+    @pytest.mark.asyncio
+    async def test_hard_delete(self, project_repository: ProjectRepository):
+        """hard_delete should remove the row and raise for a missing id."""
+        project = await project_repository.create({"name": "Hard", "owner_id": str(uuid.uuid4())})
+
+        await project_repository.hard_delete(project.id)
+
+        assert await project_repository.count() == 0
+        with pytest.raises(NotFoundError):
+            await project_repository.hard_delete(project.id)
+
+
+class TestProjectRepositoryBulkWrites:
+    """Tests for chunked bulk create, update and soft delete."""
+
+    @pytest.mark.asyncio
+    async def test_create_many_chunks_by_bind_params(self, project_repository: ProjectRepository):
+        """create_many should split rows so each statement stays under the limit."""
+        columns = len(Project.__table__.columns)
+        project_repository.max_bind_params = columns * 2
+        owner_id = str(uuid.uuid4())
+
+        result = await project_repository.create_many(
+            [{"name": f"Bulk {i}", "owner_id": owner_id} for i in range(5)]
+        )
+
+        assert result.chunk_counts == [2, 2, 1]
+        assert result.count == 5
+        assert [p.name for p in result.items] == [f"Bulk {i}" for i in range(5)]
+        assert all(p.created_at is not None for p in result.items)
+        assert await project_repository.count() == 5
+
+    @pytest.mark.asyncio
+    async def test_create_many_one_statement_per_chunk(
+        self, project_repository: ProjectRepository, async_engine
+    ):
+        """Rows in a chunk should share one INSERT, not fall back to row-at-a-time."""
+        owner_id = str(uuid.uuid4())
+        statements: list[str] = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(async_engine.sync_engine, "before_cursor_execute", _record)
+        try:
+            result = await project_repository.create_many(
+                [{"name": f"Bulk {i}", "owner_id": owner_id} for i in range(3)]
+            )
+        finally:
+            event.remove(async_engine.sync_engine, "before_cursor_execute", _record)
+
+        assert result.chunk_counts == [3]
+        assert len(statements) == 1
+        assert [p.name for p in result.items] == ["Bulk 0", "Bulk 1", "Bulk 2"]
+
+    @pytest.mark.asyncio
+    async def test_create_many_empty(self, project_repository: ProjectRepository):
+        """An empty input should not touch the database."""
+        result = await project_repository.create_many([])
+
+        assert result.count == 0
+        assert result.chunk_counts == []
+
+    @pytest.mark.asyncio
+    async def test_update_many_by_ids_chunks(self, project_repository: ProjectRepository):
+        """update_many by id list should chunk and skip unknown IDs."""
+        project_repository.max_bind_params = 4
+        created = await project_repository.create_many(
+            [{"name": f"U {i}", "owner_id": str(uuid.uuid4())} for i in range(4)]
+        )
+
+        result = await project_repository.update_many(
+            {"status": ProjectStatus.ARCHIVED.value},
+            ids=[*created.ids, str(uuid.uuid4())],
+        )
+
+        assert sorted(result.ids) == sorted(created.ids)
+        assert len(result.chunk_counts) > 1
+        assert sum(result.chunk_counts) == 4
+        assert all(p.status == ProjectStatus.ARCHIVED.value for p in created.items)
+
+    @pytest.mark.asyncio
+    async def test_update_many_by_filter(self, project_repository: ProjectRepository):
+        """update_many by filters should issue a single set-based UPDATE."""
+        owner_id = str(uuid.uuid4())
+        await project_repository.create_many(
+            [
+                {"name": "Mine", "owner_id": owner_id},
+                {"name": "Theirs", "owner_id": str(uuid.uuid4())},
+            ]
+        )
+
+        result = await project_repository.update_many(
+            {"description": "touched"}, filters={"owner_id": owner_id}
+        )
+
+        assert result.count == 1
+        assert result.chunk_counts == [1]
+
+    @pytest.mark.asyncio
+    async def test_update_many_requires_selector(self, project_repository: ProjectRepository):
+        """update_many without ids or filters must not update the whole table."""
+        with pytest.raises(ValueError):
+            await project_repository.update_many({"name": "All"})
+
+    @pytest.mark.asyncio
+    async def test_soft_delete_many_respects_filters(self, project_repository: ProjectRepository):
+        """soft_delete_many should only delete rows matching both ids and filters."""
+        owner_id = str(uuid.uuid4())
+        mine = await project_repository.create({"name": "Mine", "owner_id": owner_id})
+        theirs = await project_repository.create({"name": "Theirs", "owner_id": str(uuid.uuid4())})
+
+        result = await project_repository.soft_delete_many(
+            ids=[mine.id, theirs.id], filters={"owner_id": owner_id}
+        )
+
+        assert result.ids == [mine.id]
+        assert await project_repository.get(mine.id) is None
+        assert await project_repository.get(theirs.id) is not None
+
+        again = await project_repository.soft_delete_many(ids=[mine.id])
+        assert again.count == 0
+
+
+class TestProjectRepositoryGetMany:
+    """Tests for fetching many records by ID in one query."""
+
+    @pytest.mark.asyncio
+    async def test_get_many_skips_unknown_and_deleted(self, project_repository: ProjectRepository):
+        """get_many should return live rows only, once per ID."""
+        owner_id = str(uuid.uuid4())
+        live = await project_repository.create({"name": "Live", "owner_id": owner_id})
+        gone = await project_repository.create({"name": "Gone", "owner_id": owner_id})
+        await project_repository.soft_delete(gone.id)
+
+        result = await project_repository.get_many([live.id, gone.id, live.id, str(uuid.uuid4())])
+
+        assert [p.id for p in result] == [live.id]
+
+    @pytest.mark.asyncio
+    async def test_get_many_empty(self, project_repository: ProjectRepository):
+        """An empty ID list should not touch the database."""
+        assert await project_repository.get_many([]) == []
+
+
+class TestProjectRepositoryMembership:
+    """Tests for project members and the accessible-projects scope."""
+
+    @pytest.mark.asyncio
+    async def test_set_member_upserts_role(self, project_repository: ProjectRepository):
+        """set_member should add a member, then update the same row's role."""
+        project = await project_repository.create({"name": "M", "owner_id": str(uuid.uuid4())})
+        user_id = str(uuid.uuid4())
+
+        await project_repository.set_member(project.id, user_id, ProjectRole.VIEWER)
+        member = await project_repository.set_member(project.id, user_id, ProjectRole.ADMIN)
+
+        assert member.role == ProjectRole.ADMIN
+        assert [m.user_id for m in await project_repository.list_members(project.id)] == [user_id]
+        assert await project_repository.get_memberships(user_id) == {project.id: ProjectRole.ADMIN}
+
+    @pytest.mark.asyncio
+    async def test_remove_member(self, project_repository: ProjectRepository):
+        """remove_member should report whether a membership existed."""
+        project = await project_repository.create({"name": "R", "owner_id": str(uuid.uuid4())})
+        user_id = str(uuid.uuid4())
+        await project_repository.set_member(project.id, user_id, ProjectRole.MEMBER)
+
+        assert await project_repository.remove_member(project.id, user_id) is True
+        assert await project_repository.remove_member(project.id, user_id) is False
+        assert await project_repository.get_memberships(user_id) == {}
+
+    @pytest.mark.asyncio
+    async def test_accessible_listings_include_memberships(
+        self, project_repository: ProjectRepository
+    ):
+        """Owned and member projects are listed once each; deleted ones are not."""
+        user_id = str(uuid.uuid4())
+        owned = await project_repository.create({"name": "Owned", "owner_id": user_id})
+        shared = await project_repository.create({"name": "Shared", "owner_id": str(uuid.uuid4())})
+        gone = await project_repository.create({"name": "Gone", "owner_id": str(uuid.uuid4())})
+        await project_repository.create({"name": "Other", "owner_id": str(uuid.uuid4())})
+        await project_repository.set_member(shared.id, user_id, ProjectRole.VIEWER)
+        await project_repository.set_member(owned.id, user_id, ProjectRole.MEMBER)
+        await project_repository.set_member(gone.id, user_id, ProjectRole.MEMBER)
+        await project_repository.soft_delete(gone.id)
+        expected = {owned.id, shared.id}
+
+        items, total = await project_repository.list_accessible_by_user(user_id)
+        rows, row_total = await project_repository.list_accessible_by_user_rows(user_id)
+        keyset, _ = await project_repository.list_accessible_by_user_keyset(user_id)
+        streamed = [p async for p in project_repository.stream_accessible_by_user(user_id)]
+
+        assert {p.id for p in items} == expected
+        assert (total, row_total) == (2, 2)
+        assert {row.id for row in rows} == expected
+        assert {p.id for p in keyset} == expected
+        assert {p.id for p in streamed} == expected
+
+    @pytest.mark.asyncio
+    async def test_listing_fingerprint_tracks_memberships(
+        self, project_repository: ProjectRepository
+    ):
+        """Joining and leaving a project should both move the user's fingerprint."""
+        user_id = str(uuid.uuid4())
+        project = await project_repository.create({"name": "F", "owner_id": str(uuid.uuid4())})
+        before = await project_repository.listing_fingerprint(user_id)
+
+        await project_repository.set_member(project.id, user_id, ProjectRole.MEMBER)
+        joined = await project_repository.listing_fingerprint(user_id)
+        await project_repository.remove_member(project.id, user_id)
+        left = await project_repository.listing_fingerprint(user_id)
+
+        assert joined[0] == 1
+        assert len({before, joined}) == 2
+        assert len({joined, left}) == 2
+
+
+class TestProjectRepositoryStreaming:
+    """Tests for server-side cursor streaming."""
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_live_rows_newest_first(
+        self, project_repository: ProjectRepository
+    ):
+        """stream() should yield every live row in listing order across batches."""
+        owner_id = str(uuid.uuid4())
+        created = await project_repository.create_many(
+            [{"name": f"S {i}", "owner_id": owner_id} for i in range(5)]
+        )
+        await project_repository.soft_delete(created.ids[0])
+
+        streamed = [p async for p in project_repository.stream(batch_size=2)]
+
+        keys = [(p.created_at, p.id) for p in streamed]
+        assert keys == sorted(keys, reverse=True)
+        assert {p.id for p in streamed} == set(created.ids[1:])
+
+    @pytest.mark.asyncio
+    async def test_stream_accessible_by_user_is_scoped(self, project_repository: ProjectRepository):
+        """Non-admin exports should only include the user's projects."""
+        owner_id = str(uuid.uuid4())
+        mine = await project_repository.create({"name": "Mine", "owner_id": owner_id})
+        await project_repository.create({"name": "Theirs", "owner_id": str(uuid.uuid4())})
+
+        streamed = [p async for p in project_repository.stream_accessible_by_user(owner_id)]
+
+        assert [p.id for p in streamed] == [mine.id]
+
+
+class TestProjectRepositoryProjection:
+    """Tests for column projection on listings."""
+
+    @pytest.mark.asyncio
+    async def test_get_multi_selects_only_requested_columns(
+        self, project_repository: ProjectRepository, async_engine
+    ):
+        """Unselected columns should be absent from the SQL and unreadable."""
+        await project_repository.create(
+            {"name": "Slim", "description": "x" * 1000, "owner_id": str(uuid.uuid4())}
+        )
+        statements: list[str] = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(async_engine.sync_engine, "before_cursor_execute", _record)
+        try:
+            items, total = await project_repository.get_multi(fields={"name", "status"})
+        finally:
+            event.remove(async_engine.sync_engine, "before_cursor_execute", _record)
+
+        assert total == 1
+        assert "projects.name" in statements[0]
+        assert "projects.description" not in statements[0]
+        assert (items[0].id, items[0].name) is not None
+        with pytest.raises(InvalidRequestError):
+            items[0].description  # noqa: B018
+
+    @pytest.mark.asyncio
+    async def test_keyset_pages_with_projection(self, project_repository: ProjectRepository):
+        """Keyset cursors should not depend on the projected columns."""
+        owner_id = str(uuid.uuid4())
+        await project_repository.create_many(
+            [{"name": f"K {i}", "owner_id": owner_id} for i in range(3)]
+        )
+
+        first, cursor = await project_repository.list_accessible_by_user_keyset(
+            owner_id, limit=2, fields={"name"}
+        )
+        second, end = await project_repository.list_accessible_by_user_keyset(
+            owner_id, cursor=cursor, limit=2, fields={"name"}
+        )
+
+        assert len(first) == 2 and len(second) == 1 and end is None
+        assert {p.name for p in first + second} == {"K 0", "K 1", "K 2"}
+
+
 # ============================================================
 # CUSTOM QUERIES
 # ============================================================
@@ -333,3 +1010,149 @@ class TestProjectRepositoryCustomQueries:
         result = await project_repository.name_exists("Exclude Test", exclude_id=project.id)
         assert result is False
 
+
+# ============================================================
+# CORE ROWS
+# ============================================================
+
+
+class TestProjectRepositoryRows:
+    """Tests for the Core-row listing path."""
+
+    @pytest.mark.asyncio
+    async def test_get_multi_rows_returns_rows_not_models(
+        self, project_repository: ProjectRepository
+    ):
+        """Rows should expose columns by name without building Project instances."""
+        owner_id = str(uuid.uuid4())
+        await project_repository.create_many(
+            [{"name": f"R {i}", "owner_id": owner_id} for i in range(3)]
+        )
+
+        rows, total = await project_repository.get_multi_rows(limit=2)
+
+        assert total == 3
+        assert len(rows) == 2
+        assert all(isinstance(row, Row) for row in rows)
+        assert {row.owner_id for row in rows} == {owner_id}
+
+    @pytest.mark.asyncio
+    async def test_rows_skip_soft_deleted(self, project_repository: ProjectRepository):
+        """The row query should apply the same live-row filter as _base_query."""
+        owner_id = str(uuid.uuid4())
+        keep = await project_repository.create({"name": "Keep", "owner_id": owner_id})
+        gone = await project_repository.create({"name": "Gone", "owner_id": owner_id})
+        await project_repository.soft_delete(gone.id)
+
+        rows, total = await project_repository.list_accessible_by_user_rows(owner_id)
+
+        assert [row.id for row in rows] == [keep.id]
+        assert total == 1
+
+    @pytest.mark.asyncio
+    async def test_rows_select_only_requested_columns(self, project_repository: ProjectRepository):
+        """A field selection should narrow the selected columns."""
+        owner_id = str(uuid.uuid4())
+        await project_repository.create({"name": "Narrow", "owner_id": owner_id})
+
+        rows, _ = await project_repository.list_accessible_by_user_rows(
+            owner_id, fields={"id", "name"}
+        )
+
+        assert set(rows[0]._fields) == {"id", "name", "_total"}
+        assert rows[0].name == "Narrow"
+
+    @pytest.mark.asyncio
+    async def test_rows_match_orm_listing_order(self, project_repository: ProjectRepository):
+        """Both listing paths should return the same page in the same order."""
+        owner_id = str(uuid.uuid4())
+        await project_repository.create_many(
+            [{"name": f"O {i}", "owner_id": owner_id} for i in range(5)]
+        )
+
+        projects, _ = await project_repository.get_by_owner(owner_id, offset=1, limit=3)
+        rows, _ = await project_repository.list_accessible_by_user_rows(owner_id, offset=1, limit=3)
+
+        assert [row.id for row in rows] == [project.id for project in projects]
+
+
+# ============================================================
+# VERSIONS (conditional requests)
+# ============================================================
+
+
+class TestProjectRepositoryVersions:
+    """Tests for the version queries behind ETags."""
+
+    @pytest.mark.asyncio
+    async def test_get_version(self, project_repository: ProjectRepository):
+        """get_version should return id, owner and updated_at of a live project."""
+        project = await project_repository.create({"name": "V", "owner_id": str(uuid.uuid4())})
+
+        version = await project_repository.get_version(project.id)
+
+        assert (version.id, version.owner_id) == (project.id, project.owner_id)
+        assert version.updated_at == project.updated_at
+        assert version.version == project.version == 1
+
+    @pytest.mark.asyncio
+    async def test_every_update_bumps_the_version(self, project_repository: ProjectRepository):
+        """Single-row and set-based updates both count, whatever `updated_at` says."""
+        project = await project_repository.create({"name": "V", "owner_id": str(uuid.uuid4())})
+
+        first = await project_repository.update(project.id, {"name": "V2"})
+        assert first.version == 2
+        second = await project_repository.update(project.id, {"name": "V3"})
+        assert second.version == 3
+        await project_repository.update_many({"description": "bulk"}, ids=[project.id])
+
+        assert (await project_repository.get_version(project.id)).version == 4
+
+    @pytest.mark.asyncio
+    async def test_get_version_of_deleted_project(self, project_repository: ProjectRepository):
+        """Soft-deleted projects have no version."""
+        project = await project_repository.create({"name": "V", "owner_id": str(uuid.uuid4())})
+        await project_repository.soft_delete(project.id)
+
+        assert await project_repository.get_version(project.id) is None
+
+    @pytest.mark.asyncio
+    async def test_listing_fingerprint_counts_live_rows_in_scope(
+        self, project_repository: ProjectRepository
+    ):
+        """The fingerprint should count live rows of the owner and track updated_at."""
+        owner_id = str(uuid.uuid4())
+        a = await project_repository.create({"name": "A", "owner_id": owner_id})
+        await project_repository.create({"name": "B", "owner_id": owner_id})
+        await project_repository.create({"name": "Other", "owner_id": str(uuid.uuid4())})
+
+        count, latest, *_ = await project_repository.listing_fingerprint(owner_id)
+        assert count == 2
+        assert latest is not None
+
+        await project_repository.soft_delete(a.id)
+
+        assert (await project_repository.listing_fingerprint(owner_id))[0] == 1
+        assert (await project_repository.listing_fingerprint())[0] == 2
+
+    @pytest.mark.asyncio
+    async def test_listing_fingerprint_moves_on_every_update(
+        self, project_repository: ProjectRepository
+    ):
+        """Updates within one `updated_at` tick still change the fingerprint."""
+        owner_id = str(uuid.uuid4())
+        project = await project_repository.create({"name": "A", "owner_id": owner_id})
+        before = await project_repository.listing_fingerprint(owner_id)
+
+        await project_repository.update(project.id, {"name": "B"})
+
+        assert await project_repository.listing_fingerprint(owner_id) != before
+
+    @pytest.mark.asyncio
+    async def test_get_for_update(self, project_repository: ProjectRepository):
+        """get_for_update should load live rows and raise for missing ones."""
+        project = await project_repository.create({"name": "L", "owner_id": str(uuid.uuid4())})
+
+        assert (await project_repository.get_for_update(project.id)).id == project.id
+        with pytest.raises(NotFoundError):
+            await project_repository.get_for_update(str(uuid.uuid4()))
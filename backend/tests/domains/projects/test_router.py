@@ -4,14 +4,19 @@
 
 from __future__ import annotations
 
+import csv
+import io
+import json
 import uuid
 from unittest.mock import AsyncMock, patch
 
 import pytest
 import pytest_asyncio
+from fastapi import FastAPI
 from httpx import AsyncClient
 
 from app.core.constants import ProjectStatus
+from app.core.dependencies import CurrentUser, get_current_user
 
 
 # ============================================================
@@ -130,9 +135,66 @@ class TestListProjectsEndpoint:
         data = response.json()
         assert len(data["items"]) == 1
 
+    @pytest.mark.asyncio
+    async def test_list_items_match_get_response(self, client: AsyncClient):
+        """Row-path list items should serialize exactly like the single-item route."""
+        created = (await client.post("/api/v1/projects/", json={"name": "Same Shape"})).json()
+
+        listed = await client.get("/api/v1/projects/")
+        single = await client.get(f"/api/v1/projects/{created['id']}")
+
+        assert listed.headers["content-type"] == "application/json"
+        (item,) = [p for p in listed.json()["data"] if p["id"] == created["id"]]
+        assert item == single.json()
+
+    @pytest.mark.asyncio
+    async def test_list_projects_cursor_pagination(self, client: AsyncClient):
+        """`?cursor=` should page by keyset with next_cursor until exhausted."""
+        created = []
+        for i in range(3):
+            response = await client.post(
+                "/api/v1/projects/",
+                json={"name": f"Cursor Project {i}"},
+            )
+            created.append(response.json()["id"])
+
+        first = await client.get("/api/v1/projects/", params={"cursor": "", "per_page": 2})
+        assert first.status_code == 200
+        first_data = first.json()
+        assert len(first_data["data"]) == 2
+        assert first_data["meta"]["has_more"] is True
+        assert "total" not in first_data["meta"]
+
+        seen = [p["id"] for p in first_data["data"]]
+        cursor = first_data["meta"]["next_cursor"]
+        while cursor is not None:
+            page = await client.get("/api/v1/projects/", params={"cursor": cursor, "per_page": 2})
+            assert page.status_code == 200
+            seen.extend(p["id"] for p in page.json()["data"])
+            cursor = page.json()["meta"]["next_cursor"]
+
+        assert len(seen) == len(set(seen))
+        assert seen[:3] == created[::-1]
+
+    @pytest.mark.asyncio
+    async def test_list_projects_invalid_cursor(self, client: AsyncClient):
+        """A forged cursor should be rejected with 400."""
+        response = await client.get("/api/v1/projects/?cursor=not-a-cursor")
+
+        assert response.status_code == 400
+        assert response.json()["error"]["code"] == "INVALID_CURSOR"
+
+    @pytest.mark.asyncio
+    async def test_list_projects_page_and_cursor_rejected(self, client: AsyncClient):
+        """Mixing page and cursor parameters should be rejected with 400."""
+        response = await client.get("/api/v1/projects/?cursor=abc&page=2")
+
+        assert response.status_code == 400
+
 
 # ============================================================
 # GET /api/v1/projects/{id} — Detail
+
 # ============================================================
 
 
@@ -218,7 +280,9 @@ class TestUpdateProjectEndpoint:
         assert response.status_code == 404
 
     @pytest.mark.asyncio
-    async def test_update_project_viewer_forbidden(self, viewer_client: AsyncClient, client: AsyncClient):
+    async def test_update_project_viewer_forbidden(
+        self, viewer_client: AsyncClient, client: AsyncClient
+    ):
         """Viewer should receive 403 when updating a project."""
         create_resp = await client.post(
             "/api/v1/projects/",
@@ -294,6 +358,355 @@ class TestDeleteProjectEndpoint:
         assert project_id not in ids
 
 
+class TestBulkProjectsEndpoint:
+    """Integration tests for POST/DELETE /api/v1/projects/bulk."""
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_and_delete(self, client: AsyncClient):
+        """Should create many projects, then soft-delete them and report missing IDs."""
+        create_resp = await client.post(
+            "/api/v1/projects/bulk",
+            json={"items": [{"name": "Bulk A"}, {"name": "Bulk B"}]},
+        )
+
+        assert create_resp.status_code == 201
+        created = create_resp.json()
+        ids = [item["id"] for item in created["data"]]
+        assert len(ids) == 2
+        assert sum(created["chunk_counts"]) == 2
+
+        missing = str(uuid.uuid4())
+        delete_resp = await client.request(
+            "DELETE", "/api/v1/projects/bulk", json={"ids": [*ids, missing]}
+        )
+
+        assert delete_resp.status_code == 200
+        body = delete_resp.json()
+        assert sorted(body["deleted"]) == sorted(ids)
+        assert body["not_deleted"] == [missing]
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_viewer_forbidden(self, viewer_client: AsyncClient):
+        """Viewer should receive 403 when bulk-creating projects."""
+        response = await viewer_client.post(
+            "/api/v1/projects/bulk",
+            json={"items": [{"name": "Nope"}]},
+        )
+
+        assert response.status_code == 403
+
+    @pytest.mark.asyncio
+    async def test_bulk_delete_rejects_empty(self, client: AsyncClient):
+        """An empty ID list should fail validation."""
+        response = await client.request("DELETE", "/api/v1/projects/bulk", json={"ids": []})
+
+        assert response.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_bulk_delete_rejects_malformed_ids(self, client: AsyncClient):
+        """IDs that are not UUIDs should fail validation, as in batch-get."""
+        response = await client.request(
+            "DELETE", "/api/v1/projects/bulk", json={"ids": ["not-a-uuid"]}
+        )
+
+        assert response.status_code == 422
+
+
+class TestBatchGetProjectsEndpoint:
+    """Integration tests for POST /api/v1/projects/batch-get."""
+
+    @pytest.mark.asyncio
+    async def test_batch_get_returns_found_and_missing(self, client: AsyncClient):
+        """Should return projects in request order and list unknown IDs."""
+        ids = [
+            (await client.post("/api/v1/projects/", json={"name": name})).json()["id"]
+            for name in ("Batch A", "Batch B")
+        ]
+        unknown = str(uuid.uuid4())
+
+        response = await client.post(
+            "/api/v1/projects/batch-get", json={"ids": [ids[1], unknown, ids[0]]}
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert [item["id"] for item in body["data"]] == [ids[1], ids[0]]
+        assert body["missing"] == [unknown]
+
+    @pytest.mark.asyncio
+    async def test_batch_get_rejects_invalid_ids(self, client: AsyncClient):
+        """Non-UUID IDs and oversized batches should fail validation."""
+        bad = await client.post("/api/v1/projects/batch-get", json={"ids": ["nope"]})
+        too_many = await client.post(
+            "/api/v1/projects/batch-get",
+            json={"ids": [str(uuid.uuid4()) for _ in range(101)]},
+        )
+
+        assert bad.status_code == 422
+        assert too_many.status_code == 422
+
+
+class TestProjectMembersEndpoint:
+    """Integration tests for /api/v1/projects/{id}/members."""
+
+    @pytest.mark.asyncio
+    async def test_member_gains_and_loses_access(
+        self, app: FastAPI, client: AsyncClient, viewer_user: CurrentUser, admin_user: CurrentUser
+    ):
+        """A member can read and list the project until removed."""
+        project_id = (await client.post("/api/v1/projects/", json={"name": "Team"})).json()["id"]
+        members_url = f"/api/v1/projects/{project_id}/members"
+
+        put_resp = await client.put(f"{members_url}/{viewer_user.id}", json={"role": "VIEWER"})
+        assert put_resp.status_code == 200
+        assert put_resp.json()["role"] == "VIEWER"
+
+        app.dependency_overrides[get_current_user] = lambda: viewer_user
+        assert (await client.get(f"/api/v1/projects/{project_id}")).status_code == 200
+        listed = (await client.get("/api/v1/projects/")).json()["data"]
+        assert [item["id"] for item in listed] == [project_id]
+        members = (await client.get(members_url)).json()
+        assert [m["user_id"] for m in members] == [viewer_user.id]
+        assert (await client.delete(f"{members_url}/{viewer_user.id}")).status_code == 403
+
+        app.dependency_overrides[get_current_user] = lambda: admin_user
+        assert (await client.delete(f"{members_url}/{viewer_user.id}")).status_code == 204
+        assert (await client.delete(f"{members_url}/{viewer_user.id}")).status_code == 404
+
+        app.dependency_overrides[get_current_user] = lambda: viewer_user
+        assert (await client.get(f"/api/v1/projects/{project_id}")).status_code == 403
+
+    @pytest.mark.asyncio
+    async def test_owner_role_rejected(self, client: AsyncClient):
+        project_id = (await client.post("/api/v1/projects/", json={"name": "Own"})).json()["id"]
+
+        response = await client.put(
+            f"/api/v1/projects/{project_id}/members/{uuid.uuid4()}", json={"role": "OWNER"}
+        )
+
+        assert response.status_code == 422
+
+
+class TestProjectQueryCounts:
+    """Statement counts reported via Server-Timing stay within route budgets."""
+
+    @staticmethod
+    def _query_count(response) -> int:
+        for entry in response.headers["server-timing"].split(","):
+            name, _, params = entry.strip().partition(";")
+            if name == "db-queries":
+                return int(params.removeprefix("desc=").strip('"'))
+        raise AssertionError("db-queries missing from Server-Timing")
+
+    @pytest.mark.asyncio
+    async def test_create_get_update_delete_counts(self, client: AsyncClient):
+        """Each write is one statement; reads by ID are one statement."""
+        create_resp = await client.post("/api/v1/projects/", json={"name": "Counted"})
+        project_id = create_resp.json()["id"]
+        assert self._query_count(create_resp) == 1
+
+        get_resp = await client.get(f"/api/v1/projects/{project_id}")
+        assert self._query_count(get_resp) == 1
+
+        update_resp = await client.put(f"/api/v1/projects/{project_id}", json={"name": "Re"})
+        assert self._query_count(update_resp) == 2
+
+        delete_resp = await client.delete(f"/api/v1/projects/{project_id}")
+        assert self._query_count(delete_resp) == 2
+
+    @pytest.mark.asyncio
+    async def test_pm_list_is_fingerprint_plus_one_query(self, pm_client: AsyncClient):
+        """A non-admin offset listing should fetch page and total together.
+
+        The listing fingerprint (for the ETag) is the only other statement.
+        """
+        await pm_client.post("/api/v1/projects/", json={"name": "Listed"})
+
+        response = await pm_client.get("/api/v1/projects/")
+
+        assert response.status_code == 200
+        assert self._query_count(response) == 2
+
+    @pytest.mark.asyncio
+    async def test_not_modified_list_skips_page_query(self, pm_client: AsyncClient):
+        """A 304 should be answered from the fingerprint alone."""
+        await pm_client.post("/api/v1/projects/", json={"name": "Polled"})
+        etag = (await pm_client.get("/api/v1/projects/")).headers["etag"]
+
+        response = await pm_client.get("/api/v1/projects/", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert self._query_count(response) == 1
+
+
+class TestConditionalRequestsEndpoint:
+    """ETag / Last-Modified validators, 304s and If-Match on PUT."""
+
+    @pytest.mark.asyncio
+    async def test_get_returns_validators(self, client: AsyncClient):
+        created = (await client.post("/api/v1/projects/", json={"name": "Tagged"})).json()
+
+        response = await client.get(f"/api/v1/projects/{created['id']}")
+
+        assert response.headers["etag"].startswith('"')
+        assert "last-modified" in response.headers
+        assert response.headers["cache-control"] == "private, no-cache"
+
+    @pytest.mark.asyncio
+    async def test_get_if_none_match(self, client: AsyncClient):
+        """Unchanged projects return 304 with no body; changes return 200."""
+        created = (await client.post("/api/v1/projects/", json={"name": "Polled"})).json()
+        url = f"/api/v1/projects/{created['id']}"
+        etag = (await client.get(url)).headers["etag"]
+
+        cached = await client.get(url, headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+        assert cached.headers["etag"] == etag
+
+        await client.put(url, json={"name": "Changed"})
+        fresh = await client.get(url, headers={"If-None-Match": etag})
+        assert fresh.status_code == 200
+        assert fresh.json()["name"] == "Changed"
+
+    @pytest.mark.asyncio
+    async def test_get_if_modified_since(self, client: AsyncClient):
+        created = (await client.post("/api/v1/projects/", json={"name": "Dated"})).json()
+        url = f"/api/v1/projects/{created['id']}"
+        last_modified = (await client.get(url)).headers["last-modified"]
+
+        response = await client.get(url, headers={"If-Modified-Since": last_modified})
+
+        assert response.status_code == 304
+
+    @pytest.mark.asyncio
+    async def test_list_etag_changes_with_contents(self, client: AsyncClient):
+        await client.post("/api/v1/projects/", json={"name": "First"})
+        etag = (await client.get("/api/v1/projects/")).headers["etag"]
+        assert (
+            await client.get("/api/v1/projects/", headers={"If-None-Match": etag})
+        ).status_code == 304
+
+        await client.post("/api/v1/projects/", json={"name": "Second"})
+        response = await client.get("/api/v1/projects/", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    @pytest.mark.asyncio
+    async def test_put_if_match(self, client: AsyncClient):
+        """A current ETag updates; a stale one is refused with 412."""
+        created = (await client.post("/api/v1/projects/", json={"name": "Locked"})).json()
+        url = f"/api/v1/projects/{created['id']}"
+        etag = (await client.get(url)).headers["etag"]
+
+        stale = await client.put(url, json={"name": "Nope"}, headers={"If-Match": '"stale"'})
+        assert stale.status_code == 412
+        assert stale.json()["error"]["code"] == "PRECONDITION_FAILED"
+
+        updated = await client.put(url, json={"name": "Yes"}, headers={"If-Match": etag})
+        assert updated.status_code == 200
+        assert updated.headers["etag"] == (await client.get(url)).headers["etag"]
+
+    @pytest.mark.asyncio
+    async def test_put_if_match_rejects_an_etag_from_the_same_second(self, client: AsyncClient):
+        """Back-to-back updates share `updated_at` on SQLite but not an ETag."""
+        created = (await client.post("/api/v1/projects/", json={"name": "Quick"})).json()
+        url = f"/api/v1/projects/{created['id']}"
+        first = await client.put(url, json={"name": "One"})
+        second = await client.put(url, json={"name": "Two"})
+        assert first.headers["etag"] != second.headers["etag"]
+
+        lost_update = await client.put(
+            url, json={"name": "Three"}, headers={"If-Match": first.headers["etag"]}
+        )
+
+        assert lost_update.status_code == 412
+
+    @pytest.mark.asyncio
+    async def test_put_if_match_accepts_a_sparse_etag(self, client: AsyncClient):
+        created = (await client.post("/api/v1/projects/", json={"name": "Slim"})).json()
+        url = f"/api/v1/projects/{created['id']}"
+        etag = (await client.get(url, params={"fields": "id,name"})).headers["etag"]
+
+        updated = await client.put(url, json={"name": "Slimmer"}, headers={"If-Match": etag})
+
+        assert updated.status_code == 200
+
+
+class TestExportProjectsEndpoint:
+    """Integration tests for GET /api/v1/projects/export."""
+
+    @pytest.mark.asyncio
+    async def test_export_ndjson(self, client: AsyncClient):
+        """Should stream one JSON object per line."""
+        for name in ("Export A", "Export B"):
+            await client.post("/api/v1/projects/", json={"name": name})
+
+        response = await client.get("/api/v1/projects/export")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert {"Export A", "Export B"} <= {row["name"] for row in rows}
+
+    @pytest.mark.asyncio
+    async def test_export_csv(self, client: AsyncClient):
+        """Should stream a CSV with a header row."""
+        await client.post("/api/v1/projects/", json={"name": "CSV Row"})
+
+        response = await client.get("/api/v1/projects/export", params={"format": "csv"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert "CSV Row" in {row["name"] for row in rows}
+
+    @pytest.mark.asyncio
+    async def test_export_rejects_unknown_format(self, client: AsyncClient):
+        """Unsupported formats should fail validation."""
+        response = await client.get("/api/v1/projects/export", params={"format": "xml"})
+
+        assert response.status_code == 422
+
+
+class TestSparseFieldsEndpoint:
+    """Integration tests for `?fields=` on read endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_list_returns_only_selected_fields(self, client: AsyncClient):
+        """List items should carry exactly the selected fields plus id."""
+        await client.post("/api/v1/projects/", json={"name": "Sparse", "description": "long"})
+
+        response = await client.get("/api/v1/projects/", params={"fields": "name,status"})
+
+        assert response.status_code == 200
+        body = response.json()
+        assert set(body["data"][0]) == {"id", "name", "status"}
+        assert "total" in body["meta"]
+
+    @pytest.mark.asyncio
+    async def test_get_returns_only_selected_fields(self, client: AsyncClient):
+        """Get should honour the same selection."""
+        created = await client.post("/api/v1/projects/", json={"name": "Sparse One"})
+        project_id = created.json()["id"]
+
+        response = await client.get(f"/api/v1/projects/{project_id}", params={"fields": "name"})
+
+        assert response.status_code == 200
+        assert response.json() == {"id": project_id, "name": "Sparse One"}
+
+    @pytest.mark.asyncio
+    async def test_unknown_field_rejected(self, client: AsyncClient):
+        """Unknown fields should be a 400 with the INVALID_FIELDS code."""
+        response = await client.get(
+            "/api/v1/projects/", params={"cursor": "", "fields": "name,secret"}
+        )
+
+        assert response.status_code == 400
+        assert response.json()["error"]["code"] == "INVALID_FIELDS"
+
+
 # ============================================================
 # RESPONSE FORMAT
 # ============================================================
@@ -311,7 +724,15 @@ class TestResponseFormat:
         )
 
         data = response.json()
-        required_fields = {"id", "name", "description", "status", "owner_id", "created_at", "updated_at"}
+        required_fields = {
+            "id",
+            "name",
+            "description",
+            "status",
+            "owner_id",
+            "created_at",
+            "updated_at",
+        }
         assert required_fields.issubset(data.keys())
 
     @pytest.mark.asyncio
@@ -337,4 +758,3 @@ class TestResponseFormat:
         data = response.json()
         assert data["status"] == "healthy"
         assert "version" in data
-
@@ -4,20 +4,23 @@
 
 from __future__ import annotations
 
+import json
 import uuid
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from app.core.constants import ProjectStatus, Role
+from app.core.constants import CountStrategy, ProjectRole, ProjectStatus, Role
 from app.core.dependencies import CurrentUser
 from app.core.exceptions import (
     BusinessRuleError,
     InsufficientPermissionError,
     NotFoundError,
+    PreconditionFailedError,
 )
 from app.core.schemas import PaginationParams
-from app.domains.projects.schemas import ProjectCreate, ProjectUpdate
+from app.db.base_repository import BulkResult, TotalCount
+from app.domains.projects.schemas import ProjectCreate, ProjectMemberSet, ProjectUpdate
 from app.domains.projects.service import ProjectService
 
 from .conftest import make_project
@@ -164,7 +167,10 @@ class TestUpdateProjectRBAC:
 
     @pytest.mark.asyncio
     async def test_developer_cannot_update_project(
-        self, project_service: ProjectService, mock_repository: AsyncMock, developer_user: CurrentUser
+        self,
+        project_service: ProjectService,
+        mock_repository: AsyncMock,
+        developer_user: CurrentUser,
     ):
         """Developer should NOT be able to update projects."""
         project = make_project(owner_id=str(uuid.uuid4()))
@@ -204,9 +210,7 @@ class TestStatusTransitions:
         """ACTIVE → ARCHIVED is a valid transition."""
         project = make_project(owner_id=admin_user.id, status=ProjectStatus.ACTIVE.value)
         mock_repository.get_or_raise.return_value = project
-        updated = make_project(
-            owner_id=admin_user.id, status=ProjectStatus.ARCHIVED.value
-        )
+        updated = make_project(owner_id=admin_user.id, status=ProjectStatus.ARCHIVED.value)
         mock_repository.update.return_value = updated
 
         data = ProjectUpdate(status=ProjectStatus.ARCHIVED)
@@ -221,9 +225,7 @@ class TestStatusTransitions:
         """ARCHIVED → ACTIVE is a valid transition."""
         project = make_project(owner_id=admin_user.id, status=ProjectStatus.ARCHIVED.value)
         mock_repository.get_or_raise.return_value = project
-        updated = make_project(
-            owner_id=admin_user.id, status=ProjectStatus.ACTIVE.value
-        )
+        updated = make_project(owner_id=admin_user.id, status=ProjectStatus.ACTIVE.value)
         mock_repository.update.return_value = updated
 
         data = ProjectUpdate(status=ProjectStatus.ACTIVE)
@@ -292,7 +294,10 @@ class TestSoftDeleteRBAC:
 
     @pytest.mark.asyncio
     async def test_developer_cannot_delete_project(
-        self, project_service: ProjectService, mock_repository: AsyncMock, developer_user: CurrentUser
+        self,
+        project_service: ProjectService,
+        mock_repository: AsyncMock,
+        developer_user: CurrentUser,
     ):
         """Developer should NOT be able to delete projects."""
         project = make_project(owner_id=str(uuid.uuid4()))
@@ -302,6 +307,240 @@ class TestSoftDeleteRBAC:
             await project_service.soft_delete_project(project.id, developer_user)
 
 
+# ============================================================
+# BULK WRITES — RBAC
+# ============================================================
+
+
+class TestBulkProjectsRBAC:
+    """RBAC and result reporting for bulk create and bulk soft-delete."""
+
+    @pytest.mark.asyncio
+    async def test_pm_bulk_create_owns_all(
+        self, project_service: ProjectService, mock_repository: AsyncMock, pm_user: CurrentUser
+    ):
+        """Bulk-created projects should all be owned by the caller."""
+        created = [make_project(owner_id=pm_user.id), make_project(owner_id=pm_user.id)]
+        mock_repository.create_many.return_value = BulkResult(
+            ids=[p.id for p in created], chunk_counts=[2], items=created
+        )
+
+        result = await project_service.create_projects(
+            [ProjectCreate(name="A"), ProjectCreate(name="B")], pm_user
+        )
+
+        rows = mock_repository.create_many.call_args.args[0]
+        assert [row["name"] for row in rows] == ["A", "B"]
+        assert all(row["owner_id"] == pm_user.id for row in rows)
+        assert len(result.data) == 2
+        assert result.chunk_counts == [2]
+
+    @pytest.mark.asyncio
+    async def test_viewer_bulk_create_forbidden(
+        self, project_service: ProjectService, mock_repository: AsyncMock, viewer_user: CurrentUser
+    ):
+        """Viewers cannot bulk-create projects."""
+        with pytest.raises(InsufficientPermissionError):
+            await project_service.create_projects([ProjectCreate(name="A")], viewer_user)
+
+        mock_repository.create_many.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_admin_bulk_delete_unscoped(
+        self, project_service: ProjectService, mock_repository: AsyncMock, admin_user: CurrentUser
+    ):
+        """Admin bulk delete should not add an ownership filter."""
+        ids = [str(uuid.uuid4()), str(uuid.uuid4())]
+        mock_repository.soft_delete_many.return_value = BulkResult(ids=ids, chunk_counts=[2])
+
+        result = await project_service.soft_delete_projects(ids, admin_user)
+
+        mock_repository.soft_delete_many.assert_called_once_with(ids=ids)
+        assert result.deleted == ids
+        assert result.not_deleted == []
+
+    @pytest.mark.asyncio
+    async def test_pm_bulk_delete_filtered_by_owner(
+        self, project_service: ProjectService, mock_repository: AsyncMock, pm_user: CurrentUser
+    ):
+        """PM bulk delete should filter by owner in SQL and report skipped IDs."""
+        own, other = str(uuid.uuid4()), str(uuid.uuid4())
+        mock_repository.soft_delete_many.return_value = BulkResult(ids=[own], chunk_counts=[1])
+
+        result = await project_service.soft_delete_projects([own, other], pm_user)
+
+        mock_repository.soft_delete_many.assert_called_once_with(
+            ids=[own, other], filters={"owner_id": pm_user.id}
+        )
+        assert result.deleted == [own]
+        assert result.not_deleted == [other]
+
+    @pytest.mark.asyncio
+    async def test_developer_bulk_delete_forbidden(
+        self,
+        project_service: ProjectService,
+        mock_repository: AsyncMock,
+        developer_user: CurrentUser,
+    ):
+        """Developers cannot bulk-delete projects."""
+        with pytest.raises(InsufficientPermissionError):
+            await project_service.soft_delete_projects([str(uuid.uuid4())], developer_user)
+
+        mock_repository.soft_delete_many.assert_not_called()
+
+
+class TestBatchGetProjectsRBAC:
+    """RBAC and ordering for batch-get."""
+
+    @pytest.mark.asyncio
+    async def test_admin_gets_all_in_requested_order(
+        self, project_service: ProjectService, mock_repository: AsyncMock, admin_user: CurrentUser
+    ):
+        """Results follow the request order; unknown IDs are missing."""
+        first, second = make_project(), make_project()
+        unknown = str(uuid.uuid4())
+        mock_repository.get_many.return_value = [first, second]
+
+        result = await project_service.get_projects(
+            [second.id, unknown, first.id, second.id], admin_user
+        )
+
+        mock_repository.get_many.assert_called_once_with([second.id, unknown, first.id])
+        assert [p.id for p in result.data] == [second.id, first.id]
+        assert result.missing == [unknown]
+
+    @pytest.mark.asyncio
+    async def test_unreadable_projects_reported_as_missing(
+        self, project_service: ProjectService, mock_repository: AsyncMock, pm_user: CurrentUser
+    ):
+        """Projects the caller may not read look the same as unknown IDs."""
+        own = make_project(owner_id=pm_user.id)
+        other = make_project(owner_id=str(uuid.uuid4()))
+        mock_repository.get_many.return_value = [own, other]
+
+        result = await project_service.get_projects([own.id, other.id], pm_user)
+
+        assert [p.id for p in result.data] == [own.id]
+        assert result.missing == [other.id]
+
+
+class TestMembershipRBAC:
+    """Membership grants read access; owners and admins manage members."""
+
+    @pytest.mark.asyncio
+    async def test_member_can_read_project(
+        self,
+        project_service: ProjectService,
+        mock_repository: AsyncMock,
+        developer_user: CurrentUser,
+    ):
+        """A member reads the project; memberships are looked up once per request."""
+        project = make_project(owner_id=str(uuid.uuid4()))
+        mock_repository.get_or_raise.return_value = project
+        mock_repository.get_version.return_value = project
+        mock_repository.get_memberships.return_value = {project.id: ProjectRole.VIEWER}
+
+        await project_service.project_validators(project.id, developer_user)
+        result = await project_service.get_project(project.id, developer_user)
+
+        assert result.id == project.id
+        mock_repository.get_memberships.assert_called_once_with(developer_user.id)
+
+    @pytest.mark.asyncio
+    async def test_owner_read_skips_membership_lookup(
+        self, project_service: ProjectService, mock_repository: AsyncMock, pm_user: CurrentUser
+    ):
+        """Ownership decides without consulting memberships."""
+        mock_repository.get_or_raise.return_value = make_project(owner_id=pm_user.id)
+
+        await project_service.get_project("p1", pm_user)
+
+        mock_repository.get_memberships.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_batch_get_includes_member_projects(
+        self,
+        project_service: ProjectService,
+        mock_repository: AsyncMock,
+        developer_user: CurrentUser,
+    ):
+        shared, hidden = make_project(), make_project()
+        mock_repository.get_many.return_value = [shared, hidden]
+        mock_repository.get_memberships.return_value = {shared.id: ProjectRole.MEMBER}
+
+        result = await project_service.get_projects([shared.id, hidden.id], developer_user)
+
+        assert [p.id for p in result.data] == [shared.id]
+        assert result.missing == [hidden.id]
+
+    @pytest.mark.asyncio
+    async def test_owner_sets_member(
+        self, project_service: ProjectService, mock_repository: AsyncMock, pm_user: CurrentUser
+    ):
+        project = make_project(owner_id=pm_user.id)
+        user_id = str(uuid.uuid4())
+        mock_repository.get_or_raise.return_value = project
+        member = MagicMock(
+            project_id=project.id,
+            user_id=user_id,
+            role=ProjectRole.ADMIN,
+            created_at=project.created_at,
+            updated_at=project.updated_at,
+        )
+        mock_repository.set_member.return_value = member
+
+        result = await project_service.set_member(
+            project.id, user_id, ProjectMemberSet(role=ProjectRole.ADMIN), pm_user
+        )
+
+        mock_repository.set_member.assert_called_once_with(project.id, user_id, ProjectRole.ADMIN)
+        assert result.role == ProjectRole.ADMIN
+
+    @pytest.mark.asyncio
+    async def test_ownership_is_not_a_membership(
+        self, project_service: ProjectService, mock_repository: AsyncMock, pm_user: CurrentUser
+    ):
+        """OWNER cannot be granted, and the owner cannot be added as a member."""
+        project = make_project(owner_id=pm_user.id)
+        mock_repository.get_or_raise.return_value = project
+
+        with pytest.raises(BusinessRuleError):
+            await project_service.set_member(
+                project.id, str(uuid.uuid4()), ProjectMemberSet(role=ProjectRole.OWNER), pm_user
+            )
+        with pytest.raises(BusinessRuleError):
+            await project_service.set_member(project.id, pm_user.id, ProjectMemberSet(), pm_user)
+
+        mock_repository.set_member.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_member_cannot_manage_members(
+        self,
+        project_service: ProjectService,
+        mock_repository: AsyncMock,
+        developer_user: CurrentUser,
+    ):
+        """Read access through membership does not allow managing members."""
+        project = make_project()
+        mock_repository.get_or_raise.return_value = project
+        mock_repository.get_memberships.return_value = {project.id: ProjectRole.ADMIN}
+
+        with pytest.raises(InsufficientPermissionError):
+            await project_service.remove_member(project.id, str(uuid.uuid4()), developer_user)
+
+        mock_repository.remove_member.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_remove_unknown_member_is_404(
+        self, project_service: ProjectService, mock_repository: AsyncMock, admin_user: CurrentUser
+    ):
+        mock_repository.get_or_raise.return_value = make_project()
+        mock_repository.remove_member.return_value = False
+
+        with pytest.raises(NotFoundError):
+            await project_service.remove_member("p1", str(uuid.uuid4()), admin_user)
+
+
 # ============================================================
 # READ / LIST — RBAC
 # ============================================================
@@ -336,7 +575,10 @@ class TestReadProjectRBAC:
 
     @pytest.mark.asyncio
     async def test_non_owner_non_admin_cannot_read_project(
-        self, project_service: ProjectService, mock_repository: AsyncMock, developer_user: CurrentUser
+        self,
+        project_service: ProjectService,
+        mock_repository: AsyncMock,
+        developer_user: CurrentUser,
     ):
         """Non-owner, non-admin should NOT be able to read a project."""
         project = make_project(owner_id=str(uuid.uuid4()))
@@ -359,6 +601,24 @@ class TestReadProjectRBAC:
         mock_repository.get_multi.assert_called_once()
         assert result.meta.total == 3
 
+    @pytest.mark.asyncio
+    async def test_admin_listing_uses_estimated_total(
+        self, project_service: ProjectService, mock_repository: AsyncMock, admin_user: CurrentUser
+    ):
+        """Admin listings should request the cheap count and surface its exactness."""
+        mock_repository.get_multi.return_value = (
+            [make_project()],
+            TotalCount(5000, is_exact=False),
+        )
+
+        pagination = PaginationParams(page=1, per_page=20)
+        result = await project_service.list_projects(admin_user, pagination)
+
+        kwargs = mock_repository.get_multi.call_args.kwargs
+        assert kwargs["count_strategy"] == CountStrategy.ESTIMATED
+        assert result.meta.total == 5000
+        assert result.meta.total_is_exact is False
+
     @pytest.mark.asyncio
     async def test_pm_lists_only_own_projects(
         self, project_service: ProjectService, mock_repository: AsyncMock, pm_user: CurrentUser
@@ -374,6 +634,286 @@ class TestReadProjectRBAC:
         assert result.meta.total == 1
 
 
+class TestListProjectsKeyset:
+    """Keyset pagination scoping in the service."""
+
+    @pytest.mark.asyncio
+    async def test_admin_keyset_lists_all(
+        self, project_service: ProjectService, mock_repository: AsyncMock, admin_user: CurrentUser
+    ):
+        """Admin keyset listing should page over all projects."""
+        mock_repository.get_multi_keyset.return_value = ([make_project()], "next-token")
+
+        result = await project_service.list_projects_keyset(admin_user, cursor=None, per_page=1)
+
+        mock_repository.get_multi_keyset.assert_called_once_with(cursor=None, limit=1, fields=None)
+        assert result.meta.next_cursor == "next-token"
+        assert result.meta.has_more is True
+
+    @pytest.mark.asyncio
+    async def test_pm_keyset_scoped_to_user(
+        self, project_service: ProjectService, mock_repository: AsyncMock, pm_user: CurrentUser
+    ):
+        """Non-admin keyset listing should be scoped to accessible projects."""
+        mock_repository.list_accessible_by_user_keyset.return_value = (
+            [make_project(owner_id=pm_user.id)],
+            None,
+        )
+
+        result = await project_service.list_projects_keyset(pm_user, cursor="abc", per_page=20)
+
+        mock_repository.list_accessible_by_user_keyset.assert_called_once_with(
+            user_id=pm_user.id, cursor="abc", limit=20, fields=None
+        )
+        mock_repository.get_multi_keyset.assert_not_called()
+        assert result.meta.has_more is False
+
+
+class TestSparseFields:
+    """Tests for `fields` selection on reads."""
+
+    @pytest.mark.asyncio
+    async def test_list_passes_fields_and_serializes_partial(
+        self, project_service: ProjectService, mock_repository: AsyncMock, pm_user: CurrentUser
+    ):
+        """The projection should reach the repository and shape the response."""
+        fields = frozenset({"id", "name"})
+        mock_repository.list_accessible_by_user.return_value = ([make_project(name="P")], 1)
+
+        result = await project_service.list_projects(
+            pm_user, PaginationParams(page=1, per_page=20), fields=fields
+        )
+
+        kwargs = mock_repository.list_accessible_by_user.call_args.kwargs
+        assert kwargs["fields"] == fields
+        assert result.data[0].model_dump().keys() == {"id", "name"}
+
+    @pytest.mark.asyncio
+    async def test_get_narrows_response_only(
+        self, project_service: ProjectService, mock_repository: AsyncMock, pm_user: CurrentUser
+    ):
+        """get_project should still run the RBAC check on the full row."""
+        project = make_project(owner_id=pm_user.id)
+        mock_repository.get_or_raise.return_value = project
+
+        result = await project_service.get_project(
+            project.id, pm_user, fields=frozenset({"id", "status"})
+        )
+
+        assert result.model_dump() == {"id": project.id, "status": ProjectStatus.ACTIVE}
+
+
+class TestListProjectsJson:
+    """The row fast path renders the same body as list_projects."""
+
+    @pytest.mark.asyncio
+    async def test_pm_body_matches_orm_path(
+        self, project_service: ProjectService, mock_repository: AsyncMock, pm_user: CurrentUser
+    ):
+        """Rows and ORM objects should serialize to identical bytes."""
+        projects = [make_project(owner_id=pm_user.id, name=f"P{i}") for i in range(3)]
+        pagination = PaginationParams(page=1, per_page=20)
+        mock_repository.list_accessible_by_user.return_value = (projects, TotalCount(3))
+        mock_repository.list_accessible_by_user_rows.return_value = (projects, TotalCount(3))
+
+        expected = await project_service.list_projects(pm_user, pagination)
+        body = await project_service.list_projects_json(pm_user, pagination)
+
+        assert body == expected.model_dump_json().encode()
+
+    @pytest.mark.asyncio
+    async def test_admin_reads_rows_with_estimated_total(
+        self, project_service: ProjectService, mock_repository: AsyncMock, admin_user: CurrentUser
+    ):
+        """Admin listings should use get_multi_rows and keep the inexact total flag."""
+        mock_repository.get_multi_rows.return_value = (
+            [{"id": "p1", "name": "Slim"}],
+            TotalCount(500, is_exact=False),
+        )
+
+        body = await project_service.list_projects_json(
+            admin_user, PaginationParams(page=2, per_page=10), fields=frozenset({"id", "name"})
+        )
+
+        mock_repository.get_multi_rows.assert_called_once_with(
+            offset=10,
+            limit=10,
+            count_strategy=CountStrategy.ESTIMATED,
+            fields=frozenset({"id", "name"}),
+        )
+        payload = json.loads(body)
+        assert payload["data"] == [{"id": "p1", "name": "Slim"}]
+        assert payload["meta"]["total_is_exact"] is False
+        assert payload["meta"]["total_pages"] == 50
+
+
+class TestConditionalRequests:
+    """ETag validators and If-Match preconditions."""
+
+    @pytest.mark.asyncio
+    async def test_project_validators_use_version_only(
+        self, project_service: ProjectService, mock_repository: AsyncMock, pm_user: CurrentUser
+    ):
+        """The pre-check should not load the row and should match the full-path ETag."""
+        project = make_project(owner_id=pm_user.id)
+        mock_repository.get_version.return_value = project
+        mock_repository.get_or_raise.return_value = project
+
+        validators = await project_service.project_validators(project.id, pm_user)
+        _, loaded = await project_service.get_project_versioned(project.id, pm_user)
+
+        assert validators == loaded
+        assert validators.last_modified == project.updated_at
+
+    @pytest.mark.asyncio
+    async def test_project_validators_enforce_rbac_and_404(
+        self, project_service: ProjectService, mock_repository: AsyncMock, pm_user: CurrentUser
+    ):
+        """A 304 must not be available where the full read would fail."""
+        mock_repository.get_version.return_value = make_project()
+        with pytest.raises(InsufficientPermissionError):
+            await project_service.project_validators("p1", pm_user)
+
+        mock_repository.get_version.return_value = None
+        with pytest.raises(NotFoundError):
+            await project_service.project_validators("p1", pm_user)
+
+    @pytest.mark.asyncio
+    async def test_fields_are_separate_representations(
+        self, project_service: ProjectService, mock_repository: AsyncMock, pm_user: CurrentUser
+    ):
+        project = make_project(owner_id=pm_user.id)
+        mock_repository.get_version.return_value = project
+
+        full = await project_service.project_validators(project.id, pm_user)
+        narrow = await project_service.project_validators(
+            project.id, pm_user, fields=frozenset({"id", "name"})
+        )
+
+        assert full.etag != narrow.etag
+
+    @pytest.mark.asyncio
+    async def test_listing_validators_scope(
+        self,
+        project_service: ProjectService,
+        mock_repository: AsyncMock,
+        pm_user: CurrentUser,
+        admin_user: CurrentUser,
+    ):
+        """PMs fingerprint their accessible projects; admins the whole table."""
+        mock_repository.listing_fingerprint.return_value = (3, None)
+
+        pm = await project_service.listing_validators(pm_user, variant="/?page=1")
+        mock_repository.listing_fingerprint.assert_called_with(pm_user.id)
+        admin = await project_service.listing_validators(admin_user, variant="/?page=1")
+        mock_repository.listing_fingerprint.assert_called_with(None)
+
+        assert pm.etag != admin.etag
+        mock_repository.listing_fingerprint.return_value = (4, None)
+        assert (await project_service.listing_validators(pm_user, variant="/?page=1")) != pm
+
+    @pytest.mark.asyncio
+    async def test_update_with_stale_if_match_is_refused(
+        self, project_service: ProjectService, mock_repository: AsyncMock, pm_user: CurrentUser
+    ):
+        """A stale ETag should raise 412 before anything is written."""
+        project = make_project(owner_id=pm_user.id)
+        mock_repository.get_for_update.return_value = project
+
+        with pytest.raises(PreconditionFailedError):
+            await project_service.update_project(
+                project.id, ProjectUpdate(name="New"), pm_user, if_match='"stale"'
+            )
+        mock_repository.update.assert_not_called()
+        mock_repository.get_or_raise.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_update_with_current_if_match(
+        self, project_service: ProjectService, mock_repository: AsyncMock, pm_user: CurrentUser
+    ):
+        project = make_project(owner_id=pm_user.id)
+        mock_repository.get_for_update.return_value = project
+        mock_repository.update.return_value = make_project(id=project.id, name="New")
+        etag = ProjectService.project_etag(project.id, project.version)
+
+        result = await project_service.update_project(
+            project.id, ProjectUpdate(name="New"), pm_user, if_match=etag
+        )
+
+        assert result.name == "New"
+
+    @pytest.mark.asyncio
+    async def test_update_with_sparse_if_match(
+        self, project_service: ProjectService, mock_repository: AsyncMock, pm_user: CurrentUser
+    ):
+        """The ETag of a `?fields=` read guards the update of the same version."""
+        project = make_project(owner_id=pm_user.id, version=4)
+        mock_repository.get_for_update.return_value = project
+        mock_repository.update.return_value = make_project(id=project.id, name="New", version=5)
+        etag = ProjectService.project_etag(project.id, 4, frozenset({"id", "name"}))
+
+        result, validators = await project_service.update_project_versioned(
+            project.id, ProjectUpdate(name="New"), pm_user, if_match=etag
+        )
+
+        assert result.name == "New"
+        assert validators.etag == ProjectService.project_etag(project.id, 5)
+
+    @pytest.mark.asyncio
+    async def test_etag_follows_version_not_timestamp(
+        self, project_service: ProjectService, mock_repository: AsyncMock, pm_user: CurrentUser
+    ):
+        """Two writes within one second must not share an ETag."""
+        first = make_project(owner_id=pm_user.id, version=1)
+        second = make_project(
+            id=first.id, owner_id=pm_user.id, updated_at=first.updated_at, version=2
+        )
+
+        mock_repository.get_version.return_value = first
+        before = await project_service.project_validators(first.id, pm_user)
+        mock_repository.get_version.return_value = second
+        after = await project_service.project_validators(first.id, pm_user)
+
+        assert before.etag != after.etag
+
+
+class TestExportProjects:
+    """Export scoping in the service."""
+
+    @staticmethod
+    async def _rows(*projects):
+        for project in projects:
+            yield project
+
+    @pytest.mark.asyncio
+    async def test_admin_exports_all(
+        self, project_service: ProjectService, mock_repository: AsyncMock, admin_user: CurrentUser
+    ):
+        """Admin exports should stream every project."""
+        mock_repository.stream = MagicMock(return_value=self._rows(make_project()))
+
+        rows = [row async for row in project_service.export_projects(admin_user)]
+
+        mock_repository.stream.assert_called_once_with()
+        assert len(rows) == 1
+
+    @pytest.mark.asyncio
+    async def test_pm_export_scoped_to_user(
+        self, project_service: ProjectService, mock_repository: AsyncMock, pm_user: CurrentUser
+    ):
+        """Non-admin exports should use the accessible-projects stream."""
+        mock_repository.stream = MagicMock()
+        mock_repository.stream_accessible_by_user = MagicMock(
+            return_value=self._rows(make_project(owner_id=pm_user.id))
+        )
+
+        rows = [row async for row in project_service.export_projects(pm_user)]
+
+        mock_repository.stream_accessible_by_user.assert_called_once_with(pm_user.id)
+        mock_repository.stream.assert_not_called()
+        assert rows[0].owner_id == pm_user.id
+
+
 # ============================================================
 # EDGE CASES
 # ============================================================
@@ -441,4 +981,3 @@ class TestEdgeCases:
         assert result.name == "Serialization Test"
         assert result.description == "Test description"
         assert result.owner_id == admin_user.id
-
@@ -0,0 +1,44 @@
+# Unit tests for the Bloom filter
+# No false negatives, a false-positive rate near the configured one, and
+# growth when built from more items than its capacity.
+
+from __future__ import annotations
+
+import pytest
+
+from app.core.bloom import BloomFilter
+
+
+class TestBloomFilter:
+    def test_added_items_are_always_found(self):
+        bloom = BloomFilter(capacity=1_000, error_rate=0.01)
+        items = [f"jti-{i}" for i in range(1_000)]
+        for item in items:
+            bloom.add(item)
+
+        assert all(item in bloom for item in items)
+        assert len(bloom) == 1_000
+
+    def test_false_positive_rate_is_near_target(self):
+        bloom = BloomFilter(capacity=2_000, error_rate=0.01)
+        for i in range(2_000):
+            bloom.add(f"in-{i}")
+
+        false_positives = sum(f"out-{i}" in bloom for i in range(20_000))
+
+        assert false_positives / 20_000 < 0.02
+
+    def test_empty_filter_contains_nothing(self):
+        assert "anything" not in BloomFilter(capacity=10)
+
+    def test_from_items_grows_past_capacity(self):
+        items = [f"jti-{i}" for i in range(50)]
+        bloom = BloomFilter.from_items(items, capacity=10)
+
+        assert bloom.capacity == 100
+        assert all(item in bloom for item in items)
+
+    @pytest.mark.parametrize(("capacity", "error_rate"), [(0, 0.01), (10, 0), (10, 1)])
+    def test_rejects_invalid_sizing(self, capacity, error_rate):
+        with pytest.raises(ValueError):
+            BloomFilter(capacity, error_rate)
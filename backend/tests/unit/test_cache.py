@@ -0,0 +1,319 @@
+# Unit tests for the read-through cache tiers
+# Runs against fakeredis: TTL jitter, read-through, stampede locking,
+# version guards, degradation to misses when Redis fails, the in-process LRU, the
+# two-tier cache with pub/sub invalidation, and the `cached` decorator.
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+from fakeredis import FakeAsyncRedis, FakeServer
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.core.cache import LRUCache, RedisCache, TieredCache, cached
+
+
+@pytest_asyncio.fixture
+async def redis():
+    client = FakeAsyncRedis()
+    yield client
+    await client.aclose()
+
+
+@pytest.fixture
+def cache(redis) -> RedisCache:
+    return RedisCache(redis, ttl_seconds=100, jitter=0.2, lock_poll_seconds=0.01)
+
+
+class TestRedisCache:
+    """Read-through behaviour of RedisCache."""
+
+    def test_ttl_is_jittered_within_bounds(self, cache: RedisCache):
+        ttls = {cache.ttl() for _ in range(200)}
+        assert min(ttls) >= 80
+        assert max(ttls) <= 120
+        assert len(ttls) > 1
+
+    @pytest.mark.asyncio
+    async def test_get_or_set_loads_once_then_hits(self, cache: RedisCache, redis):
+        calls = 0
+
+        async def load():
+            nonlocal calls
+            calls += 1
+            return {"value": 1}
+
+        assert await cache.get_or_set("k", load) == {"value": 1}
+        assert await cache.get_or_set("k", load) == {"value": 1}
+        assert calls == 1
+        assert 80 <= await redis.ttl("k") <= 120
+
+    @pytest.mark.asyncio
+    async def test_none_is_not_cached(self, cache: RedisCache, redis):
+        async def load():
+            return None
+
+        assert await cache.get_or_set("missing", load) is None
+        assert await redis.exists("missing") == 0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_load_once(self, cache: RedisCache):
+        """Only the lock holder should reach the loader; the rest wait for its value."""
+        calls = 0
+
+        async def slow_load():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return "fresh"
+
+        results = await asyncio.gather(*(cache.get_or_set("hot", slow_load) for _ in range(10)))
+
+        assert results == ["fresh"] * 10
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_lock_is_released_after_load_error(self, cache: RedisCache, redis):
+        async def failing_load():
+            raise RuntimeError("db down")
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_set("k", failing_load)
+        assert await redis.exists("k:lock") == 0
+
+    @pytest.mark.asyncio
+    async def test_incr_sets_version_expiry(self, cache: RedisCache, redis):
+        await cache.incr("ver", ttl=60)
+        await cache.incr("ver", ttl=60)
+
+        assert await cache.get_many(["ver", "absent"]) == [2, None]
+        assert 0 < await redis.ttl("ver") <= 60
+
+    @pytest.mark.asyncio
+    async def test_incr_bumps_several_keys(self, cache: RedisCache):
+        await cache.incr("a", "b", ttl=60)
+        await cache.incr("b", ttl=60)
+
+        assert await cache.get_many(["a", "b"]) == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_value_is_not_stored_if_a_guard_moves_during_load(self, cache: RedisCache, redis):
+        """A write that starts while the old value loads must not be undone by the read."""
+
+        async def load_racing_a_write():
+            await cache.incr("ver", ttl=60)
+            return "old"
+
+        assert await cache.get_or_set("k", load_racing_a_write, guard=["ver"]) == "old"
+        assert await redis.exists("k") == 0
+
+        async def load():
+            return "new"
+
+        assert await cache.get_or_set("k", load, guard=["ver"]) == "new"
+        assert await cache.get("k") == "new"
+
+    @pytest.mark.asyncio
+    async def test_redis_errors_degrade_to_misses(self, cache: RedisCache, redis, monkeypatch):
+        """A broken Redis should fall through to the loader, not fail the caller."""
+
+        async def broken(*args, **kwargs):
+            raise RedisConnectionError("connection refused")
+
+        monkeypatch.setattr(redis, "execute_command", broken)
+
+        async def load():
+            return "from-db"
+
+        assert await cache.get_or_set("k", load) == "from-db"
+        assert await cache.get_or_set("k", load, guard=["ver"]) == "from-db"
+        await cache.delete("k")
+        await cache.incr("ver", ttl=60)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLRUCache:
+    """Size- and TTL-based eviction of the in-process tier."""
+
+    def test_evicts_least_recently_used(self):
+        lru = LRUCache(max_entries=2)
+        lru.set("a", 1)
+        lru.set("b", 2)
+        assert lru.get("a") == 1  # "b" is now least recently used
+        lru.set("c", 3)
+
+        assert lru.get("b") is None
+        assert (lru.get("a"), lru.get("c")) == (1, 3)
+        assert lru.stats.evictions == 1
+
+    def test_entries_expire(self):
+        clock = FakeClock()
+        lru = LRUCache(ttl_seconds=10, clock=clock)
+        lru.set("a", 1)
+
+        clock.now = 9.9
+        assert lru.get("a") == 1
+        clock.now = 10
+        assert lru.get("a") is None
+        assert len(lru) == 0
+        assert lru.stats.snapshot() == {
+            "hits": 1,
+            "misses": 1,
+            "evictions": 0,
+            "expirations": 1,
+            "invalidations": 0,
+            "errors": 0,
+        }
+
+
+def _tiered(server: FakeServer) -> TieredCache:
+    """One worker's cache: its own L1, a client on the shared fake server."""
+    return TieredCache(
+        RedisCache(FakeAsyncRedis(server=server), lock_poll_seconds=0.01),
+        LRUCache(max_entries=100, ttl_seconds=60),
+        reconnect_seconds=0.01,
+    )
+
+
+@pytest_asyncio.fixture
+async def workers():
+    server = FakeServer()
+    caches = [_tiered(server), _tiered(server)]
+    for cache in caches:
+        cache.start()
+        await asyncio.wait_for(cache.wait_subscribed(), timeout=1)
+    yield caches
+    for cache in caches:
+        await cache.stop()
+        await cache.l2.redis.aclose()
+
+
+async def _until(predicate, timeout: float = 1.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline, "condition not met in time"
+        await asyncio.sleep(0.01)
+
+
+class TestTieredCache:
+    """L1 in front of Redis, invalidated across workers over pub/sub."""
+
+    @pytest.mark.asyncio
+    async def test_l1_hit_skips_redis(self, workers):
+        worker, _ = workers
+
+        async def load():
+            return {"v": 1}
+
+        await worker.get_or_set("k", load)
+        redis_reads = worker.l2.stats.hits + worker.l2.stats.misses
+
+        assert await worker.get_or_set("k", load) == {"v": 1}
+        assert worker.l2.stats.hits + worker.l2.stats.misses == redis_reads
+        assert worker.metrics()["l1"]["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_second_worker_fills_l1_from_redis(self, workers):
+        first, second = workers
+        calls = 0
+
+        async def load():
+            nonlocal calls
+            calls += 1
+            return "shared"
+
+        await first.get_or_set("k", load)
+        assert await second.get_or_set("k", load) == "shared"
+        assert calls == 1
+        assert second.l2.stats.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_value_loaded_across_a_guard_bump_skips_l1(self, workers):
+        worker, _ = workers
+
+        async def load_racing_a_write():
+            await worker.incr("ver", ttl=60)
+            return "old"
+
+        assert await worker.get_or_set("k", load_racing_a_write, guard=["ver"]) == "old"
+        assert worker.l1.get("k") is None
+        assert await worker.l2.get("k") is None
+
+    @pytest.mark.asyncio
+    async def test_delete_evicts_l1_in_every_worker(self, workers):
+        first, second = workers
+        await first.set("k", "old")
+        assert await second.get("k") == "old"
+        assert await first.get("k") == "old"
+
+        await first.delete("k")
+
+        await _until(lambda: len(second.l1) == 0)
+        assert await first.get("k") is None
+        assert await second.get("k") is None
+
+    @pytest.mark.asyncio
+    async def test_incr_evicts_version_in_every_worker(self, workers):
+        first, second = workers
+        await first.incr("ver", ttl=60)
+        assert await second.get_many(["ver"]) == [1]
+
+        await first.incr("ver", ttl=60)
+
+        await _until(lambda: len(second.l1) == 0)
+        assert await second.get_many(["ver"]) == [2]
+
+
+class Repo:
+    """Minimal opt-in target for the `cached` decorator."""
+
+    def __init__(self, cache) -> None:
+        self.cache = cache
+        self.calls = 0
+
+    async def key_for(self, name: str) -> str:
+        return f"greeting:{name}"
+
+    @cached(lambda self, name: self.key_for(name), encode=str.upper, decode=str.lower)
+    async def greet(self, name: str) -> str | None:
+        self.calls += 1
+        return None if name == "nobody" else f"hi {name}"
+
+
+class TestCachedDecorator:
+    """Repository opt-in with @cached."""
+
+    @pytest.mark.asyncio
+    async def test_miss_returns_fresh_value_and_hit_decodes(self, cache: RedisCache, redis):
+        repo = Repo(cache)
+
+        assert await repo.greet("ann") == "hi ann"
+        assert await redis.get("greeting:ann") == b'"HI ANN"'
+        assert await repo.greet("ann") == "hi ann"
+        assert repo.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_none_results_are_not_cached(self, cache: RedisCache):
+        repo = Repo(cache)
+
+        assert await repo.greet("nobody") is None
+        assert await repo.greet("nobody") is None
+        assert repo.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_without_cache_calls_through(self):
+        repo = Repo(None)
+
+        await repo.greet("ann")
+        await repo.greet("ann")
+
+        assert repo.calls == 2
@@ -0,0 +1,179 @@
+# Unit tests for the response compression middleware
+# Tests Accept-Encoding negotiation, size thresholds, streaming behaviour,
+# the ETag-keyed cache of compressed bodies, and ETag suffix handling.
+
+from __future__ import annotations
+
+import gzip
+import zlib
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from httpx import ASGITransport, AsyncClient
+
+from app.middleware import compression
+from app.middleware.compression import CompressionMiddleware, negotiate
+
+BIG = {"items": ["x" * 50] * 100}
+ETAG = '"v1"'
+
+
+def _app(**options) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, **options)
+
+    @app.get("/big")
+    async def big() -> JSONResponse:
+        return JSONResponse(BIG, headers={"ETag": ETAG})
+
+    @app.get("/small")
+    async def small() -> dict[str, str]:
+        return {"ok": "yes"}
+
+    @app.get("/binary")
+    async def binary() -> Response:
+        return Response(b"\0" * 4096, media_type="application/octet-stream")
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def lines():
+            for i in range(3):
+                yield f'{{"n": {i}}}\n'.encode() * 100
+
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+    @app.get("/echo")
+    async def echo(request: Request) -> dict[str, str | None]:
+        return {
+            "if_none_match": request.headers.get("if-none-match"),
+            "if_match": request.headers.get("if-match"),
+        }
+
+    return app
+
+
+def _client(app: FastAPI) -> AsyncClient:
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+async def _raw(client: AsyncClient, path: str, accept: str = "gzip") -> tuple[int, dict, bytes]:
+    """Fetch without httpx's transparent decoding."""
+    async with client.stream("GET", path, headers={"Accept-Encoding": accept}) as response:
+        body = b"".join([chunk async for chunk in response.aiter_raw()])
+        return response.status_code, response.headers, body
+
+
+class TestNegotiate:
+    """Accept-Encoding parsing."""
+
+    @pytest.mark.parametrize(
+        ("header", "expected"),
+        [
+            ("gzip", "gzip"),
+            ("gzip, br", "br"),
+            ("br;q=0.5, gzip", "gzip"),
+            ("gzip;q=0", None),
+            ("*", "br"),
+            ("identity", None),
+            ("", None),
+        ],
+    )
+    def test_preference_and_qvalues(self, header: str, expected: str | None):
+        assert negotiate(header, ("br", "gzip")) == expected
+
+    def test_unavailable_encoding_is_not_chosen(self):
+        assert negotiate("br", ("gzip",)) is None
+
+
+class TestCompressionMiddleware:
+    """Behaviour on complete and streaming responses."""
+
+    @pytest.mark.asyncio
+    async def test_large_json_is_gzipped(self):
+        async with _client(_app()) as client:
+            status, headers, body = await _raw(client, "/big")
+
+        assert status == 200
+        assert headers["content-encoding"] == "gzip"
+        assert headers["vary"] == "Accept-Encoding"
+        assert int(headers["content-length"]) == len(body)
+        assert gzip.decompress(body).startswith(b'{"items"')
+        assert headers["etag"] == '"v1-gzip"'
+
+    @pytest.mark.asyncio
+    async def test_small_binary_and_identity_pass_through(self):
+        async with _client(_app()) as client:
+            for path, accept in (("/small", "gzip"), ("/binary", "gzip"), ("/big", "identity")):
+                _, headers, _ = await _raw(client, path, accept)
+                assert "content-encoding" not in headers, path
+
+    @pytest.mark.asyncio
+    async def test_threshold_and_level_are_tunable(self):
+        async with _client(_app(minimum_size=1)) as client:
+            _, headers, _ = await _raw(client, "/small")
+        assert headers["content-encoding"] == "gzip"
+
+        async with _client(_app(gzip_level=1)) as client:
+            _, _, fast = await _raw(client, "/big")
+        async with _client(_app(gzip_level=9)) as client:
+            _, _, best = await _raw(client, "/big")
+        assert gzip.decompress(fast) == gzip.decompress(best)
+
+    @pytest.mark.asyncio
+    async def test_streams_pass_through_by_default(self):
+        async with _client(_app()) as client:
+            _, headers, body = await _raw(client, "/stream")
+
+        assert "content-encoding" not in headers
+        assert body.count(b"\n") == 300
+
+    @pytest.mark.asyncio
+    async def test_streams_compressed_chunkwise_when_enabled(self):
+        async with _client(_app(compress_streams=True)) as client:
+            _, headers, body = await _raw(client, "/stream")
+
+        assert headers["content-encoding"] == "gzip"
+        assert "content-length" not in headers
+        assert zlib.decompress(body, 31).count(b"\n") == 300
+
+    @pytest.mark.asyncio
+    async def test_etag_keyed_cache_skips_recompression(self):
+        app = _app()
+        middleware_compress = CompressionMiddleware.compress
+        calls = []
+
+        def counting(self, body, encoding):
+            calls.append(encoding)
+            return middleware_compress(self, body, encoding)
+
+        with patch.object(CompressionMiddleware, "compress", counting):
+            async with _client(app) as client:
+                first = await _raw(client, "/big")
+                second = await _raw(client, "/big")
+
+        assert calls == ["gzip"]
+        assert first[2] == second[2]
+
+    @pytest.mark.asyncio
+    async def test_precondition_headers_lose_encoding_suffix(self):
+        async with _client(_app()) as client:
+            response = await client.get(
+                "/echo", headers={"If-None-Match": '"a-gzip", W/"b-br"', "If-Match": '"c-gzip"'}
+            )
+
+        assert response.json() == {"if_none_match": '"a", W/"b"', "if_match": '"c"'}
+
+    @pytest.mark.asyncio
+    async def test_brotli_when_available(self):
+        brotli = pytest.importorskip("brotli")
+        async with _client(_app()) as client:
+            _, headers, body = await _raw(client, "/big", accept="gzip, br")
+
+        assert headers["content-encoding"] == "br"
+        assert brotli.decompress(body).startswith(b'{"items"')
+
+    def test_gzip_only_without_brotli(self):
+        with patch.object(compression, "brotli", None):
+            assert compression.available_encodings() == ("gzip",)
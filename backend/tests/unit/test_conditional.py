@@ -0,0 +1,150 @@
+# Unit tests for conditional requests
+# Tests ETag generation, If-None-Match / If-Modified-Since evaluation,
+# and If-Match preconditions.
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import Response
+from starlette.requests import Request
+
+from app.core.conditional import (
+    Validators,
+    http_date,
+    is_conditional,
+    make_etag,
+    request_variant,
+    require_match,
+)
+from app.core.exceptions import PreconditionFailedError
+
+UPDATED = datetime(2026, 10, 18, 9, 0, 0, 250_000, tzinfo=timezone.utc)
+
+
+def _request(headers: dict[str, str] | None = None, query: str = "") -> Request:
+    raw = [(key.lower().encode(), value.encode()) for key, value in (headers or {}).items()]
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/items",
+            "query_string": query.encode(),
+            "headers": raw,
+        }
+    )
+
+
+class TestMakeEtag:
+    """Entity tags are strong, stable and timezone-insensitive."""
+
+    def test_stable_and_quoted(self):
+        etag = make_etag("project", "p1", UPDATED)
+
+        assert etag == make_etag("project", "p1", UPDATED)
+        assert etag.startswith('"') and etag.endswith('"')
+
+    def test_equal_instants_share_a_tag(self):
+        local = UPDATED.astimezone(timezone(timedelta(hours=2)))
+
+        assert make_etag(UPDATED) == make_etag(local)
+
+    def test_parts_change_the_tag(self):
+        assert make_etag("p1", UPDATED) != make_etag("p1", UPDATED + timedelta(microseconds=1))
+
+    def test_variant_extends_the_state_tag(self):
+        state = make_etag("p1", 3)
+        variant = make_etag("p1", 3, variant="id,name")
+
+        assert variant.startswith(state[:-1] + ".")
+        assert make_etag("p1", 3, variant="") == state
+
+
+class TestValidators:
+    """Freshness checks for conditional GETs."""
+
+    validators = Validators(etag='"abc"', last_modified=UPDATED)
+
+    def test_headers(self):
+        assert self.validators.headers == {
+            "ETag": '"abc"',
+            "Cache-Control": "private, no-cache",
+            "Last-Modified": "Sun, 18 Oct 2026 09:00:00 GMT",
+        }
+
+    def test_unconditional_request(self):
+        request = _request()
+
+        assert not is_conditional(request)
+        assert not self.validators.is_fresh(request)
+
+    @pytest.mark.parametrize("header", ['"abc"', 'W/"abc"', '"x", "abc"', "*"])
+    def test_if_none_match_hit(self, header: str):
+        request = _request({"If-None-Match": header})
+
+        assert is_conditional(request)
+        assert self.validators.is_fresh(request)
+
+    def test_if_none_match_miss(self):
+        assert not self.validators.is_fresh(_request({"If-None-Match": '"old"'}))
+
+    def test_if_modified_since(self):
+        assert self.validators.is_fresh(_request({"If-Modified-Since": http_date(UPDATED)}))
+        earlier = http_date(UPDATED - timedelta(seconds=1))
+        assert not self.validators.is_fresh(_request({"If-Modified-Since": earlier}))
+
+    def test_if_none_match_takes_precedence(self):
+        request = _request({"If-None-Match": '"old"', "If-Modified-Since": http_date(UPDATED)})
+
+        assert not self.validators.is_fresh(request)
+
+    def test_unparseable_date_is_ignored(self):
+        assert not self.validators.is_fresh(_request({"If-Modified-Since": "yesterday"}))
+
+    def test_not_modified_keeps_validators(self):
+        response = self.validators.not_modified()
+
+        assert response.status_code == 304
+        assert response.body == b""
+        assert response.headers["etag"] == '"abc"'
+
+    def test_attach_prefers_returned_response(self):
+        injected, returned = Response(), Response()
+
+        assert self.validators.attach(returned, injected) is returned
+        assert returned.headers["etag"] == '"abc"'
+        assert "etag" not in injected.headers
+
+        self.validators.attach({"id": 1}, injected)
+        assert injected.headers["etag"] == '"abc"'
+
+    def test_variant_includes_path_and_query(self):
+        assert request_variant(_request(query="page=2")) == "/items?page=2"
+
+
+class TestRequireMatch:
+    """If-Match preconditions for writes."""
+
+    def test_absent_header_passes(self):
+        require_match(None, '"abc"')
+
+    @pytest.mark.parametrize("header", ['"abc"', '"x", "abc"', "*"])
+    def test_matching_header_passes(self, header: str):
+        require_match(header, '"abc"')
+
+    @pytest.mark.parametrize("header", ['"old"', 'W/"abc"'])
+    def test_mismatch_raises_412(self, header: str):
+        with pytest.raises(PreconditionFailedError) as exc_info:
+            require_match(header, '"abc"')
+        assert exc_info.value.status_code == 412
+
+    def test_any_variant_of_the_current_state_passes(self):
+        """The ETag of a sparse read guards a write to the same version."""
+        require_match('"abc.f1"', '"abc"')
+        require_match('"abc"', '"abc.f1"')
+
+    @pytest.mark.parametrize("header", ['"old.f1"', 'W/"abc.f1"'])
+    def test_variant_of_another_state_raises_412(self, header: str):
+        with pytest.raises(PreconditionFailedError):
+            require_match(header, '"abc"')
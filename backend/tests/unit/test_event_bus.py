@@ -0,0 +1,102 @@
+# Unit tests for the in-process event bus and session outbox
+# Tests dispatch by type, handler isolation, and publish-after-commit in get_db.
+
+from __future__ import annotations
+
+import pytest
+from starlette.requests import Request
+
+from app.core.event_bus import EventBus, event_bus
+from app.core.events import DomainEvent, ProjectCreated, ProjectDeleted
+from app.db.outbox import has_pending_events, record_event, take_events
+from app.db.session import get_db
+
+
+class TestEventBus:
+    """Subscription and dispatch."""
+
+    @pytest.mark.asyncio
+    async def test_dispatches_by_type_and_base_type(self):
+        bus = EventBus()
+        created: list[DomainEvent] = []
+        everything: list[DomainEvent] = []
+
+        async def on_created(event):
+            created.append(event)
+
+        bus.subscribe(ProjectCreated, on_created)
+        bus.subscribe(DomainEvent, everything.append)
+
+        first = ProjectCreated(project_id="p1", owner_id="u1")
+        second = ProjectDeleted(project_id="p1", owner_id="u1")
+        await bus.publish_all([first, second])
+
+        assert created == [first]
+        assert everything == [first, second]
+
+    @pytest.mark.asyncio
+    async def test_subscribe_is_idempotent(self):
+        bus = EventBus()
+        seen: list[DomainEvent] = []
+        bus.subscribe(ProjectCreated, seen.append)
+        bus.subscribe(ProjectCreated, seen.append)
+
+        await bus.publish(ProjectCreated(project_id="p1", owner_id="u1"))
+
+        assert len(seen) == 1
+
+    @pytest.mark.asyncio
+    async def test_failing_handler_does_not_block_others(self):
+        bus = EventBus()
+        seen: list[DomainEvent] = []
+
+        def broken(event):
+            raise RuntimeError("boom")
+
+        bus.subscribe(ProjectCreated, broken)
+        bus.subscribe(ProjectCreated, seen.append)
+
+        await bus.publish(ProjectCreated(project_id="p1", owner_id="u1"))
+
+        assert len(seen) == 1
+
+
+class TestOutbox:
+    """Events recorded on a session are published only after commit."""
+
+    @pytest.mark.asyncio
+    async def test_get_db_publishes_after_commit(self):
+        seen: list[DomainEvent] = []
+        event_bus.subscribe(ProjectCreated, seen.append)
+        try:
+            sessions = get_db(Request({"type": "http", "method": "POST", "headers": []}))
+            session = await anext(sessions)
+            event = ProjectCreated(project_id="p1", owner_id="u1")
+            record_event(session, event)
+            assert has_pending_events(session)
+            assert seen == []
+
+            with pytest.raises(StopAsyncIteration):
+                await anext(sessions)
+
+            assert seen == [event]
+            assert take_events(session) == []
+        finally:
+            event_bus.unsubscribe(ProjectCreated, seen.append)
+
+    @pytest.mark.asyncio
+    async def test_get_db_drops_events_on_rollback(self):
+        seen: list[DomainEvent] = []
+        event_bus.subscribe(ProjectCreated, seen.append)
+        try:
+            sessions = get_db(Request({"type": "http", "method": "POST", "headers": []}))
+            session = await anext(sessions)
+            record_event(session, ProjectCreated(project_id="p1", owner_id="u1"))
+
+            with pytest.raises(RuntimeError):
+                await sessions.athrow(RuntimeError("handler failed"))
+
+            assert seen == []
+            assert not has_pending_events(session)
+        finally:
+            event_bus.unsubscribe(ProjectCreated, seen.append)
@@ -0,0 +1,58 @@
+# Unit tests for sparse fieldsets
+# Tests `?fields=` parsing and the cached partial response models.
+
+from __future__ import annotations
+
+import pytest
+from pydantic import BaseModel
+
+from app.core.exceptions import InvalidFieldsError
+from app.core.fields import parse_fields, partial_model, sparse_response
+
+
+class Item(BaseModel):
+    id: str
+    name: str
+    note: str | None = None
+
+
+class TestParseFields:
+    """Validation of the comma-separated selection."""
+
+    def test_absent_means_all_fields(self):
+        assert parse_fields(None, Item.model_fields) is None
+
+    def test_always_includes_id(self):
+        assert parse_fields(" name , ", Item.model_fields) == {"id", "name"}
+
+    def test_unknown_field_rejected(self):
+        with pytest.raises(InvalidFieldsError) as exc_info:
+            parse_fields("name,secret", Item.model_fields)
+        assert exc_info.value.status_code == 400
+        assert "secret" in exc_info.value.message
+
+    def test_empty_selection_rejected(self):
+        with pytest.raises(InvalidFieldsError):
+            parse_fields(",", Item.model_fields)
+
+
+class TestPartialModel:
+    """Partial models keep field types and are built once per selection."""
+
+    def test_only_selected_fields(self):
+        model = partial_model(Item, frozenset({"id", "note"}))
+
+        assert set(model.model_fields) == {"id", "note"}
+        assert model(id="1").model_dump() == {"id": "1", "note": None}
+
+    def test_cached_per_selection(self):
+        fields = frozenset({"id", "name"})
+
+        assert partial_model(Item, fields) is partial_model(Item, frozenset({"name", "id"}))
+
+    def test_sparse_response_serializes_only_partial_payloads(self):
+        full = Item(id="1", name="n")
+        partial = partial_model(Item, frozenset({"id"}))(id="1")
+
+        assert sparse_response(full, None) is full
+        assert sparse_response(partial, frozenset({"id"})).body == b'{"id":"1"}'
@@ -0,0 +1,136 @@
+# Unit tests for the request-scoped batch loader
+# Tests tick-level batching, memoization, soft-delete filtering,
+# and cache maintenance by BaseRepository writes.
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+from starlette.requests import Request
+
+from app.db.loader import BatchLoader, get_loader, install_loader
+from app.db.session import get_db
+from app.domains.projects.models import Project
+from app.domains.projects.repository import ProjectRepository
+
+
+@pytest_asyncio.fixture
+async def loader(db_session) -> BatchLoader:
+    return install_loader(db_session)
+
+
+@pytest_asyncio.fixture
+async def repository(db_session, loader) -> ProjectRepository:
+    return ProjectRepository(db_session)
+
+
+@pytest.fixture
+def statements(async_engine):
+    """Collect SQL statements executed during the test."""
+    recorded: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        recorded.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", _record)
+    yield recorded
+    event.remove(async_engine.sync_engine, "before_cursor_execute", _record)
+
+
+async def _create(repository: ProjectRepository, name: str) -> Project:
+    return await repository.create({"name": name, "owner_id": str(uuid.uuid4())})
+
+
+class TestBatchLoader:
+    """Batching and memoization of get-by-id lookups."""
+
+    @pytest.mark.asyncio
+    async def test_same_tick_lookups_share_one_query(
+        self, repository: ProjectRepository, loader: BatchLoader, statements: list[str]
+    ):
+        """Concurrent get() calls should resolve from a single IN query."""
+        a = await _create(repository, "A")
+        b = await _create(repository, "B")
+        loader.clear(Project)
+        missing = str(uuid.uuid4())
+        statements.clear()
+
+        results = await asyncio.gather(
+            repository.get(a.id),
+            repository.get(b.id),
+            repository.get(missing),
+            repository.get(a.id),
+        )
+
+        assert [r.id if r else None for r in results] == [a.id, b.id, None, a.id]
+        assert len(statements) == 1
+
+    @pytest.mark.asyncio
+    async def test_results_are_memoized(
+        self, repository: ProjectRepository, loader: BatchLoader, statements: list[str]
+    ):
+        """Repeated lookups, including misses, should not hit the database again."""
+        project = await _create(repository, "Memo")
+        missing = str(uuid.uuid4())
+        statements.clear()
+
+        assert await repository.get(project.id) is project
+        assert await repository.get(missing) is None
+        assert await repository.get(missing) is None
+        assert len(statements) == 1
+
+    @pytest.mark.asyncio
+    async def test_load_many_preserves_order(
+        self, repository: ProjectRepository, loader: BatchLoader
+    ):
+        """load_many should return rows in input order with None for misses."""
+        a = await _create(repository, "A")
+        b = await _create(repository, "B")
+        missing = str(uuid.uuid4())
+
+        results = await loader.load_many(Project, [b.id, missing, a.id])
+
+        assert results == [b, None, a]
+
+    @pytest.mark.asyncio
+    async def test_soft_delete_invalidates_memo(self, repository: ProjectRepository):
+        """A soft-deleted row should stop resolving through the loader."""
+        project = await _create(repository, "Doomed")
+        assert await repository.get(project.id) is project
+
+        await repository.soft_delete(project.id)
+
+        assert await repository.get(project.id) is None
+
+    @pytest.mark.asyncio
+    async def test_bulk_soft_delete_invalidates_memo(self, repository: ProjectRepository):
+        """Set-based writes should drop the affected rows from the memo."""
+        project = await _create(repository, "Bulk Doomed")
+        assert await repository.get(project.id) is project
+
+        await repository.soft_delete_many(ids=[project.id])
+
+        assert await repository.get(project.id) is None
+
+    @pytest.mark.asyncio
+    async def test_session_without_loader_queries_directly(self, db_session):
+        """Repositories should still work on sessions created outside get_db."""
+        repository = ProjectRepository(db_session)
+        project = await _create(repository, "Plain")
+
+        assert get_loader(db_session) is None
+        assert (await repository.get(project.id)).id == project.id
+
+    @pytest.mark.asyncio
+    async def test_get_db_installs_loader(self):
+        """Sessions from the DBSession dependency should carry a loader."""
+        sessions = get_db(Request({"type": "http", "method": "GET", "headers": []}))
+        session = await anext(sessions)
+        try:
+            assert isinstance(get_loader(session), BatchLoader)
+        finally:
+            await sessions.aclose()
@@ -0,0 +1,271 @@
+# Unit tests for request logging
+# QueueLogSink (non-blocking submit, drops, writer-thread rendering),
+# SuccessSampler, and the RequestID / Logging ASGI middleware end to end
+# through a real sink.
+
+from __future__ import annotations
+
+import io
+import json
+import threading
+
+import pytest
+import structlog
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core.logging import QueueLogger, QueueLogSink, SuccessSampler, _to_sink
+from app.middleware import logging as logging_middleware
+from app.middleware.logging import LoggingMiddleware
+from app.middleware.request_id import RequestIDMiddleware
+
+
+class BlockingStream(io.StringIO):
+    """A stdout that stalls until released."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.release = threading.Event()
+
+    def write(self, text: str) -> int:
+        self.release.wait(5)
+        return super().write(text)
+
+
+def _records(stream: io.StringIO) -> list[dict]:
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+class TestQueueLogSink:
+    def test_renders_and_writes_on_the_writer_thread(self):
+        stream = io.StringIO()
+        threads = []
+
+        def renderer(_logger, _level, event_dict):
+            threads.append(threading.current_thread().name)
+            return json.dumps(event_dict)
+
+        sink = QueueLogSink(renderer, stream=stream)
+        sink.submit("info", {"event": "hello"})
+
+        assert sink.flush()
+        assert _records(stream) == [{"event": "hello", "level": "info"}]
+        assert threads == ["log-writer"]
+        sink.close()
+
+    def test_full_queue_drops_instead_of_blocking(self):
+        stream = BlockingStream()
+        sink = QueueLogSink(lambda _l, _m, e: json.dumps(e), stream=stream, max_size=2)
+        for i in range(50):  # the writer is stuck on the first batch
+            sink.submit("info", {"event": "e", "i": i})
+
+        assert sink.stats["dropped"] > 0
+        stream.release.set()
+        assert sink.flush()
+        sink.submit("info", {"event": "after"})  # room again once drained
+        assert sink.flush()
+        records = _records(stream)
+        reported = sum(r["count"] for r in records if r["event"] == "log_records_dropped")
+        assert reported == sink.stats["dropped"]
+        assert "after" in [r["event"] for r in records]
+        sink.close()
+
+    def test_render_errors_do_not_stop_the_writer(self):
+        stream = io.StringIO()
+
+        def renderer(_logger, _level, event_dict):
+            if event_dict["event"] == "bad":
+                raise TypeError("not serializable")
+            return event_dict["event"]
+
+        sink = QueueLogSink(renderer, stream=stream)
+        sink.submit("info", {"event": "bad"})
+        sink.submit("info", {"event": "good"})
+
+        assert sink.flush()
+        lines = stream.getvalue().splitlines()
+        assert lines[0].startswith("log_render_failed")
+        assert lines[1] == "good"
+        sink.close()
+
+    def test_close_writes_pending_records(self):
+        stream = io.StringIO()
+        sink = QueueLogSink(lambda _l, _m, e: e["event"], stream=stream)
+        for i in range(10):
+            sink.submit("info", {"event": str(i)})
+
+        sink.close()
+
+        assert stream.getvalue().splitlines() == [str(i) for i in range(10)]
+
+
+class TestSuccessSampler:
+    def test_samples_success_logs_past_threshold(self):
+        sampler = SuccessSampler(threshold=3, rate=2, clock=lambda: 100.0)
+        records = [{"status_code": 200} for _ in range(7)]
+
+        kept = [sampler.keep("info", record) for record in records]
+
+        assert kept == [True, True, True, False, True, False, True]
+        assert records[4]["sample_rate"] == 2
+        assert "sample_rate" not in records[0]
+
+    def test_threshold_resets_every_second(self):
+        now = [100.0]
+        sampler = SuccessSampler(threshold=1, rate=100, clock=lambda: now[0])
+        sampler.keep("info", {"status_code": 200})
+        assert sampler.keep("info", {"status_code": 200}) is False
+
+        now[0] = 101.0
+        assert sampler.keep("info", {"status_code": 200}) is True
+
+    @pytest.mark.parametrize(
+        ("level", "record"),
+        [
+            ("info", {"status_code": 404}),
+            ("error", {"status_code": 500}),
+            ("info", {"status_code": 200, "slow": True}),
+            ("info", {"event": "task_created"}),
+        ],
+    )
+    def test_never_samples_failures_slow_requests_or_other_events(self, level, record):
+        sampler = SuccessSampler(threshold=0, rate=1_000, clock=lambda: 100.0)
+
+        assert all(sampler.keep(level, dict(record)) for _ in range(5))
+
+
+@pytest.fixture
+def log_stream(monkeypatch) -> io.StringIO:
+    """Route the logging middleware through a real sink writing JSON lines."""
+    stream = io.StringIO()
+    sink = QueueLogSink(structlog.processors.JSONRenderer(), stream=stream)
+    logger = structlog.wrap_logger(
+        QueueLogger(sink),
+        processors=[
+            structlog.contextvars.merge_contextvars,
+            structlog.processors.add_log_level,
+            structlog.processors.format_exc_info,
+            _to_sink,
+        ],
+    )
+    monkeypatch.setattr(logging_middleware, "logger", logger)
+    stream.sink = sink  # type: ignore[attr-defined]
+    yield stream
+    sink.close()
+
+
+def _logged(stream: io.StringIO) -> list[dict]:
+    assert stream.sink.flush()  # type: ignore[attr-defined]
+    return _records(stream)
+
+
+def _client(**logging_options) -> TestClient:
+    app = FastAPI()
+
+    @app.get("/items")
+    async def items(request: Request) -> dict[str, str]:
+        request.state.user_id = "user-1"
+        return {"request_id": request.state.request_id}
+
+    @app.get("/context")
+    async def context() -> dict[str, object]:
+        return structlog.contextvars.get_contextvars()
+
+    @app.get("/missing")
+    async def missing() -> None:
+        from fastapi import HTTPException
+
+        raise HTTPException(status_code=404)
+
+    @app.get("/boom")
+    async def boom() -> None:
+        raise RuntimeError("boom")
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def chunks():
+            for i in range(3):
+                yield f"chunk-{i}\n"
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    app.add_middleware(LoggingMiddleware, **logging_options)
+    app.add_middleware(RequestIDMiddleware)
+    return TestClient(app, raise_server_exceptions=False)
+
+
+class TestRequestIDMiddleware:
+    def test_generates_and_exposes_request_id(self, log_stream):
+        response = _client().get("/items")
+
+        request_id = response.headers["X-Request-ID"]
+        assert response.json() == {"request_id": request_id}
+        assert len(request_id) == 36
+
+    def test_reuses_valid_incoming_id(self, log_stream):
+        response = _client().get("/items", headers={"X-Request-ID": "gw-42.a:b"})
+
+        assert response.headers["X-Request-ID"] == "gw-42.a:b"
+
+    @pytest.mark.parametrize("incoming", ["has space", "x" * 129, "new\nline"])
+    def test_replaces_unsafe_incoming_id(self, log_stream, incoming):
+        response = _client().get("/items", headers={"X-Request-ID": incoming})
+
+        assert response.headers["X-Request-ID"] != incoming
+
+    def test_binds_contextvars_for_the_request_only(self, log_stream):
+        response = _client().get("/context", headers={"X-Request-ID": "req-1"})
+
+        assert response.json()["request_id"] == "req-1"
+        assert "request_id" not in structlog.contextvars.get_contextvars()
+
+
+class TestLoggingMiddleware:
+    def test_logs_one_record_per_request(self, log_stream):
+        _client().get("/items?page=2", headers={"X-Request-ID": "req-1"})
+
+        (record,) = _logged(log_stream)
+        assert record["event"] == "request_completed"
+        assert record["level"] == "info"
+        assert record["request_id"] == "req-1"
+        assert record["user_id"] == "user-1"
+        assert record["method"] == "GET"
+        assert record["path"] == "/items"
+        assert record["query_string"] == "page=2"
+        assert record["status_code"] == 200
+        assert record["latency_ms"] >= 0
+        assert "slow" not in record
+
+    def test_client_errors_log_at_warning(self, log_stream):
+        _client().get("/missing")
+
+        (record,) = _logged(log_stream)
+        assert (record["level"], record["status_code"]) == ("warning", 404)
+
+    def test_unhandled_exception_logs_traceback_and_reraises(self, log_stream):
+        response = _client().get("/boom")
+
+        assert response.status_code == 500
+        (record,) = _logged(log_stream)
+        assert record["event"] == "request_failed"
+        assert record["level"] == "critical"
+        assert "RuntimeError: boom" in record["exception"]
+
+    def test_streaming_passes_through_and_logs_after_the_body(self, log_stream):
+        response = _client().get("/stream")
+
+        assert response.text == "chunk-0\nchunk-1\nchunk-2\n"
+        (record,) = _logged(log_stream)
+        assert record["status_code"] == 200
+
+    def test_slow_requests_are_flagged(self, log_stream):
+        _client(slow_request_ms=0).get("/items")
+
+        (record,) = _logged(log_stream)
+        assert record["slow"] is True
+
+    def test_headers_are_never_logged(self, log_stream):
+        _client().get("/items", headers={"Authorization": "Bearer secret", "Cookie": "s=1"})
+
+        assert "secret" not in log_stream.getvalue()
@@ -0,0 +1,203 @@
+# Unit tests for Prometheus metrics
+# MetricsMiddleware (route templates, status counters, in-flight gauge),
+# pool instrumentation, the /metrics endpoint, and multiprocess aggregation.
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from fastapi import APIRouter, FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from prometheus_client import CollectorRegistry
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.metrics import UNMATCHED_PATH, HttpMetrics, PoolMetrics, render_metrics
+from app.db.pool_metrics import InstrumentedAsyncQueuePool, instrument_pool
+from app.main import create_app
+from app.middleware.metrics import MetricsMiddleware
+
+BACKEND = Path(__file__).resolve().parents[2]
+
+
+@pytest.fixture
+def registry() -> CollectorRegistry:
+    return CollectorRegistry()
+
+
+def _client(registry: CollectorRegistry, observed: dict | None = None) -> TestClient:
+    metrics = HttpMetrics(registry)
+    sprints = APIRouter()
+
+    @sprints.get("/{sprint_id}")
+    async def get_sprint(project_id: str, sprint_id: str) -> dict[str, float | None]:
+        in_progress = registry.get_sample_value("http_requests_in_progress", {"method": "GET"})
+        return {"in_progress": in_progress}
+
+    @sprints.delete("/{sprint_id}")
+    async def delete_sprint(project_id: str, sprint_id: str) -> None:
+        raise HTTPException(status_code=404)
+
+    @sprints.post("/{sprint_id}/close")
+    async def close_sprint(project_id: str, sprint_id: str) -> None:
+        raise RuntimeError("boom")
+
+    api = APIRouter(prefix="/api/v1")
+    api.include_router(sprints, prefix="/projects/{project_id}/sprints")
+    app = FastAPI()
+    app.include_router(api)
+    app.add_middleware(MetricsMiddleware, metrics=metrics)
+    if observed is not None:
+        observed["metrics"] = metrics
+    return TestClient(app, raise_server_exceptions=False)
+
+
+def _requests(registry: CollectorRegistry, method: str, path: str, status: str) -> float | None:
+    return registry.get_sample_value(
+        "http_requests_total", {"method": method, "path": path, "status": status}
+    )
+
+
+SPRINT = "/api/v1/projects/{project_id}/sprints/{sprint_id}"
+
+
+class TestMetricsMiddleware:
+    def test_labels_by_route_template_not_raw_url(self, registry):
+        client = _client(registry)
+        client.get("/api/v1/projects/p1/sprints/s1")
+        client.get("/api/v1/projects/p2/sprints/s2")
+
+        assert _requests(registry, "GET", SPRINT, "200") == 2
+        count = registry.get_sample_value(
+            "http_request_duration_seconds_count", {"method": "GET", "path": SPRINT}
+        )
+        assert count == 2
+
+    def test_counts_statuses_separately(self, registry):
+        client = _client(registry)
+        client.delete("/api/v1/projects/p1/sprints/s1")
+        client.post("/api/v1/projects/p1/sprints/s1/close")
+
+        assert _requests(registry, "DELETE", SPRINT, "404") == 1
+        assert _requests(registry, "POST", f"{SPRINT}/close", "500") == 1
+
+    def test_unmatched_paths_share_one_label(self, registry):
+        client = _client(registry)
+        client.get("/nope/1")
+        client.get("/nope/2")
+
+        assert _requests(registry, "GET", UNMATCHED_PATH, "404") == 2
+
+    def test_unknown_methods_are_bucketed(self, registry):
+        _client(registry).request("PROPFIND", "/nope")
+
+        assert _requests(registry, "OTHER", UNMATCHED_PATH, "404") == 1
+
+    def test_in_progress_gauge_covers_the_request(self, registry):
+        response = _client(registry).get("/api/v1/projects/p1/sprints/s1")
+
+        assert response.json() == {"in_progress": 1.0}
+        assert registry.get_sample_value("http_requests_in_progress", {"method": "GET"}) == 0
+
+    def test_label_children_are_bound_once(self, registry):
+        observed: dict = {}
+        client = _client(registry, observed)
+        client.get("/api/v1/projects/p1/sprints/s1")
+        metrics: HttpMetrics = observed["metrics"]
+        route = metrics.route("GET", SPRINT)
+
+        client.get("/api/v1/projects/p2/sprints/s2")
+
+        assert metrics.route("GET", SPRINT) is route
+
+
+class TestPoolMetrics:
+    async def test_reports_checked_out_overflow_and_wait(self, registry, tmp_path):
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+            poolclass=InstrumentedAsyncQueuePool,
+            pool_size=1,
+            max_overflow=1,
+        )
+        instrument_pool(engine, "primary", PoolMetrics(registry))
+        labels = {"engine": "primary"}
+
+        def sample(name: str) -> float | None:
+            return registry.get_sample_value(name, labels)
+
+        async with engine.connect() as first, engine.connect() as second:
+            await first.execute(text("select 1"))
+            await second.execute(text("select 1"))
+            assert sample("db_pool_checked_out") == 2
+            assert sample("db_pool_overflow") == 1
+
+        assert sample("db_pool_checked_out") == 0
+        assert sample("db_pool_overflow") == 0
+        assert sample("db_pool_checkout_wait_seconds_count") == 2
+
+        await engine.dispose()  # the replacement pool keeps reporting
+        async with engine.connect() as conn:
+            await conn.execute(text("select 1"))
+            assert sample("db_pool_checked_out") == 1
+        await engine.dispose()
+
+    def test_rejects_engines_without_the_instrumented_pool(self, registry):
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+
+        with pytest.raises(TypeError):
+            instrument_pool(engine, "primary", PoolMetrics(registry))
+
+
+class TestMetricsEndpoint:
+    def test_exposes_request_and_pool_metrics(self):
+        client = TestClient(create_app())
+        client.get("/health")
+
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert 'http_requests_total{method="GET",path="/health",status="200"}' in response.text
+        assert 'db_pool_checked_out{engine="primary"}' in response.text
+
+
+_WORKER = textwrap.dedent(
+    """
+    from prometheus_client import CollectorRegistry
+    from app.core.metrics import HttpMetrics
+
+    metrics = HttpMetrics(CollectorRegistry())
+    metrics.route("GET", "/health").observe(0.01, 200)
+    metrics.in_progress_for("GET").inc()
+    """
+)
+
+
+class TestMultiprocess:
+    def test_scrape_aggregates_workers_and_forgets_dead_gauges(self, tmp_path, monkeypatch):
+        env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(tmp_path), "PYTHONPATH": str(BACKEND)}
+        pids = []
+        for _ in range(2):
+            process = subprocess.Popen([sys.executable, "-c", _WORKER], env=env, cwd=BACKEND)
+            assert process.wait(timeout=60) == 0
+            pids.append(process.pid)
+        monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+
+        body = render_metrics()[0].decode()
+        assert 'http_requests_total{method="GET",path="/health",status="200"} 2.0' in body
+        assert 'http_requests_in_progress{method="GET"} 2.0' in body
+
+        gunicorn_conf: dict = {}
+        exec((BACKEND / "gunicorn.conf.py").read_text(), gunicorn_conf)
+        for pid in pids:
+            gunicorn_conf["child_exit"](None, SimpleNamespace(pid=pid))
+
+        body = render_metrics()[0].decode()
+        assert 'http_requests_total{method="GET",path="/health",status="200"} 2.0' in body
+        assert 'http_requests_in_progress{method="GET"} 2.0' not in body
@@ -0,0 +1,155 @@
+# Unit tests for off-loop password hashing
+# PasswordHashPool runs hashes on its own threads, admits at most
+# workers + queue_limit calls, and rejects the rest with a 503.
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from passlib.context import CryptContext
+
+from app.core import security
+from app.core.exceptions import PasswordHasherBusyError, register_exception_handlers
+from app.core.security import PasswordHashPool, hash_password_async, verify_password_async
+
+
+@pytest.fixture
+def pool():
+    pool = PasswordHashPool(workers=1, queue_limit=1, retry_after_seconds=3)
+    yield pool
+    pool.shutdown()
+
+
+@pytest.fixture
+def gate():
+    """A blocking job: holds its pool thread until the event is set."""
+    event = threading.Event()
+    yield event
+    event.set()
+
+
+class TestPasswordHashPool:
+    async def test_runs_off_the_event_loop_thread(self, pool: PasswordHashPool):
+        name = await pool.run(lambda: threading.current_thread().name)
+
+        assert name.startswith("password-hash")
+        assert name != threading.current_thread().name
+
+    async def test_loop_keeps_running_while_hashing(self, pool: PasswordHashPool, gate):
+        job = asyncio.ensure_future(pool.run(gate.wait, 5))
+        ticks = 0
+        for _ in range(10):
+            await asyncio.sleep(0)
+            ticks += 1
+        gate.set()
+
+        assert await job is True
+        assert ticks == 10
+
+    async def test_rejects_beyond_capacity(self, pool: PasswordHashPool, gate):
+        running = asyncio.ensure_future(pool.run(gate.wait, 5))
+        queued = asyncio.ensure_future(pool.run(lambda: "queued"))
+        await asyncio.sleep(0)
+
+        with pytest.raises(PasswordHasherBusyError) as exc_info:
+            await pool.run(lambda: "rejected")
+        assert exc_info.value.status_code == 503
+        assert exc_info.value.headers == {"Retry-After": "3"}
+        assert pool.stats == {"in_flight": 2, "rejected": 1}
+
+        gate.set()
+        assert await running is True
+        assert await queued == "queued"
+        assert await pool.run(lambda: "admitted") == "admitted"
+        assert pool.stats["in_flight"] == 0
+
+    async def test_cancelled_caller_holds_slot_until_hash_finishes(
+        self, pool: PasswordHashPool, gate
+    ):
+        job = asyncio.ensure_future(pool.run(gate.wait, 5))
+        await asyncio.sleep(0)
+        job.cancel()
+        await asyncio.sleep(0)
+
+        assert pool.stats["in_flight"] == 1
+        gate.set()
+        for _ in range(100):
+            if pool.stats["in_flight"] == 0:
+                break
+            await asyncio.sleep(0.01)
+        assert pool.stats["in_flight"] == 0
+
+    async def test_cancelled_queued_call_frees_its_slot_at_once(self, pool: PasswordHashPool, gate):
+        running = asyncio.ensure_future(pool.run(gate.wait, 5))
+        queued = asyncio.ensure_future(pool.run(lambda: "never"))
+        await asyncio.sleep(0)
+        assert pool.stats["in_flight"] == 2
+
+        queued.cancel()
+        await asyncio.sleep(0)
+
+        assert pool.stats["in_flight"] == 1
+        gate.set()
+        assert await running is True
+
+    async def test_shutdown_cancels_queued_calls(self, pool: PasswordHashPool, gate):
+        running = asyncio.ensure_future(pool.run(gate.wait, 5))
+        queued = asyncio.ensure_future(pool.run(lambda: "never"))
+        await asyncio.sleep(0)
+
+        pool.shutdown()
+
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+        assert pool.stats["in_flight"] == 1  # the running hash still counts
+        gate.set()
+        assert await running is True
+
+    async def test_errors_propagate_and_release_the_slot(self, pool: PasswordHashPool):
+        def boom() -> None:
+            raise ValueError("bad hash")
+
+        with pytest.raises(ValueError, match="bad hash"):
+            await pool.run(boom)
+        await asyncio.sleep(0)
+        assert pool.stats["in_flight"] == 0
+
+    async def test_restarts_after_shutdown(self, pool: PasswordHashPool):
+        await pool.run(lambda: None)
+        pool.shutdown()
+
+        assert await pool.run(lambda: "again") == "again"
+
+
+class TestAsyncPasswordHelpers:
+    async def test_hash_and_verify_round_trip(self, monkeypatch):
+        # A cheap scheme keeps the test fast; the pool path is the same.
+        monkeypatch.setattr(
+            security,
+            "pwd_context",
+            CryptContext(schemes=["sha256_crypt"], sha256_crypt__rounds=1000),
+        )
+
+        hashed = await hash_password_async("s3cret")
+
+        assert await verify_password_async("s3cret", hashed) is True
+        assert await verify_password_async("wrong", hashed) is False
+
+
+def test_busy_error_response_carries_retry_after():
+    app = FastAPI()
+    register_exception_handlers(app)
+
+    @app.get("/login")
+    async def login() -> None:
+        raise PasswordHasherBusyError(headers={"Retry-After": "2"})
+
+    response = TestClient(app).get("/login")
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "2"
+    assert response.json()["error"]["code"] == "PASSWORD_HASHER_BUSY"
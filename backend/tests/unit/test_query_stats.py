@@ -0,0 +1,146 @@
+# Unit tests for per-request query statistics
+# Tests statement counting, the Server-Timing header, and query budgets
+# on a minimal app backed by the SQLite test engine.
+
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+from app.core.config import get_settings
+from app.core.dependencies import query_budget
+from app.core.exceptions import register_exception_handlers
+from app.db.query_stats import _TIMER_KEY, instrument_engine, track_queries
+from app.middleware.query_stats import QueryStatsMiddleware
+from tests.conftest import get_test_settings
+
+
+def _server_timing(response) -> dict[str, str]:
+    entries = {}
+    for entry in response.headers["server-timing"].split(","):
+        name, *params = entry.strip().split(";")
+        entries[name] = ";".join(params)
+    return entries
+
+
+@pytest_asyncio.fixture
+async def stats_app(async_engine) -> FastAPI:
+    instrument_engine(async_engine)
+    app = FastAPI()
+    register_exception_handlers(app)
+    app.add_middleware(QueryStatsMiddleware)
+
+    async def run(n: int) -> None:
+        async with async_engine.connect() as conn:
+            for _ in range(n):
+                await conn.execute(text("SELECT 1"))
+
+    @app.get("/queries/{n}")
+    async def queries(n: int) -> dict[str, int]:
+        await run(n)
+        return {"ran": n}
+
+    @app.get("/budgeted/{n}", dependencies=[query_budget(2)])
+    async def budgeted(n: int) -> dict[str, int]:
+        await run(n)
+        return {"ran": n}
+
+    return app
+
+
+@pytest_asyncio.fixture
+async def stats_client(stats_app: FastAPI) -> AsyncGenerator[AsyncClient, None]:
+    transport = ASGITransport(app=stats_app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+
+
+class TestQueryStats:
+    """Statement counting and Server-Timing exposure."""
+
+    @pytest.mark.asyncio
+    async def test_track_queries_counts_statements(self, async_engine):
+        instrument_engine(async_engine)
+        with track_queries() as stats:
+            async with async_engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+                await conn.execute(text("SELECT 2"))
+
+        assert stats.count == 2
+        assert stats.duration_ms > 0
+
+    @pytest.mark.asyncio
+    async def test_failed_statements_are_counted_and_release_their_timer(self, async_engine):
+        instrument_engine(async_engine)
+        with track_queries() as stats:
+            async with async_engine.connect() as conn:
+                with pytest.raises(DBAPIError):
+                    await conn.execute(text("SELECT * FROM no_such_table"))
+                info = (await conn.get_raw_connection()).info
+
+        assert stats.count == 1
+        assert not info.get(_TIMER_KEY)
+
+    @pytest.mark.asyncio
+    async def test_untracked_statements_are_ignored(self, async_engine):
+        instrument_engine(async_engine)
+        async with async_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        with track_queries() as stats:
+            pass
+
+        assert stats.count == 0
+
+    @pytest.mark.asyncio
+    async def test_server_timing_header(self, stats_client: AsyncClient):
+        response = await stats_client.get("/queries/3")
+
+        timing = _server_timing(response)
+        assert timing["db-queries"] == 'desc="3"'
+        assert timing["db"].startswith("dur=")
+
+    @pytest.mark.asyncio
+    async def test_requests_are_counted_separately(self, stats_client: AsyncClient):
+        await stats_client.get("/queries/4")
+        response = await stats_client.get("/queries/0")
+
+        assert _server_timing(response)["db-queries"] == 'desc="0"'
+
+
+class TestQueryBudget:
+    """Per-route query budgets."""
+
+    @pytest.mark.asyncio
+    async def test_within_budget_passes(self, stats_app: FastAPI, stats_client: AsyncClient):
+        stats_app.dependency_overrides[get_settings] = get_test_settings
+
+        response = await stats_client.get("/budgeted/2")
+
+        assert response.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_over_budget_raises_in_tests(self, stats_app: FastAPI, stats_client: AsyncClient):
+        stats_app.dependency_overrides[get_settings] = get_test_settings
+
+        response = await stats_client.get("/budgeted/3")
+
+        assert response.status_code == 500
+        assert response.json()["error"]["code"] == "QUERY_BUDGET_EXCEEDED"
+
+    @pytest.mark.asyncio
+    async def test_over_budget_only_warns_outside_tests(
+        self, stats_app: FastAPI, stats_client: AsyncClient
+    ):
+        stats_app.dependency_overrides[get_settings] = lambda: get_test_settings().model_copy(
+            update={"ENVIRONMENT": "production"}
+        )
+
+        response = await stats_client.get("/budgeted/3")
+
+        assert response.status_code == 200
@@ -0,0 +1,235 @@
+# Unit tests for the rate limiter
+# Token buckets (refill, LRU bound), the Redis sliding window on fakeredis
+# (weighting, atomic script, fail-open), and the middleware's policy
+# matching, headers and 429 envelope.
+
+from __future__ import annotations
+
+import pytest
+import pytest_asyncio
+from fakeredis import FakeAsyncRedis
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.core.security import create_access_token
+from app.middleware.rate_limiter import (
+    RateLimit,
+    RateLimitMiddleware,
+    RedisSlidingWindow,
+    TokenBucketBackend,
+    default_policies,
+)
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest_asyncio.fixture
+async def redis():
+    client = FakeAsyncRedis()
+    yield client
+    await client.aclose()
+
+
+class TestTokenBucketBackend:
+    async def test_allows_burst_then_rejects(self):
+        backend = TokenBucketBackend(clock=FakeClock())
+        limit = RateLimit(3, 60)
+
+        decisions = [await backend.hit("k", limit) for _ in range(4)]
+
+        assert [d.allowed for d in decisions] == [True, True, True, False]
+        assert [d.remaining for d in decisions] == [2, 1, 0, 0]
+        assert decisions[-1].retry_after == pytest.approx(20)
+
+    async def test_refills_continuously(self):
+        clock = FakeClock()
+        backend = TokenBucketBackend(clock=clock)
+        limit = RateLimit(3, 60)
+        for _ in range(3):
+            await backend.hit("k", limit)
+
+        clock.now += 20
+        assert (await backend.hit("k", limit)).allowed is True
+        assert (await backend.hit("k", limit)).allowed is False
+        clock.now += 600
+        assert (await backend.hit("k", limit)).remaining == 2
+
+    async def test_keys_are_independent(self):
+        backend = TokenBucketBackend(clock=FakeClock())
+        limit = RateLimit(1, 60)
+
+        assert (await backend.hit("a", limit)).allowed is True
+        assert (await backend.hit("b", limit)).allowed is True
+        assert (await backend.hit("a", limit)).allowed is False
+
+    async def test_memory_is_bounded_by_lru(self):
+        backend = TokenBucketBackend(max_keys=2, clock=FakeClock())
+        limit = RateLimit(1, 60)
+        await backend.hit("a", limit)
+        await backend.hit("b", limit)
+        await backend.hit("a", limit)  # "b" is now least recently used
+
+        await backend.hit("c", limit)
+
+        assert len(backend) == 2
+        assert (await backend.hit("a", limit)).allowed is False  # kept, still drained
+        assert (await backend.hit("b", limit)).allowed is True  # evicted, fresh bucket
+
+
+class TestRedisSlidingWindow:
+    async def test_allows_limit_then_rejects(self, redis):
+        backend = RedisSlidingWindow(redis, clock=FakeClock(600.0))
+        limit = RateLimit(3, 60)
+
+        decisions = [await backend.hit("k", limit) for _ in range(4)]
+
+        assert [d.allowed for d in decisions] == [True, True, True, False]
+        assert [d.remaining for d in decisions[:3]] == [2, 1, 0]
+        assert decisions[-1].retry_after == pytest.approx(60 + 60 * (1 - 2 / 3))
+
+    async def test_previous_window_is_weighted(self, redis):
+        clock = FakeClock(600.0)
+        backend = RedisSlidingWindow(redis, clock=clock)
+        limit = RateLimit(4, 60)
+        for _ in range(4):
+            await backend.hit("k", limit)
+
+        clock.now += 90  # halfway into the next window: 4 * 0.5 = 2 still count
+        decisions = [await backend.hit("k", limit) for _ in range(3)]
+
+        assert [d.allowed for d in decisions] == [True, True, False]
+        assert decisions[-1].retry_after == pytest.approx(15)
+
+    async def test_one_round_trip_and_expiring_keys(self, redis, monkeypatch):
+        backend = RedisSlidingWindow(redis, clock=FakeClock(600.0))
+        await backend.hit("warm-up", RateLimit(3, 60))  # loads the script once
+        calls = []
+        execute = redis.execute_command
+
+        async def counting(*args, **kwargs):
+            calls.append(args[0])
+            return await execute(*args, **kwargs)
+
+        monkeypatch.setattr(redis, "execute_command", counting)
+        await backend.hit("k", RateLimit(3, 60))
+
+        assert calls == ["EVALSHA"]
+        (key,) = await redis.keys("pmt:ratelimit:{k}:*")
+        assert 0 < await redis.pttl(key) <= 120_000
+
+    async def test_fails_open_when_redis_is_down(self, redis, monkeypatch):
+        backend = RedisSlidingWindow(redis)
+
+        async def broken(*args, **kwargs):
+            raise RedisConnectionError("connection refused")
+
+        monkeypatch.setattr(redis, "execute_command", broken)
+        decision = await backend.hit("k", RateLimit(1, 60))
+
+        assert decision.allowed is True
+
+
+def _client(backend=None, **kwargs) -> TestClient:
+    app = FastAPI()
+
+    @app.post("/api/v1/auth/login")
+    async def login() -> dict[str, bool]:
+        return {"ok": True}
+
+    @app.get("/api/v1/projects")
+    async def projects() -> dict[str, bool]:
+        return {"ok": True}
+
+    @app.get("/health")
+    async def health() -> dict[str, bool]:
+        return {"ok": True}
+
+    app.add_middleware(
+        RateLimitMiddleware,
+        backend=backend or TokenBucketBackend(),
+        policies=default_policies(login_per_minute=5, user_per_minute=3, anonymous_per_minute=2),
+        **kwargs,
+    )
+    return TestClient(app)
+
+
+def _bearer(user_id: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {create_access_token(user_id, role='PM')}"}
+
+
+class TestRateLimitMiddleware:
+    def test_login_is_limited_to_five_per_minute_per_ip(self):
+        client = _client()
+
+        statuses = [client.post("/api/v1/auth/login").status_code for _ in range(6)]
+
+        assert statuses == [200] * 5 + [429]
+
+    def test_rejection_uses_error_envelope_and_headers(self):
+        client = _client()
+        for _ in range(5):
+            ok = client.post("/api/v1/auth/login")
+
+        rejected = client.post("/api/v1/auth/login")
+
+        assert ok.headers["X-RateLimit-Limit"] == "5"
+        assert ok.headers["X-RateLimit-Remaining"] == "0"
+        assert int(ok.headers["X-RateLimit-Reset"]) == 60
+        assert rejected.json()["error"]["code"] == "RATE_LIMIT_EXCEEDED"
+        assert rejected.headers["Retry-After"] == "12"
+        assert rejected.headers["X-RateLimit-Remaining"] == "0"
+
+    def test_users_are_limited_by_token_subject(self):
+        client = _client()
+        alice, bob = _bearer("alice"), _bearer("bob")
+
+        alice_statuses = [
+            client.get("/api/v1/projects", headers=alice).status_code for _ in range(4)
+        ]
+
+        assert alice_statuses == [200, 200, 200, 429]
+        assert client.get("/api/v1/projects", headers=bob).status_code == 200
+
+    def test_anonymous_and_invalid_tokens_share_the_ip_budget(self):
+        client = _client()
+        invalid = {"Authorization": "Bearer not-a-token"}
+
+        statuses = [
+            client.get("/api/v1/projects").status_code,
+            client.get("/api/v1/projects", headers=invalid).status_code,
+            client.get("/api/v1/projects").status_code,
+        ]
+
+        assert statuses == [200, 200, 429]
+
+    def test_unmatched_paths_are_not_limited(self):
+        client = _client()
+
+        responses = [client.get("/health") for _ in range(10)]
+
+        assert {r.status_code for r in responses} == {200}
+        assert "X-RateLimit-Limit" not in responses[0].headers
+
+    def test_forwarded_for_is_used_only_when_trusted(self):
+        trusting, default = _client(trust_forwarded=True), _client()
+        for client in (trusting, default):
+            for _ in range(2):
+                client.get("/api/v1/projects", headers={"X-Forwarded-For": "10.0.0.1"})
+
+        other_ip = {"X-Forwarded-For": "10.0.0.2"}
+        assert trusting.get("/api/v1/projects", headers=other_ip).status_code == 200
+        assert default.get("/api/v1/projects", headers=other_ip).status_code == 429
+
+    def test_redis_backend(self, redis):
+        client = _client(RedisSlidingWindow(redis))
+
+        statuses = [client.post("/api/v1/auth/login").status_code for _ in range(6)]
+
+        assert statuses == [200] * 5 + [429]
@@ -0,0 +1,275 @@
+# Unit tests for read-replica routing
+# Uses two SQLite databases as primary and replica to verify where
+# statements land, read-your-writes stickiness, and get_db wiring.
+
+from __future__ import annotations
+
+import uuid
+
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event, select
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from starlette.requests import Request
+
+from app.core.dependencies import DBSession
+from app.core.exceptions import AuthenticationError
+from app.db import session as db_session
+from app.db.base import Base
+from app.db.routing import (
+    READ_ONLY_KEY,
+    STICKY_KEY,
+    WROTE_KEY,
+    ReadYourWritesTracker,
+    RoutingSession,
+)
+from app.db.session import engine, get_db
+from app.domains.projects.models import Project
+from app.domains.projects.repository import ProjectRepository
+
+
+@pytest_asyncio.fixture
+async def databases(tmp_path):
+    """Primary and replica SQLite files, each seeded with a distinguishable row."""
+    primary = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}")
+    replica = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}")
+    for database, name in ((primary, "on-primary"), (replica, "on-replica")):
+        async with database.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.execute(
+                Project.__table__.insert().values(
+                    id=str(uuid.uuid4()), name=name, owner_id=str(uuid.uuid4())
+                )
+            )
+    yield primary, replica
+    await primary.dispose()
+    await replica.dispose()
+
+
+@pytest.fixture
+def tracker() -> ReadYourWritesTracker:
+    return ReadYourWritesTracker(60)
+
+
+@pytest.fixture
+def session_factory(databases, tracker):
+    primary, replica = databases
+    return async_sessionmaker(
+        primary,
+        class_=AsyncSession,
+        sync_session_class=RoutingSession,
+        expire_on_commit=False,
+        replicas=[replica],
+        tracker=tracker,
+    )
+
+
+async def _names(session: AsyncSession) -> set[str]:
+    return set((await session.scalars(select(Project.name))).all())
+
+
+class TestRoutingSession:
+    """Statement routing between primary and replica."""
+
+    @pytest.mark.asyncio
+    async def test_default_reads_use_primary(self, session_factory):
+        """Sessions not marked read-only should never touch the replica."""
+        async with session_factory() as session:
+            assert await _names(session) == {"on-primary"}
+
+    @pytest.mark.asyncio
+    async def test_read_only_session_uses_replica(self, session_factory):
+        """Read-only sessions should read from the replica."""
+        async with session_factory() as session:
+            session.info[READ_ONLY_KEY] = True
+            assert await _names(session) == {"on-replica"}
+
+    @pytest.mark.asyncio
+    async def test_writes_pin_session_to_primary(self, session_factory):
+        """Writes go to the primary, and later @read_only reads in the session follow them."""
+        async with session_factory() as session:
+            repository = ProjectRepository(session)
+            projects, _ = await repository.get_multi()
+            assert [p.name for p in projects] == ["on-replica"]
+
+            await repository.create({"name": "written", "owner_id": str(uuid.uuid4())})
+
+            assert session.info[WROTE_KEY] is True
+            projects, _ = await repository.get_multi()
+            assert {p.name for p in projects} == {"on-primary", "written"}
+
+    @pytest.mark.asyncio
+    async def test_read_only_session_rejects_writes(self, session_factory):
+        """Sessions marked read-only should refuse DML and flushes."""
+        async with session_factory() as session:
+            session.info[READ_ONLY_KEY] = True
+            repository = ProjectRepository(session)
+
+            with pytest.raises(InvalidRequestError):
+                await repository.create({"name": "nope", "owner_id": str(uuid.uuid4())})
+
+            session.add(Project(name="nope", owner_id=str(uuid.uuid4())))
+            with pytest.raises(InvalidRequestError):
+                await session.flush()
+
+    @pytest.mark.asyncio
+    async def test_read_only_method_uses_replica(self, session_factory):
+        """@read_only repository methods may use a replica in a write session."""
+        async with session_factory() as session:
+            repository = ProjectRepository(session)
+
+            projects, total = await repository.get_multi()
+
+            assert [p.name for p in projects] == ["on-replica"]
+            assert total == 1
+            assert await _names(session) == {"on-primary"}
+
+    @pytest.mark.asyncio
+    async def test_recent_writer_sticks_to_primary(self, session_factory, tracker):
+        """A caller inside the read-your-writes window should read from the primary."""
+        tracker.mark("user-1")
+        async with session_factory() as session:
+            session.info[READ_ONLY_KEY] = True
+            session.info[STICKY_KEY] = lambda: "user-1"
+            assert await _names(session) == {"on-primary"}
+
+        async with session_factory() as session:
+            session.info[READ_ONLY_KEY] = True
+            session.info[STICKY_KEY] = "user-2"
+            assert await _names(session) == {"on-replica"}
+
+
+class TestReadYourWritesTracker:
+    """Expiry and bounds of the stickiness window."""
+
+    def test_window_expires(self):
+        now = [100.0]
+        tracker = ReadYourWritesTracker(5, clock=lambda: now[0])
+
+        tracker.mark("user-1")
+        assert tracker.is_sticky("user-1") is True
+
+        now[0] += 5
+        assert tracker.is_sticky("user-1") is False
+
+    def test_evicts_oldest_beyond_max_entries(self):
+        tracker = ReadYourWritesTracker(60, max_entries=2)
+        for key in ("a", "b", "c"):
+            tracker.mark(key)
+
+        assert tracker.is_sticky("a") is False
+        assert tracker.is_sticky("c") is True
+
+    def test_anonymous_callers_never_stick(self):
+        tracker = ReadYourWritesTracker(60)
+        tracker.mark(None)
+        assert tracker.is_sticky(None) is False
+
+
+class TestGetDbRouting:
+    """get_db picks the session mode by HTTP method."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(("method", "read_only"), [("GET", True), ("POST", False)])
+    async def test_method_sets_read_only(self, method: str, read_only: bool):
+        request = Request({"type": "http", "method": method, "headers": []})
+        request.state.user_id = "user-1"
+        sessions = get_db(request)
+        session = await anext(sessions)
+        try:
+            assert session.info[READ_ONLY_KEY] is read_only
+            assert session.info[STICKY_KEY]() == "user-1"
+            isolation = session.bind.get_execution_options().get("isolation_level")
+            assert (isolation == "AUTOCOMMIT") is read_only
+        finally:
+            await sessions.aclose()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("method", ["GET", "POST"])
+    async def test_unused_session_never_connects(self, method: str):
+        """A request that fails before its first query should not touch the pool."""
+        connects: list[object] = []
+
+        def _record(dialect, conn_rec, cargs, cparams):
+            connects.append(conn_rec)
+
+        event.listen(engine.sync_engine, "do_connect", _record)
+        try:
+            request = Request({"type": "http", "method": method, "headers": []})
+            sessions = get_db(request)
+            await anext(sessions)
+            with pytest.raises(AuthenticationError):
+                await sessions.athrow(AuthenticationError("Invalid token"))
+        finally:
+            event.remove(engine.sync_engine, "do_connect", _record)
+
+        assert connects == []
+        assert engine.pool.checkedout() == 0
+
+
+class TestGetDbReadYourWrites:
+    """A write is committed and pins its caller before the response goes out."""
+
+    @pytest.fixture
+    def app(self, monkeypatch, session_factory, tracker) -> FastAPI:
+        monkeypatch.setattr(db_session, "async_session_factory", session_factory)
+        monkeypatch.setattr(db_session, "read_only_session_factory", session_factory)
+        monkeypatch.setattr(db_session, "read_your_writes", tracker)
+        app = FastAPI()
+
+        @app.post("/projects")
+        async def create(request: Request, session: DBSession) -> dict[str, str]:
+            request.state.user_id = "user-1"
+            project = await ProjectRepository(session).create(
+                {"name": "written", "owner_id": str(uuid.uuid4())}
+            )
+            return {"id": project.id}
+
+        @app.get("/projects")
+        async def names(request: Request, session: DBSession) -> list[str]:
+            request.state.user_id = "user-1"
+            return sorted(await _names(session))
+
+        return app
+
+    @pytest.mark.asyncio
+    async def test_read_after_write_goes_to_primary(self, app, databases, tracker):
+        primary, _ = databases
+        at_response_start: list[tuple[bool, set[str]]] = []
+
+        async def probe_app(scope, receive, send):
+            async def probing_send(message):
+                if message["type"] == "http.response.start" and scope["method"] == "POST":
+                    async with AsyncSession(primary) as other:
+                        at_response_start.append((tracker.is_sticky("user-1"), await _names(other)))
+                await send(message)
+
+            await app(scope, receive, probing_send)
+
+        transport = ASGITransport(app=probe_app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            created = await client.post("/projects")
+            read = await client.get("/projects")
+
+        assert created.status_code == 200
+        assert at_response_start == [(True, {"on-primary", "written"})]
+        assert read.json() == ["on-primary", "written"]
+
+
+class TestReadOnlyAutocommit:
+    """Autocommit reads on the SQLite stand-in."""
+
+    @pytest.mark.asyncio
+    async def test_autocommit_session_reads_without_commit(self, databases):
+        primary, _ = databases
+        factory = async_sessionmaker(
+            primary.execution_options(isolation_level="AUTOCOMMIT"),
+            class_=AsyncSession,
+            sync_session_class=RoutingSession,
+        )
+        async with factory() as session:
+            session.info[READ_ONLY_KEY] = True
+            assert await _names(session) == {"on-primary"}
@@ -0,0 +1,64 @@
+# Unit tests for the row serialization fast path
+# Tests bulk TypeAdapter validation of rows and envelope assembly.
+
+from __future__ import annotations
+
+import json
+from collections import namedtuple
+from datetime import datetime, timezone
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from app.core.schemas import PaginatedResponse, PaginationMeta
+from app.core.serialization import envelope_json, json_response, list_adapter, rows_to_json
+
+
+class Item(BaseModel):
+    id: str
+    created_at: datetime
+
+
+Row = namedtuple("Row", ["id", "created_at", "total"])
+
+CREATED = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+
+class TestRowsToJson:
+    """Bulk validation and dumping of row-like inputs."""
+
+    def test_reads_attributes_and_ignores_extra_columns(self):
+        body = rows_to_json(Item, [Row("a", CREATED, 7)])
+
+        assert json.loads(body) == [{"id": "a", "created_at": "2026-01-02T03:04:05Z"}]
+
+    def test_accepts_mappings(self):
+        body = rows_to_json(Item, [{"id": "a", "created_at": "2026-01-02T03:04:05Z"}])
+
+        assert json.loads(body)[0]["id"] == "a"
+
+    def test_invalid_row_raises(self):
+        with pytest.raises(ValidationError):
+            rows_to_json(Item, [{"id": "a"}])
+
+    def test_adapter_is_cached_per_schema(self):
+        assert list_adapter(Item) is list_adapter(Item)
+
+
+class TestEnvelopeJson:
+    """Envelope bytes match the pydantic response model."""
+
+    def test_matches_paginated_response(self):
+        items = [Item(id="a", created_at=CREATED)]
+        meta = PaginationMeta.create(total=1, page=1, per_page=20)
+
+        body = envelope_json(rows_to_json(Item, items), meta)
+
+        expected = PaginatedResponse[Item](data=items, meta=meta).model_dump_json()
+        assert body == expected.encode()
+
+    def test_json_response_keeps_bytes(self):
+        response = json_response(b"[]")
+
+        assert response.body == b"[]"
+        assert response.media_type == "application/json"
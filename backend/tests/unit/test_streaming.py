@@ -0,0 +1,64 @@
+# Unit tests for streaming export encoders
+# Tests NDJSON and CSV chunking of Pydantic model streams.
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+from datetime import datetime, timezone
+
+import pytest
+from pydantic import BaseModel
+
+from app.core.constants import ExportFormat
+from app.core.streaming import csv_chunks, export_response, ndjson_chunks
+
+
+class Row(BaseModel):
+    id: int
+    name: str
+    note: str | None = None
+    at: datetime
+
+
+async def _rows(n: int):
+    for i in range(n):
+        yield Row(id=i, name=f"row {i}", at=datetime(2026, 1, 1, tzinfo=timezone.utc))
+
+
+class TestStreamingEncoders:
+    """Chunked NDJSON/CSV encoding."""
+
+    @pytest.mark.asyncio
+    async def test_ndjson_chunks_rows(self):
+        chunks = [chunk async for chunk in ndjson_chunks(_rows(5), rows_per_chunk=2)]
+
+        assert len(chunks) == 3
+        lines = b"".join(chunks).decode().splitlines()
+        assert [json.loads(line)["id"] for line in lines] == [0, 1, 2, 3, 4]
+        assert json.loads(lines[0])["at"] == "2026-01-01T00:00:00Z"
+
+    @pytest.mark.asyncio
+    async def test_csv_has_header_and_blank_nulls(self):
+        chunks = [
+            chunk async for chunk in csv_chunks(_rows(3), ["id", "name", "note"], rows_per_chunk=2)
+        ]
+
+        assert len(chunks) == 2
+        rows = list(csv.reader(io.StringIO(b"".join(chunks).decode())))
+        assert rows[0] == ["id", "name", "note"]
+        assert rows[1] == ["0", "row 0", ""]
+        assert len(rows) == 4
+
+    @pytest.mark.asyncio
+    async def test_empty_stream_csv_is_header_only(self):
+        chunks = [chunk async for chunk in csv_chunks(_rows(0), ["id"])]
+
+        assert b"".join(chunks) == b"id\r\n"
+
+    def test_export_response_headers(self):
+        response = export_response(_rows(1), Row, ExportFormat.CSV, filename="rows")
+
+        assert response.media_type.startswith("text/csv")
+        assert response.headers["content-disposition"] == 'attachment; filename="rows.csv"'
@@ -0,0 +1,117 @@
+# Unit tests for the verified access-token cache
+# decode_access_token answers repeat tokens from VerifiedTokenCache until
+# `exp` or the TTL; forged, expired and bypassed lookups always verify.
+
+from __future__ import annotations
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from app.core import security
+from app.core.exceptions import TokenExpiredError, TokenInvalidError
+from app.core.security import VerifiedTokenCache, create_access_token, decode_access_token
+
+
+@pytest.fixture
+def token_cache(monkeypatch) -> VerifiedTokenCache:
+    cache = VerifiedTokenCache(max_entries=8, ttl_seconds=60)
+    monkeypatch.setattr(security, "verified_tokens", cache)
+    return cache
+
+
+def _counting_decode():
+    return patch.object(security.jwt, "decode", wraps=security.jwt.decode)
+
+
+class TestDecodeAccessTokenCache:
+    def test_repeat_token_skips_verification(self, token_cache: VerifiedTokenCache):
+        token = create_access_token("user-1", role="PM")
+
+        with _counting_decode() as decode:
+            first = decode_access_token(token)
+            second = decode_access_token(token)
+
+        assert decode.call_count == 1
+        assert first == second
+        assert second["sub"] == "user-1"
+
+    def test_use_cache_false_always_verifies(self, token_cache: VerifiedTokenCache):
+        token = create_access_token("user-1", role="PM")
+        decode_access_token(token)
+
+        with _counting_decode() as decode:
+            decode_access_token(token, use_cache=False)
+
+        assert decode.call_count == 1
+
+    def test_disabled_cache_always_verifies(self, monkeypatch):
+        monkeypatch.setattr(security, "verified_tokens", None)
+        token = create_access_token("user-1", role="PM")
+
+        with _counting_decode() as decode:
+            decode_access_token(token)
+            decode_access_token(token)
+
+        assert decode.call_count == 2
+
+    def test_forged_token_is_not_served_from_cache(self, token_cache: VerifiedTokenCache):
+        token = create_access_token("user-1", role="PM")
+        decode_access_token(token)
+        header, payload, signature = token.split(".")
+
+        with pytest.raises(TokenInvalidError):
+            decode_access_token(f"{header}.{payload}.{signature[::-1]}")
+        assert token_cache.stats["hits"] == 0
+
+    def test_callers_cannot_mutate_cached_claims(self, token_cache: VerifiedTokenCache):
+        token = create_access_token("user-1", role="PM")
+
+        decode_access_token(token)["role"] = "ADMIN"
+        decode_access_token(token)["role"] = "ADMIN"
+
+        assert decode_access_token(token)["role"] == "PM"
+
+    def test_expired_token_is_rejected(self, token_cache: VerifiedTokenCache):
+        with patch.object(security.settings, "ACCESS_TOKEN_EXPIRE_MINUTES", -1):
+            token = create_access_token("user-1", role="PM")
+
+        with pytest.raises(TokenExpiredError):
+            decode_access_token(token)
+        assert len(token_cache._entries) == 0
+
+
+class TestVerifiedTokenCache:
+    def test_entry_expires_at_exp(self):
+        now = [1000.0]
+        cache = VerifiedTokenCache(ttl_seconds=600, clock=lambda: now[0])
+        cache.put("t", {"sub": "u", "exp": 1010})
+
+        assert cache.get("t") == {"sub": "u", "exp": 1010}
+        now[0] = 1010.0
+        assert cache.get("t") is None
+
+    def test_entry_expires_at_ttl(self):
+        cache = VerifiedTokenCache(ttl_seconds=0)
+        cache.put("t", {"sub": "u", "exp": time.time() + 600})
+
+        assert cache.get("t") is None
+
+    def test_claims_without_exp_are_not_cached(self):
+        cache = VerifiedTokenCache()
+        cache.put("t", {"sub": "u"})
+
+        assert cache.get("t") is None
+
+    def test_bounded_and_discardable(self):
+        cache = VerifiedTokenCache(max_entries=2)
+        exp = time.time() + 600
+        for token in ("a", "b", "c"):
+            cache.put(token, {"sub": token, "exp": exp})
+
+        assert cache.get("a") is None
+        assert cache.get("c") is not None
+        cache.discard("c")
+        assert cache.get("c") is None
+        assert cache.stats["evictions"] == 1